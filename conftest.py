@@ -29,6 +29,11 @@ os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
 os.environ.setdefault("PEOPLE_TABLE_V2_NAME", "test-people-table-v2")
 os.environ.setdefault("PROJECTS_TABLE_V2_NAME", "test-projects-table-v2")
 os.environ.setdefault("SUBSCRIPTIONS_TABLE_V2_NAME", "test-subscriptions-table-v2")
+os.environ.setdefault("STATS_TABLE_NAME", "test-stats-table")
+os.environ.setdefault("JOBS_TABLE_NAME", "test-jobs-table")
+os.environ.setdefault("OUTBOX_TABLE_NAME", "test-outbox-table")
+# Outbox messages are delivered explicitly in tests, not by background threads
+os.environ.setdefault("OUTBOX_WORKERS", "0")
 
 # Legacy tables (for migration compatibility)
 os.environ.setdefault("PEOPLE_TABLE_NAME", "test-people-table")
@@ -55,6 +60,17 @@ def aws_credentials():
     os.environ["AWS_SESSION_TOKEN"] = "testing"
 
 
+@pytest.fixture(scope="function", autouse=True)
+def repository_caches():
+    """Start every test with empty repository caches and search indexes."""
+    from src.core.cache import clear_caches
+    from src.core.search import clear_search_indexes
+
+    clear_caches()
+    clear_search_indexes()
+    yield
+
+
 @pytest.fixture(scope="function", autouse=True)
 def dynamodb_mock():
     """Mock DynamoDB for tests."""
@@ -74,17 +90,66 @@ def dynamodb_mock():
             ("test-people-table-v2", "id"),
             ("test-projects-table-v2", "id"),
             ("test-subscriptions-table-v2", "id"),
+            ("test-stats-table", "id"),
+            ("test-jobs-table", "id"),
+            ("test-outbox-table", "id"),
         ]
 
+        # Global secondary indexes (index name, hash key[, range key]) per table
+        table_indexes = {
+            "test-people-table-v2": [
+                ("EmailLowerIndex", "emailLower"),
+                ("FirstNameIndex", "listPartition", "firstName"),
+                ("LastNameIndex", "listPartition", "lastName"),
+                ("EmailSortIndex", "listPartition", "email"),
+                ("CreatedAtIndex", "listPartition", "createdAt"),
+            ],
+            "test-subscriptions-table-v2": [
+                ("PersonIdIndex", "personId"),
+                ("ProjectIdIndex", "projectId"),
+            ],
+            "test-outbox-table": [
+                ("StatusAvailableAtIndex", "status", "availableAt"),
+            ],
+        }
+        # Index key attributes that hold numbers; the rest are strings
+        number_attributes = {"availableAt"}
+
         for table_name, key_name in tables_to_create:
+            indexes = table_indexes.get(table_name, [])
+            attribute_names = [key_name]
+            for _, *index_keys in indexes:
+                attribute_names += [
+                    name for name in index_keys if name not in attribute_names
+                ]
+            extra_args = {}
+            if indexes:
+                extra_args["GlobalSecondaryIndexes"] = [
+                    {
+                        "IndexName": index_name,
+                        "KeySchema": [
+                            {"AttributeName": name, "KeyType": key_type}
+                            for name, key_type in zip(index_keys, ("HASH", "RANGE"))
+                        ],
+                        "Projection": {"ProjectionType": "ALL"},
+                    }
+                    for index_name, *index_keys in indexes
+                ]
             try:
                 dynamodb.create_table(
                     TableName=table_name,
                     KeySchema=[{"AttributeName": key_name, "KeyType": "HASH"}],
                     AttributeDefinitions=[
-                        {"AttributeName": key_name, "AttributeType": "S"}
+                        {
+                            "AttributeName": name,
+                            "AttributeType": (
+                                "N" if name in number_attributes else "S"
+                            ),
+                        }
+                        for name in attribute_names
                     ],
                     BillingMode="PAY_PER_REQUEST",
+                    **extra_args,
                 )
             except Exception as e:
                 # Table might already exist
@@ -3,6 +3,8 @@ Main entry point for the People Registry API.
 Lambda-compatible entry point using Mangum.
 """
 
+import time
+
 from mangum import Mangum
 from src.app import app
 
@@ -10,6 +12,49 @@ from src.app import app
 handler = Mangum(app)
 lambda_handler = handler  # Alias for Lambda deployment
 
+# Share of the remaining invocation time a scheduled run may spend working
+OUTBOX_DRAIN_TIME_SHARE = 0.8
+
+
+def outbox_handler(event, context):
+    """Scheduled Lambda entry point that delivers due outbox messages.
+
+    Deployed from the same image with the handler ``main.outbox_handler`` and
+    invoked by an EventBridge schedule (``rate(1 minute)``). The API function
+    starts no outbox threads under Lambda, so this is what sends notification
+    emails and their retries.
+    """
+    from src.core.outbox import outbox
+    from src.services.service_registry_manager import service_registry
+
+    # Services register the handlers of their message types
+    service_registry.get_subscriptions_service()
+
+    until = None
+    if context is not None:
+        remaining = context.get_remaining_time_in_millis() / 1000
+        until = time.time() + remaining * OUTBOX_DRAIN_TIME_SHARE
+    return outbox.drain(until)
+
+
+def jobs_handler(event, context):
+    """Scheduled Lambda entry point that runs queued and stopped admin jobs.
+
+    Deployed like ``main.outbox_handler``, with the handler ``main.jobs_handler``
+    and an EventBridge schedule (``rate(1 minute)``). The API function runs no
+    job threads under Lambda, so this is what processes submitted bulk jobs
+    and continues the ones a timeout interrupted.
+    """
+    from src.services.service_registry_manager import service_registry
+
+    until = None
+    if context is not None:
+        remaining = context.get_remaining_time_in_millis() / 1000
+        until = time.time() + remaining * OUTBOX_DRAIN_TIME_SHARE
+    completed = service_registry.get_bulk_jobs_service().resume_unfinished(until)
+    return {"completed": len(completed)}
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+One-off backfill of the emailLower and listPartition attributes on people rows.
+Rows written before the email and sort indexes existed are invisible to email
+lookups and keyset listings until this has run. Run it again after the listing
+is sharded or PEOPLE_LIST_SHARDS changes, so every row moves to its shard.
+Usage: python scripts/backfill_index_keys.py
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.repositories.people_repository import PeopleRepository
+
+
+def main():
+    """Backfill index keys on every person that is missing them."""
+    repo = PeopleRepository()
+
+    print(f"🔄 Backfilling index keys in {repo.table_name}...")
+    try:
+        updated = repo.backfill_index_keys()
+    except Exception as e:
+        print(f"❌ Error during backfill: {e}")
+        return 1
+
+    print(f"✅ Backfill completed! Updated {updated} people.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,12 +6,15 @@ Usage: python scripts/cleanup_test_users.py
 import sys
 import asyncio
 import os
-import boto3
 from typing import List, Dict, Any
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
 from src.core.config import config
+from src.core.database import db
+from src.repositories.people_repository import PeopleRepository
+from src.repositories.projects_repository import ProjectsRepository
+from src.repositories.subscriptions_repository import SubscriptionsRepository
 
 # Test user patterns to identify and remove
 TEST_USER_PATTERNS = [
@@ -36,15 +39,19 @@ def is_test_user(email: str) -> bool:
 async def cleanup_test_users():
     """Remove test users from all API tables"""
     try:
-        # Connect to DynamoDB
-        dynamodb = boto3.resource("dynamodb", region_name=config.database.region)
-
         # Get the actual table names from config
         tables_to_clean = {
             "people": config.database.people_table,
             "projects": config.database.projects_table,
             "subscriptions": config.database.subscriptions_table,
         }
+        # Repository deletes keep the aggregate counters in step, and
+        # subscription deletes free the project spots they hold
+        repositories = {
+            "people": PeopleRepository(),
+            "projects": ProjectsRepository(),
+            "subscriptions": SubscriptionsRepository(),
+        }
 
         print("🧹 Cleaning up test users from API tables...")
         print(f"Tables to clean: {list(tables_to_clean.values())}")
@@ -54,9 +61,7 @@ async def cleanup_test_users():
 
         for table_type, table_name in tables_to_clean.items():
             try:
-                table = dynamodb.Table(table_name)
-                response = table.scan()
-                items = response["Items"]
+                items = db.parallel_scan_table(table_name)
 
                 print(f"📋 Checking {table_name} ({table_type}):")
                 print(f"  Total items: {len(items)}")
@@ -74,11 +79,9 @@ async def cleanup_test_users():
                 elif table_type == "subscriptions":
                     # For subscriptions, we need to check if the person is a test user
                     # First get all test person IDs
-                    people_table = dynamodb.Table(config.database.people_table)
-                    people_response = people_table.scan()
                     test_person_ids = set()
 
-                    for person in people_response["Items"]:
+                    for person in db.parallel_scan(config.database.people_table):
                         email = person.get("email", "")
                         if email and is_test_user(email):
                             test_person_ids.add(person.get("id"))
@@ -112,29 +115,31 @@ async def cleanup_test_users():
                 if test_items:
                     print(f"  🗑️  Removing {len(test_items)} test items...")
 
+                    result = repositories[table_type].delete_many(
+                        [item["id"] for item in test_items]
+                    )
+                    total_removed += result.success_count
+                    errors = {
+                        failure["key"]["id"]: failure["error"]
+                        for failure in result.failed
+                    }
+
                     for item in test_items:
-                        try:
-                            # Get the primary key
-                            key = {"id": item["id"]}
-                            table.delete_item(Key=key)
-                            total_removed += 1
-
-                            if table_type == "people":
-                                print(
-                                    f"    ✅ Removed user: {item.get('email', 'No email')}"
-                                )
-                            elif table_type == "subscriptions":
-                                print(
-                                    f"    ✅ Removed subscription: {item.get('id', 'No ID')}"
-                                )
-                            elif table_type == "projects":
-                                print(
-                                    f"    ✅ Removed project: {item.get('name', 'No name')}"
-                                )
-
-                        except Exception as e:
+                        if item["id"] in errors:
+                            print(
+                                f"    ❌ Error removing item {item['id']}: {errors[item['id']]}"
+                            )
+                        elif table_type == "people":
+                            print(
+                                f"    ✅ Removed user: {item.get('email', 'No email')}"
+                            )
+                        elif table_type == "subscriptions":
+                            print(
+                                f"    ✅ Removed subscription: {item.get('id', 'No ID')}"
+                            )
+                        elif table_type == "projects":
                             print(
-                                f"    ❌ Error removing item {item.get('id', 'No ID')}: {e}"
+                                f"    ✅ Removed project: {item.get('name', 'No name')}"
                             )
                 else:
                     print(f"  ✅ No test items found in {table_name}")
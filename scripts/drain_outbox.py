@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Deliver every due outbox message, such as notification emails whose worker
+stopped or whose retry is due. Deployed on Lambda, the same drain runs from
+the scheduled main.outbox_handler; this script is for manual runs. With
+--requeue-dead, dead letters are given a fresh set of attempts first.
+Usage: python scripts/drain_outbox.py [--requeue-dead]
+"""
+
+import sys
+import os
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.outbox import outbox
+from src.services.service_registry_manager import service_registry
+
+
+def main():
+    """Deliver due messages and report what is left dead-lettered."""
+    # Services register the handlers of their message types
+    service_registry.get_subscriptions_service()
+
+    repo = outbox.repository
+    print(f"🔄 Draining outbox {repo.table_name}...")
+    try:
+        if "--requeue-dead" in sys.argv[1:]:
+            for message in repo.list_dead():
+                repo.requeue(message["id"], int(time.time()))
+        result = outbox.drain()
+        dead = repo.list_dead()
+    except Exception as e:
+        print(f"❌ Error while draining outbox: {e}")
+        return 1
+
+    print(f"   {result['delivered']} of {result['due']} due messages delivered")
+    for message in dead:
+        print(
+            f"   dead: {message['id']} ({message['type']}): {message.get('lastError')}"
+        )
+    print("✅ Drain completed!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Bulk import people from an NDJSON or CSV file.
+The file is read lazily and imported in batches; the per-row report is
+written as JSON next to the input (or to --report).
+Usage: python scripts/import_people.py people.csv [--format csv] [--dry-run]
+"""
+
+import argparse
+import json
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.repositories.people_repository import PeopleRepository
+from src.services.people_service import PeopleService
+from src.utils.imports import FORMATS, import_records
+
+
+def main():
+    """Import every row of the file and print a summary."""
+    parser = argparse.ArgumentParser(description="Bulk import people")
+    parser.add_argument("path", help="NDJSON or CSV file to import")
+    parser.add_argument("--format", choices=FORMATS, help="default: from extension")
+    parser.add_argument("--dry-run", action="store_true", help="only validate rows")
+    parser.add_argument("--workers", type=int, help="password hashing processes")
+    parser.add_argument("--report", help="where to write the per-row JSON report")
+    args = parser.parse_args()
+
+    import_format = args.format or ("csv" if args.path.endswith(".csv") else "ndjson")
+    report_path = args.report or f"{args.path}.report.json"
+    service = PeopleService(PeopleRepository())
+
+    print(f"🔄 Importing {args.path} as {import_format}...")
+    try:
+        with open(args.path, encoding="utf-8-sig", newline="") as source:
+            report = service.import_people(
+                import_records(source, import_format),
+                dry_run=args.dry_run,
+                max_workers=args.workers,
+            )
+    except Exception as e:
+        print(f"❌ Error during import: {e}")
+        return 1
+
+    with open(report_path, "w", encoding="utf-8") as output:
+        json.dump(report, output, indent=2)
+
+    verb = "valid" if args.dry_run else "created"
+    print(f"   {report['succeeded']} {verb}, {report['failed']} failed")
+    print(f"✅ Import completed! Report written to {report_path}")
+    return 0 if report["failed"] == 0 else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
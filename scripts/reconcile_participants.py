@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Recount every project's currentParticipants from its subscriptions.
+Subscriptions hold a spot while active (see SubscriptionsRepository.holds_seat);
+the count is kept current by subscription writes, but projects created before
+counting, or data written outside the API, can hold a wrong value. Run this
+before deploying participant-limit enforcement, and whenever drift is suspected.
+Usage: python scripts/reconcile_participants.py
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.repositories.subscriptions_repository import SubscriptionsRepository
+
+
+def main():
+    """Recount and store every project's participant count."""
+    repo = SubscriptionsRepository()
+
+    print(
+        f"🔄 Reconciling participant counts in {repo.projects_repository.table_name}..."
+    )
+    try:
+        changed = repo.reconcile_participants()
+    except Exception as e:
+        print(f"❌ Error during reconcile: {e}")
+        return 1
+
+    for project_id, (old, new) in changed.items():
+        print(f"   {project_id}: {old} -> {new}")
+    print(f"✅ Reconcile completed! {len(changed)} projects corrected")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
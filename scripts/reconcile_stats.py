@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Recount the admin dashboard's aggregate counters from the tables.
+The counters are kept current by the repositories' writes; run this on a
+schedule, or after writing to the tables outside the API, to correct drift.
+Each scope's sharded counters are folded into one shard, and the per-project
+subscription counters are rewritten.
+Usage: python scripts/reconcile_stats.py
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.repositories.stats_repository import StatsRepository
+
+
+def main():
+    """Recount and store every scope's counters."""
+    repo = StatsRepository()
+
+    print(f"🔄 Reconciling counters in {repo.table_name}...")
+    try:
+        # Stored counters, summed over every shard
+        stored = repo.get_counters()
+        stats = repo.reconcile()
+        projects = repo.get_project_counters()
+    except Exception as e:
+        print(f"❌ Error during reconcile: {e}")
+        return 1
+
+    for scope, counters in stats.items():
+        before = stored.get(scope, {}).get("total", 0)
+        print(f"   {scope}: {before} -> {counters.get('total', 0)} total")
+    print(f"   {len(projects)} projects with subscriptions")
+    print("✅ Reconcile completed!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
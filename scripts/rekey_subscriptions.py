@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Move subscriptions created before pair IDs to their person/project pair ID.
+Pair lookups read a single item keyed by pair ID; rows still stored under a
+random ID are only found while SUBSCRIPTIONS_LEGACY_PAIR_LOOKUP is on. Run this
+once after deploying, then leave the flag off. Rows whose pair ID is already
+taken are reported as duplicates and left for manual review.
+Usage: python scripts/rekey_subscriptions.py
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.repositories.subscriptions_repository import SubscriptionsRepository
+
+
+def main():
+    """Re-key every legacy subscription to its pair ID."""
+    repo = SubscriptionsRepository()
+
+    print(f"🔄 Re-keying legacy subscriptions in {repo.table_name}...")
+    try:
+        outcome = repo.rekey_legacy_ids()
+    except Exception as e:
+        print(f"❌ Error during re-key: {e}")
+        return 1
+
+    for subscription_id in outcome["duplicates"]:
+        print(f"   ⚠️  {subscription_id}: pair ID already taken, left in place")
+    for subscription_id in outcome["changed"]:
+        print(f"   ⚠️  {subscription_id}: changed during the run, re-run to retry")
+    print(
+        f"✅ Re-key completed! {len(outcome['rekeyed'])} subscriptions moved to pair IDs"
+    )
+    return 0 if not outcome["changed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
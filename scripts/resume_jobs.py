@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Resume background admin jobs whose worker stopped, such as after a Lambda
+timeout. Each job continues from its last checkpoint; jobs that a live
+worker still holds are left alone. Deployments on Lambda run the same resume
+on a schedule through main.jobs_handler; this script is for running it by
+hand or from cron on a server without job workers (JOB_WORKERS=0).
+Usage: python scripts/resume_jobs.py
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.repositories.people_repository import PeopleRepository
+from src.services.bulk_jobs_service import BulkJobsService
+
+
+def main():
+    """Run every stalled job to completion."""
+    service = BulkJobsService(PeopleRepository())
+
+    print(f"🔄 Resuming jobs in {service.jobs_repository.table_name}...")
+    try:
+        resumed = service.resume_unfinished()
+    except Exception as e:
+        print(f"❌ Error while resuming jobs: {e}")
+        return 1
+
+    for job_id in resumed:
+        print(f"   {job_id}")
+    print(f"✅ Resumed {len(resumed)} jobs!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,6 +15,7 @@ from .middleware.enterprise_middleware import (
     RateLimitingMiddleware,
 )
 from .middleware.authentication_middleware import AuthenticationMiddleware
+from .middleware.request_scope_middleware import RequestScopeMiddleware
 from .middleware.authorization_middleware import (
     AuthorizationMiddleware,
     InputValidationMiddleware,
@@ -92,6 +93,9 @@ def create_app() -> FastAPI:
     app.add_middleware(AuthorizationMiddleware)
     app.add_middleware(AuthenticationMiddleware)
 
+    # Outermost: one identity map shared by every layer of a request
+    app.add_middleware(RequestScopeMiddleware)
+
     # Include routers
     app.include_router(people_router.router)
     app.include_router(projects_router.router)
@@ -0,0 +1,329 @@
+"""
+Read-through cache for repository point reads.
+Items are cached per table namespace with a TTL in a pluggable backend: an
+in-process LRU, or a shared key-value store (Redis-style get/set/delete).
+Inside a request scope, a per-request identity map is consulted first so each
+item is loaded at most once per request.
+"""
+
+import fnmatch
+import math
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from .config import config
+
+# Per-request identity map: (namespace, key) -> item, None for known misses.
+# The dict is shared with worker threads through copied contexts.
+_request_items: ContextVar[Optional[Dict[Tuple[str, str], Any]]] = ContextVar(
+    "request_items", default=None
+)
+
+
+@contextmanager
+def request_scope() -> Iterator[None]:
+    """Open a fresh identity map for the current request or job."""
+    token = _request_items.set({})
+    try:
+        yield
+    finally:
+        _request_items.reset(token)
+
+
+class CacheBackend:
+    """Storage for cached values. ``get`` returns None for missing or expired keys."""
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def size(self) -> int:
+        raise NotImplementedError
+
+
+class InProcessCacheBackend(CacheBackend):
+    """Thread-safe LRU with per-entry expiry, bounded to ``max_entries``."""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries or config.cache.max_entries
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+class LocalSharedStore:
+    """In-process stand-in for a Redis-style store, for local runs and tests.
+
+    Implements the ``get``/``set(ex=...)``/``delete``/``scan_iter`` subset
+    SharedCacheBackend uses, storing bytes like the real thing.
+    """
+
+    def __init__(self):
+        self._values: Dict[str, Tuple[bytes, Optional[float]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._values[key]
+                return None
+            return value
+
+    def set(self, key: str, value: bytes, ex: Optional[int] = None) -> bool:
+        with self._lock:
+            expires_at = time.monotonic() + ex if ex else None
+            self._values[key] = (value, expires_at)
+        return True
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            return sum(self._values.pop(key, None) is not None for key in keys)
+
+    def scan_iter(self, match: str = "*") -> Iterator[str]:
+        with self._lock:
+            keys = list(self._values)
+        return (key for key in keys if fnmatch.fnmatchcase(key, match))
+
+
+class SharedCacheBackend(CacheBackend):
+    """Cache in a store shared by every process, e.g. a ``redis.Redis`` client.
+
+    Values are pickled; the store enforces TTLs and its own eviction policy.
+    """
+
+    def __init__(self, store: Any, prefix: str = "registry:cache:"):
+        self.store = store
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.store.get(self.prefix + key)
+        if raw is None:
+            return None
+        return pickle.loads(raw)
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        self.store.set(
+            self.prefix + key,
+            pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+            ex=max(1, math.ceil(ttl_seconds)),
+        )
+
+    def delete(self, key: str) -> None:
+        self.store.delete(self.prefix + key)
+
+    def clear(self) -> None:
+        for key in self.store.scan_iter(match=self.prefix + "*"):
+            self.store.delete(key)
+
+    def size(self) -> int:
+        return sum(1 for _ in self.store.scan_iter(match=self.prefix + "*"))
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters of one cache namespace."""
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    # Reads answered by the request identity map before reaching the cache
+    request_hits: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ReadThroughCache:
+    """Read-through cache of database items for one table.
+
+    Only found items are cached. Writers call ``invalidate`` after changing an
+    item; a load that races with an invalidation is not stored.
+    """
+
+    def __init__(self, namespace: str, ttl_seconds: float, backend: CacheBackend):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.backend = backend
+        self.stats = CacheStats()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def get_or_load(
+        self, key: str, loader: Callable[[], Optional[Dict[str, Any]]]
+    ) -> Optional[Dict[str, Any]]:
+        """Return the cached item for ``key``, loading and caching it on a miss.
+
+        Inside a request scope the identity map answers repeated reads, misses
+        included. Cached items are shared between callers and must not be
+        mutated.
+        """
+        request_items = _request_items.get()
+        if request_items is None:
+            return self._get_or_load(key, loader)
+
+        identity = (self.namespace, key)
+        if identity in request_items:
+            with self._lock:
+                self.stats.request_hits += 1
+            return request_items[identity]
+        item = self._get_or_load(key, loader)
+        request_items[identity] = item
+        return item
+
+    def _get_or_load(
+        self, key: str, loader: Callable[[], Optional[Dict[str, Any]]]
+    ) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return loader()
+
+        cached = self.backend.get(self._key(key))
+        with self._lock:
+            if cached is not None:
+                self.stats.hits += 1
+                return cached
+            self.stats.misses += 1
+            generation = self._generation
+
+        item = loader()
+        if item is not None:
+            with self._lock:
+                if generation == self._generation:
+                    self.backend.set(self._key(key), item, self.ttl_seconds)
+        return item
+
+    def invalidate(self, *keys: str) -> None:
+        """Drop cached items after they were written or deleted."""
+        request_items = _request_items.get()
+        if request_items is not None:
+            for key in keys:
+                request_items.pop((self.namespace, key), None)
+        with self._lock:
+            self._generation += 1
+            self.stats.invalidations += len(keys)
+            for key in keys:
+                self.backend.delete(self._key(key))
+
+
+def _default_backend() -> CacheBackend:
+    """Backend selected by CACHE_BACKEND."""
+    if config.cache.backend == "shared":
+        return SharedCacheBackend(LocalSharedStore())
+    return InProcessCacheBackend()
+
+
+_backend: CacheBackend = _default_backend()
+_caches: Dict[str, ReadThroughCache] = {}
+_caches_lock = threading.Lock()
+
+
+def repository_cache(namespace: str, ttl_seconds: float) -> ReadThroughCache:
+    """Get the process-wide cache for a table, creating it on first use."""
+    with _caches_lock:
+        cache = _caches.get(namespace)
+        if cache is None:
+            ttl = ttl_seconds if config.cache.enabled else 0
+            cache = _caches[namespace] = ReadThroughCache(namespace, ttl, _backend)
+        return cache
+
+
+def use_cache_backend(backend: CacheBackend) -> CacheBackend:
+    """Switch every repository cache to another backend; returns the previous one."""
+    global _backend
+    with _caches_lock:
+        previous, _backend = _backend, backend
+        for cache in _caches.values():
+            cache.backend = backend
+    return previous
+
+
+def clear_caches() -> None:
+    """Empty the cache backend and reset every counter."""
+    with _caches_lock:
+        _backend.clear()
+        for cache in _caches.values():
+            cache.stats = CacheStats()
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters per namespace plus backend totals."""
+    with _caches_lock:
+        caches = dict(_caches)
+    hits = sum(cache.stats.hits for cache in caches.values())
+    misses = sum(cache.stats.misses for cache in caches.values())
+    return {
+        "backend": type(_backend).__name__,
+        "hits": hits,
+        "misses": misses,
+        "hitRate": hits / (hits + misses) if hits + misses else 0.0,
+        "entries": _backend.size(),
+        "evictions": getattr(_backend, "evictions", 0),
+        "namespaces": {
+            namespace: {
+                "ttlSeconds": cache.ttl_seconds,
+                "hits": cache.stats.hits,
+                "misses": cache.stats.misses,
+                "invalidations": cache.stats.invalidations,
+                "requestHits": cache.stats.request_hits,
+                "hitRate": cache.stats.hit_rate,
+            }
+            for namespace, cache in caches.items()
+        },
+    }
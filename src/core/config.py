@@ -3,7 +3,7 @@ Application configuration management.
 """
 
 import os
-from typing import Optional
+from typing import Dict, Optional
 from pydantic import BaseModel, Field
 from enum import Enum
 
@@ -31,6 +31,18 @@ class DatabaseConfig(BaseModel):
             "SUBSCRIPTIONS_TABLE_V2_NAME", "SubscriptionsTableV2"
         )
     )
+    # Aggregate counters maintained on the write path, one item per scope
+    stats_table: str = Field(
+        default_factory=lambda: os.getenv("STATS_TABLE_NAME", "RegistryStatsTable")
+    )
+    # Background admin jobs: one item per job plus one per chunk of its work
+    jobs_table: str = Field(
+        default_factory=lambda: os.getenv("JOBS_TABLE_NAME", "RegistryJobsTable")
+    )
+    # Messages written with the change that causes them, delivered afterwards
+    outbox_table: str = Field(
+        default_factory=lambda: os.getenv("OUTBOX_TABLE_NAME", "RegistryOutboxTable")
+    )
 
     # Legacy tables (for migration compatibility)
     people_table_legacy: str = Field(
@@ -47,6 +59,147 @@ class DatabaseConfig(BaseModel):
 
     region: str = Field(default_factory=lambda: os.getenv("AWS_REGION", "us-east-1"))
 
+    # Global secondary indexes
+    people_email_index: str = Field(
+        default_factory=lambda: os.getenv("PEOPLE_EMAIL_INDEX_NAME", "EmailLowerIndex")
+    )
+    # Sorted GSIs (listPartition hash, sort attribute range) behind keyset
+    # pagination of people, keyed by sort attribute
+    people_sort_indexes: Dict[str, str] = Field(
+        default_factory=lambda: {
+            "firstName": os.getenv("PEOPLE_FIRST_NAME_INDEX_NAME", "FirstNameIndex"),
+            "lastName": os.getenv("PEOPLE_LAST_NAME_INDEX_NAME", "LastNameIndex"),
+            "email": os.getenv("PEOPLE_EMAIL_SORT_INDEX_NAME", "EmailSortIndex"),
+            "createdAt": os.getenv("PEOPLE_CREATED_AT_INDEX_NAME", "CreatedAtIndex"),
+        }
+    )
+    # People are spread over this many listPartition values ("person#0",
+    # "person#1", ...) so no single sort index partition takes every write;
+    # listings merge-read the shards. Changing it needs the index key backfill
+    people_list_shards: int = Field(
+        default_factory=lambda: int(os.getenv("PEOPLE_LIST_SHARDS", "4"))
+    )
+    # Outbox messages by status, in availableAt order, for due-message sweeps
+    outbox_due_index: str = Field(
+        default_factory=lambda: os.getenv(
+            "OUTBOX_DUE_INDEX_NAME", "StatusAvailableAtIndex"
+        )
+    )
+    # Look up subscriptions written before pair IDs through the person index
+    # when the pair-ID GetItem misses. Only needed until
+    # scripts/rekey_subscriptions.py has run
+    subscriptions_legacy_pair_lookup: bool = Field(
+        default_factory=lambda: os.getenv(
+            "SUBSCRIPTIONS_LEGACY_PAIR_LOOKUP", "false"
+        ).lower()
+        == "true"
+    )
+    subscriptions_person_index: str = Field(
+        default_factory=lambda: os.getenv(
+            "SUBSCRIPTIONS_PERSON_INDEX_NAME", "PersonIdIndex"
+        )
+    )
+    subscriptions_project_index: str = Field(
+        default_factory=lambda: os.getenv(
+            "SUBSCRIPTIONS_PROJECT_INDEX_NAME", "ProjectIdIndex"
+        )
+    )
+
+    # "resource" uses the boto3 resource layer; "client" reads through the
+    # low-level client with the schema-aware FastAttributeDecoder
+    client_mode: str = Field(
+        default_factory=lambda: os.getenv("DYNAMODB_CLIENT_MODE", "resource")
+    )
+
+    # "dynamodb" talks to DynamoDB; "memory" uses the in-memory stand-in
+    backend: str = Field(
+        default_factory=lambda: os.getenv("DYNAMODB_BACKEND", "dynamodb")
+    )
+
+    # Parallel scan tuning (segments per scan, max concurrent segments per table)
+    scan_segments: int = Field(
+        default_factory=lambda: int(os.getenv("DYNAMODB_SCAN_SEGMENTS", "4"))
+    )
+    scan_max_workers: int = Field(
+        default_factory=lambda: int(os.getenv("DYNAMODB_SCAN_MAX_WORKERS", "8"))
+    )
+
+    # Threads available to the async repository facade for blocking boto3 calls
+    async_max_workers: int = Field(
+        default_factory=lambda: int(os.getenv("DYNAMODB_ASYNC_MAX_WORKERS", "16"))
+    )
+
+    # Long-lived worker threads per DatabaseClient, shared by parallel scans
+    # and batch writes
+    worker_threads: int = Field(
+        default_factory=lambda: int(os.getenv("DYNAMODB_WORKER_THREADS", "16"))
+    )
+
+    # Concurrent BatchWriteItem chunks submitted by put_many/delete_many
+    batch_write_max_workers: int = Field(
+        default_factory=lambda: int(os.getenv("DYNAMODB_BATCH_WRITE_MAX_WORKERS", "4"))
+    )
+
+    # Attempts per request for throttled (and, for reads, transient) errors
+    max_attempts: int = Field(
+        default_factory=lambda: int(os.getenv("DYNAMODB_MAX_ATTEMPTS", "4"))
+    )
+    # Per-table circuit breaker: consecutive failures to open, seconds to probe
+    breaker_failure_threshold: int = Field(
+        default_factory=lambda: int(os.getenv("DYNAMODB_BREAKER_FAILURES", "5"))
+    )
+    breaker_reset_seconds: float = Field(
+        default_factory=lambda: float(os.getenv("DYNAMODB_BREAKER_RESET_SECONDS", "30"))
+    )
+
+    # Per-request metrics (latency, item counts, consumed capacity)
+    metrics_enabled: bool = Field(
+        default_factory=lambda: os.getenv("DYNAMODB_METRICS_ENABLED", "true").lower()
+        == "true"
+    )
+    metrics_window_seconds: float = Field(
+        default_factory=lambda: float(
+            os.getenv("DYNAMODB_METRICS_WINDOW_SECONDS", "300")
+        )
+    )
+
+
+class CacheConfig(BaseModel):
+    """Repository read cache configuration."""
+
+    enabled: bool = Field(
+        default_factory=lambda: os.getenv("CACHE_ENABLED", "true").lower() == "true"
+    )
+    # "memory" is a per-process LRU; "shared" uses a key-value store
+    backend: str = Field(default_factory=lambda: os.getenv("CACHE_BACKEND", "memory"))
+    max_entries: int = Field(
+        default_factory=lambda: int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+    )
+    people_ttl_seconds: float = Field(
+        default_factory=lambda: float(os.getenv("CACHE_PEOPLE_TTL_SECONDS", "60"))
+    )
+    projects_ttl_seconds: float = Field(
+        default_factory=lambda: float(os.getenv("CACHE_PROJECTS_TTL_SECONDS", "30"))
+    )
+    # Age after which the in-memory people search index is rebuilt
+    search_index_ttl_seconds: float = Field(
+        default_factory=lambda: float(
+            os.getenv("CACHE_SEARCH_INDEX_TTL_SECONDS", "300")
+        )
+    )
+    # Admin dashboard and analytics snapshots are served as-is while younger
+    # than the fresh window, then served stale (up to the max) while refreshing
+    admin_snapshot_fresh_seconds: float = Field(
+        default_factory=lambda: float(
+            os.getenv("CACHE_ADMIN_SNAPSHOT_FRESH_SECONDS", "30")
+        )
+    )
+    admin_snapshot_max_stale_seconds: float = Field(
+        default_factory=lambda: float(
+            os.getenv("CACHE_ADMIN_SNAPSHOT_MAX_STALE_SECONDS", "600")
+        )
+    )
+
 
 class AuthConfig(BaseModel):
     """Authentication configuration."""
@@ -71,6 +224,81 @@ class EmailConfig(BaseModel):
         default_factory=lambda: os.getenv("SES_FROM_EMAIL", "noreply@example.com")
     )
     region: str = Field(default_factory=lambda: os.getenv("AWS_REGION", "us-east-1"))
+    # SES account sending quota (emails per second), shared by bulk sends
+    max_send_rate: float = Field(
+        default_factory=lambda: float(os.getenv("SES_MAX_SEND_RATE", "14"))
+    )
+    # Bulk send calls in flight at once
+    bulk_concurrency: int = Field(
+        default_factory=lambda: int(os.getenv("SES_BULK_CONCURRENCY", "4"))
+    )
+
+
+class OutboxConfig(BaseModel):
+    """Outbox delivery configuration."""
+
+    # Delivery threads per process; 0 leaves delivery to drain runs. Lambda
+    # freezes background threads between invocations, so there delivery is
+    # left to the scheduled drain (main.outbox_handler) by default
+    workers: int = Field(
+        default_factory=lambda: int(
+            os.getenv(
+                "OUTBOX_WORKERS",
+                "0" if os.getenv("AWS_LAMBDA_FUNCTION_NAME") else "4",
+            )
+        )
+    )
+    # Messages waiting in memory for a worker; beyond this, sweeps pick them up
+    queue_size: int = Field(
+        default_factory=lambda: int(os.getenv("OUTBOX_QUEUE_SIZE", "1000"))
+    )
+    # Failed deliveries are retried with exponential backoff from this delay,
+    # and dead-lettered after max_attempts
+    max_attempts: int = Field(
+        default_factory=lambda: int(os.getenv("OUTBOX_MAX_ATTEMPTS", "5"))
+    )
+    retry_base_seconds: float = Field(
+        default_factory=lambda: float(os.getenv("OUTBOX_RETRY_BASE_SECONDS", "30"))
+    )
+    # How often idle workers look for due retries and unannounced messages
+    sweep_interval_seconds: float = Field(
+        default_factory=lambda: float(os.getenv("OUTBOX_SWEEP_INTERVAL_SECONDS", "30"))
+    )
+
+
+class JobsConfig(BaseModel):
+    """Background job configuration."""
+
+    # Jobs run at the same time by this process; 0 leaves them to the
+    # scheduled resume (main.jobs_handler). Lambda freezes background threads
+    # between invocations, so there that is the default
+    workers: int = Field(
+        default_factory=lambda: int(
+            os.getenv(
+                "JOB_WORKERS",
+                "0" if os.getenv("AWS_LAMBDA_FUNCTION_NAME") else "4",
+            )
+        )
+    )
+
+
+class ExportConfig(BaseModel):
+    """Table export configuration."""
+
+    # Lambda buffers whole responses and caps them at 6 MB, so there exports
+    # are uploaded to this bucket and returned as a presigned URL by default
+    to_s3: bool = Field(
+        default_factory=lambda: os.getenv(
+            "EXPORT_TO_S3", "true" if os.getenv("AWS_LAMBDA_FUNCTION_NAME") else "false"
+        ).lower()
+        == "true"
+    )
+    bucket: str = Field(
+        default_factory=lambda: os.getenv("EXPORTS_BUCKET_NAME", "registry-exports")
+    )
+    url_expires_seconds: int = Field(
+        default_factory=lambda: int(os.getenv("EXPORT_URL_EXPIRES_SECONDS", "900"))
+    )
 
 
 class AppConfig(BaseModel):
@@ -90,6 +318,10 @@ class AppConfig(BaseModel):
     database: DatabaseConfig = Field(default_factory=DatabaseConfig)
     auth: AuthConfig = Field(default_factory=AuthConfig)
     email: EmailConfig = Field(default_factory=EmailConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
+    outbox: OutboxConfig = Field(default_factory=OutboxConfig)
+    jobs: JobsConfig = Field(default_factory=JobsConfig)
+    export: ExportConfig = Field(default_factory=ExportConfig)
 
 
 # Global configuration instance
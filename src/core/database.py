@@ -3,46 +3,603 @@ Database connection and utilities.
 Simplified DynamoDB client without field mapping complexity.
 """
 
-import boto3
 import logging
-from typing import Dict, Any, Optional, List
+import queue
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field as dataclass_field
+from decimal import Decimal
+from itertools import islice
+from typing import (
+    Callable,
+    Dict,
+    Any,
+    Optional,
+    List,
+    Iterator,
+    Sequence,
+    Set,
+    Tuple,
+    get_args,
+)
+from boto3.dynamodb.conditions import ConditionBase, ConditionExpressionBuilder
+from boto3.dynamodb.types import TypeSerializer
 from botocore.exceptions import ClientError
 from .config import config
+from .metrics import DatabaseMetrics, database_metrics, READ_OPERATIONS
+from .resilience import CircuitBreaker, error_code, is_throttling, is_unavailable
+from ..exceptions.base_exceptions import DatabaseUnavailableException
+from .storage import BotoBackend, InMemoryBackend, StorageBackend
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class BatchWriteResult:
+    """Per-item outcome of a put_many/delete_many call."""
+
+    succeeded: List[Dict[str, Any]] = dataclass_field(default_factory=list)
+    # Each entry is {"key": <item key>, "error": <reason>}
+    failed: List[Dict[str, Any]] = dataclass_field(default_factory=list)
+    # Item images returned by update_many_if_exists, in ``succeeded`` order
+    items: List[Dict[str, Any]] = dataclass_field(default_factory=list)
+
+    @property
+    def success_count(self) -> int:
+        return len(self.succeeded)
+
+    @property
+    def failure_count(self) -> int:
+        return len(self.failed)
+
+    def merge(self, other: "BatchWriteResult") -> None:
+        """Fold another result into this one."""
+        self.succeeded.extend(other.succeeded)
+        self.failed.extend(other.failed)
+        self.items.extend(other.items)
+
+
+class FastAttributeDecoder:
+    """Decode low-level DynamoDB attribute values into plain Python values.
+
+    Numbers in fields declared as int or float are converted straight to that
+    type instead of going through Decimal; numbers elsewhere stay Decimal, as
+    with the resource layer.
+    """
+
+    def __init__(
+        self,
+        int_fields: Optional[Set[str]] = None,
+        float_fields: Optional[Set[str]] = None,
+    ):
+        self.int_fields = frozenset(int_fields or ())
+        self.float_fields = frozenset(float_fields or ())
+
+    def decode_item(self, item: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Decode a top-level item, applying the field types."""
+        int_fields = self.int_fields
+        float_fields = self.float_fields
+        decode = self.decode
+        result = {}
+        for name, value in item.items():
+            if "N" in value:
+                if name in int_fields:
+                    result[name] = int(value["N"])
+                    continue
+                if name in float_fields:
+                    result[name] = float(value["N"])
+                    continue
+            result[name] = decode(value)
+        return result
+
+    def decode(self, value: Dict[str, Any]) -> Any:
+        """Decode a single attribute value."""
+        ((type_name, raw),) = value.items()
+        if type_name == "S":
+            return raw
+        if type_name == "N":
+            return Decimal(raw)
+        if type_name == "BOOL":
+            return raw
+        if type_name == "NULL":
+            return None
+        if type_name == "M":
+            decode = self.decode
+            return {name: decode(inner) for name, inner in raw.items()}
+        if type_name == "L":
+            decode = self.decode
+            return [decode(inner) for inner in raw]
+        if type_name == "SS":
+            return set(raw)
+        if type_name == "NS":
+            return {Decimal(number) for number in raw}
+        if type_name == "B":
+            return raw
+        if type_name == "BS":
+            return set(raw)
+        raise TypeError(f"Unknown DynamoDB attribute type: {type_name}")
+
+    @classmethod
+    def for_model(cls, model: Any) -> "FastAttributeDecoder":
+        """Build a decoder from the int/float fields of a Pydantic model."""
+        int_fields: Set[str] = set()
+        float_fields: Set[str] = set()
+        for name, model_field in model.model_fields.items():
+            annotation = model_field.annotation
+            # Unwrap Optional[...] and other unions of a single number type
+            candidates = set(get_args(annotation)) or {annotation}
+            candidates.discard(type(None))
+            if candidates == {int}:
+                int_fields.add(name)
+            elif candidates == {float}:
+                float_fields.add(name)
+        return cls(int_fields, float_fields)
+
+
+class TransactionCancelledError(Exception):
+    """A TransactWriteItems call was cancelled.
+
+    ``reasons`` holds one cancellation code per action, in request order
+    (e.g. ``["None", "ConditionalCheckFailed"]``).
+    """
+
+    def __init__(self, reasons: List[str]):
+        super().__init__(f"Transaction cancelled: [{', '.join(reasons)}]")
+        self.reasons = reasons
+
+
 class DatabaseClient:
     """Simplified DynamoDB client with standardized field handling."""
 
-    def __init__(self):
-        self.dynamodb = boto3.resource("dynamodb", region_name=config.database.region)
+    # DynamoDB BatchGetItem accepts at most 100 keys per request
+    BATCH_GET_LIMIT = 100
+    # DynamoDB BatchWriteItem accepts at most 25 put/delete requests
+    BATCH_WRITE_LIMIT = 25
+    BATCH_MAX_ATTEMPTS = 5
+    BATCH_BASE_DELAY = 0.05
+    BATCH_MAX_DELAY = 2.0
+    # How long a missing index is remembered before describing the table again
+    INDEX_RECHECK_SECONDS = 300
+    # DynamoDB refreshes ItemCount about every six hours; caching it briefly
+    # keeps DescribeTable off the request path
+    ITEM_COUNT_TTL_SECONDS = 60
+    # How long a parallel scan waits for a page before scanning segments that
+    # no pool thread has picked up on the consuming thread
+    SCAN_INLINE_AFTER_SECONDS = 0.5
+
+    def __init__(
+        self,
+        client_mode: Optional[str] = None,
+        backend: Optional[StorageBackend] = None,
+        metrics: Optional[DatabaseMetrics] = None,
+    ):
+        self.backend = backend or self._default_backend()
+        self.metrics = metrics or database_metrics
+        self.dynamodb = self.backend.resource()
+        # Low-level client mode: reads skip the resource layer's Decimal-based
+        # deserializer and use a per-table FastAttributeDecoder instead
+        self.client_mode = (
+            client_mode or config.database.client_mode
+        ) == "client" and self.backend.supports_low_level_client
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._decoders: Dict[str, FastAttributeDecoder] = {}
+        self._default_decoder = FastAttributeDecoder()
+        self._serializer = TypeSerializer()
         # Cache for table objects to avoid recreating them
         self._table_cache = {}
+        # (table, index) -> (exists, checked_at) for has_index
+        self._index_cache: Dict[Tuple[str, str], Tuple[bool, float]] = {}
+        self._item_counts: Dict[str, Tuple[int, float]] = {}
+        # boto3 resources are not thread-safe: worker threads get their own
+        self._thread_local = threading.local()
+        # Long-lived pool behind parallel scans and batch writes, so their
+        # threads (and per-thread resources) are reused across calls
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        # Per-table semaphores capping concurrent parallel scan segments
+        self._scan_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._scan_slots_lock = threading.Lock()
+        # Per-table circuit breakers guarding every request
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._breakers_lock = threading.Lock()
+
+    @staticmethod
+    def _default_backend() -> StorageBackend:
+        """Backend selected by DYNAMODB_BACKEND."""
+        if config.database.backend == "memory":
+            backend = InMemoryBackend()
+            backend.create_registry_tables()
+            return backend
+        return BotoBackend()
+
+    def use_backend(self, backend: StorageBackend) -> StorageBackend:
+        """Switch to another storage backend and return the previous one.
+
+        Drops every cached table, index lookup and per-thread resource.
+        """
+        previous = self.backend
+        self.backend = backend
+        self.dynamodb = backend.resource()
+        if not backend.supports_low_level_client:
+            self.client_mode = False
+        self._client = None
+        self._table_cache = {}
+        self._index_cache = {}
+        self._item_counts = {}
+        self._thread_local = threading.local()
+        return previous
 
     def _get_table(self, table_name: str):
         """Get or create a table object with caching."""
+        if threading.current_thread() is not threading.main_thread():
+            return self._get_thread_table(table_name)
         if table_name not in self._table_cache:
             self._table_cache[table_name] = self.dynamodb.Table(table_name)
         return self._table_cache[table_name]
 
+    def _get_thread_table(self, table_name: str):
+        """Get a table object bound to a resource owned by the current thread."""
+        local = self._thread_local
+        resource = self._get_resource()
+        if table_name not in local.tables:
+            local.tables[table_name] = resource.Table(table_name)
+        return local.tables[table_name]
+
+    def _get_resource(self):
+        """Get the DynamoDB resource that is safe to use on the current thread."""
+        if threading.current_thread() is threading.main_thread():
+            return self.dynamodb
+        local = self._thread_local
+        if not hasattr(local, "dynamodb"):
+            local.dynamodb = self.backend.resource()
+            local.tables = {}
+        return local.dynamodb
+
+    def _get_client(self):
+        """Get the shared low-level client (boto3 clients are thread-safe).
+
+        Batch and scan requests from every thread go through this one client,
+        so they share its adaptive rate limiter.
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self.backend.client()
+        return self._client
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the client's long-lived worker pool."""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=config.database.worker_threads,
+                        thread_name_prefix="dynamodb",
+                    )
+        return self._executor
+
+    def _map(
+        self, func: Callable[[Any], Any], items: Sequence[Any], max_workers: int
+    ) -> List[Any]:
+        """Apply ``func`` to every item on the worker pool, results in order.
+
+        The calling thread works through the items too, and helpers that have
+        not started by the time it runs out are cancelled, so a call finishes
+        even when every pool thread is busy.
+        """
+        results: List[Any] = [None] * len(items)
+        claims = iter(range(len(items)))
+        claims_lock = threading.Lock()
+
+        def work() -> None:
+            while True:
+                with claims_lock:
+                    index = next(claims, None)
+                if index is None:
+                    return
+                results[index] = func(items[index])
+
+        executor = self._get_executor()
+        helpers = [
+            executor.submit(work) for _ in range(min(max_workers, len(items)) - 1)
+        ]
+        try:
+            work()
+        finally:
+            for helper in helpers:
+                if not helper.cancel():
+                    helper.result()
+        return results
+
+    def _low_level(self) -> bool:
+        """Whether batch and scan requests can use the shared low-level client."""
+        return self.backend.supports_low_level_client
+
+    def _read_decoder(
+        self, table_name: str
+    ) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """Decoder for low-level reads.
+
+        Client mode applies the table's field types; otherwise numbers stay
+        Decimal, as the resource layer returns them.
+        """
+        if self.client_mode:
+            return self._decoder(table_name)
+        return self._default_decoder.decode_item
+
+    def register_model(self, table_name: str, model: Any) -> None:
+        """Use a model's int/float fields to decode items of a table."""
+        self._decoders[table_name] = FastAttributeDecoder.for_model(model)
+
+    def _decoder(self, table_name: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """The item decoder for a table in low-level client mode."""
+        return self._decoders.get(table_name, self._default_decoder).decode_item
+
+    def _serialize_key(self, key: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Serialize a plain key to the low-level attribute format."""
+        serialize = self._serializer.serialize
+        return {name: serialize(value) for name, value in key.items()}
+
+    def _serialize_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Serialize a BatchWriteItem put or delete request."""
+        if "PutRequest" in request:
+            return {
+                "PutRequest": {
+                    "Item": self._serialize_key(request["PutRequest"]["Item"])
+                }
+            }
+        return {
+            "DeleteRequest": {
+                "Key": self._serialize_key(request["DeleteRequest"]["Key"])
+            }
+        }
+
+    def _low_level_scan_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Scan parameters in the low-level client's format.
+
+        Condition objects are rendered to expression strings and every
+        expression value is serialized.
+        """
+        params = dict(params)
+        names = dict(params.pop("ExpressionAttributeNames", None) or {})
+        values = dict(params.pop("ExpressionAttributeValues", None) or {})
+        condition = params.get("FilterExpression")
+        if isinstance(condition, ConditionBase):
+            built = ConditionExpressionBuilder().build_expression(condition)
+            params["FilterExpression"] = built.condition_expression
+            names.update(built.attribute_name_placeholders)
+            values.update(built.attribute_value_placeholders)
+        if names:
+            params["ExpressionAttributeNames"] = names
+        if values:
+            params["ExpressionAttributeValues"] = self._serialize_key(values)
+        return params
+
+    def _breaker(self, table_name: str) -> CircuitBreaker:
+        """Get the circuit breaker of a table."""
+        with self._breakers_lock:
+            breaker = self._breakers.get(table_name)
+            if breaker is None:
+                breaker = self._breakers[table_name] = CircuitBreaker(
+                    config.database.breaker_failure_threshold,
+                    config.database.breaker_reset_seconds,
+                )
+            return breaker
+
+    def circuit_states(self) -> Dict[str, Dict[str, Any]]:
+        """Circuit breaker state per table."""
+        with self._breakers_lock:
+            breakers = dict(self._breakers)
+        return {name: breaker.snapshot() for name, breaker in breakers.items()}
+
+    def _call(
+        self,
+        table_name: str,
+        operation: str,
+        method: Callable[..., Dict[str, Any]],
+        params: Dict[str, Any],
+        items: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Send one DynamoDB request through the table's circuit breaker.
+
+        Throttled requests are retried with full-jitter backoff, as are
+        transient server and connection errors on reads. When retries run out,
+        or the breaker is open, DatabaseUnavailableException is raised instead
+        of the ClientError so callers cannot mistake it for a missing item.
+        Other errors are raised unchanged.
+        """
+        breaker = self._breaker(table_name)
+        if not breaker.allow_request():
+            raise DatabaseUnavailableException(
+                operation,
+                table_name,
+                "circuit open",
+                retry_after_seconds=breaker.retry_after(),
+            )
+
+        attempts = max(1, config.database.max_attempts)
+        for attempt in range(attempts):
+            try:
+                response = self._send(table_name, operation, method, params, items)
+            except Exception as e:
+                retryable = is_throttling(e) or (
+                    operation in READ_OPERATIONS and is_unavailable(e)
+                )
+                if retryable and attempt + 1 < attempts:
+                    time.sleep(self._backoff_delay(attempt))
+                    continue
+                if not is_unavailable(e):
+                    # The table answered (e.g. a failed condition)
+                    breaker.record_success()
+                    raise
+                breaker.record_failure()
+                logger.warning(
+                    f"{operation} on {table_name} failed after {attempt + 1} "
+                    f"attempts: {error_code(e) or type(e).__name__}"
+                )
+                raise DatabaseUnavailableException(
+                    operation,
+                    table_name,
+                    error_code(e) or type(e).__name__,
+                    retry_after_seconds=breaker.retry_after() or None,
+                    cause=e,
+                ) from e
+            breaker.record_success()
+            return response
+
+    def _send(
+        self,
+        table_name: str,
+        operation: str,
+        method: Callable[..., Dict[str, Any]],
+        params: Dict[str, Any],
+        items: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Send one request and record its metrics.
+
+        Asks for ReturnConsumedCapacity=TOTAL; ``items`` overrides the item
+        count for writes, where the response does not carry one.
+        """
+        metrics = self.metrics
+        if not metrics.enabled:
+            return method(**params)
+
+        started = time.perf_counter()
+        try:
+            response = method(ReturnConsumedCapacity="TOTAL", **params)
+        except Exception:
+            latency_ms = (time.perf_counter() - started) * 1000
+            metrics.record(table_name, operation, latency_ms, error=True)
+            raise
+        latency_ms = (time.perf_counter() - started) * 1000
+        metrics.record_response(table_name, operation, latency_ms, response, items)
+        return response
+
     def get_item(
-        self, table_name: str, key: Dict[str, Any]
+        self, table_name: str, key: Dict[str, Any], consistent_read: bool = False
     ) -> Optional[Dict[str, Any]]:
-        """Get a single item from DynamoDB."""
+        """Get a single item from DynamoDB.
+
+        Returns None only when the item does not exist; errors are raised.
+        ``consistent_read`` reflects every write acknowledged before the read.
+        """
+        params: Dict[str, Any] = {"ConsistentRead": True} if consistent_read else {}
         try:
+            if self.client_mode:
+                response = self._call(
+                    table_name,
+                    "GetItem",
+                    self._get_client().get_item,
+                    {
+                        "TableName": table_name,
+                        "Key": self._serialize_key(key),
+                        **params,
+                    },
+                )
+                item = response.get("Item")
+                return self._decoder(table_name)(item) if item else None
             table = self._get_table(table_name)
-            response = table.get_item(Key=key)
+            response = self._call(
+                table_name, "GetItem", table.get_item, {"Key": key, **params}
+            )
             return response.get("Item")
         except ClientError as e:
             logger.error(f"Error getting item from {table_name}: {e}")
-            return None
+            raise
+
+    def get_many(
+        self, table_name: str, keys: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Get many items with BatchGetItem.
+
+        Results line up with ``keys``; items that do not exist come back as
+        None. Keys are deduplicated, sent in chunks of 100, and any
+        UnprocessedKeys are retried with jittered exponential backoff. Errors,
+        including keys still unprocessed after every retry, are raised rather
+        than reported as missing items.
+        """
+        if not keys:
+            return []
+
+        unique_keys: Dict[Tuple, Dict[str, Any]] = {}
+        for key in keys:
+            unique_keys.setdefault(self._key_signature(key), key)
+
+        key_names = list(keys[0].keys())
+        pending = list(unique_keys.values())
+        found: Dict[Tuple, Dict[str, Any]] = {}
+        for start in range(0, len(pending), self.BATCH_GET_LIMIT):
+            chunk = pending[start : start + self.BATCH_GET_LIMIT]
+            for item in self._batch_get_chunk(table_name, chunk):
+                key = {name: item.get(name) for name in key_names}
+                found[self._key_signature(key)] = item
+
+        return [found.get(self._key_signature(key)) for key in keys]
+
+    def _batch_get_chunk(
+        self, table_name: str, keys: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Read one BatchGetItem chunk, retrying unprocessed keys."""
+        low_level = self._low_level()
+        if low_level:
+            batch_get_item = self._get_client().batch_get_item
+            keys = [self._serialize_key(key) for key in keys]
+            decode_item = self._read_decoder(table_name)
+        else:
+            batch_get_item = self._get_resource().batch_get_item
+        request = {table_name: {"Keys": keys}}
+        items: List[Dict[str, Any]] = []
+
+        for attempt in range(self.BATCH_MAX_ATTEMPTS):
+            try:
+                response = self._call(
+                    table_name,
+                    "BatchGetItem",
+                    batch_get_item,
+                    {"RequestItems": request},
+                )
+            except ClientError as e:
+                logger.error(f"Error batch getting items from {table_name}: {e}")
+                raise
+
+            found = response.get("Responses", {}).get(table_name, [])
+            if low_level:
+                found = [decode_item(item) for item in found]
+            items.extend(found)
+            request = response.get("UnprocessedKeys") or {}
+            if not request:
+                return items
+            time.sleep(self._backoff_delay(attempt))
+
+        remaining = len(request.get(table_name, {}).get("Keys", []))
+        logger.error(
+            f"{remaining} keys still unprocessed in {table_name} "
+            f"after {self.BATCH_MAX_ATTEMPTS} attempts"
+        )
+        raise DatabaseUnavailableException(
+            "BatchGetItem", table_name, f"{remaining} keys still unprocessed"
+        )
+
+    @classmethod
+    def _backoff_delay(cls, attempt: int) -> float:
+        """Full-jitter exponential backoff delay for a retry attempt."""
+        return random.uniform(
+            0, min(cls.BATCH_MAX_DELAY, cls.BATCH_BASE_DELAY * 2**attempt)
+        )
+
+    @staticmethod
+    def _key_signature(key: Dict[str, Any]) -> Tuple:
+        """Hashable, type-insensitive signature for a primary key."""
+        return tuple(sorted((name, str(value)) for name, value in key.items()))
 
     def put_item(self, table_name: str, item: Dict[str, Any]) -> bool:
         """Put an item into DynamoDB."""
         try:
             table = self._get_table(table_name)
-            table.put_item(Item=item)
+            self._call(table_name, "PutItem", table.put_item, {"Item": item}, items=1)
             return True
         except ClientError as e:
             logger.error(f"Error putting item to {table_name}: {e}")
@@ -55,41 +612,342 @@ class DatabaseClient:
     def update_item(
         self, table_name: str, key: Dict[str, Any], update_data: Dict[str, Any]
     ) -> bool:
-        """Update an item in DynamoDB."""
+        """Update an item in DynamoDB.
+
+        A failed condition is reported as False; other errors are raised.
+        """
+        try:
+            table = self._get_table(table_name)
+            self._call(
+                table_name,
+                "UpdateItem",
+                table.update_item,
+                self._build_update_params(key, update_data),
+                items=1,
+            )
+            return True
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return False
+            logger.error(f"Error updating item in {table_name}: {e}")
+            raise e
+
+    def update_item_if_exists(
+        self,
+        table_name: str,
+        key: Dict[str, Any],
+        update_data: Dict[str, Any],
+        return_old: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """Update an existing item in one round trip and return the new item.
+
+        The update is conditioned on the key existing, so a missing item is
+        reported as None instead of being created. Other errors are raised.
+        With ``return_old`` the item as it was before the update is returned.
+        """
+        params = self._build_update_params(key, update_data)
+        conditions = []
+        for name in key:
+            params["ExpressionAttributeNames"][f"#{name}"] = name
+            conditions.append(f"attribute_exists(#{name})")
+        params["ConditionExpression"] = " AND ".join(conditions)
+        params["ReturnValues"] = "ALL_OLD" if return_old else "ALL_NEW"
+
         try:
             table = self._get_table(table_name)
+            response = self._call(
+                table_name, "UpdateItem", table.update_item, params, items=1
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return None
+            logger.error(f"Error updating item in {table_name}: {e}")
+            raise e
+        return response.get("Attributes")
 
-            # Build update expression
-            update_expression = "SET "
-            expression_values = {}
-            expression_names = {}
+    def update_many_if_exists(
+        self,
+        table_name: str,
+        keys: List[Dict[str, Any]],
+        update_data: Dict[str, Any],
+        return_old: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> BatchWriteResult:
+        """Apply the same update_item_if_exists to many keys in parallel.
 
-            for field, value in update_data.items():
-                if field != "id":  # Don't update the key
-                    attr_name = f"#{field}"
-                    attr_value = f":{field}"
-                    update_expression += f"{attr_name} = {attr_value}, "
-                    expression_names[attr_name] = field
-
-                    # Convert nested dicts recursively to ensure proper serialization
-                    if isinstance(value, dict):
-                        expression_values[attr_value] = self._serialize_dict(value)
-                    else:
-                        expression_values[attr_value] = value
+        Every key gets its own conditional UpdateItem, so only the updated
+        attributes are written and concurrent changes to other attributes are
+        kept. Keys that do not exist fail with "Item not found"; any other
+        error fails just its key. The returned images are in ``result.items``.
+        """
+        result = BatchWriteResult()
+        unique: Dict[Tuple, Dict[str, Any]] = {}
+        for key in keys:
+            unique.setdefault(self._key_signature(key), key)
+        if not unique:
+            return result
+
+        def update(key: Dict[str, Any]) -> Tuple[Dict[str, Any], Any]:
+            try:
+                return key, self.update_item_if_exists(
+                    table_name, key, update_data, return_old
+                )
+            except Exception as e:
+                return key, e
+
+        outcomes = self._map(
+            update,
+            list(unique.values()),
+            max_workers or config.database.batch_write_max_workers,
+        )
+        for key, outcome in outcomes:
+            if isinstance(outcome, Exception):
+                result.failed.append({"key": key, "error": str(outcome)})
+            elif outcome is None:
+                result.failed.append({"key": key, "error": "Item not found"})
+            else:
+                result.succeeded.append(key)
+                result.items.append(outcome)
+        return result
+
+    def update_item_where(
+        self,
+        table_name: str,
+        key: Dict[str, Any],
+        update_data: Dict[str, Any],
+        condition: ConditionBase,
+    ) -> Optional[Dict[str, Any]]:
+        """Update an item only if it meets ``condition`` and return the new item.
 
-            # Remove trailing comma and space
-            update_expression = update_expression.rstrip(", ")
+        A failed condition is reported as None; other errors are raised.
+        """
+        params = self._build_update_params(key, update_data)
+        params["ConditionExpression"] = condition
+        params["ReturnValues"] = "ALL_NEW"
 
-            table.update_item(
-                Key=key,
-                UpdateExpression=update_expression,
-                ExpressionAttributeNames=expression_names,
-                ExpressionAttributeValues=expression_values,
+        try:
+            table = self._get_table(table_name)
+            response = self._call(
+                table_name, "UpdateItem", table.update_item, params, items=1
             )
-            return True
         except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return None
             logger.error(f"Error updating item in {table_name}: {e}")
-            return False
+            raise e
+        return response.get("Attributes")
+
+    def update_action(
+        self,
+        table_name: str,
+        key: Dict[str, Any],
+        update_data: Dict[str, Any],
+        condition: str,
+        names: Optional[Dict[str, str]] = None,
+        values: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """The update_item SET of ``update_data`` as a transact_write action.
+
+        ``condition`` is an expression string with its placeholders in
+        ``names`` and ``values``. Updated fields use the ``#field`` and
+        ``:field`` placeholders; ``values`` must not reuse the latter.
+        """
+        params = self._build_update_params(key, update_data)
+        params["ConditionExpression"] = condition
+        params["ExpressionAttributeNames"].update(names or {})
+        params["ExpressionAttributeValues"].update(values or {})
+        return {"Update": {"TableName": table_name, **params}}
+
+    def _build_update_params(
+        self, key: Dict[str, Any], update_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build UpdateItem parameters that SET every field except the key."""
+        # Build update expression
+        update_expression = "SET "
+        expression_values = {}
+        expression_names = {}
+
+        for field, value in update_data.items():
+            if field not in key:  # Don't update the key
+                attr_name = f"#{field}"
+                attr_value = f":{field}"
+                update_expression += f"{attr_name} = {attr_value}, "
+                expression_names[attr_name] = field
+
+                # Convert nested dicts recursively to ensure proper serialization
+                if isinstance(value, dict):
+                    expression_values[attr_value] = self._serialize_dict(value)
+                else:
+                    expression_values[attr_value] = value
+
+        # Remove trailing comma and space
+        update_expression = update_expression.rstrip(", ")
+
+        return {
+            "Key": key,
+            "UpdateExpression": update_expression,
+            "ExpressionAttributeNames": expression_names,
+            "ExpressionAttributeValues": expression_values,
+        }
+
+    def add_to_counter(
+        self,
+        table_name: str,
+        key: Dict[str, Any],
+        attribute: str,
+        amount: int,
+        limit_attribute: Optional[str] = None,
+        update_data: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Atomically ADD ``amount`` to a numeric attribute of an existing item.
+
+        See _build_counter_params for the conditions applied. Returns the
+        updated item, or None when a condition fails.
+        """
+        params = self._build_counter_params(
+            key, attribute, amount, limit_attribute, update_data
+        )
+        params["ReturnValues"] = "ALL_NEW"
+        try:
+            table = self._get_table(table_name)
+            response = self._call(
+                table_name, "UpdateItem", table.update_item, params, items=1
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return None
+            logger.error(f"Error updating counter in {table_name}: {e}")
+            raise e
+        return response.get("Attributes")
+
+    def increment(
+        self, table_name: str, key: Dict[str, Any], deltas: Dict[str, int]
+    ) -> bool:
+        """ADD each delta to its numeric attribute in one UpdateItem.
+
+        Missing attributes (and a missing item) start from zero. A failed
+        condition is reported as False; other errors are raised.
+        """
+        if not deltas:
+            return True
+        clauses = []
+        names: Dict[str, str] = {}
+        values: Dict[str, Any] = {}
+        for position, (attribute, amount) in enumerate(deltas.items()):
+            clauses.append(f"#c{position} :c{position}")
+            names[f"#c{position}"] = attribute
+            values[f":c{position}"] = amount
+        params = {
+            "Key": key,
+            "UpdateExpression": "ADD " + ", ".join(clauses),
+            "ExpressionAttributeNames": names,
+            "ExpressionAttributeValues": values,
+        }
+        try:
+            table = self._get_table(table_name)
+            self._call(table_name, "UpdateItem", table.update_item, params, items=1)
+            return True
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return False
+            logger.error(f"Error incrementing counters in {table_name}: {e}")
+            raise e
+
+    def counter_update_action(
+        self,
+        table_name: str,
+        key: Dict[str, Any],
+        attribute: str,
+        amount: int,
+        limit_attribute: Optional[str] = None,
+        update_data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """The add_to_counter update as a transact_write action."""
+        params = self._build_counter_params(
+            key, attribute, amount, limit_attribute, update_data
+        )
+        return {"Update": {"TableName": table_name, **params}}
+
+    def _build_counter_params(
+        self,
+        key: Dict[str, Any],
+        attribute: str,
+        amount: int,
+        limit_attribute: Optional[str] = None,
+        update_data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Build an ``ADD`` counter update conditioned on the item existing.
+
+        Increments with ``limit_attribute`` only succeed while the counter is
+        below that attribute; decrements only succeed if the counter would not
+        drop below zero.
+        """
+        if limit_attribute and amount != 1:
+            raise ValueError("Counter limits are only enforced for increments of 1")
+
+        names = {"#counter": attribute}
+        values: Dict[str, Any] = {":amount": amount}
+        conditions = []
+        for name in key:
+            names[f"#{name}"] = name
+            conditions.append(f"attribute_exists(#{name})")
+        if limit_attribute:
+            names["#limit"] = limit_attribute
+            conditions.append("(attribute_not_exists(#counter) OR #counter < #limit)")
+        if amount < 0:
+            values[":needed"] = -amount
+            conditions.append("#counter >= :needed")
+
+        update_expression = "ADD #counter :amount"
+        if update_data:
+            assignments = []
+            for field, value in update_data.items():
+                names[f"#{field}"] = field
+                values[f":{field}"] = value
+                assignments.append(f"#{field} = :{field}")
+            update_expression += " SET " + ", ".join(assignments)
+
+        return {
+            "Key": key,
+            "UpdateExpression": update_expression,
+            "ConditionExpression": " AND ".join(conditions),
+            "ExpressionAttributeNames": names,
+            "ExpressionAttributeValues": values,
+        }
+
+    def transact_write(self, actions: List[Dict[str, Any]]) -> None:
+        """Apply several writes atomically with TransactWriteItems.
+
+        Actions use the resource-style shape with plain Python values, e.g.
+        ``{"Put": {"TableName": ..., "Item": {...}}}``. Raises
+        TransactionCancelledError when any condition fails.
+        """
+        # The resource's client serializes plain values like Table methods do
+        client = self._get_resource().meta.client
+        # Metrics are recorded against the first table; capacity is split per table
+        (first_action,) = actions[0].values()
+        try:
+            self._call(
+                first_action["TableName"],
+                "TransactWriteItems",
+                client.transact_write_items,
+                {"TransactItems": actions},
+                items=len(actions),
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "TransactionCanceledException":
+                logger.error(f"Error in write transaction: {e}")
+                raise e
+            reasons = [
+                reason.get("Code", "None")
+                for reason in e.response.get("CancellationReasons", [])
+            ]
+            if not reasons:
+                # Some endpoints only report the reasons in the error message
+                message = e.response["Error"].get("Message", "")
+                listed = message[message.rfind("[") + 1 : message.rfind("]")]
+                reasons = [reason.strip() for reason in listed.split(",")]
+            raise TransactionCancelledError(reasons) from e
 
     def _serialize_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Recursively serialize dictionary for DynamoDB, preserving camelCase."""
@@ -102,57 +960,614 @@ class DatabaseClient:
         return result
 
     def delete_item(self, table_name: str, key: Dict[str, Any]) -> bool:
-        """Delete an item from DynamoDB."""
+        """Delete an item from DynamoDB.
+
+        A failed condition is reported as False; other errors are raised.
+        """
         try:
             table = self._get_table(table_name)
-            table.delete_item(Key=key)
+            self._call(
+                table_name, "DeleteItem", table.delete_item, {"Key": key}, items=1
+            )
             return True
         except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return False
+            logger.error(f"Error deleting item from {table_name}: {e}")
+            raise e
+
+    def delete_item_returning(
+        self, table_name: str, key: Dict[str, Any]
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Delete an item and return it as it was.
+
+        Returns ``(deleted, old_item)``; ``old_item`` is None when nothing was
+        stored under the key. A failed condition is reported as
+        ``(False, None)``; other errors are raised.
+        """
+        try:
+            table = self._get_table(table_name)
+            response = self._call(
+                table_name,
+                "DeleteItem",
+                table.delete_item,
+                {"Key": key, "ReturnValues": "ALL_OLD"},
+                items=1,
+            )
+            return True, response.get("Attributes")
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return False, None
             logger.error(f"Error deleting item from {table_name}: {e}")
-            return False
+            raise e
+
+    def put_many(
+        self,
+        table_name: str,
+        items: List[Dict[str, Any]],
+        key_names: Sequence[str] = ("id",),
+        max_workers: Optional[int] = None,
+    ) -> BatchWriteResult:
+        """Put many items with BatchWriteItem.
+
+        Items are sent in chunks of 25, with chunks submitted in parallel.
+        ``key_names`` identifies each item in the returned result; when an item
+        key repeats, the last item wins.
+        """
+        requests = [
+            (
+                {name: item.get(name) for name in key_names},
+                {"PutRequest": {"Item": item}},
+            )
+            for item in items
+        ]
+        return self._batch_write(table_name, requests, max_workers)
+
+    def delete_many(
+        self,
+        table_name: str,
+        keys: List[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+    ) -> BatchWriteResult:
+        """Delete many items by key with BatchWriteItem.
+
+        Like delete_item, deleting a key that does not exist succeeds.
+        """
+        requests = [(key, {"DeleteRequest": {"Key": key}}) for key in keys]
+        return self._batch_write(table_name, requests, max_workers)
+
+    def _batch_write(
+        self,
+        table_name: str,
+        requests: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+        max_workers: Optional[int] = None,
+    ) -> BatchWriteResult:
+        """Deduplicate, chunk and submit write requests."""
+        result = BatchWriteResult()
+        if not requests:
+            return result
+
+        # A single BatchWriteItem call rejects two requests for the same key
+        unique: Dict[Tuple, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+        for key, request in requests:
+            unique[self._key_signature(key)] = (key, request)
+        pending = list(unique.values())
+        chunks = [
+            pending[start : start + self.BATCH_WRITE_LIMIT]
+            for start in range(0, len(pending), self.BATCH_WRITE_LIMIT)
+        ]
+
+        for chunk_result in self._map(
+            lambda chunk: self._batch_write_chunk(table_name, chunk),
+            chunks,
+            max_workers or config.database.batch_write_max_workers,
+        ):
+            result.merge(chunk_result)
+        return result
+
+    def _batch_write_chunk(
+        self,
+        table_name: str,
+        chunk: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+    ) -> BatchWriteResult:
+        """Write one BatchWriteItem chunk, retrying unprocessed items."""
+        low_level = self._low_level()
+        if low_level:
+            batch_write_item = self._get_client().batch_write_item
+            chunk = [(key, self._serialize_request(request)) for key, request in chunk]
+            decode_item = self._default_decoder.decode_item
+        else:
+            batch_write_item = self._get_resource().batch_write_item
+        result = BatchWriteResult()
+        pending = {self._key_signature(key): (key, request) for key, request in chunk}
+        key_names = list(chunk[0][0].keys())
+
+        for attempt in range(self.BATCH_MAX_ATTEMPTS):
+            try:
+                response = self._call(
+                    table_name,
+                    "BatchWriteItem",
+                    batch_write_item,
+                    {
+                        "RequestItems": {
+                            table_name: [request for _, request in pending.values()]
+                        }
+                    },
+                    items=len(pending),
+                )
+            except ClientError as e:
+                logger.error(f"Error batch writing items to {table_name}: {e}")
+                result.failed.extend(
+                    {"key": key, "error": str(e)} for key, _ in pending.values()
+                )
+                return result
+
+            unprocessed = {}
+            for request in response.get("UnprocessedItems", {}).get(table_name, []):
+                if "PutRequest" in request:
+                    item = request["PutRequest"]["Item"]
+                    key = {name: item.get(name) for name in key_names}
+                else:
+                    key = request["DeleteRequest"]["Key"]
+                if low_level:
+                    key = decode_item(key)
+                signature = self._key_signature(key)
+                if signature in pending:
+                    unprocessed[signature] = pending[signature]
+
+            result.succeeded.extend(
+                key
+                for signature, (key, _) in pending.items()
+                if signature not in unprocessed
+            )
+            pending = unprocessed
+            if not pending:
+                return result
+            time.sleep(self._backoff_delay(attempt))
+
+        logger.error(
+            f"{len(pending)} items still unprocessed in {table_name} "
+            f"after {self.BATCH_MAX_ATTEMPTS} attempts"
+        )
+        result.failed.extend(
+            {"key": key, "error": "Unprocessed after retries"}
+            for key, _ in pending.values()
+        )
+        return result
+
+    def scan_pages(
+        self,
+        table_name: str,
+        page_size: Optional[int] = None,
+        exclusive_start_key: Optional[Dict[str, Any]] = None,
+        **scan_kwargs: Any,
+    ) -> Iterator[Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+        """Scan a table page by page, following LastEvaluatedKey.
+
+        Yields ``(items, last_evaluated_key)`` for every page. The key is None on
+        the last page; otherwise it can be passed back as ``exclusive_start_key``
+        to resume the scan later. Errors are raised from the iterator, so a
+        scan never ends early looking complete.
+        """
+        params = dict(scan_kwargs)
+        if page_size:
+            params["Limit"] = page_size
+
+        # Scans from every thread share the low-level client (and its rate
+        # limiter) when the backend has one
+        low_level = self._low_level()
+        if low_level:
+            scan = self._get_client().scan
+            params = self._low_level_scan_params(params)
+            params["TableName"] = table_name
+            decode_item = self._read_decoder(table_name)
+        else:
+            scan = self._get_table(table_name).scan
+
+        start_key = exclusive_start_key
+        while True:
+            if start_key:
+                params["ExclusiveStartKey"] = (
+                    self._serialize_key(start_key) if low_level else start_key
+                )
+            try:
+                response = self._call(table_name, "Scan", scan, params)
+            except ClientError as e:
+                logger.error(f"Error scanning table {table_name}: {e}")
+                raise
+
+            items = response.get("Items", [])
+            start_key = response.get("LastEvaluatedKey")
+            if low_level:
+                items = [decode_item(item) for item in items]
+                if start_key:
+                    start_key = self._default_decoder.decode_item(start_key)
+            yield items, start_key
+            if not start_key:
+                return
+
+    def iter_scan(
+        self,
+        table_name: str,
+        page_size: Optional[int] = None,
+        exclusive_start_key: Optional[Dict[str, Any]] = None,
+        **scan_kwargs: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield every item in a table, fetching pages lazily.
+
+        Callers can stop iterating at any point and no further pages are read.
+        """
+        for items, _ in self.scan_pages(
+            table_name, page_size, exclusive_start_key, **scan_kwargs
+        ):
+            yield from items
+
+    def scan_page(
+        self,
+        table_name: str,
+        limit: int,
+        exclusive_start_key: Optional[Dict[str, Any]] = None,
+        **scan_kwargs: Any,
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Read a single scan page and return it with the resume token."""
+        for items, last_key in self.scan_pages(
+            table_name, limit, exclusive_start_key, **scan_kwargs
+        ):
+            return items, last_key
+        return [], None
 
     def scan_table(
         self, table_name: str, limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
-        """Scan a table and return all items."""
+        """Scan a table and return all items across every page."""
+        items = self.iter_scan(table_name, page_size=limit)
+        if limit:
+            return list(islice(items, limit))
+        return list(items)
+
+    def parallel_scan(
+        self,
+        table_name: str,
+        total_segments: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        page_size: Optional[int] = None,
+        **scan_kwargs: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """Scan a table with Segment/TotalSegments on the client's worker pool.
+
+        Pages are yielded as soon as any segment returns them, so results stream
+        in arrival order (not key order). Concurrent segment reads per table are
+        capped by ``config.database.scan_max_workers`` across all callers. If
+        no pool thread picks up the remaining segments (the pool is busy), the
+        consuming thread scans them itself. Closing the generator early stops
+        the remaining segment workers. An error in any segment is raised to the
+        consumer rather than ending the scan early with partial results.
+        """
+        segments = total_segments or config.database.scan_segments
+        if segments <= 1:
+            yield from self.iter_scan(table_name, page_size, **scan_kwargs)
+            return
+
+        workers = min(segments, max_workers or config.database.scan_max_workers)
+        pages: queue.Queue = queue.Queue(maxsize=workers * 2)
+        stop = threading.Event()
+        segment_done = object()
+        errors: List[Exception] = []
+        slots = self._get_scan_slots(table_name)
+        unclaimed: queue.SimpleQueue = queue.SimpleQueue()
+        for segment in range(segments):
+            unclaimed.put(segment)
+
+        def claim() -> Optional[int]:
+            try:
+                return unclaimed.get_nowait()
+            except queue.Empty:
+                return None
+
+        def segment_pages(segment: int):
+            return self.scan_pages(
+                table_name,
+                page_size,
+                Segment=segment,
+                TotalSegments=segments,
+                **scan_kwargs,
+            )
+
+        def scan_segments() -> None:
+            segment = claim()
+            while segment is not None and not stop.is_set():
+                try:
+                    with slots:
+                        for items, _ in segment_pages(segment):
+                            if stop.is_set() or not self._offer(pages, items, stop):
+                                return
+                except Exception as e:
+                    logger.error(
+                        f"Error in scan segment {segment} of {table_name}: {e}"
+                    )
+                    errors.append(e)
+                finally:
+                    self._offer(pages, segment_done, stop)
+                segment = claim()
+
+        executor = self._get_executor()
+        runners: List[Future] = [executor.submit(scan_segments) for _ in range(workers)]
         try:
-            table = self._get_table(table_name)
+            remaining = segments
+            while remaining:
+                try:
+                    page = pages.get(timeout=self.SCAN_INLINE_AFTER_SECONDS)
+                except queue.Empty:
+                    # A runner still queued means the pool is busy: take over
+                    # its share so the scan cannot wait on itself
+                    for runner in runners:
+                        if runner.cancel():
+                            runners.remove(runner)
+                            break
+                    else:
+                        continue
+                    segment = claim()
+                    while segment is not None:
+                        for items, _ in segment_pages(segment):
+                            yield from items
+                        remaining -= 1
+                        segment = claim()
+                    continue
+                if page is segment_done:
+                    if errors:
+                        raise errors[0]
+                    remaining -= 1
+                    continue
+                yield from page
+        finally:
+            stop.set()
+            for runner in runners:
+                runner.cancel()
 
-            if limit:
-                response = table.scan(Limit=limit)
-            else:
-                response = table.scan()
+    def parallel_scan_table(
+        self,
+        table_name: str,
+        total_segments: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Parallel-scan a table and return all items."""
+        return list(self.parallel_scan(table_name, total_segments, max_workers))
 
-            return response.get("Items", [])
-        except ClientError as e:
-            logger.error(f"Error scanning table {table_name}: {e}")
-            return []
+    def scan_attributes(
+        self,
+        table_name: str,
+        attributes: Sequence[str],
+        parallel: bool = True,
+        **scan_kwargs: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream only the named attributes of every item.
+
+        Attribute names go through placeholders, so reserved words such as
+        ``status`` need no special handling by callers. Other scan arguments,
+        such as a FilterExpression, are passed through.
+        """
+        names = {f"#a{position}": name for position, name in enumerate(attributes)}
+        scan_kwargs.update(
+            ProjectionExpression=", ".join(names), ExpressionAttributeNames=names
+        )
+        if parallel:
+            return self.parallel_scan(table_name, **scan_kwargs)
+        return self.iter_scan(table_name, **scan_kwargs)
+
+    def _get_scan_slots(self, table_name: str) -> threading.BoundedSemaphore:
+        """Get the semaphore limiting concurrent scan segments for a table."""
+        with self._scan_slots_lock:
+            if table_name not in self._scan_slots:
+                self._scan_slots[table_name] = threading.BoundedSemaphore(
+                    config.database.scan_max_workers
+                )
+            return self._scan_slots[table_name]
+
+    @staticmethod
+    def _offer(pages: queue.Queue, page: Any, stop: threading.Event) -> bool:
+        """Put a page on the merge queue unless the consumer has gone away."""
+        while not stop.is_set():
+            try:
+                pages.put(page, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def query_pages(
+        self,
+        table_name: str,
+        index_name: str,
+        key_condition: Dict[str, Any],
+        page_size: Optional[int] = None,
+        exclusive_start_key: Optional[Dict[str, Any]] = None,
+        scan_index_forward: bool = True,
+    ) -> Iterator[Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+        """Query a GSI page by page, following LastEvaluatedKey.
+
+        Yields ``(items, last_evaluated_key)`` like scan_pages, and like it
+        raises errors instead of stopping. On an index with a range key,
+        ``scan_index_forward=False`` returns items in descending range order.
+        """
+        # Build key condition expression; names go through placeholders so
+        # reserved words such as ``status`` can be index keys
+        conditions = []
+        expression_names = {}
+        expression_values = {}
+
+        for field, value in key_condition.items():
+            conditions.append(f"#{field} = :{field}")
+            expression_names[f"#{field}"] = field
+            expression_values[f":{field}"] = value
+
+        low_level = self.client_mode
+        if low_level:
+            query = self._get_client().query
+            expression_values = self._serialize_key(expression_values)
+            decode_item = self._decoder(table_name)
+        else:
+            query = self._get_table(table_name).query
+
+        params = {
+            "IndexName": index_name,
+            "KeyConditionExpression": " AND ".join(conditions),
+            "ExpressionAttributeNames": expression_names,
+            "ExpressionAttributeValues": expression_values,
+        }
+        if low_level:
+            params["TableName"] = table_name
+        if page_size:
+            params["Limit"] = page_size
+        if not scan_index_forward:
+            params["ScanIndexForward"] = False
+
+        start_key = exclusive_start_key
+        while True:
+            if start_key:
+                params["ExclusiveStartKey"] = (
+                    self._serialize_key(start_key) if low_level else start_key
+                )
+            try:
+                response = self._call(table_name, "Query", query, params)
+            except ClientError as e:
+                logger.error(f"Error querying {table_name} by index {index_name}: {e}")
+                raise
+
+            items = response.get("Items", [])
+            start_key = response.get("LastEvaluatedKey")
+            if low_level:
+                items = [decode_item(item) for item in items]
+                if start_key:
+                    start_key = self._default_decoder.decode_item(start_key)
+            yield items, start_key
+            if not start_key:
+                return
+
+    def query_page(
+        self,
+        table_name: str,
+        index_name: str,
+        key_condition: Dict[str, Any],
+        limit: int,
+        exclusive_start_key: Optional[Dict[str, Any]] = None,
+        scan_index_forward: bool = True,
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Read a single GSI query page and return it with the resume token."""
+        for items, last_key in self.query_pages(
+            table_name,
+            index_name,
+            key_condition,
+            limit,
+            exclusive_start_key,
+            scan_index_forward,
+        ):
+            return items, last_key
+        return [], None
+
+    def query_page_many(
+        self,
+        table_name: str,
+        index_name: str,
+        queries: Sequence[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]],
+        limit: int,
+        scan_index_forward: bool = True,
+    ) -> List[Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+        """Read one page of several GSI queries on the client's worker pool.
+
+        ``queries`` pairs a key condition with the key to resume after (or
+        None). Pages come back in the order of ``queries``, each with its
+        resume token, as query_page returns them.
+        """
+        return self._map(
+            lambda query: self.query_page(
+                table_name,
+                index_name,
+                query[0],
+                limit=limit,
+                exclusive_start_key=query[1],
+                scan_index_forward=scan_index_forward,
+            ),
+            queries,
+            config.database.scan_max_workers,
+        )
 
     def query_by_index(
-        self, table_name: str, index_name: str, key_condition: Dict[str, Any]
+        self,
+        table_name: str,
+        index_name: str,
+        key_condition: Dict[str, Any],
+        limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
-        """Query a table by GSI."""
+        """Query a table by GSI and return items across every page."""
+        items = (
+            item
+            for page, _ in self.query_pages(
+                table_name, index_name, key_condition, page_size=limit
+            )
+            for item in page
+        )
+        if limit:
+            return list(islice(items, limit))
+        return list(items)
+
+    def has_index(self, table_name: str, index_name: str) -> bool:
+        """Check whether a table has an ACTIVE global secondary index.
+
+        Positive answers are cached for the life of the client; negative ones
+        are re-checked every INDEX_RECHECK_SECONDS so a newly built index is
+        picked up without a restart. Only a missing table counts as having no
+        index: other DescribeTable errors (e.g. AccessDenied when the role
+        lacks dynamodb:DescribeTable) are raised instead of silently turning
+        every lookup into a full scan.
+        """
+        cache_key = (table_name, index_name)
+        cached = self._index_cache.get(cache_key)
+        if cached is not None:
+            exists, checked_at = cached
+            if exists or time.monotonic() - checked_at < self.INDEX_RECHECK_SECONDS:
+                return exists
+
         try:
-            table = self._get_table(table_name)
+            client = self._get_resource().meta.client
+            description = client.describe_table(TableName=table_name)["Table"]
+        except ClientError as e:
+            if error_code(e) != "ResourceNotFoundException":
+                logger.error(f"Error describing {table_name}: {e}")
+                raise
+            description = {}
 
-            # Build key condition expression
-            key_condition_expression = ""
-            expression_values = {}
+        exists = any(
+            index.get("IndexName") == index_name
+            and index.get("IndexStatus", "ACTIVE") == "ACTIVE"
+            for index in description.get("GlobalSecondaryIndexes", [])
+        )
+        self._index_cache[cache_key] = (exists, time.monotonic())
+        return exists
 
-            for field, value in key_condition.items():
-                key_condition_expression += f"{field} = :{field}"
-                expression_values[f":{field}"] = value
+    def item_count(self, table_name: str) -> Optional[int]:
+        """Approximate item count of a table from DescribeTable.
 
-            response = table.query(
-                IndexName=index_name,
-                KeyConditionExpression=key_condition_expression,
-                ExpressionAttributeValues=expression_values,
-            )
+        Cached for ITEM_COUNT_TTL_SECONDS. Returns None if the table does not
+        exist; other DescribeTable errors are raised.
+        """
+        cached = self._item_counts.get(table_name)
+        if cached is not None:
+            count, checked_at = cached
+            if time.monotonic() - checked_at < self.ITEM_COUNT_TTL_SECONDS:
+                return count
 
-            return response.get("Items", [])
+        try:
+            client = self._get_resource().meta.client
+            description = client.describe_table(TableName=table_name)["Table"]
         except ClientError as e:
-            logger.error(f"Error querying {table_name} by index {index_name}: {e}")
-            return []
+            if error_code(e) == "ResourceNotFoundException":
+                return None
+            logger.error(f"Error describing {table_name}: {e}")
+            raise
+
+        count = int(description.get("ItemCount", 0))
+        self._item_counts[table_name] = (count, time.monotonic())
+        return count
 
 
 # Global database client instance
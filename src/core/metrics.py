@@ -0,0 +1,282 @@
+"""
+DynamoDB request metrics.
+Every DatabaseClient request is recorded per table and operation: latency,
+items returned, items scanned and consumed capacity. Latencies are kept in a
+rolling window for percentiles; per-minute buckets keep a longer history.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .config import config
+
+READ_OPERATIONS = frozenset({"GetItem", "BatchGetItem", "Query", "Scan"})
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+@dataclass
+class OperationStats:
+    """Counters and recent latencies for one (table, operation) pair."""
+
+    calls: int = 0
+    errors: int = 0
+    items: int = 0
+    scanned: int = 0
+    read_units: float = 0.0
+    write_units: float = 0.0
+    # (recorded_at, latency_ms) inside the rolling window
+    latencies: Deque[Tuple[float, float]] = field(default_factory=deque)
+
+
+@dataclass
+class HistoryBucket:
+    """Totals for one (table, operation) pair over one history interval."""
+
+    calls: int = 0
+    errors: int = 0
+    latency_ms: float = 0.0
+    read_units: float = 0.0
+    write_units: float = 0.0
+
+
+class DatabaseMetrics:
+    """Thread-safe aggregation of DynamoDB request metrics."""
+
+    def __init__(
+        self,
+        window_seconds: Optional[float] = None,
+        max_samples: int = 10000,
+        bucket_seconds: int = 60,
+        retention_seconds: int = 24 * 3600,
+    ):
+        self.enabled = config.database.metrics_enabled
+        self.window_seconds = window_seconds or config.database.metrics_window_seconds
+        self.max_samples = max_samples
+        self.bucket_seconds = bucket_seconds
+        self.retention_seconds = retention_seconds
+        self._operations: Dict[Tuple[str, str], OperationStats] = {}
+        # bucket start (epoch seconds) -> (table, operation) -> totals
+        self._history: Dict[int, Dict[Tuple[str, str], HistoryBucket]] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        table_name: str,
+        operation: str,
+        latency_ms: float,
+        items: int = 0,
+        scanned: int = 0,
+        read_units: float = 0.0,
+        write_units: float = 0.0,
+        error: bool = False,
+    ) -> None:
+        """Record one request."""
+        now = time.time()
+        key = (table_name, operation)
+        bucket_start = int(now // self.bucket_seconds * self.bucket_seconds)
+        with self._lock:
+            stats = self._operations.get(key)
+            if stats is None:
+                stats = self._operations[key] = OperationStats()
+            stats.calls += 1
+            stats.errors += error
+            stats.items += items
+            stats.scanned += scanned
+            stats.read_units += read_units
+            stats.write_units += write_units
+            stats.latencies.append((now, latency_ms))
+            if len(stats.latencies) > self.max_samples:
+                stats.latencies.popleft()
+
+            buckets = self._history.get(bucket_start)
+            if buckets is None:
+                buckets = self._history[bucket_start] = {}
+                self._expire_history(now)
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = HistoryBucket()
+            bucket.calls += 1
+            bucket.errors += error
+            bucket.latency_ms += latency_ms
+            bucket.read_units += read_units
+            bucket.write_units += write_units
+
+    def record_response(
+        self,
+        table_name: str,
+        operation: str,
+        latency_ms: float,
+        response: Dict[str, Any],
+        items: Optional[int] = None,
+    ) -> None:
+        """Record a request from its response (counts and ConsumedCapacity)."""
+        if items is None:
+            if "Count" in response:
+                items = response["Count"]
+            elif "Responses" in response:
+                items = len(response["Responses"].get(table_name, []))
+            else:
+                items = 1 if response.get("Item") else 0
+        scanned = response.get("ScannedCount", items)
+
+        consumed = response.get("ConsumedCapacity") or []
+        if isinstance(consumed, dict):
+            consumed = [consumed]
+        units: Dict[str, Tuple[float, float]] = {}
+        for entry in consumed:
+            name = entry.get("TableName", table_name)
+            total = float(entry.get("CapacityUnits", 0))
+            read = entry.get("ReadCapacityUnits")
+            write = entry.get("WriteCapacityUnits")
+            if read is None and write is None:
+                read, write = (
+                    (total, 0.0) if operation in READ_OPERATIONS else (0.0, total)
+                )
+            previous = units.get(name, (0.0, 0.0))
+            units[name] = (
+                previous[0] + float(read or 0),
+                previous[1] + float(write or 0),
+            )
+
+        read_units, write_units = units.pop(table_name, (0.0, 0.0))
+        self.record(
+            table_name,
+            operation,
+            latency_ms,
+            items=items,
+            scanned=scanned,
+            read_units=read_units,
+            write_units=write_units,
+        )
+        # Transactions report capacity for every table they touched
+        for other_table, (read, write) in units.items():
+            self.record(
+                other_table, operation, latency_ms, read_units=read, write_units=write
+            )
+
+    def _expire_history(self, now: float) -> None:
+        oldest = now - self.retention_seconds
+        for bucket_start in [start for start in self._history if start < oldest]:
+            del self._history[bucket_start]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Percentiles over the rolling window plus lifetime totals per table."""
+        cutoff = time.time() - self.window_seconds
+        tables: Dict[str, Dict[str, Any]] = {}
+        all_latencies: List[float] = []
+        window_reads = window_writes = 0
+        totals = {"readCapacityUnits": 0.0, "writeCapacityUnits": 0.0}
+
+        with self._lock:
+            for (table_name, operation), stats in self._operations.items():
+                while stats.latencies and stats.latencies[0][0] < cutoff:
+                    stats.latencies.popleft()
+                latencies = sorted(latency for _, latency in stats.latencies)
+                all_latencies.extend(latencies)
+                if operation in READ_OPERATIONS:
+                    window_reads += len(latencies)
+                else:
+                    window_writes += len(latencies)
+                totals["readCapacityUnits"] += stats.read_units
+                totals["writeCapacityUnits"] += stats.write_units
+                tables.setdefault(table_name, {})[operation] = {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "items": stats.items,
+                    "scannedItems": stats.scanned,
+                    "readCapacityUnits": round(stats.read_units, 2),
+                    "writeCapacityUnits": round(stats.write_units, 2),
+                    "windowCalls": len(latencies),
+                    "latencyMs": self._latency_summary(latencies),
+                }
+
+        all_latencies.sort()
+        consumers = sorted(
+            (
+                {
+                    "table": table_name,
+                    "operation": operation,
+                    "capacityUnits": round(
+                        stats["readCapacityUnits"] + stats["writeCapacityUnits"], 2
+                    ),
+                    "p95LatencyMs": stats["latencyMs"]["p95"],
+                }
+                for table_name, operations in tables.items()
+                for operation, stats in operations.items()
+            ),
+            key=lambda consumer: (consumer["capacityUnits"], consumer["p95LatencyMs"]),
+            reverse=True,
+        )
+        return {
+            "windowSeconds": self.window_seconds,
+            "latencyMs": self._latency_summary(all_latencies),
+            "throughput": {
+                "reads": window_reads,
+                "writes": window_writes,
+                "readsPerSecond": round(window_reads / self.window_seconds, 2),
+                "writesPerSecond": round(window_writes / self.window_seconds, 2),
+            },
+            "capacity": {name: round(value, 2) for name, value in totals.items()},
+            "tables": tables,
+            "topConsumers": consumers[:10],
+        }
+
+    def history(self, range_seconds: float) -> List[Dict[str, Any]]:
+        """Per-interval totals for the last ``range_seconds``, oldest first."""
+        since = time.time() - range_seconds
+        with self._lock:
+            buckets = sorted(
+                (start, dict(operations))
+                for start, operations in self._history.items()
+                if start + self.bucket_seconds > since
+            )
+        return [
+            {
+                "time": _iso_time(start),
+                "table": table_name,
+                "operation": operation,
+                "calls": bucket.calls,
+                "errors": bucket.errors,
+                "avgLatencyMs": round(bucket.latency_ms / bucket.calls, 2),
+                "readCapacityUnits": round(bucket.read_units, 2),
+                "writeCapacityUnits": round(bucket.write_units, 2),
+            }
+            for start, operations in buckets
+            for (table_name, operation), bucket in sorted(operations.items())
+            if bucket.calls
+        ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._operations.clear()
+            self._history.clear()
+
+    @staticmethod
+    def _latency_summary(sorted_latencies: List[float]) -> Dict[str, float]:
+        count = len(sorted_latencies)
+        return {
+            "avg": round(sum(sorted_latencies) / count, 2) if count else 0.0,
+            "p50": round(percentile(sorted_latencies, 0.50), 2),
+            "p95": round(percentile(sorted_latencies, 0.95), 2),
+            "p99": round(percentile(sorted_latencies, 0.99), 2),
+            "max": round(sorted_latencies[-1], 2) if count else 0.0,
+        }
+
+
+def _iso_time(epoch_seconds: float) -> str:
+    """UTC ISO-8601 timestamp for epoch seconds."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(epoch_seconds))
+
+
+# Global metrics shared by every DatabaseClient
+database_metrics = DatabaseMetrics()
@@ -0,0 +1,224 @@
+"""
+Delivery of outbox messages by a bounded worker pool.
+Writers store a message in the outbox table with their change, then announce
+its ID on a queue without waiting. Worker threads take IDs off the queue,
+lease the message, run the handler for its type and delete it. A failure
+schedules a retry with exponential backoff; after the last attempt the
+message is kept as a dead letter. Idle workers periodically sweep the table
+for due retries and for messages whose announcement was lost (full queue,
+process frozen or restarted), so every committed message is delivered at
+least once. drain() runs the same delivery synchronously, for schedulers and
+tests. Under Lambda, where background threads are frozen between invocations,
+delivery is left to a scheduled drain (main.outbox_handler).
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .config import config
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[Dict[str, Any]], None]
+
+
+class DeliveryIncomplete(Exception):
+    """Raised by a handler that delivered part of a message.
+
+    ``payload`` replaces the message's payload for the retry, recording the
+    part already done so it is not repeated.
+    """
+
+    def __init__(self, message: str, payload: Dict[str, Any]):
+        super().__init__(message)
+        self.payload = payload
+
+
+# Time a worker has to deliver a message before others may retry it
+LEASE_SECONDS = 120
+# Longest wait between retries
+MAX_RETRY_SECONDS = 3600
+
+
+class LocalQueue:
+    """In-process bounded queue of message IDs.
+
+    Stands in for a managed queue (such as SQS) behind the same two calls:
+    ``put`` never blocks and reports whether the ID was accepted, ``get``
+    waits up to ``timeout`` seconds for the next ID.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        self._queue: queue.Queue = queue.Queue(maxsize)
+
+    def put(self, message_id: str) -> bool:
+        try:
+            self._queue.put_nowait(message_id)
+            return True
+        except queue.Full:
+            return False
+
+    def get(self, timeout: Optional[float] = None) -> Optional[str]:
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+
+class Outbox:
+    """Delivers outbox messages with retries and dead-lettering."""
+
+    def __init__(
+        self,
+        repository=None,
+        message_queue: Optional[LocalQueue] = None,
+        workers: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        retry_base_seconds: Optional[float] = None,
+        sweep_interval_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        settings = config.outbox
+        self._repository = repository
+        self.queue = (
+            LocalQueue(settings.queue_size) if message_queue is None else message_queue
+        )
+        self.workers = settings.workers if workers is None else workers
+        self.max_attempts = max_attempts or settings.max_attempts
+        self.retry_base_seconds = (
+            settings.retry_base_seconds
+            if retry_base_seconds is None
+            else retry_base_seconds
+        )
+        self.sweep_interval_seconds = (
+            settings.sweep_interval_seconds
+            if sweep_interval_seconds is None
+            else sweep_interval_seconds
+        )
+        self._clock = clock
+        self._handlers: Dict[str, Handler] = {}
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._last_sweep = clock()
+
+    @property
+    def repository(self):
+        if self._repository is None:
+            from ..repositories.outbox_repository import OutboxRepository
+
+            self._repository = OutboxRepository()
+        return self._repository
+
+    def register(self, message_type: str, handler: Handler) -> None:
+        """Deliver messages of ``message_type`` by calling ``handler(payload)``."""
+        self._handlers[message_type] = handler
+
+    def publish(self, message_id: str) -> None:
+        """Announce a stored message to the workers without waiting.
+
+        When the queue is full the message is left to the next sweep, so
+        writers are never slowed down by delivery.
+        """
+        if not self.workers:
+            return
+        self._start()
+        if not self.queue.put(message_id):
+            logger.warning(f"Outbox queue full; message {message_id} left to sweep")
+
+    def deliver(self, message_id: str) -> bool:
+        """Lease and deliver one message; True when it was delivered."""
+        now = int(self._clock())
+        message = self.repository.claim(message_id, now, now + LEASE_SECONDS)
+        if message is None:
+            return False
+        attempts = int(message.get("attempts", 0)) + 1
+        try:
+            handler = self._handlers.get(message["type"])
+            if handler is None:
+                raise LookupError(f"No handler for {message['type']} messages")
+            handler(message["payload"])
+        except Exception as e:
+            payload = e.payload if isinstance(e, DeliveryIncomplete) else None
+            if attempts >= self.max_attempts:
+                logger.error(
+                    f"Outbox message {message_id} dead-lettered after "
+                    f"{attempts} attempts: {e}"
+                )
+                self.repository.failed(message_id, attempts, str(e), payload=payload)
+            else:
+                delay = min(
+                    self.retry_base_seconds * 2 ** (attempts - 1), MAX_RETRY_SECONDS
+                )
+                logger.warning(
+                    f"Outbox message {message_id} failed (attempt {attempts}), "
+                    f"retrying in {delay:.0f}s: {e}"
+                )
+                self.repository.failed(
+                    message_id,
+                    attempts,
+                    str(e),
+                    int(self._clock() + delay),
+                    payload=payload,
+                )
+            return False
+        self.repository.delivered(message_id)
+        return True
+
+    def drain(self, until: Optional[float] = None) -> Dict[str, int]:
+        """Deliver every due message in the calling thread.
+
+        With ``until`` (a clock time), delivery stops once it has passed and
+        the messages left over wait for the next drain.
+        """
+        due = self.repository.list_due(int(self._clock()))
+        delivered = 0
+        for message in due:
+            if until is not None and self._clock() >= until:
+                break
+            delivered += self.deliver(message["id"])
+        return {"due": len(due), "delivered": delivered}
+
+    def _start(self) -> None:
+        """Start the worker threads on first use."""
+        if self._threads:
+            return
+        with self._lock:
+            if self._threads:
+                return
+            for number in range(self.workers):
+                thread = threading.Thread(
+                    target=self._work, name=f"outbox-{number}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _work(self) -> None:
+        while True:
+            message_id = self.queue.get(timeout=self.sweep_interval_seconds)
+            try:
+                if message_id is not None:
+                    self.deliver(message_id)
+                self._sweep_if_due()
+            except Exception as e:
+                logger.error(f"Outbox worker error: {e}")
+
+    def _sweep_if_due(self) -> None:
+        """Queue due messages again, at most once per sweep interval."""
+        with self._lock:
+            now = self._clock()
+            if now - self._last_sweep < self.sweep_interval_seconds:
+                return
+            self._last_sweep = now
+        for message in self.repository.list_due(int(now)):
+            if not self.queue.put(message["id"]):
+                break
+
+
+# Global outbox instance
+outbox = Outbox()
@@ -0,0 +1,136 @@
+"""
+Resilience primitives for DynamoDB calls.
+Classifies errors as throttling or transient and keeps one circuit breaker per
+table so a degraded table fails fast instead of timing out every request.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from botocore.exceptions import (
+    ClientError,
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    ReadTimeoutError,
+)
+
+# Throttled requests are never applied, so every operation can retry them
+THROTTLING_ERROR_CODES = frozenset(
+    {
+        "ProvisionedThroughputExceededException",
+        "ThrottlingException",
+        "RequestLimitExceeded",
+    }
+)
+# Server-side failures; retried for reads only since a write may have applied
+SERVER_ERROR_CODES = frozenset({"InternalServerError", "ServiceUnavailable"})
+CONNECTION_ERRORS = (
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    ReadTimeoutError,
+)
+
+
+def error_code(error: Exception) -> Optional[str]:
+    """The DynamoDB error code of a ClientError, or None."""
+    if isinstance(error, ClientError):
+        return error.response.get("Error", {}).get("Code")
+    return None
+
+
+def is_throttling(error: Exception) -> bool:
+    return error_code(error) in THROTTLING_ERROR_CODES
+
+
+def is_unavailable(error: Exception) -> bool:
+    """Whether an error means the table could not serve the request."""
+    return (
+        is_throttling(error)
+        or error_code(error) in SERVER_ERROR_CODES
+        or isinstance(error, CONNECTION_ERRORS)
+    )
+
+
+class CircuitBreaker:
+    """Closed → open after consecutive failures → half-open probe → closed.
+
+    While open every request is rejected for ``reset_seconds``. Then a single
+    probe request is let through: success closes the circuit, failure opens
+    it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._reset_due():
+                return self.HALF_OPEN
+            return self._state
+
+    def _reset_due(self) -> bool:
+        return self._clock() - self._opened_at >= self.reset_seconds
+
+    def allow_request(self) -> bool:
+        """Whether a request may be sent now; claims the probe when half-open."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if not self._reset_due():
+                    return False
+                self._state = self.HALF_OPEN
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def retry_after(self) -> float:
+        """Seconds until the next probe may be sent."""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self.reset_seconds - (self._clock() - self._opened_at))
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or (
+                self._failures >= self.failure_threshold
+            ):
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+            self._probing = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutiveFailures": self._failures,
+            "retryAfterSeconds": round(self.retry_after(), 2),
+        }
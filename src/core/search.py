@@ -0,0 +1,254 @@
+"""
+In-memory text search index for repository listings.
+Each item is indexed by a few text fields: trigram postings answer substring
+queries and a sorted token list answers prefix queries. Only the normalized
+field values are kept, never whole items, and postings are compact arrays of
+item numbers. The index is built from a streamed snapshot of the table, kept
+current by the repository's writes and rebuilt when it grows older than its
+TTL to pick up writes from other processes.
+"""
+
+import re
+import threading
+import time
+from array import array
+from bisect import bisect_left, insort
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .config import config
+
+_TOKEN_SPLIT = re.compile(r"[^\w]+")
+GRAM_SIZE = 3
+
+# Match ranks, best first
+EXACT, PREFIX, SUBSTRING = 3, 2, 1
+
+
+def normalize(text: str) -> str:
+    return text.lower().strip()
+
+
+def _grams(text: str) -> Set[str]:
+    return {text[i : i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+class SearchIndex:
+    """Ranked prefix / substring search over the text fields of items.
+
+    Queries shorter than GRAM_SIZE match token prefixes only; longer queries
+    also match anywhere inside a field. Results rank exact token matches
+    first, then prefix matches, then other substring matches.
+
+    Items are numbered in insertion order and postings are append-only
+    arrays of those numbers. An update gives the item a new number and
+    leaves the old one as a tombstone until the next rebuild.
+    """
+
+    def __init__(
+        self,
+        fields: Tuple[str, ...],
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.fields = fields
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._build_lock = threading.Lock()
+        self._built_at: Optional[float] = None
+        # Writes seen while a build is streaming, replayed after the swap
+        self._pending: Optional[List[Tuple[str, Optional[Dict[str, Any]]]]] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        # item number -> (item id, normalized field values); None once removed
+        self._docs: List[Optional[Tuple[str, Tuple[str, ...]]]] = []
+        self._numbers: Dict[str, int] = {}
+        # trigram -> item numbers; token -> item numbers, plus sorted tokens
+        self._grams: Dict[str, array] = {}
+        self._token_docs: Dict[str, array] = {}
+        self._tokens: List[str] = []
+
+    @property
+    def size(self) -> int:
+        return len(self._numbers)
+
+    def is_fresh(self) -> bool:
+        with self._lock:
+            return (
+                self._built_at is not None
+                and self._clock() - self._built_at < self.ttl_seconds
+            )
+
+    def refresh(self, load: Callable[[], Iterable[Dict[str, Any]]]) -> None:
+        """Rebuild from ``load()`` unless the index is fresh.
+
+        Concurrent callers wait for a single build.
+        """
+        with self._build_lock:
+            if not self.is_fresh():
+                self.build(load())
+
+    def build(self, items: Iterable[Dict[str, Any]]) -> None:
+        """Rebuild the index from a stream of items."""
+        with self._lock:
+            self._pending = []
+        try:
+            fresh = SearchIndex(self.fields, self.ttl_seconds, self._clock)
+            for item in items:
+                fresh._add(item, keep_sorted=False)
+            fresh._tokens.sort()
+        except BaseException:
+            with self._lock:
+                self._pending = None
+            raise
+
+        with self._lock:
+            self._docs = fresh._docs
+            self._numbers = fresh._numbers
+            self._grams = fresh._grams
+            self._token_docs = fresh._token_docs
+            self._tokens = fresh._tokens
+            for item_id, item in self._pending:
+                self._remove(item_id)
+                if item is not None:
+                    self._add(item)
+            self._pending = None
+            self._built_at = self._clock()
+
+    def invalidate(self) -> None:
+        """Drop the index; the next search rebuilds it."""
+        with self._lock:
+            self._reset()
+            self._built_at = None
+
+    def add(self, item: Dict[str, Any]) -> None:
+        """Index a created or updated item."""
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append((item["id"], item))
+            if self._built_at is not None:
+                self._remove(item["id"])
+                self._add(item)
+
+    def remove(self, *item_ids: str) -> None:
+        """Drop deleted items."""
+        with self._lock:
+            for item_id in item_ids:
+                if self._pending is not None:
+                    self._pending.append((item_id, None))
+                if self._built_at is not None:
+                    self._remove(item_id)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """IDs of matching items, best match first."""
+        text = normalize(query)
+        if not text:
+            return []
+        with self._lock:
+            if len(text) < GRAM_SIZE:
+                candidates = self._prefix_candidates(text)
+            else:
+                candidates = self._substring_candidates(text)
+            ranked = []
+            for number in candidates:
+                doc = self._docs[number]
+                if doc is None:
+                    continue
+                rank = self._rank(doc[1], text)
+                if rank:
+                    ranked.append((-rank, doc[1], doc[0]))
+        ranked.sort()
+        ids = [item_id for _, _, item_id in ranked]
+        return ids[:limit] if limit else ids
+
+    # -- internals --------------------------------------------------------
+
+    def _values(self, item: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(normalize(str(item.get(field) or "")) for field in self.fields)
+
+    @staticmethod
+    def _tokens_of(values: Tuple[str, ...]) -> Set[str]:
+        tokens = set(values)
+        for value in values:
+            tokens.update(_TOKEN_SPLIT.split(value))
+        tokens.discard("")
+        return tokens
+
+    def _add(self, item: Dict[str, Any], keep_sorted: bool = True) -> None:
+        values = self._values(item)
+        number = len(self._docs)
+        self._docs.append((item["id"], values))
+        self._numbers[item["id"]] = number
+        for gram in set().union(*(_grams(value) for value in values)):
+            postings = self._grams.get(gram)
+            if postings is None:
+                postings = self._grams[gram] = array("I")
+            postings.append(number)
+        for token in self._tokens_of(values):
+            postings = self._token_docs.get(token)
+            if postings is None:
+                postings = self._token_docs[token] = array("I")
+                if keep_sorted:
+                    insort(self._tokens, token)
+                else:
+                    self._tokens.append(token)
+            postings.append(number)
+
+    def _remove(self, item_id: str) -> None:
+        number = self._numbers.pop(item_id, None)
+        if number is not None:
+            self._docs[number] = None
+
+    def _prefix_candidates(self, prefix: str) -> Set[int]:
+        candidates: Set[int] = set()
+        position = bisect_left(self._tokens, prefix)
+        while position < len(self._tokens):
+            token = self._tokens[position]
+            if not token.startswith(prefix):
+                break
+            candidates.update(self._token_docs[token])
+            position += 1
+        return candidates
+
+    def _substring_candidates(self, text: str) -> Iterable[int]:
+        # Every match contains every trigram of the query, so the shortest
+        # posting list bounds the candidates; _rank verifies each one
+        postings = [self._grams.get(gram) for gram in _grams(text)]
+        if not all(postings):
+            return ()
+        return min(postings, key=len)
+
+    @classmethod
+    def _rank(cls, values: Tuple[str, ...], text: str) -> int:
+        tokens = cls._tokens_of(values)
+        if text in tokens:
+            return EXACT
+        if any(token.startswith(text) for token in tokens):
+            return PREFIX
+        if len(text) >= GRAM_SIZE and any(text in value for value in values):
+            return SUBSTRING
+        return 0
+
+
+_indexes: Dict[str, SearchIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def search_index(namespace: str, fields: Tuple[str, ...]) -> SearchIndex:
+    """Get the process-wide search index for a table, creating it on first use."""
+    with _indexes_lock:
+        index = _indexes.get(namespace)
+        if index is None:
+            index = _indexes[namespace] = SearchIndex(
+                fields, config.cache.search_index_ttl_seconds
+            )
+        return index
+
+
+def clear_search_indexes() -> None:
+    """Drop every index so the next search rebuilds it."""
+    with _indexes_lock:
+        indexes = list(_indexes.values())
+    for index in indexes:
+        index.invalidate()
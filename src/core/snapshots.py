@@ -0,0 +1,140 @@
+"""
+Stale-while-revalidate snapshots of expensive read models.
+A snapshot is served as-is while it is younger than the freshness window.
+After that it is still served, up to a maximum staleness, while one
+background refresh recomputes it; older snapshots, and requests that ask for
+fresh data, are recomputed before returning. Callers that need a recompute at
+the same time wait for a single computation instead of each running their own.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Snapshot:
+    """A computed value and when it was computed."""
+
+    value: Any
+    computed_at: float
+    generated_at: str
+    age_seconds: float = 0.0
+    stale: bool = False
+
+    def metadata(self) -> Dict[str, Any]:
+        return {
+            "generatedAt": self.generated_at,
+            "ageSeconds": round(self.age_seconds, 3),
+            "stale": self.stale,
+        }
+
+
+class SnapshotCache:
+    """Per-key snapshots with a freshness window and background refresh."""
+
+    def __init__(
+        self,
+        fresh_seconds: float,
+        max_stale_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+        executor: Optional[Executor] = None,
+    ):
+        self.fresh_seconds = fresh_seconds
+        self.max_stale_seconds = max(max_stale_seconds, fresh_seconds)
+        self._clock = clock
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Snapshot] = {}
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._refreshing: Set[str] = set()
+
+    def get(
+        self, key: str, compute: Callable[[], Any], fresh: bool = False
+    ) -> Snapshot:
+        """The snapshot for ``key``, computing it when needed.
+
+        ``fresh`` skips any snapshot computed before this call.
+        """
+        now = self._clock()
+        if not fresh:
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is not None:
+                age = now - entry.computed_at
+                if age < self.fresh_seconds:
+                    return self._served(entry, now)
+                if age < self.max_stale_seconds:
+                    self._refresh_in_background(key, compute)
+                    return self._served(entry, now)
+        not_before = now if fresh else now - self.fresh_seconds
+        return self._served(self._compute(key, compute, not_before), self._clock())
+
+    def invalidate(self, *keys: str) -> None:
+        """Drop snapshots so the next read recomputes them; no keys drops all."""
+        with self._lock:
+            if keys:
+                for key in keys:
+                    self._entries.pop(key, None)
+            else:
+                self._entries.clear()
+
+    def _served(self, entry: Snapshot, now: float) -> Snapshot:
+        age = max(0.0, now - entry.computed_at)
+        return Snapshot(
+            value=entry.value,
+            computed_at=entry.computed_at,
+            generated_at=entry.generated_at,
+            age_seconds=age,
+            stale=age >= self.fresh_seconds,
+        )
+
+    def _compute(
+        self, key: str, compute: Callable[[], Any], not_before: float
+    ) -> Snapshot:
+        """Compute and store a snapshot, once per key at a time.
+
+        A caller that waited while another computed a recent enough snapshot
+        gets that one instead of computing again.
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is not None and entry.computed_at > not_before:
+                return entry
+            started, generated_at = self._clock(), datetime.utcnow().isoformat()
+            entry = Snapshot(compute(), started, generated_at)
+            with self._lock:
+                self._entries[key] = entry
+            return entry
+
+    def _refresh_in_background(self, key: str, compute: Callable[[], Any]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="snapshot"
+                )
+            executor = self._executor
+
+        def refresh() -> None:
+            try:
+                self._compute(key, compute, self._clock() - self.fresh_seconds)
+            except Exception as e:
+                # Keep serving the stale snapshot; the next read retries
+                logger.error(f"Background refresh of snapshot {key} failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        executor.submit(refresh)
@@ -0,0 +1,853 @@
+"""
+Storage backends for DatabaseClient.
+The boto3 backend talks to DynamoDB; the in-memory backend is a deterministic,
+dependency-free stand-in for load tests and local benchmarks.
+"""
+
+import re
+import threading
+import zlib
+from bisect import bisect_left, bisect_right, insort
+from decimal import Decimal
+from itertools import dropwhile
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+import boto3
+from boto3.dynamodb.conditions import ConditionBase, ConditionExpressionBuilder
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from .config import config
+
+# A GSI's hash key, or its (hash key, range key) pair
+IndexKeys = Union[str, Tuple[str, str]]
+
+
+class StorageBackend:
+    """Source of DynamoDB-compatible resources for DatabaseClient.
+
+    ``resource()`` returns an object with the boto3 DynamoDB resource API
+    (``Table``, ``batch_get_item``, ``batch_write_item`` and a ``meta.client``
+    with ``transact_write_items`` and ``describe_table``). It is called once
+    per thread that talks to the database.
+    """
+
+    # Whether low-level client mode is available
+    supports_low_level_client = False
+
+    def resource(self):
+        raise NotImplementedError
+
+    def client(self):
+        raise NotImplementedError
+
+
+class BotoBackend(StorageBackend):
+    """Real DynamoDB through boto3.
+
+    botocore runs in adaptive mode, so its client-side rate limiter slows
+    sending after throttles, but makes a single attempt: DatabaseClient owns
+    retries so they are classified, jittered and visible to the breaker. The
+    limiter belongs to one client, so DatabaseClient sends its batch and scan
+    traffic from every thread through a single shared ``client()``.
+    """
+
+    supports_low_level_client = True
+
+    def __init__(self, region: Optional[str] = None):
+        self.region = region or config.database.region
+        self.botocore_config = Config(
+            retries={"mode": "adaptive", "total_max_attempts": 1}
+        )
+
+    def resource(self):
+        # boto3 resources are not thread-safe: every caller gets its own
+        return boto3.session.Session().resource(
+            "dynamodb", region_name=self.region, config=self.botocore_config
+        )
+
+    def client(self):
+        return boto3.client(
+            "dynamodb", region_name=self.region, config=self.botocore_config
+        )
+
+
+class InMemoryBackend(StorageBackend):
+    """In-memory DynamoDB stand-in shared by every thread.
+
+    Tables, including global secondary indexes, must be created first with
+    create_table or create_registry_tables.
+    """
+
+    def __init__(self):
+        self._resource = InMemoryResource()
+
+    def resource(self):
+        return self._resource
+
+    def create_table(
+        self,
+        table_name: str,
+        hash_key: str = "id",
+        range_key: Optional[str] = None,
+        indexes: Optional[Dict[str, IndexKeys]] = None,
+    ) -> "InMemoryTable":
+        """Create a table.
+
+        ``indexes`` maps GSI names to their hash key, or to a
+        ``(hash_key, range_key)`` pair for a sorted index.
+        """
+        return self._resource.create_table(table_name, hash_key, range_key, indexes)
+
+    def create_registry_tables(self) -> None:
+        """Create every table of the registry, with its indexes."""
+        database = config.database
+        people_indexes: Dict[str, IndexKeys] = {
+            database.people_email_index: "emailLower"
+        }
+        for attribute, index_name in database.people_sort_indexes.items():
+            people_indexes[index_name] = ("listPartition", attribute)
+        self.create_table(database.people_table, indexes=people_indexes)
+        self.create_table(database.projects_table)
+        self.create_table(
+            database.subscriptions_table,
+            indexes={
+                database.subscriptions_person_index: "personId",
+                database.subscriptions_project_index: "projectId",
+            },
+        )
+        self.create_table(database.stats_table)
+        self.create_table(database.jobs_table)
+        self.create_table(
+            database.outbox_table,
+            indexes={database.outbox_due_index: ("status", "availableAt")},
+        )
+
+
+def _client_error(code: str, message: str, operation: str, **extra: Any):
+    """Build a botocore ClientError like the ones DynamoDB returns."""
+    response = {"Error": {"Code": code, "Message": message}}
+    response.update(extra)
+    return ClientError(response, operation)
+
+
+def _copy(value: Any) -> Any:
+    """Copy an item so callers never share state with the store."""
+    if isinstance(value, dict):
+        return {name: _copy(inner) for name, inner in value.items()}
+    if isinstance(value, list):
+        return [_copy(inner) for inner in value]
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+class InMemoryResource:
+    """The subset of the boto3 DynamoDB resource used by DatabaseClient."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.tables: Dict[str, InMemoryTable] = {}
+        self.meta = _Meta(InMemoryClient(self))
+
+    def create_table(
+        self,
+        table_name: str,
+        hash_key: str = "id",
+        range_key: Optional[str] = None,
+        indexes: Optional[Dict[str, IndexKeys]] = None,
+    ) -> "InMemoryTable":
+        with self.lock:
+            table = InMemoryTable(self, table_name, hash_key, range_key, indexes)
+            self.tables[table_name] = table
+            return table
+
+    def Table(self, table_name: str) -> "_TableHandle":  # noqa: N802 - boto3 API
+        # Like boto3, the handle is lazy: a missing table fails on first request
+        return _TableHandle(self, table_name)
+
+    def _table(self, table_name: str, operation: str) -> "InMemoryTable":
+        table = self.tables.get(table_name)
+        if table is None:
+            raise _client_error(
+                "ResourceNotFoundException",
+                f"Requested resource not found: Table: {table_name} not found",
+                operation,
+            )
+        return table
+
+    def batch_get_item(
+        self, RequestItems: Dict[str, Any], **params: Any
+    ) -> Dict[str, Any]:
+        responses = {}
+        with self.lock:
+            for table_name, request in RequestItems.items():
+                table = self._table(table_name, "BatchGetItem")
+                found = []
+                for key in request["Keys"]:
+                    item = table.items.get(table.key_of(key))
+                    if item is not None:
+                        found.append(_copy(item))
+                responses[table_name] = found
+        return {"Responses": responses, "UnprocessedKeys": {}}
+
+    def batch_write_item(
+        self, RequestItems: Dict[str, Any], **params: Any
+    ) -> Dict[str, Any]:
+        with self.lock:
+            for table_name, requests in RequestItems.items():
+                table = self._table(table_name, "BatchWriteItem")
+                for request in requests:
+                    if "PutRequest" in request:
+                        table.put_item(Item=request["PutRequest"]["Item"])
+                    else:
+                        table.delete_item(Key=request["DeleteRequest"]["Key"])
+        return {"UnprocessedItems": {}}
+
+
+class _TableHandle:
+    """Lazy reference to a table, resolved on every request."""
+
+    def __init__(self, resource: InMemoryResource, table_name: str):
+        self._resource = resource
+        self.name = table_name
+
+    def __getattr__(self, attribute: str) -> Callable[..., Dict[str, Any]]:
+        operation = "".join(part.title() for part in attribute.split("_"))
+
+        def request(**params: Any) -> Dict[str, Any]:
+            table = self._resource._table(self.name, operation)
+            return getattr(table, attribute)(**params)
+
+        return request
+
+
+class _Meta:
+    def __init__(self, client: "InMemoryClient"):
+        self.client = client
+
+
+class InMemoryClient:
+    """Client-level operations reached through ``resource.meta.client``."""
+
+    def __init__(self, resource: InMemoryResource):
+        self._resource = resource
+
+    def describe_table(self, TableName: str) -> Dict[str, Any]:
+        table = self._resource._table(TableName, "DescribeTable")
+        key_schema = [{"AttributeName": table.hash_key, "KeyType": "HASH"}]
+        if table.range_key:
+            key_schema.append({"AttributeName": table.range_key, "KeyType": "RANGE"})
+        return {
+            "Table": {
+                "TableName": TableName,
+                "KeySchema": key_schema,
+                "ItemCount": len(table.items),
+                "GlobalSecondaryIndexes": [
+                    {
+                        "IndexName": index_name,
+                        "IndexStatus": "ACTIVE",
+                        "KeySchema": [{"AttributeName": attribute, "KeyType": "HASH"}]
+                        + (
+                            [
+                                {
+                                    "AttributeName": table.index_ranges[index_name],
+                                    "KeyType": "RANGE",
+                                }
+                            ]
+                            if table.index_ranges[index_name]
+                            else []
+                        ),
+                    }
+                    for index_name, attribute in table.index_keys.items()
+                ],
+            }
+        }
+
+    def transact_write_items(
+        self, TransactItems: List[Dict[str, Any]], **params: Any
+    ) -> Dict:
+        resource = self._resource
+        with resource.lock:
+            # Check every condition before applying anything
+            reasons = []
+            for action in TransactItems:
+                ((action_type, params),) = action.items()
+                table = resource._table(params["TableName"], "TransactWriteItems")
+                if action_type == "Put":
+                    current = table.items.get(table.key_of(params["Item"]))
+                else:
+                    current = table.items.get(table.key_of(params["Key"]))
+                passed = table.condition_passes(current, params)
+                reasons.append("None" if passed else "ConditionalCheckFailed")
+
+            if any(reason != "None" for reason in reasons):
+                raise _client_error(
+                    "TransactionCanceledException",
+                    "Transaction cancelled, please refer cancellation reasons for "
+                    f"specific reasons [{', '.join(reasons)}]",
+                    "TransactWriteItems",
+                    CancellationReasons=[{"Code": reason} for reason in reasons],
+                )
+
+            for action in TransactItems:
+                ((action_type, params),) = action.items()
+                params = {k: v for k, v in params.items() if k != "ConditionExpression"}
+                table = resource.tables[params.pop("TableName")]
+                if action_type == "Put":
+                    table.put_item(**params)
+                elif action_type == "Delete":
+                    table.delete_item(**params)
+                elif action_type == "Update":
+                    table.update_item(**params)
+        return {}
+
+
+class InMemoryTable:
+    """One table: items in insertion order plus hash-key buckets per GSI.
+
+    Buckets of a sorted index hold ``(range_value, item_key)`` pairs in order.
+    Scans read item keys from sorted per-segment lists, so a page resumes by
+    bisecting to its start key instead of walking the table.
+    """
+
+    def __init__(
+        self,
+        resource: InMemoryResource,
+        name: str,
+        hash_key: str,
+        range_key: Optional[str],
+        indexes: Optional[Dict[str, IndexKeys]],
+    ):
+        self.resource = resource
+        self.name = name
+        self.hash_key = hash_key
+        self.range_key = range_key
+        self.items: Dict[Tuple, Dict[str, Any]] = {}
+        # index name -> index hash / range attribute, and hash value -> item keys
+        self.index_keys: Dict[str, str] = {}
+        self.index_ranges: Dict[str, Optional[str]] = {}
+        for index_name, keys in (indexes or {}).items():
+            hash_attribute, range_attribute = (
+                keys if isinstance(keys, tuple) else (keys, None)
+            )
+            self.index_keys[index_name] = hash_attribute
+            self.index_ranges[index_name] = range_attribute
+        self.index_buckets: Dict[str, Dict[Any, Any]] = {
+            index_name: {} for index_name in self.index_keys
+        }
+        # TotalSegments -> sorted item keys of each segment; built by the first
+        # scan with that many segments and kept current by writes
+        self.scan_segments: Dict[int, List[List[Tuple]]] = {}
+
+    @property
+    def global_secondary_indexes(self) -> List[Dict[str, Any]]:
+        return self.resource.meta.client.describe_table(TableName=self.name)["Table"][
+            "GlobalSecondaryIndexes"
+        ]
+
+    def key_of(self, item: Dict[str, Any]) -> Tuple:
+        """Primary key tuple of an item or key."""
+        if self.range_key:
+            return (item[self.hash_key], item[self.range_key])
+        return (item[self.hash_key],)
+
+    def key_dict(self, key: Tuple) -> Dict[str, Any]:
+        names = [self.hash_key] + ([self.range_key] if self.range_key else [])
+        return dict(zip(names, key))
+
+    # -- writes -----------------------------------------------------------
+
+    def put_item(self, Item: Dict[str, Any], **params: Any) -> Dict[str, Any]:
+        with self.resource.lock:
+            key = self.key_of(Item)
+            current = self.items.get(key)
+            if not self.condition_passes(current, params):
+                raise self._condition_failed("PutItem")
+            self._store(key, _copy(Item), current)
+        return {}
+
+    def delete_item(
+        self, Key: Dict[str, Any], ReturnValues: str = "NONE", **params: Any
+    ) -> Dict[str, Any]:
+        with self.resource.lock:
+            key = self.key_of(Key)
+            current = self.items.get(key)
+            if not self.condition_passes(current, params):
+                raise self._condition_failed("DeleteItem")
+            if current is not None:
+                self._unindex(key, current)
+                del self.items[key]
+                for total, segments in self.scan_segments.items():
+                    segment = segments[self._segment_of(key, total)]
+                    del segment[bisect_left(segment, key)]
+                if ReturnValues == "ALL_OLD":
+                    return {"Attributes": current}
+        return {}
+
+    def update_item(
+        self,
+        Key: Dict[str, Any],
+        UpdateExpression: str,
+        ReturnValues: str = "NONE",
+        **params: Any,
+    ) -> Dict[str, Any]:
+        with self.resource.lock:
+            key = self.key_of(Key)
+            current = self.items.get(key)
+            if not self.condition_passes(current, params):
+                raise self._condition_failed("UpdateItem")
+            item = _copy(current) if current is not None else _copy(Key)
+            _apply_update(
+                item,
+                UpdateExpression,
+                params.get("ExpressionAttributeNames") or {},
+                params.get("ExpressionAttributeValues") or {},
+            )
+            self._store(key, item, current)
+            if ReturnValues == "ALL_NEW":
+                return {"Attributes": _copy(item)}
+            if ReturnValues == "ALL_OLD" and current is not None:
+                return {"Attributes": _copy(current)}
+        return {}
+
+    def _store(self, key: Tuple, item: Dict[str, Any], current: Optional[Dict]):
+        if current is not None:
+            self._unindex(key, current)
+        else:
+            for total, segments in self.scan_segments.items():
+                insort(segments[self._segment_of(key, total)], key)
+        self.items[key] = item
+        for index_name, attribute in self.index_keys.items():
+            if attribute not in item:
+                continue
+            range_attribute = self.index_ranges[index_name]
+            buckets = self.index_buckets[index_name]
+            if range_attribute is None:
+                buckets.setdefault(item[attribute], {})[key] = None
+            elif range_attribute in item:
+                entries = buckets.setdefault(item[attribute], [])
+                insort(entries, (item[range_attribute], key))
+
+    def _unindex(self, key: Tuple, item: Dict[str, Any]) -> None:
+        for index_name, attribute in self.index_keys.items():
+            if attribute not in item:
+                continue
+            range_attribute = self.index_ranges[index_name]
+            bucket = self.index_buckets[index_name].get(item[attribute])
+            if bucket is None:
+                continue
+            if range_attribute is None:
+                bucket.pop(key, None)
+            elif range_attribute in item:
+                entry = (item[range_attribute], key)
+                position = bisect_left(bucket, entry)
+                if position < len(bucket) and bucket[position] == entry:
+                    del bucket[position]
+
+    def condition_passes(self, item: Optional[Dict], params: Dict[str, Any]) -> bool:
+        expression = params.get("ConditionExpression")
+        if not expression:
+            return True
+        predicate = _compile_condition(
+            *_render(
+                expression,
+                params.get("ExpressionAttributeNames") or {},
+                params.get("ExpressionAttributeValues") or {},
+            )
+        )
+        return predicate(item or {})
+
+    def _condition_failed(self, operation: str):
+        return _client_error(
+            "ConditionalCheckFailedException",
+            "The conditional request failed",
+            operation,
+        )
+
+    # -- reads ------------------------------------------------------------
+
+    def get_item(self, Key: Dict[str, Any], **params: Any) -> Dict[str, Any]:
+        with self.resource.lock:
+            item = self.items.get(self.key_of(Key))
+            return {"Item": _copy(item)} if item is not None else {}
+
+    def scan(
+        self,
+        Limit: Optional[int] = None,
+        ExclusiveStartKey: Optional[Dict[str, Any]] = None,
+        Segment: Optional[int] = None,
+        TotalSegments: Optional[int] = None,
+        **params: Any,
+    ) -> Dict[str, Any]:
+        with self.resource.lock:
+            total = TotalSegments or 1
+            segments = self.scan_segments.get(total)
+            if segments is None:
+                segments = [[] for _ in range(total)]
+                for key in sorted(self.items):
+                    segments[self._segment_of(key, total)].append(key)
+                self.scan_segments[total] = segments
+            segment = segments[Segment or 0]
+            start = (
+                bisect_right(segment, self.key_of(ExclusiveStartKey))
+                if ExclusiveStartKey
+                else 0
+            )
+            keys = (segment[position] for position in range(start, len(segment)))
+            return self._page(keys, Limit, None, params)
+
+    @staticmethod
+    def _segment_of(key: Tuple, total_segments: int) -> int:
+        return zlib.crc32(repr(key).encode()) % total_segments
+
+    def query(
+        self,
+        KeyConditionExpression: Any,
+        IndexName: Optional[str] = None,
+        Limit: Optional[int] = None,
+        ExclusiveStartKey: Optional[Dict[str, Any]] = None,
+        ScanIndexForward: bool = True,
+        **params: Any,
+    ) -> Dict[str, Any]:
+        with self.resource.lock:
+            expression, names, values = _render(
+                KeyConditionExpression,
+                params.get("ExpressionAttributeNames") or {},
+                params.get("ExpressionAttributeValues") or {},
+                is_key_condition=True,
+            )
+            hash_attribute = self.index_keys[IndexName] if IndexName else self.hash_key
+            hash_value = _equality_value(expression, names, values, hash_attribute)
+            range_attribute = self.index_ranges.get(IndexName) if IndexName else None
+            if range_attribute:
+                keys = self._sorted_keys(
+                    self.index_buckets[IndexName].get(hash_value, []),
+                    range_attribute,
+                    ExclusiveStartKey,
+                    ScanIndexForward,
+                )
+                ExclusiveStartKey = None
+            elif IndexName:
+                keys = iter(list(self.index_buckets[IndexName].get(hash_value, {})))
+            else:
+                keys = iter([key for key in self.items if key[0] == hash_value])
+
+            matches = _compile_condition(expression, names, values)
+            keys = (key for key in keys if matches(self.items[key]))
+            response = self._page(keys, Limit, ExclusiveStartKey, params)
+            last_key = response.get("LastEvaluatedKey")
+            if range_attribute and last_key:
+                # Index pages resume from the index key, like DynamoDB
+                item = self.items[self.key_of(last_key)]
+                last_key[hash_attribute] = item[hash_attribute]
+                last_key[range_attribute] = item[range_attribute]
+            return response
+
+    def _sorted_keys(
+        self,
+        entries: List[Tuple[Any, Tuple]],
+        range_attribute: str,
+        exclusive_start_key: Optional[Dict[str, Any]],
+        forward: bool,
+    ) -> Iterator[Tuple]:
+        """Item keys of a sorted index bucket, resuming after a start key."""
+        if exclusive_start_key:
+            start = (
+                exclusive_start_key[range_attribute],
+                self.key_of(exclusive_start_key),
+            )
+            if forward:
+                entries = entries[bisect_right(entries, start) :]
+            else:
+                entries = entries[: bisect_left(entries, start)]
+        ordered = entries if forward else reversed(entries)
+        return iter([key for _, key in ordered])
+
+    def _page(
+        self,
+        keys: Iterator[Tuple],
+        limit: Optional[int],
+        exclusive_start_key: Optional[Dict[str, Any]],
+        params: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Read one page: ``Limit`` counts items evaluated before filtering."""
+        if exclusive_start_key:
+            start = self.key_of(exclusive_start_key)
+            keys = dropwhile(lambda key: key != start, keys)
+            next(keys, None)
+
+        keep = lambda item: True  # noqa: E731
+        if params.get("FilterExpression") is not None:
+            expression, names, values = _render(
+                params["FilterExpression"],
+                params.get("ExpressionAttributeNames") or {},
+                params.get("ExpressionAttributeValues") or {},
+            )
+            keep = _compile_condition(expression, names, values)
+
+        items = []
+        evaluated = 0
+        last_key = None
+        for key in keys:
+            item = self.items[key]
+            evaluated += 1
+            if keep(item):
+                items.append(_copy(item))
+            if limit and evaluated >= limit:
+                last_key = key
+                break
+
+        response: Dict[str, Any] = {
+            "Items": items,
+            "Count": len(items),
+            "ScannedCount": evaluated,
+        }
+        # Like DynamoDB, a full page always carries a resume token
+        if last_key is not None:
+            response["LastEvaluatedKey"] = self.key_dict(last_key)
+        return response
+
+
+# -- expressions ---------------------------------------------------------------
+
+_TOKEN = re.compile(
+    r"\s*(?:(?P<op><>|<=|>=|=|<|>)|(?P<punct>[(),])|(?P<word>[#:]?[\w.\-]+))"
+)
+_KEYWORDS = {"AND", "OR", "NOT", "BETWEEN", "IN"}
+
+
+def _render(
+    expression: Any, names: Dict[str, str], values: Dict[str, Any], **kwargs: Any
+) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+    """Turn boto3 condition objects into expression strings and placeholders."""
+    if not isinstance(expression, ConditionBase):
+        return expression, names, values
+    built = ConditionExpressionBuilder().build_expression(expression, **kwargs)
+    return (
+        built.condition_expression,
+        {**names, **built.attribute_name_placeholders},
+        {**values, **built.attribute_value_placeholders},
+    )
+
+
+def _tokenize(expression: str) -> List[str]:
+    tokens = []
+    position = 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if not match:
+            raise ValueError(f"Unsupported expression: {expression!r}")
+        tokens.append(match.group(match.lastgroup))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser for DynamoDB condition expressions."""
+
+    def __init__(self, expression: str, names: Dict[str, str], values: Dict):
+        self.tokens = _tokenize(expression)
+        self.position = 0
+        self.names = names
+        self.values = values
+
+    def parse(self) -> Callable[[Dict[str, Any]], bool]:
+        predicate = self._or()
+        if self.position != len(self.tokens):
+            raise ValueError(f"Unexpected token {self.tokens[self.position]!r}")
+        return predicate
+
+    def _peek(self) -> Optional[str]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+    def _take(self, expected: Optional[str] = None) -> str:
+        token = self._peek()
+        if token is None or (expected and token.upper() != expected):
+            raise ValueError(f"Expected {expected!r}, got {token!r}")
+        self.position += 1
+        return token
+
+    def _keyword(self, word: str) -> bool:
+        token = self._peek()
+        if token is not None and token.upper() == word:
+            self.position += 1
+            return True
+        return False
+
+    def _or(self):
+        left = self._and()
+        while self._keyword("OR"):
+            right = self._and()
+            left = (lambda a, b: lambda item: a(item) or b(item))(left, right)
+        return left
+
+    def _and(self):
+        left = self._not()
+        while self._keyword("AND"):
+            right = self._not()
+            left = (lambda a, b: lambda item: a(item) and b(item))(left, right)
+        return left
+
+    def _not(self):
+        if self._keyword("NOT"):
+            inner = self._not()
+            return lambda item: not inner(item)
+        return self._primary()
+
+    def _primary(self):
+        if self._peek() == "(":
+            self._take()
+            inner = self._or()
+            self._take(")")
+            return inner
+
+        token = self._peek()
+        if token and token.lower() in _FUNCTIONS and self._lookahead_call():
+            name = self._take().lower()
+            self._take("(")
+            args = [self._operand()]
+            while self._peek() == ",":
+                self._take()
+                args.append(self._operand())
+            self._take(")")
+            return _FUNCTIONS[name](*args)
+
+        left = self._operand()
+        if self._keyword("BETWEEN"):
+            low = self._operand()
+            self._take("AND")
+            high = self._operand()
+            return lambda item: _compare(left(item), ">=", low(item)) and _compare(
+                left(item), "<=", high(item)
+            )
+        if self._keyword("IN"):
+            self._take("(")
+            options = [self._operand()]
+            while self._peek() == ",":
+                self._take()
+                options.append(self._operand())
+            self._take(")")
+            return lambda item: any(left(item) == option(item) for option in options)
+
+        operator = self._take()
+        right = self._operand()
+        return lambda item: _compare(left(item), operator, right(item))
+
+    def _lookahead_call(self) -> bool:
+        following = self.position + 1
+        return following < len(self.tokens) and self.tokens[following] == "("
+
+    def _operand(self) -> Callable[[Dict[str, Any]], Any]:
+        token = self._take()
+        if token.startswith(":"):
+            value = self.values[token]
+            return lambda item: value
+        path = [self.names.get(part, part) for part in token.split(".")]
+        return lambda item: _resolve(item, path)
+
+
+_MISSING = object()
+
+
+def _resolve(item: Dict[str, Any], path: List[str]) -> Any:
+    value: Any = item
+    for part in path:
+        if not isinstance(value, dict) or part not in value:
+            return _MISSING
+        value = value[part]
+    return value
+
+
+def _compare(left: Any, operator: str, right: Any) -> bool:
+    if left is _MISSING or right is _MISSING:
+        return operator == "<>"
+    if operator == "=":
+        return left == right
+    if operator == "<>":
+        return left != right
+    try:
+        if operator == "<":
+            return left < right
+        if operator == "<=":
+            return left <= right
+        if operator == ">":
+            return left > right
+        if operator == ">=":
+            return left >= right
+    except TypeError:
+        return False
+    raise ValueError(f"Unsupported operator {operator!r}")
+
+
+def _contains(path, operand):
+    def check(item):
+        value, expected = path(item), operand(item)
+        if value is _MISSING:
+            return False
+        if isinstance(value, str):
+            return isinstance(expected, str) and expected in value
+        return isinstance(value, (list, set)) and expected in value
+
+    return check
+
+
+_FUNCTIONS: Dict[str, Callable[..., Callable[[Dict[str, Any]], bool]]] = {
+    "attribute_exists": lambda path: lambda item: path(item) is not _MISSING,
+    "attribute_not_exists": lambda path: lambda item: path(item) is _MISSING,
+    "begins_with": lambda path, prefix: lambda item: isinstance(path(item), str)
+    and path(item).startswith(prefix(item)),
+    "contains": _contains,
+}
+
+
+def _compile_condition(
+    expression: str, names: Dict[str, str], values: Dict[str, Any]
+) -> Callable[[Dict[str, Any]], bool]:
+    return _Parser(expression, names, values).parse()
+
+
+def _equality_value(
+    expression: str, names: Dict[str, str], values: Dict[str, Any], attribute: str
+) -> Any:
+    """Value the key condition requires ``attribute`` to equal."""
+    tokens = _tokenize(expression)
+    for index in range(len(tokens) - 2):
+        name, operator, value = tokens[index : index + 3]
+        if operator == "=" and names.get(name, name) == attribute:
+            return values[value]
+    raise _client_error(
+        "ValidationException",
+        f"Query condition missed key schema element: {attribute}",
+        "Query",
+    )
+
+
+def _apply_update(
+    item: Dict[str, Any], expression: str, names: Dict[str, str], values: Dict
+) -> None:
+    """Apply SET / ADD / REMOVE clauses of an update expression in place."""
+    clauses = re.split(r"\b(SET|ADD|REMOVE)\b", expression, flags=re.IGNORECASE)
+    for action, body in zip(clauses[1::2], clauses[2::2]):
+        action = action.upper()
+        for assignment in (part.strip() for part in body.split(",")):
+            if not assignment:
+                continue
+            if action == "SET":
+                target, source = (side.strip() for side in assignment.split("=", 1))
+                item[names.get(target, target)] = _copy(values[source])
+            elif action == "ADD":
+                target, source = assignment.split()
+                name = names.get(target, target)
+                amount = values[source]
+                if isinstance(amount, set):
+                    item[name] = set(item.get(name, set())) | amount
+                else:
+                    current = item.get(name, 0)
+                    total = Decimal(str(current)) + Decimal(str(amount))
+                    item[name] = int(total) if total == int(total) else total
+            else:
+                item.pop(names.get(assignment, assignment), None)
@@ -156,6 +156,17 @@ class ValidationException(BaseApplicationException):
         super().__init__(message, error_code, ErrorSeverity.MEDIUM, **kwargs)
 
 
+class PayloadTooLargeException(ValidationException):
+    """A request carries more than one request may process."""
+
+    def __init__(self, message: str, limit: int, received: int, **kwargs):
+        details = kwargs.get("details", {})
+        details.update({"limit": limit, "received": received})
+        kwargs["details"] = details
+
+        super().__init__(message, ErrorCode.VALUE_OUT_OF_RANGE, **kwargs)
+
+
 class BusinessLogicException(BaseApplicationException):
     """Business logic violation exceptions."""
 
@@ -233,6 +244,39 @@ class DatabaseException(BaseApplicationException):
         )
 
 
+class DatabaseUnavailableException(BaseApplicationException):
+    """A table is throttling, failing or behind an open circuit breaker."""
+
+    def __init__(
+        self,
+        operation: str,
+        table: str,
+        reason: str,
+        retry_after_seconds: Optional[float] = None,
+        **kwargs,
+    ):
+        message = f"Database unavailable during {operation} on table {table}: {reason}"
+
+        details = kwargs.get("details", {})
+        details.update(
+            {
+                "operation": operation,
+                "table": table,
+                "reason": reason,
+                "retry_after_seconds": retry_after_seconds,
+            }
+        )
+        kwargs["details"] = details
+        kwargs.setdefault(
+            "user_message", "The service is busy. Please try again shortly."
+        )
+
+        super().__init__(
+            message, ErrorCode.SERVICE_UNAVAILABLE, ErrorSeverity.HIGH, **kwargs
+        )
+        self.retry_after_seconds = retry_after_seconds
+
+
 class SecurityException(BaseApplicationException):
     """Security-related exceptions."""
 
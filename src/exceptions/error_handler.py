@@ -15,8 +15,10 @@ from .base_exceptions import (
     AuthenticationException,
     AuthorizationException,
     ValidationException,
+    PayloadTooLargeException,
     ResourceNotFoundException,
     DatabaseException,
+    DatabaseUnavailableException,
     SecurityException,
     RateLimitException,
 )
@@ -57,15 +59,20 @@ class EnterpriseErrorHandler:
         if self._should_include_details(exc):
             response_data["error"]["details"] = exc.details
 
+        headers = {
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Credentials": "true",
+            "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS, PATCH",
+            "Access-Control-Allow-Headers": "Accept, Accept-Language, Content-Language, Content-Type, Authorization, X-Requested-With, X-Api-Key, X-Amz-Date, X-Amz-Security-Token",
+        }
+        retry_after = getattr(exc, "retry_after_seconds", None)
+        if retry_after:
+            headers["Retry-After"] = str(max(1, round(retry_after)))
+
         return JSONResponse(
             status_code=status_code,
             content=response_data,
-            headers={
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Credentials": "true",
-                "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS, PATCH",
-                "Access-Control-Allow-Headers": "Accept, Accept-Language, Content-Language, Content-Type, Authorization, X-Requested-With, X-Api-Key, X-Amz-Date, X-Amz-Security-Token",
-            },
+            headers=headers,
         )
 
     def handle_http_exception(
@@ -217,10 +224,12 @@ class EnterpriseErrorHandler:
             # Authorization errors
             AuthorizationException: status.HTTP_403_FORBIDDEN,
             # Validation errors
+            PayloadTooLargeException: status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             ValidationException: status.HTTP_400_BAD_REQUEST,
             # Resource not found
             ResourceNotFoundException: status.HTTP_404_NOT_FOUND,
             # Database errors
+            DatabaseUnavailableException: status.HTTP_503_SERVICE_UNAVAILABLE,
             DatabaseException: status.HTTP_500_INTERNAL_SERVER_ERROR,
             # Security errors
             SecurityException: status.HTTP_403_FORBIDDEN,
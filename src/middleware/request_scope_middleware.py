@@ -0,0 +1,25 @@
+"""
+Request scope middleware.
+Opens a per-request identity map so repositories load each item at most once
+per request.
+"""
+
+from ..core.cache import request_scope
+
+
+class RequestScopeMiddleware:
+    """Pure ASGI middleware wrapping every HTTP request in a request scope.
+
+    Registered outermost so authentication, authorization and the route
+    handler all share one identity map.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with request_scope():
+            await self.app(scope, receive, send)
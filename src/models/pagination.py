@@ -3,10 +3,16 @@ Enterprise pagination models with clean architecture compliance.
 Standardized pagination across all domain entities.
 """
 
+import base64
+import hashlib
+import hmac
+import json
 from typing import Generic, TypeVar, List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 from enum import Enum
 
+from ..exceptions.base_exceptions import ErrorCode, ValidationException
+
 T = TypeVar("T")
 
 
@@ -45,6 +51,12 @@ class PaginationMetadata(BaseModel):
     hasPreviousPage: bool = Field(..., description="Whether there is a previous page")
     startIndex: int = Field(..., description="Start index of current page items")
     endIndex: int = Field(..., description="End index of current page items")
+    nextCursor: Optional[str] = Field(
+        default=None, description="Opaque cursor for the next page"
+    )
+    totalIsEstimate: bool = Field(
+        default=False, description="Whether totalItems is an estimate"
+    )
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -78,6 +90,79 @@ class PaginatedResponse(BaseModel, Generic[T]):
 
         return cls(items=items, pagination=pagination)
 
+    @classmethod
+    def from_cursor_page(
+        cls, page: "CursorPage[T]", page_size: int
+    ) -> "PaginatedResponse[T]":
+        """Create a paginated response for one keyset page.
+
+        hasNextPage follows the cursor rather than the (possibly estimated)
+        total.
+        """
+        response = cls.create(page.items, page.totalItems, page.pageNumber, page_size)
+        response.pagination.nextCursor = page.nextCursor
+        response.pagination.hasNextPage = page.nextCursor is not None
+        response.pagination.totalIsEstimate = page.totalIsEstimate
+        return response
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """One page of a keyset listing plus the cursor to continue from."""
+
+    items: List[T] = Field(..., description="Page items")
+    pageNumber: int = Field(default=1, description="1-based page number")
+    totalItems: int = Field(..., description="Total number of items")
+    totalIsEstimate: bool = Field(
+        default=False, description="Whether totalItems is an estimate"
+    )
+    nextCursor: Optional[str] = Field(
+        default=None, description="Opaque cursor for the next page"
+    )
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _cursor_secret() -> bytes:
+    from ..core.config import config
+
+    return config.auth.jwt_secret.encode()
+
+
+def encode_cursor(payload: Dict[str, Any]) -> str:
+    """Encode a cursor payload as an opaque, HMAC-signed token.
+
+    Cursors carry the last key of a page, so they are signed to stop clients
+    from forging arbitrary ExclusiveStartKeys.
+    """
+    body = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode()
+    signature = hmac.new(_cursor_secret(), body, hashlib.sha256).digest()
+    return f"{_b64encode(body)}.{_b64encode(signature)}"
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Verify and decode a cursor created by encode_cursor."""
+    try:
+        body_part, signature_part = cursor.split(".")
+        body = _b64decode(body_part)
+        signature = _b64decode(signature_part)
+    except ValueError:
+        body = signature = b""
+
+    expected = hmac.new(_cursor_secret(), body, hashlib.sha256).digest()
+    if not body or not hmac.compare_digest(signature, expected):
+        raise ValidationException(
+            "Invalid pagination cursor",
+            error_code=ErrorCode.INVALID_FORMAT,
+            field_errors={"cursor": ["Cursor is malformed or was tampered with"]},
+        )
+    return json.loads(body)
+
 
 class UsersPaginationRequest(PaginationRequest):
     """Specialized pagination request for users with domain-specific filters."""
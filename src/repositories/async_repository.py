@@ -0,0 +1,66 @@
+"""
+Async repository facade.
+Runs synchronous repository calls on a dedicated thread pool so async route
+handlers and services can await data access without blocking the event loop.
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+from typing import Any, Callable, Generic, TypeVar
+
+from ..core.config import config
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Dedicated pool for blocking DynamoDB calls, separate from the default executor
+_db_executor = ThreadPoolExecutor(
+    max_workers=config.database.async_max_workers, thread_name_prefix="db"
+)
+
+
+def db_executor() -> ThreadPoolExecutor:
+    """The pool behind run_in_db_executor, for background work of the same kind."""
+    return _db_executor
+
+
+async def run_in_db_executor(func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+    """Run a blocking data access call on the database executor.
+
+    The caller's context variables are copied into the worker thread so
+    request-scoped state (logging context, caches) stays visible.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        _db_executor, partial(context.run, func, *args, **kwargs)
+    )
+
+
+class AsyncRepository(Generic[T]):
+    """Awaitable view over a synchronous repository.
+
+    Every public method of the wrapped repository is exposed as a coroutine
+    that runs on the database executor; plain attributes pass through.
+    """
+
+    def __init__(self, repository: T):
+        self._repository = repository
+
+    @property
+    def repository(self) -> T:
+        """The wrapped synchronous repository."""
+        return self._repository
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._repository, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+
+        @wraps(attribute)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await run_in_db_executor(attribute, *args, **kwargs)
+
+        return call
@@ -0,0 +1,122 @@
+"""
+Jobs repository implementation.
+Stores background admin jobs: one item per job, which doubles as the job's
+checkpoint, and one item per chunk holding that chunk's work and outcomes.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from boto3.dynamodb.conditions import Attr
+
+from ..core.database import db
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+class JobsRepository:
+    """Repository for background admin jobs and their checkpoints."""
+
+    def __init__(self):
+        from ..core.config import config
+
+        self.table_name = config.database.jobs_table
+
+    @staticmethod
+    def chunk_id(job_id: str, index: int) -> str:
+        return f"{job_id}#{index}"
+
+    def create(self, job: Dict[str, Any], chunks: List[List[str]]) -> None:
+        """Store a job and its chunks of work; the chunks are written first."""
+        items = [
+            {"id": self.chunk_id(job["id"], index), "jobId": job["id"], "keys": keys}
+            for index, keys in enumerate(chunks)
+        ]
+        result = db.put_many(self.table_name, items)
+        if result.failed:
+            raise Exception(f"Failed to store {result.failure_count} job chunks")
+        db.put_item(self.table_name, job)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return db.get_item(self.table_name, {"id": job_id})
+
+    def get_chunk(self, job_id: str, index: int) -> Optional[Dict[str, Any]]:
+        return db.get_item(self.table_name, {"id": self.chunk_id(job_id, index)})
+
+    def get_chunks(self, job_id: str, count: int) -> List[Optional[Dict[str, Any]]]:
+        """The first ``count`` chunks of a job, in order."""
+        return db.get_many(
+            self.table_name,
+            [{"id": self.chunk_id(job_id, index)} for index in range(count)],
+        )
+
+    def claim(
+        self, job_id: str, owner: str, now: int, lease_until: int, statuses: tuple
+    ) -> Optional[Dict[str, Any]]:
+        """Take the lease on a job in one of ``statuses`` that nobody holds.
+
+        Returns the claimed job, or None when it is finished, in another
+        status or leased by a live worker.
+        """
+        condition = Attr("status").is_in(list(statuses)) & (
+            Attr("leaseUntil").not_exists() | Attr("leaseUntil").lt(now)
+        )
+        return db.update_item_where(
+            self.table_name,
+            {"id": job_id},
+            {"status": RUNNING, "owner": owner, "leaseUntil": lease_until},
+            condition,
+        )
+
+    def checkpoint(
+        self,
+        job_id: str,
+        owner: str,
+        chunk: Dict[str, Any],
+        progress: Dict[str, Any],
+    ) -> bool:
+        """Store a processed chunk, then advance the job past it.
+
+        The job only advances while ``owner`` still holds its lease; False
+        means another worker has taken over and this one must stop.
+        """
+        db.put_item(self.table_name, chunk)
+        return (
+            db.update_item_where(
+                self.table_name, {"id": job_id}, progress, Attr("owner").eq(owner)
+            )
+            is not None
+        )
+
+    def release(self, job_id: str, owner: str, updates: Dict[str, Any]) -> bool:
+        """Apply final updates to a job and give up its lease."""
+        return (
+            db.update_item_where(
+                self.table_name,
+                {"id": job_id},
+                {**updates, "leaseUntil": 0},
+                Attr("owner").eq(owner),
+            )
+            is not None
+        )
+
+    def requeue(self, job_id: str, updated_at: str) -> Optional[Dict[str, Any]]:
+        """Queue a failed job again; None unless the job had failed."""
+        return db.update_item_where(
+            self.table_name,
+            {"id": job_id},
+            {"status": QUEUED, "leaseUntil": 0, "updatedAt": updated_at},
+            Attr("status").eq(FAILED),
+        )
+
+    def list_unfinished(self) -> List[Dict[str, Any]]:
+        """Queued and running jobs, for resuming after a worker stopped."""
+        return list(
+            db.iter_scan(
+                self.table_name,
+                FilterExpression=Attr("status").is_in([QUEUED, RUNNING])
+                & Attr("jobId").not_exists(),
+            )
+        )
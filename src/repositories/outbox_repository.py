@@ -0,0 +1,150 @@
+"""
+Outbox repository implementation.
+Messages are written in the same transaction as the change that causes them,
+so a committed change always has its message. Delivered messages are deleted;
+messages that keep failing stay behind as dead letters.
+"""
+
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from boto3.dynamodb.conditions import Attr
+
+from ..core.database import db
+
+PENDING = "pending"
+DEAD = "dead"
+
+# Messages read per page of the status index
+STATUS_PAGE_SIZE = 100
+
+
+class OutboxRepository:
+    """Repository for outbox messages awaiting delivery."""
+
+    def __init__(self):
+        from ..core.config import config
+
+        self.table_name = config.database.outbox_table
+        self.due_index = config.database.outbox_due_index
+
+    @staticmethod
+    def new_message(message_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """A pending message, due at once."""
+        return {
+            "id": str(uuid.uuid4()),
+            "type": message_type,
+            "payload": payload,
+            "status": PENDING,
+            "attempts": 0,
+            "availableAt": int(time.time()),
+            "createdAt": datetime.utcnow().isoformat(),
+        }
+
+    def put_action(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Transaction action that writes ``message`` with another change."""
+        return {"Put": {"TableName": self.table_name, "Item": message}}
+
+    def get(self, message_id: str) -> Optional[Dict[str, Any]]:
+        return db.get_item(self.table_name, {"id": message_id})
+
+    def claim(
+        self, message_id: str, now: int, lease_until: int
+    ) -> Optional[Dict[str, Any]]:
+        """Lease a due pending message for delivery.
+
+        Returns None when the message was delivered, is dead, is not due yet
+        or is being delivered by another worker.
+        """
+        condition = (
+            Attr("status").eq(PENDING)
+            & Attr("availableAt").lte(now)
+            & (Attr("leaseUntil").not_exists() | Attr("leaseUntil").lt(now))
+        )
+        return db.update_item_where(
+            self.table_name, {"id": message_id}, {"leaseUntil": lease_until}, condition
+        )
+
+    def delivered(self, message_id: str) -> None:
+        db.delete_item(self.table_name, {"id": message_id})
+
+    def failed(
+        self,
+        message_id: str,
+        attempts: int,
+        error: str,
+        available_at: Optional[int] = None,
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record a failed delivery: retry at ``available_at``, or dead-letter.
+
+        A ``payload`` replaces the stored one, so the retry skips the work the
+        failed attempt completed.
+        """
+        updates: Dict[str, Any] = {
+            "attempts": attempts,
+            "lastError": error,
+            "leaseUntil": 0,
+            "updatedAt": datetime.utcnow().isoformat(),
+        }
+        if payload is not None:
+            updates["payload"] = payload
+        if available_at is None:
+            updates["status"] = DEAD
+        else:
+            updates["availableAt"] = available_at
+        db.update_item(self.table_name, {"id": message_id}, updates)
+
+    def requeue(self, message_id: str, now: int) -> bool:
+        """Give a dead letter a fresh set of attempts."""
+        return (
+            db.update_item_where(
+                self.table_name,
+                {"id": message_id},
+                {"status": PENDING, "attempts": 0, "availableAt": now},
+                Attr("status").eq(DEAD),
+            )
+            is not None
+        )
+
+    def list_due(self, now: int) -> List[Dict[str, Any]]:
+        """Pending messages whose delivery is due, oldest first.
+
+        The status index is read in availableAt order and only up to ``now``,
+        so a sweep costs about the number of due messages rather than the
+        size of the table. Without the index (while it is being built) the
+        table is scanned.
+        """
+        if not db.has_index(self.table_name, self.due_index):
+            return list(
+                db.iter_scan(
+                    self.table_name,
+                    FilterExpression=Attr("status").eq(PENDING)
+                    & Attr("availableAt").lte(now),
+                )
+            )
+        due = []
+        for message in self._with_status(PENDING):
+            if message["availableAt"] > now:
+                break
+            due.append(message)
+        return due
+
+    def list_dead(self) -> List[Dict[str, Any]]:
+        if not db.has_index(self.table_name, self.due_index):
+            return list(
+                db.iter_scan(self.table_name, FilterExpression=Attr("status").eq(DEAD))
+            )
+        return list(self._with_status(DEAD))
+
+    def _with_status(self, status: str) -> Iterator[Dict[str, Any]]:
+        """Messages with ``status`` from the status index, in availableAt order."""
+        for messages, _ in db.query_pages(
+            self.table_name,
+            self.due_index,
+            {"status": status},
+            page_size=STATUS_PAGE_SIZE,
+        ):
+            yield from messages
@@ -3,27 +3,105 @@ People repository implementation.
 Handles all data access operations for people/users.
 """
 
+import heapq
 import uuid
+import zlib
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator, Set
 
 from .base_repository import BaseRepository
-from ..core.database import db
+from .stats_repository import PEOPLE, StatsRepository
+from ..core.cache import repository_cache
+from ..core.database import BatchWriteResult, db
+from ..core.search import search_index
+from ..exceptions.base_exceptions import ErrorCode, ValidationException
+from ..models.pagination import CursorPage, decode_cursor, encode_cursor
 from ..models.person import Person, PersonCreate, PersonUpdate
 
 
 class PeopleRepository(BaseRepository[Person]):
     """Repository for people/users data access operations."""
 
+    # Prefix of the listPartition shards ("person#0", "person#1", ...). Each
+    # shard holds its people in sort order; listings merge the shards
+    LIST_PARTITION = "person"
+    # Listing filters and the value assumed when a row lacks the attribute
+    LIST_FILTER_DEFAULTS = {"isAdmin": False, "isActive": True, "emailVerified": False}
+    SEARCH_FIELDS = ("firstName", "lastName", "email")
+
     def __init__(self):
         from ..core.config import config
 
         self.table_name = config.database.people_table
+        db.register_model(self.table_name, Person)
+        self.email_index = config.database.people_email_index
+        self.sort_indexes = config.database.people_sort_indexes
+        self.list_shards = config.database.people_list_shards
+        self.cache = repository_cache(self.table_name, config.cache.people_ttl_seconds)
+        self.search_index = search_index(self.table_name, self.SEARCH_FIELDS)
+        self.stats = StatsRepository()
+
+    @staticmethod
+    def normalize_email(email: str) -> str:
+        """Normalized form of an email, stored as ``emailLower`` for lookups."""
+        return email.lower().strip()
+
+    def list_partition(self, person_id: str) -> str:
+        """The listPartition shard a person is stored under, stable per ID."""
+        shard = zlib.crc32(person_id.encode()) % self.list_shards
+        return f"{self.LIST_PARTITION}#{shard}"
 
     def create(self, person_data: PersonCreate) -> Person:
         """Create a new person in the database with input validation."""
+        from ..services.logging_service import logging_service
+
+        db_item = self.new_item(person_data)
+        person_id = db_item["id"]
+
+        # Log data creation
+        logging_service.log_data_operation(
+            operation="create",
+            resource_type="person",
+            resource_id=person_id,
+            success=True,
+            details={"email": db_item["email"]},
+        )
+
+        # Save to database
+        success = db.put_item(self.table_name, db_item)
+        if not success:
+            logging_service.log_data_operation(
+                operation="create",
+                resource_type="person",
+                resource_id=person_id,
+                success=False,
+                details={"error": "Database operation failed"},
+            )
+            raise Exception("Failed to create person in database")
+
+        self.cache.invalidate(person_id)
+        self.search_index.add(db_item)
+        self.stats.record(PEOPLE, new=db_item)
+        return Person(**db_item)
+
+    def create_many(self, items: List[Dict[str, Any]]) -> BatchWriteResult:
+        """Write many items built by ``new_item`` with batched writes."""
+        result = db.put_many(self.table_name, items)
+        written = {key["id"] for key in result.succeeded}
+        created = [item for item in items if item["id"] in written]
+        self.cache.invalidate(*written)
+        for item in created:
+            self.search_index.add(item)
+        self.stats.record_many(PEOPLE, [(None, item) for item in created])
+        return result
+
+    def new_item(self, person_data: PersonCreate) -> Dict[str, Any]:
+        """Validate and sanitize a new person into the item to store.
+
+        Raises ValueError when a field fails validation.
+        """
         from ..security.input_validator import InputValidator
-        from ..services.logging_service import logging_service, LogCategory, LogLevel
+        from ..services.logging_service import logging_service
 
         # Validate inputs before database operation
         email_result = InputValidator.validate_email(person_data.email)
@@ -65,6 +143,7 @@ class PeopleRepository(BaseRepository[Person]):
             person_data.lastName
         ).sanitized_data
         db_item["email"] = email_result.sanitized_data
+        db_item["emailLower"] = self.normalize_email(db_item["email"])
         if person_data.phone:
             db_item["phone"] = InputValidator.validate_and_sanitize_string(
                 person_data.phone
@@ -73,6 +152,7 @@ class PeopleRepository(BaseRepository[Person]):
         db_item.update(
             {
                 "id": person_id,
+                "listPartition": self.list_partition(person_id),
                 "createdAt": now.isoformat(),
                 "updatedAt": now.isoformat(),
                 "isActive": True,
@@ -84,73 +164,97 @@ class PeopleRepository(BaseRepository[Person]):
         # Handle password hash if provided
         if hasattr(person_data, "passwordHash") and person_data.passwordHash:
             db_item["passwordHash"] = person_data.passwordHash
-
-        # Log data creation
-        logging_service.log_data_operation(
-            operation="create",
-            resource_type="person",
-            resource_id=person_id,
-            success=True,
-            details={"email": email_result.sanitized_data},
-        )
-
-        # Save to database
-        success = db.put_item(self.table_name, db_item)
-        if not success:
-            logging_service.log_data_operation(
-                operation="create",
-                resource_type="person",
-                resource_id=person_id,
-                success=False,
-                details={"error": "Database operation failed"},
-            )
-            raise Exception("Failed to create person in database")
-
-        return Person(**db_item)
+        return db_item
 
     def get_by_id(self, person_id: str) -> Optional[Person]:
-        """Get a person by their ID."""
-        person_data = db.get_item(self.table_name, {"id": person_id})
+        """Get a person by their ID (read through the repository cache)."""
+        person_data = self.cache.get_or_load(
+            person_id, lambda: db.get_item(self.table_name, {"id": person_id})
+        )
         if not person_data:
             return None
 
         return Person(**person_data)
 
+    def get_many_by_ids(self, person_ids: List[str]) -> Dict[str, Person]:
+        """Get many people by ID with batched reads.
+
+        Returns the people that exist, keyed by ID in the order requested.
+        """
+        items = db.get_many(
+            self.table_name, [{"id": item_id} for item_id in person_ids]
+        )
+        return {
+            person_data["id"]: Person(**person_data)
+            for person_data in items
+            if person_data
+        }
+
     def get_by_email(self, email: str) -> Optional[Person]:
         """Get a person by their email address."""
-        # Normalize email to lowercase for case-insensitive comparison
-        email_lower = email.lower().strip()
+        person_data = self._find_by_email(email)
+        if not person_data:
+            return None
 
-        # Scan for person with matching email (case-insensitive)
-        all_people = db.scan_table(self.table_name)
-        for person_data in all_people:
-            stored_email = person_data.get("email", "").lower().strip()
-            if stored_email == email_lower:
-                return Person(**person_data)
-        return None
+        return Person(**person_data)
 
     def get_by_email_for_auth(self, email: str) -> Optional[dict]:
         """Get a person by email with password hash for authentication."""
+        # Return raw dict with passwordHash
+        return self._find_by_email(email)
+
+    def _find_by_email(self, email: str) -> Optional[dict]:
+        """Find a person by email through the emailLower index.
+
+        The index only needs to project keys: the matching row is read by ID
+        so callers always get the full, current item. Until the index exists
+        the table is streamed instead.
+        """
         # Normalize email to lowercase for case-insensitive comparison
-        email_lower = email.lower().strip()
+        email_lower = self.normalize_email(email)
+
+        if db.has_index(self.table_name, self.email_index):
+            matches = db.query_by_index(
+                self.table_name, self.email_index, {"emailLower": email_lower}
+            )
+            if not matches:
+                return None
+            return db.get_item(self.table_name, {"id": matches[0]["id"]})
 
-        # Scan for person with matching email (case-insensitive)
-        all_people = db.scan_table(self.table_name)
-        for person_data in all_people:
+        for person_data in db.iter_scan(self.table_name):
             stored_email = person_data.get("email", "").lower().strip()
             if stored_email == email_lower:
-                return person_data  # Return raw dict with passwordHash
+                return person_data
         return None
 
+    def backfill_index_keys(self) -> int:
+        """Set ``emailLower`` and ``listPartition`` on rows written before the
+        email and sort indexes existed, or before the listing was sharded.
+
+        Returns the number of rows updated.
+        """
+        updated = 0
+        for person_data in db.parallel_scan(self.table_name):
+            index_keys = {}
+            email = person_data.get("email")
+            if email:
+                email_lower = self.normalize_email(email)
+                if person_data.get("emailLower") != email_lower:
+                    index_keys["emailLower"] = email_lower
+            list_partition = self.list_partition(person_data["id"])
+            if person_data.get("listPartition") != list_partition:
+                index_keys["listPartition"] = list_partition
+            if not index_keys:
+                continue
+            if db.update_item(self.table_name, {"id": person_data["id"]}, index_keys):
+                self.cache.invalidate(person_data["id"])
+                updated += 1
+        return updated
+
     def update(self, person_id: str, updates: PersonUpdate) -> Optional[Person]:
         """Update an existing person."""
         from ..services.logging_service import logging_service, LogCategory, LogLevel
 
-        # Check if person exists
-        existing_person = self.get_by_id(person_id)
-        if not existing_person:
-            return None
-
         # Prepare update data (exclude None values)
         update_data = updates.model_dump(exclude_none=True)
 
@@ -168,22 +272,108 @@ class PeopleRepository(BaseRepository[Person]):
 
         if update_data:
             update_data["updatedAt"] = datetime.utcnow().isoformat()
-
-            # Update in database (no field conversion needed!)
-            success = db.update_item(self.table_name, {"id": person_id}, update_data)
-            if not success:
-                raise Exception("Failed to update person in database")
-
-        # Return updated person
+            if "email" in update_data:
+                update_data["emailLower"] = self.normalize_email(update_data["email"])
+
+            # Update in database (no field conversion needed!); the update is
+            # conditioned on the person existing and returns the new item, or
+            # the old one when the aggregate counters need its previous values
+            counted = self.stats.counts_any(PEOPLE, update_data)
+            stored = db.update_item_if_exists(
+                self.table_name, {"id": person_id}, update_data, return_old=counted
+            )
+            self.cache.invalidate(person_id)
+            if not stored:
+                return None
+            person_data = {**stored, **update_data} if counted else stored
+            if counted:
+                self.stats.record(PEOPLE, stored, person_data)
+            self.search_index.add(person_data)
+            return Person(**person_data)
+
+        # Nothing to update: return the person as stored
         return self.get_by_id(person_id)
 
     def delete(self, person_id: str) -> bool:
         """Delete a person by their ID."""
-        return db.delete_item(self.table_name, {"id": person_id})
+        deleted, old = db.delete_item_returning(self.table_name, {"id": person_id})
+        self.cache.invalidate(person_id)
+        self.search_index.remove(person_id)
+        if old:
+            self.stats.record(PEOPLE, old=old)
+        return deleted
+
+    def invalidate(self, *person_ids: str) -> None:
+        """Drop cached people after writing them outside this repository."""
+        self.cache.invalidate(*person_ids)
+
+    def delete_many(self, person_ids: List[str]) -> BatchWriteResult:
+        """Delete many people by ID with batched writes.
+
+        The people are read first, in batches, so the aggregate counters can
+        drop what they contributed.
+        """
+        keys = [{"id": person_id} for person_id in person_ids]
+        existing = {
+            item["id"]: item for item in db.get_many(self.table_name, keys) if item
+        }
+        result = db.delete_many(self.table_name, keys)
+        self.cache.invalidate(*person_ids)
+        deleted_ids = [key["id"] for key in result.succeeded]
+        self.search_index.remove(*deleted_ids)
+        self.stats.record_many(
+            PEOPLE,
+            [
+                (existing[person_id], None)
+                for person_id in deleted_ids
+                if person_id in existing
+            ],
+        )
+        return result
+
+    def set_active_many(
+        self, person_ids: List[str], is_active: bool
+    ) -> BatchWriteResult:
+        """Activate or deactivate many people with parallel conditional updates.
+
+        Only ``isActive`` and ``updatedAt`` are written, so concurrent edits to
+        other fields are kept and deleted people are not recreated. IDs that do
+        not exist fail with "Person not found"; other errors are reported with
+        their own message.
+        """
+        result = db.update_many_if_exists(
+            self.table_name,
+            [{"id": person_id} for person_id in person_ids],
+            {"isActive": is_active, "updatedAt": datetime.utcnow().isoformat()},
+            return_old=True,
+        )
+        for failure in result.failed:
+            if failure["error"] == "Item not found":
+                failure["error"] = "Person not found"
+        self.cache.invalidate(*(key["id"] for key in result.succeeded))
+        self.stats.record_many(
+            PEOPLE,
+            [(old, {**old, "isActive": is_active}) for old in result.items],
+        )
+        return result
+
+    def scan_attributes(
+        self, *attributes: str, **scan_kwargs: Any
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream the named attributes of every person with a parallel scan."""
+        return db.scan_attributes(self.table_name, attributes, **scan_kwargs)
+
+    def list_all(
+        self, limit: Optional[int] = None, parallel: bool = False
+    ) -> List[Person]:
+        """List all people with optional limit.
 
-    def list_all(self, limit: Optional[int] = None) -> List[Person]:
-        """List all people with optional limit."""
-        people_data = db.scan_table(self.table_name, limit=limit)
+        ``parallel`` uses a segmented parallel scan for full-table reads.
+        """
+        if parallel and not limit:
+            people_data = db.parallel_scan_table(self.table_name)
+        else:
+            people_data = db.scan_table(self.table_name, limit=limit)
         return [Person(**person_data) for person_data in people_data]
 
     def list_paginated(
@@ -194,28 +384,273 @@ class PeopleRepository(BaseRepository[Person]):
         sort_direction: str = "asc",
         search: Optional[str] = None,
         filters: Optional[dict] = None,
-    ) -> tuple[List[Person], int]:
+        cursor: Optional[str] = None,
+    ) -> CursorPage[Person]:
         """
         List people with pagination, sorting, and filtering.
 
-        Returns:
-            tuple: (people_list, total_count)
+        Sorting by an indexed field without a search term walks the sort
+        index (keyset pagination): a page read from a cursor costs about
+        ``page_size`` reads and carries the cursor for the next page. Search
+        terms are answered by the in-memory search index. Other listings fall
+        back to scanning and sorting the whole table.
         """
-        # Get all people data
-        all_people_data = db.scan_table(self.table_name)
+        sort_field = sort_by or "firstName"
+        direction = "desc" if sort_direction.lower() == "desc" else "asc"
+        index_name = self.sort_indexes.get(sort_field)
+        keyset = (
+            not search
+            and index_name is not None
+            and db.has_index(self.table_name, index_name)
+        )
+
+        listing = {"sort": sort_field, "dir": direction, "filters": filters or {}}
+
+        if cursor is not None:
+            state = decode_cursor(cursor)
+            if not keyset or any(
+                state.get(name) != value for name, value in listing.items()
+            ):
+                raise ValidationException(
+                    "Pagination cursor does not match the requested listing",
+                    error_code=ErrorCode.INVALID_INPUT,
+                    field_errors={"cursor": ["Cursor belongs to another listing"]},
+                )
+            return self._list_by_index(
+                index_name, sort_field, direction, page_size, filters, state
+            )
+
+        if keyset:
+            return self._list_by_index(
+                index_name, sort_field, direction, page_size, filters, listing, page
+            )
 
-        # Apply search filter
         if search:
-            search_lower = search.lower().strip()
-            filtered_data = []
-            for person_data in all_people_data:
-                if (
-                    search_lower in person_data.get("firstName", "").lower()
-                    or search_lower in person_data.get("lastName", "").lower()
-                    or search_lower in person_data.get("email", "").lower()
-                ):
-                    filtered_data.append(person_data)
-            all_people_data = filtered_data
+            return self._list_by_search(
+                page, page_size, sort_by, sort_direction, search, filters
+            )
+
+        people, total_count = self._list_by_scan(
+            page, page_size, sort_by, sort_direction, filters
+        )
+        return CursorPage(items=people, pageNumber=page, totalItems=total_count)
+
+    def _list_by_index(
+        self,
+        index_name: str,
+        sort_field: str,
+        direction: str,
+        page_size: int,
+        filters: Optional[dict],
+        state: Dict[str, Any],
+        page: int = 1,
+    ) -> CursorPage[Person]:
+        """Read one page from a sort index, merging its listPartition shards.
+
+        ``state["shards"]`` maps every shard not yet read to the end to the
+        key to resume after (None to start from the top); without it, every
+        shard is read from the top and the first ``page - 1`` pages are
+        skipped.
+        """
+        positions = state.get("shards")
+        if positions is None:
+            positions = {
+                f"{self.LIST_PARTITION}#{shard}": None
+                for shard in range(self.list_shards)
+            }
+        page_number = state.get("page", page)
+        skip = 0 if "shards" in state else (page_number - 1) * page_size
+        wanted = skip + page_size + 1
+        # Each shard holds about 1/n of the page; short shards read on
+        limit = -(-wanted // max(len(positions), 1)) + 1
+        forward = direction == "asc"
+
+        partitions = list(positions)
+        first_pages = db.query_page_many(
+            self.table_name,
+            index_name,
+            [
+                ({"listPartition": partition}, positions[partition])
+                for partition in partitions
+            ],
+            limit,
+            scan_index_forward=forward,
+        )
+
+        def read_shard(partition, items, start_key):
+            while True:
+                for position, item in enumerate(items):
+                    last = not start_key and position == len(items) - 1
+                    yield item[sort_field], partition, item, last
+                if not start_key:
+                    return
+                items, start_key = db.query_page(
+                    self.table_name,
+                    index_name,
+                    {"listPartition": partition},
+                    limit=limit,
+                    exclusive_start_key=start_key,
+                    scan_index_forward=forward,
+                )
+
+        # Shards already read to the end drop out of the next cursor
+        resume = {
+            partition: positions[partition]
+            for partition, (items, start_key) in zip(partitions, first_pages)
+            if items or start_key
+        }
+        merged = heapq.merge(
+            *(
+                read_shard(partition, items, start_key)
+                for partition, (items, start_key) in zip(partitions, first_pages)
+            ),
+            key=lambda entry: entry[0],
+            reverse=not forward,
+        )
+
+        matched: List[Dict[str, Any]] = []
+        evaluated = 0
+        exhausted = True
+        for _, partition, item, last in merged:
+            evaluated += 1
+            if self._matches(item, filters):
+                matched.append(item)
+            if len(matched) == wanted:
+                exhausted = False
+                break
+            if last:
+                resume.pop(partition, None)
+            else:
+                resume[partition] = {
+                    "id": item["id"],
+                    "listPartition": partition,
+                    sort_field: item[sort_field],
+                }
+
+        page_items = matched[skip : skip + page_size]
+        has_more = not exhausted
+        next_cursor = None
+        if has_more:
+            next_cursor = encode_cursor(
+                {**state, "shards": resume, "page": page_number + 1}
+            )
+
+        # The total is exact once the index has been read to the end;
+        # otherwise it is estimated from the table's item count
+        seen = (page_number - 1) * page_size + len(page_items)
+        total, estimate = seen, False
+        if has_more:
+            total = self._estimate_total(filters, len(matched), evaluated)
+            total, estimate = max(total, seen + 1), True
+
+        return CursorPage(
+            items=[Person(**item) for item in page_items],
+            pageNumber=page_number,
+            totalItems=total,
+            totalIsEstimate=estimate,
+            nextCursor=next_cursor,
+        )
+
+    def _matches(self, person_data: Dict[str, Any], filters: Optional[dict]) -> bool:
+        for name, value in (filters or {}).items():
+            default = self.LIST_FILTER_DEFAULTS.get(name)
+            if value is not None and person_data.get(name, default) != value:
+                return False
+        return True
+
+    def _estimate_total(
+        self, filters: Optional[dict], matched: int, evaluated: int
+    ) -> int:
+        """Estimate the listing size from the table's item count.
+
+        Filtered listings scale the count by the match rate of the rows read.
+        """
+        count = db.item_count(self.table_name) or 0
+        if filters and evaluated:
+            return round(count * matched / evaluated)
+        return count
+
+    def search_ids(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """IDs of people matching a search term, best match first.
+
+        Answered from the in-memory search index, which is built from a
+        streamed scan of names and emails on first use and once it is older
+        than ``config.cache.search_index_ttl_seconds``.
+        """
+        self.search_index.refresh(
+            lambda: db.iter_scan(
+                self.table_name,
+                ProjectionExpression="#id, firstName, lastName, email",
+                ExpressionAttributeNames={"#id": "id"},
+            )
+        )
+        return self.search_index.search(query, limit)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Person]:
+        """People matching a search term, best match first."""
+        person_ids = self.search_ids(query, limit)
+        people = self.get_many_by_ids(person_ids)
+        return [people[person_id] for person_id in person_ids if person_id in people]
+
+    def _list_by_search(
+        self,
+        page: int,
+        page_size: int,
+        sort_by: Optional[str],
+        sort_direction: str,
+        search: str,
+        filters: Optional[dict],
+    ) -> CursorPage[Person]:
+        """List search matches, ranked by relevance unless ``sort_by`` is set.
+
+        Without filters or an explicit sort only the requested page is read.
+        """
+        person_ids = self.search_ids(search)
+        start_index = (page - 1) * page_size
+        if not filters and not sort_by:
+            page_ids = person_ids[start_index : start_index + page_size]
+            people = self.get_many_by_ids(page_ids)
+            return CursorPage(
+                items=[
+                    people[person_id] for person_id in page_ids if person_id in people
+                ],
+                pageNumber=page,
+                totalItems=len(person_ids),
+            )
+
+        matches = [
+            item
+            for item in db.get_many(
+                self.table_name, [{"id": person_id} for person_id in person_ids]
+            )
+            if item and self._matches(item, filters)
+        ]
+        if sort_by:
+            # Stable sort: equal values keep their relevance order
+            matches.sort(
+                key=lambda item: str(item.get(sort_by, "")),
+                reverse=sort_direction.lower() == "desc",
+            )
+        return CursorPage(
+            items=[
+                Person(**item)
+                for item in matches[start_index : start_index + page_size]
+            ],
+            pageNumber=page,
+            totalItems=len(matches),
+        )
+
+    def _list_by_scan(
+        self,
+        page: int,
+        page_size: int,
+        sort_by: Optional[str],
+        sort_direction: str,
+        filters: Optional[dict],
+    ) -> tuple[List[Person], int]:
+        """Scan, filter and sort the whole table, then slice out one page."""
+        # Get all people data
+        all_people_data = db.scan_table(self.table_name)
 
         # Apply additional filters
         if filters:
@@ -278,6 +713,14 @@ class PeopleRepository(BaseRepository[Person]):
         person = self.get_by_id(person_id)
         return person is not None
 
+    def existing_emails(self) -> Set[str]:
+        """Normalized emails of every person, read with one projected scan."""
+        return {
+            self.normalize_email(item["email"])
+            for item in self.scan_attributes("email")
+            if item.get("email")
+        }
+
     def email_exists(self, email: str) -> bool:
         """Check if an email address is already in use."""
         person = self.get_by_email(email)
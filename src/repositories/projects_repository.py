@@ -5,10 +5,14 @@ Handles all data access operations for projects.
 
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator
+
+from boto3.dynamodb.conditions import Attr, ConditionBase
 
 from .base_repository import BaseRepository
-from ..core.database import db
+from .stats_repository import PROJECTS, StatsRepository
+from ..core.cache import repository_cache
+from ..core.database import BatchWriteResult, db
 from ..models.project import Project, ProjectCreate, ProjectUpdate, ProjectStatus
 
 
@@ -19,6 +23,11 @@ class ProjectsRepository(BaseRepository[Project]):
         from ..core.config import config
 
         self.table_name = config.database.projects_table
+        db.register_model(self.table_name, Project)
+        self.cache = repository_cache(
+            self.table_name, config.cache.projects_ttl_seconds
+        )
+        self.stats = StatsRepository()
 
     def create(
         self, project_data: ProjectCreate, created_by: str = "system"
@@ -62,43 +71,125 @@ class ProjectsRepository(BaseRepository[Project]):
             )
             raise Exception(f"Failed to create project in database: {str(e)}")
 
+        self.cache.invalidate(project_id)
+        self.stats.record(PROJECTS, new=db_item)
         return Project(**db_item)
 
     def get_by_id(self, project_id: str) -> Optional[Project]:
-        """Get a project by its ID."""
-        project_data = db.get_item(self.table_name, {"id": project_id})
+        """Get a project by its ID (read through the repository cache)."""
+        project_data = self.cache.get_or_load(
+            project_id, lambda: db.get_item(self.table_name, {"id": project_id})
+        )
         if not project_data:
             return None
 
         return Project(**project_data)
 
-    def update(self, project_id: str, updates: ProjectUpdate) -> Optional[Project]:
-        """Update an existing project."""
-        # Check if project exists
-        existing_project = self.get_by_id(project_id)
-        if not existing_project:
+    def get_current(self, project_id: str) -> Optional[Project]:
+        """Get a project with a strongly consistent read, bypassing the cache.
+
+        For values that must include the latest writes, such as the
+        participant count after a subscription.
+        """
+        project_data = db.get_item(
+            self.table_name, {"id": project_id}, consistent_read=True
+        )
+        if not project_data:
             return None
 
+        return Project(**project_data)
+
+    def get_many_by_ids(self, project_ids: List[str]) -> Dict[str, Project]:
+        """Get many projects by ID with batched reads.
+
+        Returns the projects that exist, keyed by ID in the order requested.
+        """
+        items = db.get_many(
+            self.table_name, [{"id": item_id} for item_id in project_ids]
+        )
+        return {
+            project_data["id"]: Project(**project_data)
+            for project_data in items
+            if project_data
+        }
+
+    def update(self, project_id: str, updates: ProjectUpdate) -> Optional[Project]:
+        """Update an existing project."""
         # Prepare update data (exclude None values)
         update_data = updates.model_dump(exclude_none=True)
         if update_data:
             update_data["updatedAt"] = datetime.utcnow().isoformat()
 
-            # Update in database (no field conversion needed!)
-            success = db.update_item(self.table_name, {"id": project_id}, update_data)
-            if not success:
-                raise Exception("Failed to update project in database")
+            # Update in database (no field conversion needed!); the update is
+            # conditioned on the project existing and returns the new item, or
+            # the old one when the aggregate counters need its previous status
+            counted = self.stats.counts_any(PROJECTS, update_data)
+            stored = db.update_item_if_exists(
+                self.table_name, {"id": project_id}, update_data, return_old=counted
+            )
+            self.cache.invalidate(project_id)
+            if not stored:
+                return None
+            if not counted:
+                return Project(**stored)
+            project_data = {**stored, **update_data}
+            self.stats.record(PROJECTS, stored, project_data)
+            return Project(**project_data)
 
-        # Return updated project
+        # Nothing to update: return the project as stored
         return self.get_by_id(project_id)
 
     def delete(self, project_id: str) -> bool:
         """Delete a project by its ID."""
-        return db.delete_item(self.table_name, {"id": project_id})
+        deleted, old = db.delete_item_returning(self.table_name, {"id": project_id})
+        self.cache.invalidate(project_id)
+        if old:
+            self.stats.record(PROJECTS, old=old)
+        return deleted
+
+    def delete_many(self, project_ids: List[str]) -> BatchWriteResult:
+        """Delete many projects by ID with batched writes.
+
+        The projects are read first, in batches, so the aggregate counters
+        can drop what they contributed.
+        """
+        keys = [{"id": project_id} for project_id in project_ids]
+        existing = {
+            item["id"]: item for item in db.get_many(self.table_name, keys) if item
+        }
+        result = db.delete_many(self.table_name, keys)
+        self.cache.invalidate(*project_ids)
+        self.stats.record_many(
+            PROJECTS,
+            [
+                (existing[key["id"]], None)
+                for key in result.succeeded
+                if key["id"] in existing
+            ],
+        )
+        return result
+
+    def invalidate(self, *project_ids: str) -> None:
+        """Drop cached projects after writing them outside this repository."""
+        self.cache.invalidate(*project_ids)
+
+    def scan_attributes(
+        self, *attributes: str, **scan_kwargs: Any
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream the named attributes of every project with a parallel scan."""
+        return db.scan_attributes(self.table_name, attributes, **scan_kwargs)
+
+    def list_all(
+        self, limit: Optional[int] = None, parallel: bool = False
+    ) -> List[Project]:
+        """List all projects with optional limit.
 
-    def list_all(self, limit: Optional[int] = None) -> List[Project]:
-        """List all projects with optional limit."""
-        projects_data = db.scan_table(self.table_name, limit=limit)
+        ``parallel`` uses a segmented parallel scan for full-table reads.
+        """
+        if parallel and not limit:
+            projects_data = db.parallel_scan_table(self.table_name)
+        else:
+            projects_data = db.scan_table(self.table_name, limit=limit)
         return [Project(**project_data) for project_data in projects_data]
 
     def exists(self, project_id: str) -> bool:
@@ -133,15 +224,43 @@ class ProjectsRepository(BaseRepository[Project]):
             if project.status in [ProjectStatus.ACTIVE, ProjectStatus.PENDING]
         ]
 
-    def update_participant_count(
-        self, project_id: str, count: int
+    def participant_count_action(
+        self, project_id: str, amount: int = 1
+    ) -> Dict[str, Any]:
+        """Add ``amount`` to the participant count as a write-transaction action.
+
+        Increments of one only succeed while the project has free spots, and
+        decrements never take the count below zero. The caller invalidates the
+        project once the transaction commits.
+        """
+        return db.counter_update_action(
+            self.table_name,
+            {"id": project_id},
+            "currentParticipants",
+            amount,
+            limit_attribute="maxParticipants" if amount > 0 else None,
+            update_data={"updatedAt": datetime.utcnow().isoformat()},
+        )
+
+    def set_participant_count_where(
+        self, project_id: str, count: int, condition: ConditionBase
     ) -> Optional[Project]:
-        """Update the current participant count for a project."""
+        """Set the participant count only if the project meets ``condition``.
+
+        Only reconcile_participants overwrites the count, from a fresh recount;
+        subscription writes move it with participant_count_action. Returns None when the project does not exist or the condition fails.
+        """
         update_data = {
             "currentParticipants": count,
             "updatedAt": datetime.utcnow().isoformat(),
         }
-        success = db.update_item(self.table_name, {"id": project_id}, update_data)
-        if not success:
+        project_data = db.update_item_where(
+            self.table_name,
+            {"id": project_id},
+            update_data,
+            Attr("id").exists() & condition,
+        )
+        self.cache.invalidate(project_id)
+        if not project_data:
             return None
-        return self.get_by_id(project_id)
+        return Project(**project_data)
@@ -1,11 +1,14 @@
 """Repository for managing user roles in DynamoDB."""
 
+import time
 from typing import List, Optional, Any, Dict
 from datetime import datetime
 import boto3
 from botocore.exceptions import ClientError
 
 from .base_repository import BaseRepository
+from ..core.config import config
+from ..core.database import DatabaseClient, FastAttributeDecoder
 from ..models.rbac import UserRole, RoleType
 
 
@@ -15,7 +18,10 @@ class RolesRepository(BaseRepository):
     def __init__(self):
         super().__init__()
         self.table_name = "people-registry-roles"
-        self.dynamodb = boto3.client("dynamodb", region_name="us-east-1")
+        # Single-item and batched reads share this client, so both hit the
+        # configured region
+        self.dynamodb = boto3.client("dynamodb", region_name=config.database.region)
+        self._decoder = FastAttributeDecoder()
 
     def get_user_roles(self, user_id: str) -> List[UserRole]:
         """Get all roles for a user."""
@@ -28,38 +34,10 @@ class RolesRepository(BaseRepository):
 
             roles = []
             for item in response.get("Items", []):
-                try:
-                    # Parse datetime safely
-                    assigned_at_str = item["assigned_at"]["S"]
-                    if assigned_at_str.endswith("Z"):
-                        assigned_at_str = assigned_at_str[:-1] + "+00:00"
-                    assigned_at = datetime.fromisoformat(assigned_at_str)
-
-                    # Parse expires_at safely
-                    expires_at = None
-                    expires_at_item = item.get("expires_at")
-                    if expires_at_item and not expires_at_item.get("NULL"):
-                        expires_at_str = expires_at_item.get("S")
-                        if expires_at_str:
-                            if expires_at_str.endswith("Z"):
-                                expires_at_str = expires_at_str[:-1] + "+00:00"
-                            expires_at = datetime.fromisoformat(expires_at_str)
-
-                    # Create UserRole with safe parsing
-                    role = UserRole(
-                        user_id=item["user_id"]["S"],
-                        user_email=item.get("email", {}).get("S", ""),
-                        role_type=RoleType(item["role_type"]["S"]),
-                        assigned_at=assigned_at,
-                        assigned_by=item["assigned_by"]["S"],
-                        is_active=item.get("is_active", {"BOOL": True})["BOOL"],
-                        expires_at=expires_at,
-                        notes=item.get("notes", {}).get("S"),
-                    )
+                data = self._decoder.decode_item(item)
+                role = self._parse_role(data)
+                if role:
                     roles.append(role)
-                except (ValueError, KeyError) as e:
-                    print(f"Error parsing role item: {e}, item: {item}")
-                    continue
 
             return roles
 
@@ -67,6 +45,76 @@ class RolesRepository(BaseRepository):
             print(f"Error fetching user roles: {e}")
             return []
 
+    def get_many_by_ids(self, user_ids: List[str]) -> Dict[str, List[UserRole]]:
+        """Get roles for many users with batched reads.
+
+        Role items are keyed by (user_id, role_type) and there are only a few
+        role types, so every candidate key is fetched with BatchGetItem instead
+        of issuing one query per user.
+        """
+        keys = [
+            {"user_id": {"S": user_id}, "role_type": {"S": role_type.value}}
+            for user_id in dict.fromkeys(user_ids)
+            for role_type in RoleType
+        ]
+        roles: Dict[str, List[UserRole]] = {user_id: [] for user_id in user_ids}
+        limit = DatabaseClient.BATCH_GET_LIMIT
+        for start in range(0, len(keys), limit):
+            for item in self._batch_get(keys[start : start + limit]):
+                role = self._parse_role(self._decoder.decode_item(item))
+                if role:
+                    roles.setdefault(role.user_id, []).append(role)
+        return roles
+
+    def _batch_get(self, keys: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Read one BatchGetItem chunk, retrying unprocessed keys."""
+        request = {self.table_name: {"Keys": keys}}
+        items: List[Dict[str, Any]] = []
+        for attempt in range(DatabaseClient.BATCH_MAX_ATTEMPTS):
+            response = self.dynamodb.batch_get_item(RequestItems=request)
+            items.extend(response.get("Responses", {}).get(self.table_name, []))
+            request = response.get("UnprocessedKeys") or {}
+            if not request:
+                return items
+            time.sleep(DatabaseClient._backoff_delay(attempt))
+        raise RuntimeError(
+            f"Role keys still unprocessed after "
+            f"{DatabaseClient.BATCH_MAX_ATTEMPTS} attempts"
+        )
+
+    def _parse_role(self, data: Dict[str, Any]) -> Optional[UserRole]:
+        """Build a UserRole from a deserialized role item."""
+        try:
+            # Parse datetime safely
+            assigned_at_str = data["assigned_at"]
+            if assigned_at_str.endswith("Z"):
+                assigned_at_str = assigned_at_str[:-1] + "+00:00"
+            assigned_at = datetime.fromisoformat(assigned_at_str)
+
+            # Parse expires_at safely
+            expires_at = None
+            expires_at_str = data.get("expires_at")
+            if expires_at_str:
+                if expires_at_str.endswith("Z"):
+                    expires_at_str = expires_at_str[:-1] + "+00:00"
+                expires_at = datetime.fromisoformat(expires_at_str)
+
+            # Create UserRole with safe parsing
+            is_active = data.get("is_active")
+            return UserRole(
+                user_id=data["user_id"],
+                user_email=data.get("email") or "",
+                role_type=RoleType(data["role_type"]),
+                assigned_at=assigned_at,
+                assigned_by=data["assigned_by"],
+                is_active=True if is_active is None else is_active,
+                expires_at=expires_at,
+                notes=data.get("notes"),
+            )
+        except (ValueError, KeyError, AttributeError) as e:
+            print(f"Error parsing role item: {e}, item: {data}")
+            return None
+
     def create_role_assignment(self, user_role: UserRole) -> UserRole:
         """Create a role assignment in DynamoDB."""
         try:
@@ -0,0 +1,256 @@
+"""
+Stats repository implementation.
+Keeps the admin dashboard's aggregate counters in a few small items per scope
+(people, projects, subscriptions). The other repositories ADD deltas to these
+counters right after each successful write, so the dashboard reads a handful
+of items instead of scanning every table. Each scope's counters are split over
+COUNTER_SHARDS items that writes pick at random and reads sum, so no single
+item takes every write; subscription counts per project live in one item per
+project. reconcile() recounts from full scans to correct any drift.
+"""
+
+import logging
+import random
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from boto3.dynamodb.conditions import Attr
+
+from ..core.database import BatchWriteResult, db
+
+logger = logging.getLogger(__name__)
+
+PEOPLE = "people"
+PROJECTS = "projects"
+SUBSCRIPTIONS = "subscriptions"
+
+# Prefixes of per-value counters, e.g. "status:active" or "project:<id>"
+STATUS_PREFIX = "status:"
+PROJECT_PREFIX = "project:"
+
+# Items each scope's counters are spread over. Reads sum every shard, so the
+# number can be raised later but not lowered without a reconcile
+COUNTER_SHARDS = 8
+# Attribute of a per-project item holding the project's subscription count
+PROJECT_SUBSCRIPTIONS = "subscriptions"
+
+
+def _value(value: Any) -> str:
+    return str(getattr(value, "value", value))
+
+
+def person_counters(item: Dict[str, Any]) -> Dict[str, int]:
+    """The counters one person contributes to."""
+    return {
+        "total": 1,
+        "active": int(bool(item.get("isActive", True))),
+        "admins": int(bool(item.get("isAdmin", False))),
+    }
+
+
+def project_counters(item: Dict[str, Any]) -> Dict[str, int]:
+    """The counters one project contributes to."""
+    return {"total": 1, STATUS_PREFIX + _value(item.get("status", "pending")): 1}
+
+
+def subscription_counters(item: Dict[str, Any]) -> Dict[str, int]:
+    """The counters one subscription contributes to."""
+    return {
+        "total": 1,
+        "active": int(bool(item.get("isActive", True))),
+        STATUS_PREFIX + _value(item.get("status", "active")): 1,
+        PROJECT_PREFIX + str(item.get("projectId")): 1,
+    }
+
+
+# Scope -> (counters of one item, the attributes those counters read)
+SCOPES: Dict[str, Tuple[Callable[[Dict[str, Any]], Dict[str, int]], Tuple]] = {
+    PEOPLE: (person_counters, ("isActive", "isAdmin")),
+    PROJECTS: (project_counters, ("status",)),
+    SUBSCRIPTIONS: (subscription_counters, ("isActive", "status", "projectId")),
+}
+
+Change = Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+def shard_id(scope: str, shard: int) -> str:
+    """ID of one of a scope's counter items; shard 0 carries ``reconciledAt``."""
+    return f"{scope}#{shard}"
+
+
+def grouped(counters: Dict[str, int], prefix: str) -> Dict[str, int]:
+    """Per-value counters under ``prefix``, keyed by value, zeros dropped."""
+    return {
+        name[len(prefix) :]: count
+        for name, count in counters.items()
+        if name.startswith(prefix) and count
+    }
+
+
+class StatsRepository:
+    """Repository for the aggregate counters behind the admin dashboard."""
+
+    def __init__(self):
+        from ..core.config import config
+
+        self.table_name = config.database.stats_table
+        self.source_tables = {
+            PEOPLE: config.database.people_table,
+            PROJECTS: config.database.projects_table,
+            SUBSCRIPTIONS: config.database.subscriptions_table,
+        }
+
+    @staticmethod
+    def counts_any(scope: str, update_data: Dict[str, Any]) -> bool:
+        """Whether an update touches attributes the scope's counters read."""
+        return any(field in update_data for field in SCOPES[scope][1])
+
+    def record(
+        self,
+        scope: str,
+        old: Optional[Dict[str, Any]] = None,
+        new: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Count one write: ``old`` is the item before it, ``new`` after it."""
+        self.record_many(scope, [(old, new)])
+
+    def record_many(self, scope: str, changes: Iterable[Change]) -> None:
+        """Count many writes with a single counter update.
+
+        The write itself has already succeeded, so a failed counter update is
+        logged rather than raised; the next reconcile corrects it.
+        """
+        counters_of = SCOPES[scope][0]
+        delta: Counter = Counter()
+        for old, new in changes:
+            if new is not None:
+                delta.update(counters_of(new))
+            if old is not None:
+                delta.subtract(counters_of(old))
+        deltas = {}
+        for name, amount in delta.items():
+            if not amount:
+                continue
+            if name.startswith(PROJECT_PREFIX):
+                self._increment(name, {PROJECT_SUBSCRIPTIONS: amount})
+            else:
+                deltas[name] = amount
+        if deltas:
+            shard = random.randrange(COUNTER_SHARDS)
+            self._increment(shard_id(scope, shard), deltas)
+
+    def _increment(self, item_id: str, deltas: Dict[str, int]) -> None:
+        try:
+            updated = db.increment(self.table_name, {"id": item_id}, deltas)
+        except Exception as e:
+            logger.error(f"Error updating {item_id} counters: {e}")
+            updated = False
+        if not updated:
+            logger.warning(f"{item_id} counters may have drifted until reconciled")
+
+    def get_counters(self) -> Dict[str, Dict[str, int]]:
+        """Every scope's counters summed over its shards, read with one BatchGetItem.
+
+        Subscription counts per project are read with get_project_counters.
+        Counters that have never been reconciled are seeded by a reconcile.
+        """
+        keys = [
+            {"id": shard_id(scope, shard)}
+            for scope in SCOPES
+            for shard in range(COUNTER_SHARDS)
+        ]
+        items = db.get_many(self.table_name, keys)
+        stats: Dict[str, Counter] = {scope: Counter() for scope in SCOPES}
+        for position, item in enumerate(items):
+            scope = list(SCOPES)[position // COUNTER_SHARDS]
+            if item is None:
+                if position % COUNTER_SHARDS == 0:
+                    return self.reconcile()
+                continue
+            stats[scope].update(self._counters(item))
+        return {scope: dict(counts) for scope, counts in stats.items()}
+
+    def get_project_counters(self) -> Dict[str, int]:
+        """Subscriptions per project ID, from the per-project counter items."""
+        return {
+            item["id"][len(PROJECT_PREFIX) :]: int(item[PROJECT_SUBSCRIPTIONS])
+            for item in self._project_items()
+            if int(item.get(PROJECT_SUBSCRIPTIONS, 0))
+        }
+
+    def reconcile(self) -> Dict[str, Dict[str, int]]:
+        """Recount every scope from a scan of its table and store the result.
+
+        Shard 0 of each scope gets the recount and the other shards are
+        cleared; per-project counters are rewritten the same way. Writes that
+        land while a table is being scanned can leave its counters off by
+        those writes until the next reconcile.
+        """
+        now = datetime.utcnow().isoformat()
+        stats = {}
+        for scope, (counters_of, fields) in SCOPES.items():
+            counts: Counter = Counter()
+            for item in db.scan_attributes(self.source_tables[scope], fields):
+                counts.update(counters_of(item))
+            per_project = {
+                name: counts.pop(name)
+                for name in list(counts)
+                if name.startswith(PROJECT_PREFIX)
+            }
+            stats[scope] = dict(counts)
+            db.put_item(
+                self.table_name,
+                {"id": shard_id(scope, 0), **counts, "reconciledAt": now},
+            )
+            self._check(
+                db.delete_many(
+                    self.table_name,
+                    [
+                        {"id": shard_id(scope, shard)}
+                        for shard in range(1, COUNTER_SHARDS)
+                    ],
+                )
+            )
+            if scope == SUBSCRIPTIONS:
+                self._store_project_counters(per_project)
+        return stats
+
+    def _project_items(self) -> List[Dict[str, Any]]:
+        return list(
+            db.iter_scan(
+                self.table_name,
+                FilterExpression=Attr("id").begins_with(PROJECT_PREFIX),
+            )
+        )
+
+    def _store_project_counters(self, counts: Dict[str, int]) -> None:
+        """Replace the per-project items with ``counts``, keyed by item ID."""
+        stale = [
+            {"id": item["id"]}
+            for item in self._project_items()
+            if item["id"] not in counts
+        ]
+        self._check(
+            db.put_many(
+                self.table_name,
+                [
+                    {"id": item_id, PROJECT_SUBSCRIPTIONS: count}
+                    for item_id, count in counts.items()
+                ],
+            )
+        )
+        self._check(db.delete_many(self.table_name, stale))
+
+    @staticmethod
+    def _check(result: BatchWriteResult) -> None:
+        if result.failed:
+            raise Exception(f"Failed to write {result.failure_count} counter items")
+
+    @staticmethod
+    def _counters(item: Dict[str, Any]) -> Dict[str, int]:
+        return {
+            name: int(value)
+            for name, value in item.items()
+            if name not in ("id", "reconciledAt")
+        }
@@ -5,25 +5,112 @@ Handles all data access operations for subscriptions.
 
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Tuple, Iterator
+
+from boto3.dynamodb.conditions import Attr
 
 from .base_repository import BaseRepository
-from ..core.database import db
+from .projects_repository import ProjectsRepository
+from .stats_repository import SUBSCRIPTIONS, StatsRepository
+from ..core.database import BatchWriteResult, TransactionCancelledError, db
 from ..models.subscription import Subscription, SubscriptionCreate, SubscriptionUpdate
 
+# Namespace for deterministic subscription IDs derived from personId#projectId
+SUBSCRIPTION_PAIR_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_DNS, "subscriptions.registry")
+
 
 class SubscriptionsRepository(BaseRepository[Subscription]):
     """Repository for subscriptions data access operations."""
 
+    # A subscription holds one of its project's spots (currentParticipants)
+    # while its status is one of these and isActive is true; pending,
+    # cancelled and inactive subscriptions hold none
+    SEAT_STATUSES = frozenset({"active"})
+    # Writes that may move a seat are conditioned on the updatedAt they read
+    # and retried this many times when another write got there first
+    SEAT_WRITE_ATTEMPTS = 3
+
     def __init__(self):
         from ..core.config import config
 
         self.table_name = config.database.subscriptions_table
+        db.register_model(self.table_name, Subscription)
+        self.projects_repository = ProjectsRepository()
+        self.stats = StatsRepository()
+        self.person_index = config.database.subscriptions_person_index
+        self.project_index = config.database.subscriptions_project_index
+        self.legacy_pair_lookup = config.database.subscriptions_legacy_pair_lookup
+
+    @staticmethod
+    def pair_id(person_id: str, project_id: str) -> str:
+        """Deterministic subscription ID for a person and project.
+
+        Derived from ``personId#projectId`` so the pair lookup is one GetItem.
+        """
+        return str(uuid.uuid5(SUBSCRIPTION_PAIR_NAMESPACE, f"{person_id}#{project_id}"))
 
     def create(self, subscription_data: SubscriptionCreate) -> Subscription:
         """Create a new subscription in the database."""
-        # Generate ID and timestamps
-        subscription_id = str(uuid.uuid4())
+        db_item = self._new_item(subscription_data)
+
+        # Save to database
+        success = db.put_item(self.table_name, db_item)
+        if not success:
+            raise Exception("Failed to create subscription in database")
+
+        self.stats.record(SUBSCRIPTIONS, new=db_item)
+        return Subscription(**db_item)
+
+    @classmethod
+    def holds_seat(cls, subscription_data: Dict[str, Any]) -> bool:
+        """Whether a subscription counts towards its project's participants."""
+        return subscription_data.get("status", "active") in cls.SEAT_STATUSES and bool(
+            subscription_data.get("isActive", True)
+        )
+
+    def create_reserving_seat(
+        self,
+        subscription_data: SubscriptionCreate,
+        extra_actions: Sequence[Dict[str, Any]] = (),
+    ) -> Subscription:
+        """Create a subscription and take a project spot in one transaction.
+
+        Only subscriptions that hold a seat take a spot. ``extra_actions``,
+        such as outbox messages, are written in the same transaction. Raises
+        TransactionCancelledError when the transaction is rejected;
+        ``reasons[0]`` is the subscription insert (already exists) and
+        ``reasons[1]`` the project spot (project missing or full).
+        """
+        db_item = self._new_item(subscription_data)
+        seat = self.holds_seat(db_item)
+        actions = [
+            {
+                "Put": {
+                    "TableName": self.table_name,
+                    "Item": db_item,
+                    "ConditionExpression": "attribute_not_exists(#id)",
+                    "ExpressionAttributeNames": {"#id": "id"},
+                }
+            }
+        ]
+        if seat:
+            actions.append(
+                self.projects_repository.participant_count_action(
+                    subscription_data.projectId, 1
+                )
+            )
+        db.transact_write([*actions, *extra_actions])
+        if seat:
+            self.projects_repository.invalidate(subscription_data.projectId)
+        self.stats.record(SUBSCRIPTIONS, new=db_item)
+        return Subscription(**db_item)
+
+    def _new_item(self, subscription_data: SubscriptionCreate) -> Dict[str, Any]:
+        """Build the database item for a new subscription."""
+        # Deterministic ID from the person/project pair, plus timestamps
+        subscription_id = self.pair_id(
+            subscription_data.personId, subscription_data.projectId
+        )
         now = datetime.utcnow()
 
         # Convert to database format (already camelCase - no conversion needed!)
@@ -37,13 +124,7 @@ class SubscriptionsRepository(BaseRepository[Subscription]):
                 "isActive": True,
             }
         )
-
-        # Save to database
-        success = db.put_item(self.table_name, db_item)
-        if not success:
-            raise Exception("Failed to create subscription in database")
-
-        return Subscription(**db_item)
+        return db_item
 
     def get_by_id(self, subscription_id: str) -> Optional[Subscription]:
         """Get a subscription by its ID."""
@@ -53,69 +134,409 @@ class SubscriptionsRepository(BaseRepository[Subscription]):
 
         return Subscription(**subscription_data)
 
+    def get_many_by_ids(self, subscription_ids: List[str]) -> Dict[str, Subscription]:
+        """Get many subscriptions by ID with batched reads.
+
+        Returns the subscriptions that exist, keyed by ID in the order requested.
+        """
+        items = db.get_many(
+            self.table_name, [{"id": item_id} for item_id in subscription_ids]
+        )
+        return {
+            subscription_data["id"]: Subscription(**subscription_data)
+            for subscription_data in items
+            if subscription_data
+        }
+
     def get_by_person_and_project(
         self, person_id: str, project_id: str
     ) -> Optional[Subscription]:
-        """Get a subscription by person and project IDs."""
-        # Scan for subscription with matching person and project
-        all_subscriptions = db.scan_table(self.table_name)
-        for subscription_data in all_subscriptions:
-            if (
-                subscription_data.get("personId") == person_id
-                and subscription_data.get("projectId") == project_id
-            ):
-                return Subscription(**subscription_data)
+        """Get a subscription by person and project IDs with one GetItem.
+
+        Subscriptions created before pair IDs are only found when the legacy
+        pair lookup is enabled, until rekey_legacy_ids has moved them.
+        """
+        subscription_data = db.get_item(
+            self.table_name, {"id": self.pair_id(person_id, project_id)}
+        )
+        if subscription_data:
+            return Subscription(**subscription_data)
+
+        if self.legacy_pair_lookup:
+            for subscription in self.get_by_person(person_id):
+                if subscription.projectId == project_id:
+                    return subscription
         return None
 
+    def rekey_legacy_ids(self) -> Dict[str, List[str]]:
+        """Move subscriptions with random IDs to their pair ID.
+
+        Each row is written under its pair ID and its old row deleted in one
+        transaction, the delete conditioned on the row being unchanged since
+        it was scanned. Seats and counters are unaffected. A pair that already
+        has a row under its pair ID is a duplicate and is left in place.
+        Returns the old IDs that were ``rekeyed``, the ``duplicates`` and the
+        rows ``changed`` while running (run again for those).
+        """
+        outcome: Dict[str, List[str]] = {
+            "rekeyed": [],
+            "duplicates": [],
+            "changed": [],
+        }
+        for item in db.parallel_scan(self.table_name):
+            pair_id = self.pair_id(item["personId"], item["projectId"])
+            if item["id"] == pair_id:
+                continue
+            delete: Dict[str, Any] = {
+                "TableName": self.table_name,
+                "Key": {"id": item["id"]},
+            }
+            if "updatedAt" in item:
+                delete.update(
+                    ConditionExpression="#updatedAt = :readUpdatedAt",
+                    ExpressionAttributeNames={"#updatedAt": "updatedAt"},
+                    ExpressionAttributeValues={":readUpdatedAt": item["updatedAt"]},
+                )
+            else:
+                delete.update(
+                    ConditionExpression=(
+                        "attribute_exists(#id) AND attribute_not_exists(#updatedAt)"
+                    ),
+                    ExpressionAttributeNames={"#id": "id", "#updatedAt": "updatedAt"},
+                )
+            try:
+                db.transact_write(
+                    [
+                        {
+                            "Put": {
+                                "TableName": self.table_name,
+                                "Item": {**item, "id": pair_id},
+                                "ConditionExpression": "attribute_not_exists(#id)",
+                                "ExpressionAttributeNames": {"#id": "id"},
+                            }
+                        },
+                        {"Delete": delete},
+                    ]
+                )
+            except TransactionCancelledError as e:
+                if e.reasons[0] == "ConditionalCheckFailed":
+                    outcome["duplicates"].append(item["id"])
+                else:
+                    outcome["changed"].append(item["id"])
+                continue
+            outcome["rekeyed"].append(item["id"])
+        return outcome
+
     def get_by_person(self, person_id: str) -> List[Subscription]:
         """Get all subscriptions for a person."""
-        all_subscriptions = db.scan_table(self.table_name)
-        person_subscriptions = []
-        for subscription_data in all_subscriptions:
-            if subscription_data.get("personId") == person_id:
-                person_subscriptions.append(Subscription(**subscription_data))
-        return person_subscriptions
+        return self._list_by("personId", person_id, self.person_index)
 
     def get_by_project(self, project_id: str) -> List[Subscription]:
         """Get all subscriptions for a project."""
-        all_subscriptions = db.scan_table(self.table_name)
-        project_subscriptions = []
-        for subscription_data in all_subscriptions:
-            if subscription_data.get("projectId") == project_id:
-                project_subscriptions.append(Subscription(**subscription_data))
-        return project_subscriptions
+        return self._list_by("projectId", project_id, self.project_index)
+
+    def get_page_by_person(
+        self,
+        person_id: str,
+        limit: int,
+        exclusive_start_key: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Subscription], Optional[Dict[str, Any]]]:
+        """Get one page of a person's subscriptions and the resume token."""
+        return self._page_by(
+            "personId", person_id, self.person_index, limit, exclusive_start_key
+        )
+
+    def get_page_by_project(
+        self,
+        project_id: str,
+        limit: int,
+        exclusive_start_key: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Subscription], Optional[Dict[str, Any]]]:
+        """Get one page of a project's subscriptions and the resume token."""
+        return self._page_by(
+            "projectId", project_id, self.project_index, limit, exclusive_start_key
+        )
+
+    def _list_by(
+        self, attribute: str, value: str, index_name: str
+    ) -> List[Subscription]:
+        """List subscriptions with ``attribute == value``.
+
+        Uses the attribute's GSI when it exists and streams the table otherwise.
+        """
+        if db.has_index(self.table_name, index_name):
+            items = db.query_by_index(self.table_name, index_name, {attribute: value})
+        else:
+            items = (
+                subscription_data
+                for subscription_data in db.iter_scan(self.table_name)
+                if subscription_data.get(attribute) == value
+            )
+        return [Subscription(**subscription_data) for subscription_data in items]
+
+    def _page_by(
+        self,
+        attribute: str,
+        value: str,
+        index_name: str,
+        limit: int,
+        exclusive_start_key: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Subscription], Optional[Dict[str, Any]]]:
+        """Read one GSI page of subscriptions with ``attribute == value``."""
+        if db.has_index(self.table_name, index_name):
+            items, last_key = db.query_page(
+                self.table_name,
+                index_name,
+                {attribute: value},
+                limit,
+                exclusive_start_key,
+            )
+        else:
+            # Without the index a scan page may hold fewer than ``limit`` matches
+            items, last_key = db.scan_page(
+                self.table_name,
+                limit,
+                exclusive_start_key,
+                FilterExpression=Attr(attribute).eq(value),
+            )
+        return [Subscription(**item) for item in items], last_key
 
     def update(
         self, subscription_id: str, updates: SubscriptionUpdate
     ) -> Optional[Subscription]:
-        """Update an existing subscription."""
-        # Check if subscription exists
-        existing_subscription = self.get_by_id(subscription_id)
-        if not existing_subscription:
-            return None
+        """Update an existing subscription.
 
+        Changes to ``status`` or ``isActive`` go through update_moving_seat so
+        the project's participant count follows them.
+        """
         # Prepare update data (exclude None values)
         update_data = updates.model_dump(exclude_none=True)
         if update_data:
             update_data["updatedAt"] = datetime.utcnow().isoformat()
+            if "status" in update_data or "isActive" in update_data:
+                return self.update_moving_seat(subscription_id, update_data)
 
-            # Update in database (no field conversion needed!)
-            success = db.update_item(
-                self.table_name, {"id": subscription_id}, update_data
+            # Update in database (no field conversion needed!); the update is
+            # conditioned on the subscription existing and returns the new
+            # item, or the old one when the aggregate counters need it
+            counted = self.stats.counts_any(SUBSCRIPTIONS, update_data)
+            stored = db.update_item_if_exists(
+                self.table_name,
+                {"id": subscription_id},
+                update_data,
+                return_old=counted,
             )
-            if not success:
-                raise Exception("Failed to update subscription in database")
+            if not stored:
+                return None
+            if not counted:
+                return Subscription(**stored)
+            subscription_data = {**stored, **update_data}
+            self.stats.record(SUBSCRIPTIONS, stored, subscription_data)
+            return Subscription(**subscription_data)
 
-        # Return updated subscription
+        # Nothing to update: return the subscription as stored
         return self.get_by_id(subscription_id)
 
+    def update_moving_seat(
+        self, subscription_id: str, update_data: Dict[str, Any]
+    ) -> Optional[Subscription]:
+        """Apply an update and take or free a project spot when it changes
+        whether the subscription holds a seat.
+
+        The write is conditioned on the ``updatedAt`` it was planned from, and
+        a seat move commits with the counter change in one transaction.
+        Returns None when the subscription does not exist. Raises
+        TransactionCancelledError when the project has no free spot
+        (``reasons[1]``) or when concurrent writes won every attempt
+        (``reasons[0]``).
+        """
+        key = {"id": subscription_id}
+        for _ in range(self.SEAT_WRITE_ATTEMPTS):
+            current = db.get_item(self.table_name, key)
+            if not current:
+                return None
+            updated = {**current, **update_data}
+            delta = int(self.holds_seat(updated)) - int(self.holds_seat(current))
+            if not delta:
+                if not self._update_if_unchanged(current, update_data):
+                    continue
+            else:
+                try:
+                    db.transact_write(
+                        [
+                            db.update_action(
+                                self.table_name,
+                                key,
+                                update_data,
+                                "#updatedAt = :readUpdatedAt",
+                                {"#updatedAt": "updatedAt"},
+                                {":readUpdatedAt": current["updatedAt"]},
+                            ),
+                            self.projects_repository.participant_count_action(
+                                current["projectId"], delta
+                            ),
+                        ]
+                    )
+                    self.projects_repository.invalidate(current["projectId"])
+                except TransactionCancelledError as e:
+                    if e.reasons[0] == "ConditionalCheckFailed":
+                        continue
+                    if delta > 0:
+                        raise
+                    # No counted spot to free (e.g. subscribed before counting)
+                    if not self._update_if_unchanged(current, update_data):
+                        continue
+            self.stats.record(SUBSCRIPTIONS, current, updated)
+            return Subscription(**updated)
+        raise TransactionCancelledError(["ConditionalCheckFailed"])
+
+    def _update_if_unchanged(
+        self, current: Dict[str, Any], update_data: Dict[str, Any]
+    ) -> bool:
+        """Update a subscription unless it changed since ``current`` was read."""
+        stored = db.update_item_where(
+            self.table_name,
+            {"id": current["id"]},
+            update_data,
+            Attr("updatedAt").eq(current["updatedAt"]),
+        )
+        return stored is not None
+
     def delete(self, subscription_id: str) -> bool:
         """Delete a subscription by its ID."""
-        return db.delete_item(self.table_name, {"id": subscription_id})
+        deleted, old = db.delete_item_returning(
+            self.table_name, {"id": subscription_id}
+        )
+        if old:
+            self.stats.record(SUBSCRIPTIONS, old=old)
+        return deleted
+
+    def delete_releasing_seat(self, subscription_id: str) -> bool:
+        """Delete a subscription and free its project spot in one transaction.
+
+        Subscriptions that hold no seat are deleted on their own. Like
+        update_moving_seat, the delete is conditioned on the ``updatedAt`` it
+        was planned from. Returns False when the subscription does not exist.
+        """
+        key = {"id": subscription_id}
+        for _ in range(self.SEAT_WRITE_ATTEMPTS):
+            current = db.get_item(self.table_name, key)
+            if not current:
+                return False
+            actions = [
+                {
+                    "Delete": {
+                        "TableName": self.table_name,
+                        "Key": key,
+                        "ConditionExpression": "#updatedAt = :readUpdatedAt",
+                        "ExpressionAttributeNames": {"#updatedAt": "updatedAt"},
+                        "ExpressionAttributeValues": {
+                            ":readUpdatedAt": current["updatedAt"]
+                        },
+                    }
+                }
+            ]
+            if self.holds_seat(current):
+                actions.append(
+                    self.projects_repository.participant_count_action(
+                        current["projectId"], -1
+                    )
+                )
+            try:
+                db.transact_write(actions)
+            except TransactionCancelledError as e:
+                if e.reasons[0] == "ConditionalCheckFailed":
+                    continue
+                # No counted spot to free (e.g. subscribed before counting)
+                try:
+                    db.transact_write(actions[:1])
+                except TransactionCancelledError:
+                    continue
+            if len(actions) > 1:
+                self.projects_repository.invalidate(current["projectId"])
+            self.stats.record(SUBSCRIPTIONS, old=current)
+            return True
+        raise TransactionCancelledError(["ConditionalCheckFailed"])
+
+    def delete_many(self, subscription_ids: List[str]) -> BatchWriteResult:
+        """Delete many subscriptions, freeing each one's spot transactionally.
+
+        Each subscription is deleted with delete_releasing_seat, so seats and
+        aggregate counters stay in step and a failure affects only its own
+        ID. IDs that do not exist are reported as failed.
+        """
+        result = BatchWriteResult()
+        for subscription_id in dict.fromkeys(subscription_ids):
+            key = {"id": subscription_id}
+            try:
+                if self.delete_releasing_seat(subscription_id):
+                    result.succeeded.append(key)
+                else:
+                    result.failed.append({"key": key, "error": "Item not found"})
+            except Exception as e:
+                result.failed.append({"key": key, "error": str(e)})
+        return result
+
+    def count_seats(self, project_id: str) -> int:
+        """Count a project's seat-holding subscriptions from the project index."""
+        return sum(
+            1
+            for subscription in self.get_by_project(project_id)
+            if self.holds_seat(subscription.model_dump())
+        )
+
+    def reconcile_participants(self) -> Dict[str, Tuple[int, int]]:
+        """Recount every project's currentParticipants from its subscriptions.
+
+        Each count is stored only if the stored value has not moved since it
+        was read, and retried otherwise. Returns ``{project_id: (old, new)}``
+        for the projects whose count changed.
+        """
+        changed = {}
+        for project in self.projects_repository.scan_attributes(
+            "id", "currentParticipants"
+        ):
+            project_id = project["id"]
+            for _ in range(self.SEAT_WRITE_ATTEMPTS):
+                stored = project.get("currentParticipants")
+                seats = self.count_seats(project_id)
+                if stored is not None and int(stored) == seats:
+                    break
+                condition = (
+                    Attr("currentParticipants").not_exists()
+                    if stored is None
+                    else Attr("currentParticipants").eq(stored)
+                )
+                if self.projects_repository.set_participant_count_where(
+                    project_id, seats, condition
+                ):
+                    changed[project_id] = (int(stored or 0), seats)
+                    break
+                project = (
+                    db.get_item(self.projects_repository.table_name, {"id": project_id})
+                    or {}
+                )
+                if not project:
+                    break
+        return changed
+
+    def scan_attributes(
+        self, *attributes: str, **scan_kwargs: Any
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream the named attributes of every subscription with a parallel scan."""
+        return db.scan_attributes(self.table_name, attributes, **scan_kwargs)
+
+    def list_all(
+        self, limit: Optional[int] = None, parallel: bool = False
+    ) -> List[Subscription]:
+        """List all subscriptions with optional limit.
 
-    def list_all(self, limit: Optional[int] = None) -> List[Subscription]:
-        """List all subscriptions with optional limit."""
-        subscriptions_data = db.scan_table(self.table_name, limit=limit)
+        ``parallel`` uses a segmented parallel scan for full-table reads.
+        """
+        if parallel and not limit:
+            subscriptions_data = db.parallel_scan_table(self.table_name)
+        else:
+            subscriptions_data = db.scan_table(self.table_name, limit=limit)
         return [
             Subscription(**subscription_data)
             for subscription_data in subscriptions_data
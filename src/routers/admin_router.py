@@ -5,13 +5,20 @@ All fields use camelCase - no mapping complexity.
 
 from datetime import datetime
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import iterate_in_threadpool
 
+from ..core.config import config
+from ..repositories.async_repository import run_in_db_executor
 from ..services.admin_service import AdminService
+from ..services.bulk_jobs_service import BulkJobsService
 from ..services.people_service import PeopleService
+from ..services.s3_export_service import S3ExportService
 from ..services.subscriptions_service import SubscriptionsService
 from ..services.service_registry_manager import (
     get_admin_service,
+    get_bulk_jobs_service,
     get_people_service,
     get_subscriptions_service,
     get_performance_service,
@@ -28,18 +35,30 @@ from ..models.auth import User
 from ..models.person import PersonCreate, PersonUpdate, PersonResponse
 from ..routers.auth_router import require_admin, get_current_user
 from ..utils.responses import create_success_response, create_error_response
+from ..utils.exports import MEDIA_TYPES, csv_lines, ndjson_lines
+from ..utils.imports import FORMATS as IMPORT_FORMATS, import_records
 
 router = APIRouter(prefix="/v2/admin", tags=["admin"])
 
 
+def get_s3_export_service() -> S3ExportService:
+    """Dependency to get S3 export service"""
+    return S3ExportService()
+
+
 @router.get("/dashboard", response_model=dict)
 async def get_dashboard_data(
+    fresh: bool = Query(
+        False, description="Recompute instead of serving a cached snapshot"
+    ),
     current_user: User = Depends(require_admin),
     admin_service: AdminService = Depends(get_admin_service),
 ):
     """Get admin dashboard data."""
     try:
-        dashboard_data = admin_service.get_dashboard_data()
+        dashboard_data = await run_in_db_executor(
+            admin_service.get_dashboard_data, fresh=fresh
+        )
 
         # Log successful dashboard access
         from ..services.logging_service import logging_service
@@ -100,12 +119,17 @@ async def get_dashboard_data(
 
 @router.get("/dashboard/enhanced", response_model=dict)
 async def get_enhanced_dashboard(
+    fresh: bool = Query(
+        False, description="Recompute instead of serving a cached snapshot"
+    ),
     current_user: User = Depends(require_admin),
     admin_service: AdminService = Depends(get_admin_service),
 ):
     """Get enhanced admin dashboard data."""
     try:
-        enhanced_data = await admin_service.get_enhanced_dashboard_data()
+        enhanced_data = await run_in_db_executor(
+            admin_service.get_enhanced_dashboard_data, fresh=fresh
+        )
         return create_success_response(enhanced_data)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -113,13 +137,106 @@ async def get_enhanced_dashboard(
 
 @router.get("/analytics", response_model=dict)
 async def get_admin_analytics(
+    fresh: bool = Query(
+        False, description="Recompute instead of serving a cached snapshot"
+    ),
+    bucket: str = Query("day", description="Signup series bucket: day or week"),
     current_user: User = Depends(require_admin),
     admin_service: AdminService = Depends(get_admin_service),
 ):
     """Get detailed analytics data."""
     try:
-        analytics_data = await admin_service.get_analytics_data()
+        analytics_data = await run_in_db_executor(
+            admin_service.get_analytics_data, fresh=fresh, bucket=bucket
+        )
         return create_success_response(analytics_data)
+    except ValidationException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/stats/reconcile", response_model=dict)
+async def reconcile_stats(
+    current_user: User = Depends(require_admin),
+    admin_service: AdminService = Depends(get_admin_service),
+):
+    """Recount the dashboard counters from the tables to correct drift."""
+    try:
+        counters = await run_in_db_executor(admin_service.reconcile_counters)
+        return create_success_response(counters)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/export/{resource}")
+async def export_resource(
+    resource: str,
+    export_format: str = Query(
+        "ndjson", alias="format", description="Export format: ndjson or csv"
+    ),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated fields to export (default: all)"
+    ),
+    filter: List[str] = Query(
+        [], description="Equality filters as field:value, repeatable"
+    ),
+    current_user: User = Depends(require_admin),
+    admin_service: AdminService = Depends(get_admin_service),
+    export_service: S3ExportService = Depends(get_s3_export_service),
+):
+    """Stream people, projects or subscriptions as NDJSON or CSV.
+
+    With exports to S3 enabled (the default on Lambda, which buffers whole
+    responses and caps them at 6 MB), the export is uploaded to S3 and the
+    response carries a presigned download URL instead.
+    """
+    try:
+        if export_format not in MEDIA_TYPES:
+            raise ValidationException(
+                message=f"Unknown export format: {export_format}",
+                field_errors={"format": [f"Must be one of: {', '.join(MEDIA_TYPES)}"]},
+            )
+        filters = {}
+        for item in filter:
+            name, separator, value = item.partition(":")
+            if not separator or not name:
+                raise ValidationException(
+                    message=f"Invalid filter: {item}",
+                    field_errors={"filter": ["Must be field:value"]},
+                )
+            filters[name] = value
+        selected = [name.strip() for name in (fields or "").split(",") if name.strip()]
+        columns, rows = admin_service.export_rows(resource, selected, filters)
+
+        if export_format == "csv":
+            body = csv_lines(rows, columns)
+        else:
+            body = ndjson_lines(rows)
+        filename = f"{resource}.{export_format}"
+
+        if config.export.to_s3:
+            download = await run_in_db_executor(
+                export_service.upload, body, filename, MEDIA_TYPES[export_format]
+            )
+            return create_success_response(download)
+
+        # Read the first chunk now so scan errors fail the request instead of
+        # cutting off a response that has already started; the scan runs on
+        # the database executor, never on the event loop
+        first = await run_in_db_executor(next, body, "")
+
+        def stream():
+            yield first
+            yield from body
+
+        return StreamingResponse(
+            iterate_in_threadpool(stream()),
+            media_type=MEDIA_TYPES[export_format],
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+    except ValidationException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -136,30 +253,26 @@ async def list_users(
     try:
         from ..services.service_registry_manager import get_rbac_service
 
-        users = people_service.list_people(limit=limit)
-
-        # Apply search filter if provided
+        # Searches are answered by the people search index, best match first
         if search:
-            search_lower = search.lower()
-            users = [
-                user
-                for user in users
-                if (
-                    search_lower in user.firstName.lower()
-                    or search_lower in user.lastName.lower()
-                    or search_lower in user.email.lower()
-                )
-            ]
+            users = people_service.search_people(search, limit=limit)
+        else:
+            users = people_service.list_people(limit=limit)
 
-        # Add roles to each user
+        # Add roles to each user (role items are loaded in batched reads)
         rbac_service = get_rbac_service()
+        user_dicts = [
+            user if isinstance(user, dict) else user.model_dump() for user in users
+        ]
+        roles_by_user = await rbac_service.get_users_roles(
+            [user_dict.get("id") for user_dict in user_dicts]
+        )
         users_with_roles = []
-        for user in users:
-            user_dict = user if isinstance(user, dict) else user.model_dump()
+        for user_dict in user_dicts:
             user_id = user_dict.get("id")
 
             # Get user roles from RBAC service
-            user_roles = await rbac_service.get_user_roles(user_id)
+            user_roles = roles_by_user.get(user_id, [])
             role_names = [role.value for role in user_roles]
 
             # Fallback: If no roles found but user is admin, assign admin role
@@ -183,6 +296,9 @@ async def list_users_paginated(
         "asc", pattern="^(asc|desc)$", description="Sort direction"
     ),
     search: Optional[str] = Query(None, description="Search term"),
+    cursor: Optional[str] = Query(
+        None, description="nextCursor of the previous page (overrides page)"
+    ),
     isAdmin: Optional[bool] = Query(None, description="Filter by admin status"),
     isActive: Optional[bool] = Query(None, description="Filter by active status"),
     emailVerified: Optional[bool] = Query(
@@ -205,22 +321,23 @@ async def list_users_paginated(
             filters["emailVerified"] = emailVerified
 
         # Get paginated results
-        users, total_count = people_service.list_people_paginated(
+        users_page = people_service.list_people_paginated(
             page=page,
             page_size=pageSize,
             sort_by=sortBy,
             sort_direction=sortDirection,
             search=search,
             filters=filters if filters else None,
+            cursor=cursor,
         )
 
         # Create paginated response
-        paginated_response = PaginatedResponse.create(
-            items=users, total_items=total_count, page=page, page_size=pageSize
-        )
+        paginated_response = PaginatedResponse.from_cursor_page(users_page, pageSize)
 
         return create_success_response(paginated_response.model_dump())
 
+    except ValidationException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -366,17 +483,131 @@ async def bulk_user_action(
     current_user: User = Depends(require_admin),
     admin_service: AdminService = Depends(get_admin_service),
 ):
-    """Execute bulk action on users."""
+    """Execute bulk action on users.
+
+    Runs inline; large selections should be submitted to /jobs/bulk-user-action.
+    """
     try:
-        results = await admin_service.execute_bulk_action(bulk_data)
+        results = await run_in_db_executor(admin_service.execute_bulk_action, bulk_data)
         return create_success_response(results)
+    except ValidationException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Background jobs
+@router.post("/jobs/bulk-user-action", response_model=dict, status_code=202)
+async def submit_bulk_user_job(
+    bulk_data: dict,
+    current_user: User = Depends(require_admin),
+    jobs_service: BulkJobsService = Depends(get_bulk_jobs_service),
+):
+    """Start a bulk action on users in the background and return its job."""
+    try:
+        job = await run_in_db_executor(
+            jobs_service.submit,
+            bulk_data.get("action"),
+            bulk_data.get("userIds") or [],
+            requested_by=current_user.id,
+        )
+        return create_success_response(job)
+    except ValidationException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/jobs/{job_id}", response_model=dict)
+async def get_job(
+    job_id: str,
+    includeResults: bool = Query(
+        False, description="Include the outcome of every processed user"
+    ),
+    current_user: User = Depends(require_admin),
+    jobs_service: BulkJobsService = Depends(get_bulk_jobs_service),
+):
+    """Get a job's progress."""
+    try:
+        job = await run_in_db_executor(
+            jobs_service.get_job, job_id, include_results=includeResults
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return create_success_response(job)
+
+
+@router.post("/jobs/{job_id}/resume", response_model=dict)
+async def resume_job(
+    job_id: str,
+    current_user: User = Depends(require_admin),
+    jobs_service: BulkJobsService = Depends(get_bulk_jobs_service),
+):
+    """Restart a stopped or failed job from its last checkpoint.
+
+    Under Lambda the job is queued for the next scheduled resume.
+    """
+    try:
+        job = await run_in_db_executor(jobs_service.resume, job_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return create_success_response(job)
+
+
 # Admin aliases for people and subscriptions
+@router.post("/users/import", response_model=dict)
+async def import_users(
+    request: Request,
+    import_format: Optional[str] = Query(
+        None,
+        alias="format",
+        description="ndjson or csv (default: from the Content-Type header)",
+    ),
+    dryRun: bool = Query(False, description="Validate rows without creating them"),
+    current_user: User = Depends(require_admin),
+    people_service: PeopleService = Depends(get_people_service),
+):
+    """Create people from an NDJSON or CSV request body.
+
+    Returns the outcome of every row; rows that fail do not stop the import.
+    The import runs within the request, so files over the row caps of
+    PeopleService.import_people are rejected with 413 and must be split.
+    """
+    try:
+        if import_format is None:
+            content_type = request.headers.get("content-type", "")
+            import_format = "csv" if "csv" in content_type else "ndjson"
+        if import_format not in IMPORT_FORMATS:
+            raise ValidationException(
+                message=f"Unknown import format: {import_format}",
+                field_errors={
+                    "format": [f"Must be one of: {', '.join(IMPORT_FORMATS)}"]
+                },
+            )
+        try:
+            text = (await request.body()).decode("utf-8-sig")
+        except UnicodeDecodeError:
+            raise ValidationException(
+                message="Import body must be UTF-8 text",
+                field_errors={"body": ["Must be UTF-8 text"]},
+            )
+        records = import_records(text.splitlines(keepends=True), import_format)
+        report = await run_in_db_executor(
+            people_service.import_people, records, dry_run=dryRun
+        )
+        return create_success_response(report)
+    except ValidationException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/people", response_model=dict)
 async def get_admin_people(
     current_user: User = Depends(require_admin),
@@ -588,13 +819,18 @@ async def debug_admin_stats(
 
 @router.get("/stats", response_model=dict)
 async def get_admin_stats(
+    fresh: bool = Query(
+        False, description="Recompute instead of serving a cached snapshot"
+    ),
     current_user: User = Depends(require_admin),
     admin_service: AdminService = Depends(get_admin_service),
     performance_service=Depends(get_performance_service),
 ):
     """Get comprehensive admin statistics."""
     try:
-        dashboard_data = admin_service.get_dashboard_data()
+        dashboard_data = await run_in_db_executor(
+            admin_service.get_dashboard_data, fresh=fresh
+        )
         performance_stats = await performance_service.get_performance_stats()
 
         stats = {
@@ -692,15 +928,23 @@ async def get_performance_stats(
 async def get_cache_stats(
     current_user: User = Depends(require_admin),
 ):
-    """Get cache performance statistics."""
+    """Get repository cache hit/miss statistics."""
+    from ..core.cache import cache_stats
+
+    stats = cache_stats()
+    total_requests = stats["hits"] + stats["misses"]
     return create_success_response(
         {
-            "hitRate": 85.2,
-            "missRate": 14.8,
-            "totalRequests": 12450,
-            "cacheSize": "2.4MB",
-            "evictions": 23,
-            "timestamp": "2025-09-04T02:56:00Z",
+            "backend": stats["backend"],
+            "hitRate": round(stats["hitRate"] * 100, 1),
+            "missRate": (
+                round(100 - stats["hitRate"] * 100, 1) if total_requests else 0.0
+            ),
+            "totalRequests": total_requests,
+            "cacheSize": stats["entries"],
+            "evictions": stats["evictions"],
+            "namespaces": stats["namespaces"],
+            "timestamp": datetime.utcnow().isoformat() + "Z",
         }
     )
 
@@ -775,38 +1019,48 @@ async def get_slowest_endpoints(
 async def get_database_metrics(
     current_user: User = Depends(require_admin),
 ):
-    """Get database performance metrics."""
+    """Get DynamoDB latency, throughput and consumed capacity per table."""
+    from ..core.database import db
+    from ..core.metrics import database_metrics
+
+    snapshot = database_metrics.snapshot()
     return create_success_response(
         {
-            "queryTime": {"avg": 45, "p95": 120, "p99": 250},
-            "connections": {"active": 12, "idle": 8, "max": 50},
-            "throughput": {"reads": 1250, "writes": 340},
-            "timestamp": "2025-09-04T02:56:00Z",
+            "queryTime": snapshot["latencyMs"],
+            "throughput": snapshot["throughput"],
+            "capacity": snapshot["capacity"],
+            "tables": snapshot["tables"],
+            "topConsumers": snapshot["topConsumers"],
+            "circuitBreakers": db.circuit_states(),
+            "windowSeconds": snapshot["windowSeconds"],
+            "timestamp": datetime.utcnow().isoformat() + "Z",
         }
     )
 
 
+# Accepted ranges for the optimization history, e.g. "30m", "24h", "1d"
+_HISTORY_RANGE_UNITS = {"m": 60, "h": 3600, "d": 86400}
+
+
 @router.get("/database/performance/optimization-history", response_model=dict)
 async def get_optimization_history(
     current_user: User = Depends(require_admin),
     range: str = Query("24h", description="Time range for optimization history"),
 ):
-    """Get database optimization history."""
+    """Get per-minute DynamoDB latency and capacity history per table."""
+    from ..core.metrics import database_metrics
+
+    unit = _HISTORY_RANGE_UNITS.get(range[-1:])
+    if unit is None or not range[:-1].isdigit():
+        raise HTTPException(
+            status_code=400, detail="range must look like 30m, 24h or 1d"
+        )
+
     return create_success_response(
         {
-            "optimizations": [
-                {
-                    "time": "2025-09-04T01:30:00Z",
-                    "type": "index_creation",
-                    "improvement": "25%",
-                },
-                {
-                    "time": "2025-09-04T00:15:00Z",
-                    "type": "query_optimization",
-                    "improvement": "15%",
-                },
-            ],
+            "history": database_metrics.history(int(range[:-1]) * unit),
+            "bucketSeconds": database_metrics.bucket_seconds,
             "range": range,
-            "timestamp": "2025-09-04T02:56:00Z",
+            "timestamp": datetime.utcnow().isoformat() + "Z",
         }
     )
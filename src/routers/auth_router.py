@@ -207,6 +207,7 @@ async def change_password(
             {"id": current_user.id},
             update_data,
         )
+        auth_service.people_repository.invalidate(current_user.id)
 
         if not success:
             raise HTTPException(status_code=500, detail="Failed to update password")
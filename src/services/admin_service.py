@@ -3,13 +3,32 @@ Admin service implementation.
 Handles business logic for admin operations with enterprise exception handling.
 """
 
-from typing import List, Dict, Any, Optional
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple, get_args
 from datetime import datetime, timedelta
 
+from boto3.dynamodb.conditions import Attr
+
+from ..core.analytics import BUCKETS, SignupColumns, SubscriptionColumns
+from ..core.config import config
+from ..core.database import BatchWriteResult
+from ..core.snapshots import SnapshotCache
+from ..repositories.async_repository import db_executor
 from ..repositories.people_repository import PeopleRepository
 from ..repositories.projects_repository import ProjectsRepository
 from ..repositories.subscriptions_repository import SubscriptionsRepository
+from ..repositories.stats_repository import (
+    PEOPLE,
+    PROJECTS,
+    STATUS_PREFIX,
+    SUBSCRIPTIONS,
+    StatsRepository,
+    grouped,
+)
 from ..models.person import PersonResponse
+from ..models.project import ProjectResponse
+from ..models.subscription import SubscriptionResponse
 from ..exceptions.base_exceptions import (
     DatabaseException,
     ValidationException,
@@ -18,6 +37,20 @@ from ..exceptions.base_exceptions import (
     ErrorSeverity,
 )
 
+logger = logging.getLogger(__name__)
+
+# Window of the recentSignups count, and of the signup series per bucket
+RECENT_SIGNUP_DAYS = 30
+SIGNUP_SERIES_DAYS = {"day": 90, "week": 364}
+
+# Exportable resources; the fields of each response model are exportable
+EXPORT_MODELS: Dict[str, type] = {
+    "people": PersonResponse,
+    "projects": ProjectResponse,
+    "subscriptions": SubscriptionResponse,
+}
+EXPORT_PAGE_SIZE = 500
+
 
 class AdminService:
     """Service for admin business logic."""
@@ -26,101 +59,88 @@ class AdminService:
         self.people_repository = PeopleRepository()
         self.projects_repository = ProjectsRepository()
         self.subscriptions_repository = SubscriptionsRepository()
+        self.stats_repository = StatsRepository()
+        # Background refreshes run on the database executor, like the
+        # recomputes the admin endpoints wait for
+        self.snapshots = SnapshotCache(
+            config.cache.admin_snapshot_fresh_seconds,
+            config.cache.admin_snapshot_max_stale_seconds,
+            executor=db_executor(),
+        )
 
-    def get_dashboard_data(self) -> Dict[str, Any]:
-        """Get basic dashboard data."""
-        # Get counts with detailed logging for debugging
-        people = []
-        projects = []
-        subscriptions = []
+    def _snapshot(
+        self, key: str, compute: Callable[[], Dict[str, Any]], fresh: bool
+    ) -> Dict[str, Any]:
+        """Serve ``compute()`` from the snapshot cache, with the snapshot's age.
 
-        try:
-            people = self.people_repository.list_all()
-            print(f"DEBUG: Fetched {len(people)} people")
-        except Exception as e:
-            print(f"ERROR: Could not fetch people: {e}")
-            people = []
+        ``fresh`` (or a disabled cache) recomputes before returning.
+        """
+        snapshot = self.snapshots.get(
+            key, compute, fresh=fresh or not config.cache.enabled
+        )
+        return {**snapshot.value, "snapshot": snapshot.metadata()}
 
-        try:
-            projects = self.projects_repository.list_all()
-            print(f"DEBUG: Fetched {len(projects)} projects")
-        except Exception as e:
-            print(f"ERROR: Could not fetch projects: {e}")
-            projects = []
+    def _signup_columns(self) -> SignupColumns:
+        """Stream every person's signup date into columns."""
+        recent_since = datetime.utcnow() - timedelta(days=RECENT_SIGNUP_DAYS)
+        return SignupColumns(
+            self.people_repository.scan_attributes("createdAt"), recent_since
+        )
+
+    def _load_columns(self) -> Tuple[SignupColumns, SubscriptionColumns, List[Any]]:
+        """Load the analytics columns and the projects concurrently.
+
+        People and subscriptions are streamed with projected parallel scans
+        straight into columns, so only the attributes the analytics read are
+        transferred and no model is built per row.
+        """
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="admin") as pool:
+            signups = pool.submit(self._signup_columns)
+            subscriptions = pool.submit(
+                lambda: SubscriptionColumns(
+                    self.subscriptions_repository.scan_attributes(
+                        "projectId", "status", "isActive"
+                    )
+                )
+            )
+            projects = pool.submit(self.projects_repository.list_all, parallel=True)
+            return signups.result(), subscriptions.result(), projects.result()
 
+    def get_dashboard_data(self, fresh: bool = False) -> Dict[str, Any]:
+        """Get basic dashboard data from the aggregate counters.
+
+        When the counters cannot be read the dashboard shows zeros rather
+        than failing; zeros are never cached.
+        """
         try:
-            subscriptions = self.subscriptions_repository.list_all()
-            print(f"DEBUG: Fetched {len(subscriptions)} subscriptions")
+            return self._snapshot(
+                "dashboard",
+                lambda: self._dashboard_data(self.stats_repository.get_counters()),
+                fresh,
+            )
         except Exception as e:
-            print(f"ERROR: Could not fetch subscriptions: {e}")
-            subscriptions = []
-
-        # Calculate basic stats - handle missing attributes safely
-        active_people = len([p for p in people if getattr(p, "isActive", True)])
-        active_projects = len([p for p in projects if getattr(p, "isActive", True)])
-        active_subscriptions = len(
-            [s for s in subscriptions if getattr(s, "isActive", True)]
-        )
+            logger.error(f"Could not read dashboard counters: {e}")
+            return self._dashboard_data({})
 
-        result = {
-            "totalUsers": len(people),
-            "activeUsers": active_people,
-            "totalProjects": len(projects),
-            "activeProjects": active_projects,
-            "totalSubscriptions": len(subscriptions),
-            "activeSubscriptions": active_subscriptions,
+    @staticmethod
+    def _dashboard_data(stats: Dict[str, Dict[str, int]]) -> Dict[str, Any]:
+        people = stats.get(PEOPLE, {})
+        projects = stats.get(PROJECTS, {})
+        subscriptions = stats.get(SUBSCRIPTIONS, {})
+        return {
+            "totalUsers": people.get("total", 0),
+            "activeUsers": people.get("active", 0),
+            "totalProjects": projects.get("total", 0),
+            "activeProjects": projects.get(STATUS_PREFIX + "active", 0),
+            "totalSubscriptions": subscriptions.get("total", 0),
+            "activeSubscriptions": subscriptions.get("active", 0),
             "lastUpdated": datetime.utcnow().isoformat(),
         }
 
-        print(f"DEBUG: Returning dashboard data: {result}")
-        return result
-
-    def get_enhanced_dashboard_data(self) -> Dict[str, Any]:
+    def get_enhanced_dashboard_data(self, fresh: bool = False) -> Dict[str, Any]:
         """Get enhanced dashboard data with more detailed analytics."""
         try:
-            basic_data = self.get_dashboard_data()
-
-            # Get additional analytics
-            people = self.people_repository.list_all()
-            projects = self.projects_repository.list_all()
-            subscriptions = self.subscriptions_repository.list_all()
-
-            # Calculate enhanced stats - handle missing attributes safely
-            admin_count = len([p for p in people if getattr(p, "isAdmin", False)])
-            recent_signups = len(
-                [
-                    p
-                    for p in people
-                    if hasattr(p, "createdAt")
-                    and p.createdAt
-                    and datetime.fromisoformat(p.createdAt.replace("Z", "+00:00"))
-                    > datetime.utcnow().replace(tzinfo=None) - timedelta(days=30)
-                ]
-            )
-
-            # Project statistics
-            project_stats = {}
-            for project in projects:
-                project_subs = [s for s in subscriptions if s.projectId == project.id]
-                project_stats[project.id] = {
-                    "name": project.name,
-                    "subscriptions": len(project_subs),
-                    "status": project.status,
-                }
-
-            enhanced_data = {
-                **basic_data,
-                "adminUsers": admin_count,
-                "recentSignups": recent_signups,
-                "projectStats": project_stats,
-                "systemHealth": {
-                    "status": "healthy",
-                    "uptime": "99.9%",
-                    "lastCheck": datetime.utcnow().isoformat(),
-                },
-            }
-
-            return enhanced_data
+            return self._snapshot("enhanced", self._enhanced_dashboard_data, fresh)
         except Exception as e:
             raise DatabaseException(
                 operation="get_enhanced_dashboard_data",
@@ -128,55 +148,54 @@ class AdminService:
                 user_message="Unable to retrieve enhanced dashboard data at this time.",
             )
 
-    def get_analytics_data(self) -> Dict[str, Any]:
-        """Get detailed analytics data."""
-        try:
-            people = self.people_repository.list_all()
-            projects = self.projects_repository.list_all()
-            subscriptions = self.subscriptions_repository.list_all()
-
-            # User analytics
-            user_analytics = {
-                "totalUsers": len(people),
-                "activeUsers": len([p for p in people if p.isActive]),
-                "adminUsers": len([p for p in people if p.isAdmin]),
-                "inactiveUsers": len([p for p in people if not p.isActive]),
-            }
+    def _enhanced_dashboard_data(self) -> Dict[str, Any]:
+        """Compute the enhanced dashboard from the counters and one columnar pass."""
+        counters = self.stats_repository.get_counters()
+        signups, subscriptions, projects = self._load_columns()
 
-            # Project analytics
-            project_analytics = {
-                "totalProjects": len(projects),
-                "activeProjects": len([p for p in projects if p.isActive]),
-                "projectsByStatus": {},
+        by_project = subscriptions.by_project()
+        active_by_project = subscriptions.active_by_project()
+        project_stats = {
+            project.id: {
+                "name": project.name,
+                "subscriptions": by_project.get(project.id, 0),
+                "activeSubscriptions": active_by_project.get(project.id, 0),
+                "status": project.status,
             }
+            for project in projects
+        }
 
-            # Count projects by status
-            for project in projects:
-                status = project.status
-                if status not in project_analytics["projectsByStatus"]:
-                    project_analytics["projectsByStatus"][status] = 0
-                project_analytics["projectsByStatus"][status] += 1
-
-            # Subscription analytics
-            subscription_analytics = {
-                "totalSubscriptions": len(subscriptions),
-                "activeSubscriptions": len([s for s in subscriptions if s.isActive]),
-                "subscriptionsByProject": {},
-            }
+        return {
+            **self._dashboard_data(counters),
+            "adminUsers": counters.get(PEOPLE, {}).get("admins", 0),
+            "recentSignups": signups.recent,
+            "projectStats": project_stats,
+            "subscriptionsByStatus": subscriptions.by_status(),
+            "systemHealth": {
+                "status": "healthy",
+                "uptime": "99.9%",
+                "lastCheck": datetime.utcnow().isoformat(),
+            },
+        }
 
-            # Count subscriptions by project
-            for subscription in subscriptions:
-                project_id = subscription.projectId
-                if project_id not in subscription_analytics["subscriptionsByProject"]:
-                    subscription_analytics["subscriptionsByProject"][project_id] = 0
-                subscription_analytics["subscriptionsByProject"][project_id] += 1
-
-            return {
-                "users": user_analytics,
-                "projects": project_analytics,
-                "subscriptions": subscription_analytics,
-                "generatedAt": datetime.utcnow().isoformat(),
-            }
+    def get_analytics_data(
+        self, fresh: bool = False, bucket: str = "day"
+    ) -> Dict[str, Any]:
+        """Get detailed analytics data.
+
+        Totals come from the aggregate counters; signups are bucketed by
+        ``bucket`` ("day" or "week").
+        """
+        if bucket not in BUCKETS:
+            raise ValidationException(
+                message=f"Unknown signup bucket: {bucket}",
+                error_code=ErrorCode.INVALID_INPUT,
+                field_errors={"bucket": [f"Must be one of: {', '.join(BUCKETS)}"]},
+            )
+        try:
+            return self._snapshot(
+                f"analytics:{bucket}", lambda: self._analytics_data(bucket), fresh
+            )
         except Exception as e:
             raise DatabaseException(
                 operation="get_analytics_data",
@@ -184,6 +203,131 @@ class AdminService:
                 user_message="Unable to retrieve analytics data at this time.",
             )
 
+    def _analytics_data(self, bucket: str) -> Dict[str, Any]:
+        """Compute the analytics from the counters and a scan of signup dates."""
+        stats = self.stats_repository.get_counters()
+        signups = self._signup_columns()
+        since = datetime.utcnow().date() - timedelta(days=SIGNUP_SERIES_DAYS[bucket])
+        people = stats[PEOPLE]
+        projects = stats[PROJECTS]
+        subscriptions = stats[SUBSCRIPTIONS]
+
+        user_analytics = {
+            "totalUsers": people.get("total", 0),
+            "activeUsers": people.get("active", 0),
+            "adminUsers": people.get("admins", 0),
+            "inactiveUsers": people.get("total", 0) - people.get("active", 0),
+        }
+        project_analytics = {
+            "totalProjects": projects.get("total", 0),
+            "activeProjects": projects.get(STATUS_PREFIX + "active", 0),
+            "projectsByStatus": grouped(projects, STATUS_PREFIX),
+        }
+        subscription_analytics = {
+            "totalSubscriptions": subscriptions.get("total", 0),
+            "activeSubscriptions": subscriptions.get("active", 0),
+            "subscriptionsByProject": self.stats_repository.get_project_counters(),
+            "subscriptionsByStatus": grouped(subscriptions, STATUS_PREFIX),
+        }
+
+        return {
+            "users": user_analytics,
+            "projects": project_analytics,
+            "subscriptions": subscription_analytics,
+            "signups": {
+                "recentSignups": signups.recent,
+                "bucket": bucket,
+                "series": signups.series(bucket, since),
+            },
+            "generatedAt": datetime.utcnow().isoformat(),
+        }
+
+    def reconcile_counters(self) -> Dict[str, Dict[str, int]]:
+        """Recount the dashboard counters from the tables."""
+        stats = self.stats_repository.reconcile()
+        self.snapshots.invalidate()
+        return stats
+
+    def export_rows(
+        self,
+        resource: str,
+        fields: Optional[List[str]] = None,
+        filters: Optional[Dict[str, str]] = None,
+    ) -> Tuple[List[str], Iterator[Dict[str, Any]]]:
+        """Stream the rows of an export and the fields they carry.
+
+        Only fields of the resource's response model can be exported or
+        filtered on, so secrets such as password hashes never leave the
+        table. Filters are equalities on raw query values, converted to the
+        field's type; a row without the attribute matches the field's default.
+        Rows are read page by page with a projected scan, so memory stays
+        constant whatever the table size.
+        """
+        model = EXPORT_MODELS.get(resource)
+        if model is None:
+            raise ValidationException(
+                message=f"Unknown export resource: {resource}",
+                error_code=ErrorCode.INVALID_INPUT,
+                field_errors={
+                    "resource": [f"Must be one of: {', '.join(EXPORT_MODELS)}"]
+                },
+            )
+        exportable = list(model.model_fields)
+        fields = fields or exportable
+        filters = filters or {}
+        unknown = [name for name in [*fields, *filters] if name not in exportable]
+        if unknown:
+            raise ValidationException(
+                message=f"Unknown {resource} fields: {', '.join(unknown)}",
+                error_code=ErrorCode.INVALID_INPUT,
+                field_errors={name: ["Not an exportable field"] for name in unknown},
+            )
+
+        condition = None
+        for name, raw in filters.items():
+            value = self._filter_value(model, name, raw)
+            clause = Attr(name).eq(value)
+            if model.model_fields[name].default == value:
+                clause = clause | Attr(name).not_exists()
+            condition = clause if condition is None else condition & clause
+
+        repository = {
+            "people": self.people_repository,
+            "projects": self.projects_repository,
+            "subscriptions": self.subscriptions_repository,
+        }[resource]
+        scan_kwargs: Dict[str, Any] = {"page_size": EXPORT_PAGE_SIZE}
+        if condition is not None:
+            scan_kwargs["FilterExpression"] = condition
+        items = repository.scan_attributes(*fields, **scan_kwargs)
+        # Backends that ignore projections still only export the chosen fields
+        rows = ({name: item[name] for name in fields if name in item} for item in items)
+        return fields, rows
+
+    @staticmethod
+    def _filter_value(model: type, name: str, raw: str) -> Any:
+        """Convert a query-string filter value to the type of ``name``."""
+        annotation = model.model_fields[name].annotation
+        types = set(get_args(annotation)) or {annotation}
+        if bool in types:
+            if raw.lower() not in ("true", "false"):
+                raise ValidationException(
+                    message=f"Filter {name} must be true or false",
+                    error_code=ErrorCode.INVALID_FORMAT,
+                    field_errors={name: ["Must be true or false"]},
+                )
+            return raw.lower() == "true"
+        if int in types:
+            try:
+                return int(raw)
+            except ValueError:
+                raise ValidationException(
+                    message=f"Filter {name} must be a whole number",
+                    error_code=ErrorCode.INVALID_FORMAT,
+                    field_errors={name: ["Must be a whole number"]},
+                )
+        return raw
+
     def execute_bulk_action(self, bulk_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute bulk actions on users."""
         try:
@@ -206,32 +350,50 @@ class AdminService:
                 "results": [],
             }
 
-            for user_id in user_ids:
-                try:
-                    if action == "activate":
-                        self.people_repository.activate_person(user_id)
-                    elif action == "deactivate":
-                        self.people_repository.deactivate_person(user_id)
-                    elif action == "delete":
-                        self.people_repository.delete(user_id)
-                    else:
-                        raise ValidationException(
-                            message=f"Unknown bulk action: {action}",
-                            error_code=ErrorCode.INVALID_INPUT,
-                            details={
-                                "invalid_action": action,
-                                "valid_actions": ["activate", "deactivate", "delete"],
-                            },
-                            user_message="Please provide a valid action (activate, deactivate, or delete).",
-                        )
+            # Batched deletes and parallel conditional activation updates
+            if action == "activate":
+                write_result = self.people_repository.set_active_many(user_ids, True)
+            elif action == "deactivate":
+                write_result = self.people_repository.set_active_many(user_ids, False)
+            elif action == "delete":
+                write_result = self.people_repository.delete_many(user_ids)
+            else:
+                error = ValidationException(
+                    message=f"Unknown bulk action: {action}",
+                    error_code=ErrorCode.INVALID_INPUT,
+                    details={
+                        "invalid_action": action,
+                        "valid_actions": ["activate", "deactivate", "delete"],
+                    },
+                    user_message="Please provide a valid action (activate, deactivate, or delete).",
+                )
+                write_result = BatchWriteResult(
+                    failed=[
+                        {"key": {"id": user_id}, "error": str(error)}
+                        for user_id in user_ids
+                    ]
+                )
 
-                    results["successCount"] += 1
-                    results["results"].append({"userId": user_id, "status": "success"})
-                except Exception as e:
+            # Counts changed: the next dashboard read recomputes
+            self.snapshots.invalidate()
+
+            errors = {
+                failure["key"]["id"]: failure["error"]
+                for failure in write_result.failed
+            }
+            for user_id in user_ids:
+                if user_id in errors:
                     results["failureCount"] += 1
                     results["results"].append(
-                        {"userId": user_id, "status": "failed", "error": str(e)}
+                        {
+                            "userId": user_id,
+                            "status": "failed",
+                            "error": errors[user_id],
+                        }
                     )
+                else:
+                    results["successCount"] += 1
+                    results["results"].append({"userId": user_id, "status": "success"})
 
             return results
         except (ValidationException, BusinessLogicException):
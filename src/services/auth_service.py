@@ -9,6 +9,7 @@ from typing import Optional, Dict, Any
 
 from ..core.config import config
 from ..repositories.people_repository import PeopleRepository
+from ..repositories.async_repository import AsyncRepository, run_in_db_executor
 from ..models.auth import LoginResponse, User
 from ..models.person import PersonResponse
 from ..utils.password_utils import (
@@ -27,6 +28,11 @@ class AuthService:
         self.jwt_algorithm = config.auth.jwt_algorithm
         self.access_token_expire_hours = config.auth.access_token_expire_hours
 
+    @property
+    def async_people_repository(self) -> AsyncRepository[PeopleRepository]:
+        """Awaitable view of the people repository."""
+        return AsyncRepository(self.people_repository)
+
     def _hash_password(self, password: str) -> str:
         """Hash a password using bcrypt."""
         return PasswordHasher.hash_password(password)
@@ -82,7 +88,7 @@ class AuthService:
     ) -> Optional[LoginResponse]:
         """Authenticate a user with email and password."""
         # Get user data with password hash for authentication
-        person_data = self.people_repository.get_by_email_for_auth(email)
+        person_data = await self.async_people_repository.get_by_email_for_auth(email)
         if not person_data:
             return None
 
@@ -233,7 +239,7 @@ class AuthService:
         if not user_id:
             return None
 
-        person = self.people_repository.get_by_id(user_id)
+        person = await self.async_people_repository.get_by_id(user_id)
         if not person:
             return None
 
@@ -267,7 +273,7 @@ class AuthService:
         if not user_id:
             return None
 
-        person = self.people_repository.get_by_id(user_id)
+        person = await self.async_people_repository.get_by_id(user_id)
         if not person or not person.isActive:
             return None
 
@@ -315,7 +321,7 @@ class AuthService:
     async def initiate_password_reset(self, email: str) -> Dict[str, Any]:
         """Initiate password reset process."""
         # Get user by email
-        person = self.people_repository.get_by_email(email)
+        person = await self.async_people_repository.get_by_email(email)
         if not person:
             # Return success even if email doesn't exist (security best practice)
             return {
@@ -395,7 +401,7 @@ class AuthService:
             return False
 
         # Verify user still exists and is active
-        person = self.people_repository.get_by_id(user_id)
+        person = await self.async_people_repository.get_by_id(user_id)
         if not person:
             logging_service.log_structured(
                 level=LogLevel.WARNING,
@@ -447,7 +453,7 @@ class AuthService:
             raise ValueError("Invalid reset token")
 
         # Get user
-        person = self.people_repository.get_by_id(user_id)
+        person = await self.async_people_repository.get_by_id(user_id)
         if not person or not person.isActive:
             raise ValueError("User not found or inactive")
 
@@ -478,11 +484,13 @@ class AuthService:
             "updatedAt": datetime.utcnow().isoformat(),
         }
 
-        success = db.update_item(
+        success = await run_in_db_executor(
+            db.update_item,
             self.people_repository.table_name,
             {"id": user_id},
             update_data,
         )
+        self.people_repository.invalidate(user_id)
 
         if not success:
             logging_service.log_structured(
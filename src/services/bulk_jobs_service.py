@@ -0,0 +1,310 @@
+"""
+Bulk jobs service - Background admin actions on many users.
+A submitted job is stored with its user IDs split into chunks, so the request
+returns at once. Where the process keeps running it is started on a worker
+thread; under Lambda, which freezes background threads, it is left to the
+scheduled resume (main.jobs_handler). After every chunk the job item records
+progress as a checkpoint; a worker that stops part way (for example at a
+Lambda timeout) loses its lease, and the next scheduled resume or an explicit
+resume request continues the job from the next chunk.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..core.config import config
+from ..repositories.jobs_repository import (
+    COMPLETED,
+    FAILED,
+    QUEUED,
+    RUNNING,
+    JobsRepository,
+)
+from ..repositories.people_repository import PeopleRepository
+from ..exceptions.base_exceptions import ErrorCode, ValidationException
+
+logger = logging.getLogger(__name__)
+
+BULK_USER_ACTION = "bulk-user-action"
+ACTIONS = ("activate", "deactivate", "delete")
+# Users per chunk: ten BatchWriteItem requests, sent in parallel
+CHUNK_SIZE = 250
+# A worker that has not checkpointed for this long is presumed gone
+LEASE_SECONDS = 60
+
+
+class BulkJobsService:
+    """Service for background bulk actions on users."""
+
+    def __init__(
+        self,
+        people_repository: PeopleRepository,
+        jobs_repository: Optional[JobsRepository] = None,
+        on_change: Optional[Callable[[], None]] = None,
+        executor: Optional[Executor] = None,
+        clock: Callable[[], float] = time.time,
+        workers: Optional[int] = None,
+    ):
+        self.people_repository = people_repository
+        self.jobs_repository = jobs_repository or JobsRepository()
+        self.on_change = on_change
+        self._executor = executor
+        self._clock = clock
+        self.workers = config.jobs.workers if workers is None else workers
+        self._lock = threading.Lock()
+        # Jobs this process has scheduled or is running
+        self._active: set = set()
+
+    def submit(
+        self, action: str, user_ids: List[str], requested_by: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Store a bulk action as a job and start it in the background.
+
+        With no workers in this process the job stays queued until the next
+        scheduled resume picks it up.
+        """
+        if action not in ACTIONS:
+            raise ValidationException(
+                message=f"Unknown bulk action: {action}",
+                error_code=ErrorCode.INVALID_INPUT,
+                field_errors={"action": [f"Must be one of: {', '.join(ACTIONS)}"]},
+            )
+        user_ids = list(dict.fromkeys(user_ids or []))
+        if not user_ids:
+            raise ValidationException(
+                message="userIds are required for bulk operations",
+                error_code=ErrorCode.MISSING_REQUIRED_FIELD,
+                field_errors={"userIds": ["At least one user ID is required"]},
+            )
+
+        now = datetime.utcnow().isoformat()
+        chunks = [
+            user_ids[start : start + CHUNK_SIZE]
+            for start in range(0, len(user_ids), CHUNK_SIZE)
+        ]
+        job = {
+            "id": str(uuid.uuid4()),
+            "type": BULK_USER_ACTION,
+            "action": action,
+            "status": QUEUED,
+            "total": len(user_ids),
+            "processed": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "chunkCount": len(chunks),
+            "nextChunk": 0,
+            "requestedBy": requested_by,
+            "createdAt": now,
+            "updatedAt": now,
+        }
+        self.jobs_repository.create(job, chunks)
+        self._start(job["id"])
+        return self._public(job)
+
+    def get_job(
+        self, job_id: str, include_results: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """A job's progress, optionally with the outcome of every processed user."""
+        job = self.jobs_repository.get(job_id)
+        if job is None or "jobId" in job:
+            return None
+        public = self._public(job)
+        if include_results:
+            chunks = self.jobs_repository.get_chunks(job_id, int(job["nextChunk"]))
+            public["results"] = [
+                result for chunk in chunks if chunk for result in chunk["results"]
+            ]
+        return public
+
+    def resume(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Restart a stopped or failed job from its checkpoint.
+
+        A failed job is queued again. The job is started on this process's
+        workers, or left to the next scheduled resume when there are none.
+        """
+        job = self.jobs_repository.get(job_id)
+        if job is None or "jobId" in job:
+            return None
+        if job["status"] == FAILED:
+            job = (
+                self.jobs_repository.requeue(job_id, datetime.utcnow().isoformat())
+                or job
+            )
+        if job["status"] in (QUEUED, RUNNING):
+            self._start(job_id)
+        return self._public(job)
+
+    def resume_unfinished(self, until: Optional[float] = None) -> List[str]:
+        """Run every queued or stopped job in the calling thread.
+
+        With ``until`` (a clock time), no job is started once it has passed
+        and a running job stops at its next checkpoint, leaving the rest to
+        the next run. Returns the jobs that completed.
+        """
+        completed = []
+        for job in self.jobs_repository.list_unfinished():
+            if until is not None and self._clock() >= until:
+                break
+            if self._stalled(job) and self.run(job["id"], until=until) is not None:
+                completed.append(job["id"])
+        return completed
+
+    def run(
+        self,
+        job_id: str,
+        statuses: Tuple[str, ...] = (QUEUED, RUNNING),
+        until: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Claim a job and process its remaining chunks.
+
+        Returns the job's final progress, or None when another worker holds
+        it, it is finished, this worker lost its lease part way, or ``until``
+        passed and the lease was given up after a checkpoint.
+        """
+        owner = str(uuid.uuid4())
+        now = self._clock()
+        job = self.jobs_repository.claim(
+            job_id, owner, int(now), int(now) + LEASE_SECONDS, statuses
+        )
+        if job is None:
+            return None
+
+        progress = {
+            name: int(job[name])
+            for name in ("nextChunk", "processed", "succeeded", "failed")
+        }
+        try:
+            for index in range(progress["nextChunk"], int(job["chunkCount"])):
+                chunk = self.jobs_repository.get_chunk(job_id, index)
+                if chunk is None:
+                    raise Exception(f"Chunk {index} of job {job_id} is missing")
+                results = self._apply(job["action"], chunk["keys"])
+                failed = sum(1 for result in results if result["status"] == "failed")
+                progress = {
+                    "nextChunk": index + 1,
+                    "processed": progress["processed"] + len(results),
+                    "succeeded": progress["succeeded"] + len(results) - failed,
+                    "failed": progress["failed"] + failed,
+                }
+                checkpoint = {
+                    **progress,
+                    "leaseUntil": int(self._clock()) + LEASE_SECONDS,
+                    "updatedAt": datetime.utcnow().isoformat(),
+                }
+                if not self.jobs_repository.checkpoint(
+                    job_id, owner, {**chunk, "results": results}, checkpoint
+                ):
+                    logger.warning(f"Lost the lease on job {job_id}; stopping")
+                    return None
+                if self.on_change:
+                    self.on_change()
+                if (
+                    until is not None
+                    and self._clock() >= until
+                    and index + 1 < int(job["chunkCount"])
+                ):
+                    # Out of time: let the next run continue at once
+                    self.jobs_repository.release(
+                        job_id, owner, {"updatedAt": datetime.utcnow().isoformat()}
+                    )
+                    return None
+
+            now_text = datetime.utcnow().isoformat()
+            final = {
+                "status": COMPLETED,
+                "updatedAt": now_text,
+                "completedAt": now_text,
+            }
+            if "error" in job:
+                # Clear the error of an earlier failed attempt
+                final["error"] = None
+            self.jobs_repository.release(job_id, owner, final)
+            return self._public({**job, **progress, **final})
+        except Exception as e:
+            logger.error(f"Bulk job {job_id} failed: {e}")
+            self.jobs_repository.release(
+                job_id,
+                owner,
+                {
+                    "status": FAILED,
+                    "error": str(e),
+                    "updatedAt": datetime.utcnow().isoformat(),
+                },
+            )
+            return None
+
+    def _apply(self, action: str, user_ids: List[str]) -> List[Dict[str, Any]]:
+        """Run ``action`` on one chunk with batched writes; outcome per user."""
+        if action == "delete":
+            write_result = self.people_repository.delete_many(user_ids)
+        else:
+            write_result = self.people_repository.set_active_many(
+                user_ids, action == "activate"
+            )
+        errors = {
+            failure["key"]["id"]: failure["error"] for failure in write_result.failed
+        }
+        return [
+            (
+                {"userId": user_id, "status": "failed", "error": errors[user_id]}
+                if user_id in errors
+                else {"userId": user_id, "status": "success"}
+            )
+            for user_id in user_ids
+        ]
+
+    def _stalled(self, job: Dict[str, Any]) -> bool:
+        """Whether an unfinished job has no live worker."""
+        return (
+            job["status"] in (QUEUED, RUNNING)
+            and int(job.get("leaseUntil", 0)) < self._clock()
+        )
+
+    def _start(self, job_id: str) -> None:
+        """Run a job on the worker pool unless this process already is.
+
+        Without workers nothing is started; the scheduled resume runs the job.
+        """
+        if not self.workers:
+            return
+        with self._lock:
+            if job_id in self._active:
+                return
+            self._active.add(job_id)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="bulk-job"
+                )
+            executor = self._executor
+
+        def work() -> None:
+            try:
+                self.run(job_id)
+            finally:
+                with self._lock:
+                    self._active.discard(job_id)
+
+        executor.submit(work)
+
+    @staticmethod
+    def _public(job: Dict[str, Any]) -> Dict[str, Any]:
+        """The job as returned by the API, without lease bookkeeping."""
+        public = {
+            name: value
+            for name, value in job.items()
+            if name not in ("owner", "leaseUntil")
+        }
+        for name in ("total", "processed", "succeeded", "failed", "chunkCount"):
+            public[name] = int(job[name])
+        public.pop("nextChunk", None)
+        public["progress"] = (
+            round(100 * public["processed"] / public["total"], 1)
+            if public["total"]
+            else 100.0
+        )
+        return public
@@ -3,13 +3,63 @@ Email service for AWS SES integration.
 Clean implementation for the new API architecture.
 """
 
+import json
 import os
+import threading
+import time
 import boto3
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Any, List, Optional
 from botocore.exceptions import ClientError
 
 from ..core.config import config
 
+# Destinations SES accepts in one SendBulkTemplatedEmail call
+BULK_DESTINATIONS = 50
+# Throttled bulk calls are retried this many times, backing off from 1s
+BULK_RETRIES = 3
+
+
+@dataclass(frozen=True)
+class EmailTemplate:
+    """An SES template; placeholders use Handlebars syntax ({{name}})."""
+
+    name: str
+    subject: str
+    html: str
+    text: str = ""
+
+
+class SendRateLimiter:
+    """Paces sends to stay within an emails-per-second quota.
+
+    Each caller reserves the next free slot for its emails and sleeps until
+    then, so concurrent bulk calls share the quota instead of racing for it.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = rate
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_free = 0.0
+
+    def acquire(self, emails: int) -> None:
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._next_free)
+            self._next_free = start + emails / self.rate
+        if start > now:
+            self._sleep(start - now)
+
 
 class EmailService:
     """Service for sending emails via AWS SES."""
@@ -30,6 +80,10 @@ class EmailService:
 
         self.from_email = config.email.from_email
         self.frontend_url = config.frontend_url
+        self.rate_limiter = SendRateLimiter(config.email.max_send_rate)
+        self._sleep = time.sleep
+        # Templates created or updated in SES by this process
+        self._templates: set = set()
 
     def send_email(
         self,
@@ -90,6 +144,162 @@ class EmailService:
                 "error_code": "UNKNOWN_ERROR",
             }
 
+    def ensure_template(self, template: EmailTemplate) -> None:
+        """Create ``template`` in SES, or update it, once per process."""
+        if self.test_mode or template.name in self._templates:
+            return
+        content = {
+            "TemplateName": template.name,
+            "SubjectPart": template.subject,
+            "HtmlPart": template.html,
+        }
+        if template.text:
+            content["TextPart"] = template.text
+        try:
+            self.ses_client.create_template(Template=content)
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "AlreadyExists":
+                raise
+            self.ses_client.update_template(Template=content)
+        self._templates.add(template.name)
+
+    def send_bulk_templated_email(
+        self,
+        template: EmailTemplate,
+        destinations: List[Dict[str, Any]],
+        default_data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Send a template to many recipients with SendBulkTemplatedEmail.
+
+        Destinations are sent 50 to a call, with several calls in flight and
+        all of them paced to the account's sending rate.
+
+        Args:
+            template: Template to render; created in SES on first use
+            destinations: Dicts with the recipient ``email`` and optional
+                ``data`` overriding ``default_data`` for that recipient
+            default_data: Template data shared by every recipient
+
+        Returns:
+            Dict with sent and failed counts and one result per recipient,
+            in the order given
+        """
+        if self.test_mode:
+            results = [
+                {
+                    "email": destination["email"],
+                    "success": True,
+                    "message_id": "test-mode-message-id",
+                }
+                for destination in destinations
+            ]
+        else:
+            try:
+                self.ensure_template(template)
+            except Exception as e:
+                error = f"Failed to prepare template: {str(e)}"
+                results = [
+                    {"email": destination["email"], "success": False, "error": error}
+                    for destination in destinations
+                ]
+            else:
+                results = self._send_bulk(template, destinations, default_data)
+
+        sent = sum(1 for result in results if result["success"])
+        return {
+            "success": sent == len(results),
+            "sent": sent,
+            "failed": len(results) - sent,
+            "results": results,
+        }
+
+    def _send_bulk(
+        self,
+        template: EmailTemplate,
+        destinations: List[Dict[str, Any]],
+        default_data: Optional[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Send every chunk of destinations, several calls at a time."""
+        chunks = [
+            destinations[start : start + BULK_DESTINATIONS]
+            for start in range(0, len(destinations), BULK_DESTINATIONS)
+        ]
+        if len(chunks) <= 1 or config.email.bulk_concurrency <= 1:
+            return [
+                result
+                for chunk in chunks
+                for result in self._send_bulk_chunk(template, chunk, default_data)
+            ]
+        with ThreadPoolExecutor(
+            max_workers=min(config.email.bulk_concurrency, len(chunks)),
+            thread_name_prefix="ses-bulk",
+        ) as executor:
+            chunk_results = executor.map(
+                lambda chunk: self._send_bulk_chunk(template, chunk, default_data),
+                chunks,
+            )
+            return [result for results in chunk_results for result in results]
+
+    def _send_bulk_chunk(
+        self,
+        template: EmailTemplate,
+        chunk: List[Dict[str, Any]],
+        default_data: Optional[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """One SendBulkTemplatedEmail call; a result per destination."""
+        request = {
+            "Source": f"AWS User Group Cochabamba <{self.from_email}>",
+            "Template": template.name,
+            "DefaultTemplateData": json.dumps(default_data or {}, default=str),
+            "Destinations": [
+                {
+                    "Destination": {"ToAddresses": [destination["email"]]},
+                    "ReplacementTemplateData": json.dumps(
+                        destination.get("data") or {}, default=str
+                    ),
+                }
+                for destination in chunk
+            ],
+        }
+        for attempt in range(BULK_RETRIES + 1):
+            self.rate_limiter.acquire(len(chunk))
+            try:
+                response = self.ses_client.send_bulk_templated_email(**request)
+                break
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "Throttling" and (
+                    attempt < BULK_RETRIES
+                ):
+                    self._sleep(2**attempt)
+                    continue
+                error = f"Failed to send email: {e.response['Error']['Message']}"
+            except Exception as e:
+                error = f"Unexpected error: {str(e)}"
+            return [
+                {"email": destination["email"], "success": False, "error": error}
+                for destination in chunk
+            ]
+
+        results = []
+        for destination, status in zip(chunk, response["Status"]):
+            if status.get("Status") == "Success":
+                results.append(
+                    {
+                        "email": destination["email"],
+                        "success": True,
+                        "message_id": status.get("MessageId"),
+                    }
+                )
+            else:
+                results.append(
+                    {
+                        "email": destination["email"],
+                        "success": False,
+                        "error": status.get("Error") or status.get("Status"),
+                    }
+                )
+        return results
+
     async def send_password_reset_email(
         self, email: str, first_name: str, reset_token: str
     ) -> Dict[str, Any]:
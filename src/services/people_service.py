@@ -3,10 +3,25 @@ People service - Business logic for people/users operations.
 Orchestrates repository operations and implements business rules.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
+
+from pydantic import ValidationError
 
 from ..repositories.people_repository import PeopleRepository
+from ..repositories.async_repository import AsyncRepository, run_in_db_executor
+from ..models.pagination import CursorPage
 from ..models.person import Person, PersonCreate, PersonUpdate, PersonResponse
+from ..utils.imports import ImportRecord
+
+# Rows validated, hashed and written together by import_people
+IMPORT_BATCH_SIZE = 500
+# An import runs inside its request, which API Gateway ends after 29s. Rows
+# without a password cost a validation and a share of a batched write; rows
+# with one also cost a bcrypt hash (cost 12, about 0.25s of one core, and
+# Lambda hashes in threads on one or two cores). Larger files are rejected
+# with 413 and have to be split.
+IMPORT_MAX_ROWS = 5000
+IMPORT_MAX_PASSWORD_ROWS = 100
 
 
 class PeopleService:
@@ -15,6 +30,11 @@ class PeopleService:
     def __init__(self, people_repository: PeopleRepository):
         self.people_repository = people_repository
 
+    @property
+    def async_people_repository(self) -> AsyncRepository[PeopleRepository]:
+        """Awaitable view of the people repository."""
+        return AsyncRepository(self.people_repository)
+
     def create_person(self, person_data: PersonCreate) -> PersonResponse:
         """Create a new person with enterprise security validation."""
         from ..services.logging_service import logging_service, LogCategory, LogLevel
@@ -86,9 +106,17 @@ class PeopleService:
 
         return PersonResponse(**person.model_dump())
 
+    def get_people_by_ids(self, person_ids: List[str]) -> Dict[str, PersonResponse]:
+        """Get many people by ID in batched reads, keyed by ID."""
+        people = self.people_repository.get_many_by_ids(person_ids)
+        return {
+            person_id: PersonResponse(**person.model_dump())
+            for person_id, person in people.items()
+        }
+
     async def get_person_by_email(self, email: str) -> Optional[PersonResponse]:
         """Get a person by email address."""
-        person = self.people_repository.get_by_email(email)
+        person = await self.async_people_repository.get_by_email(email)
         if not person:
             return None
 
@@ -117,7 +145,7 @@ class PeopleService:
         from ..exceptions.base_exceptions import BusinessLogicException, ErrorCode
 
         # Check if person exists
-        person = self.people_repository.get_by_id(person_id)
+        person = await self.async_people_repository.get_by_id(person_id)
         if not person:
             raise BusinessLogicException(
                 message="Person not found", error_code=ErrorCode.RESOURCE_NOT_FOUND
@@ -184,7 +212,7 @@ class PeopleService:
         )
 
         # Delete the person from database
-        person_deleted = self.people_repository.delete(person_id)
+        person_deleted = await self.async_people_repository.delete(person_id)
 
         if person_deleted:
             # Clean up orphaned subscriptions after successful person deletion
@@ -192,16 +220,19 @@ class PeopleService:
                 subscriptions = await subscriptions_service.get_person_subscriptions(
                     person_id
                 )
-                for subscription in subscriptions:
-                    subscriptions_service.delete_subscription(subscription.id)
+                if subscriptions:
+                    result = await run_in_db_executor(
+                        subscriptions_service.delete_subscriptions,
+                        [subscription.id for subscription in subscriptions],
+                    )
                     logging_service.log_structured(
-                        level=LogLevel.INFO,
+                        level=(LogLevel.WARNING if result.failed else LogLevel.INFO),
                         category=LogCategory.USER_OPERATIONS,
-                        message=f"Deleted orphaned subscription {subscription.id} for deleted person {person_id}",
+                        message=f"Deleted {result.success_count} orphaned subscriptions for deleted person {person_id}",
                         additional_data={
                             "person_id": person_id,
-                            "subscription_id": subscription.id,
-                            "project_id": subscription.projectId,
+                            "subscription_ids": [key["id"] for key in result.succeeded],
+                            "failed": result.failed,
                         },
                     )
             except Exception as e:
@@ -220,6 +251,13 @@ class PeopleService:
         people = self.people_repository.list_all(limit)
         return [PersonResponse(**person.model_dump()) for person in people]
 
+    def search_people(
+        self, query: str, limit: Optional[int] = None
+    ) -> List[PersonResponse]:
+        """People matching a search term, best match first."""
+        people = self.people_repository.search(query, limit)
+        return [PersonResponse(**person.model_dump()) for person in people]
+
     def list_people_paginated(
         self,
         page: int = 1,
@@ -228,12 +266,13 @@ class PeopleService:
         sort_direction: str = "asc",
         search: Optional[str] = None,
         filters: Optional[dict] = None,
-    ) -> tuple[List[PersonResponse], int]:
+        cursor: Optional[str] = None,
+    ) -> CursorPage[PersonResponse]:
         """
         List people with enterprise pagination, sorting, and filtering.
 
-        Returns:
-            tuple: (people_responses, total_count)
+        ``cursor`` continues a keyset listing from the previous page's
+        ``nextCursor``.
         """
         from ..services.logging_service import logging_service, LogCategory, LogLevel
 
@@ -249,22 +288,24 @@ class PeopleService:
                 "sort_direction": sort_direction,
                 "has_search": search is not None,
                 "has_filters": filters is not None and len(filters) > 0,
+                "has_cursor": cursor is not None,
             },
         )
 
         try:
-            people, total_count = self.people_repository.list_paginated(
+            people_page = self.people_repository.list_paginated(
                 page=page,
                 page_size=page_size,
                 sort_by=sort_by,
                 sort_direction=sort_direction,
                 search=search,
                 filters=filters,
+                cursor=cursor,
             )
 
             # Convert to response format
             people_responses = [
-                PersonResponse(**person.model_dump()) for person in people
+                PersonResponse(**person.model_dump()) for person in people_page.items
             ]
 
             # Log successful pagination
@@ -273,14 +314,21 @@ class PeopleService:
                 category=LogCategory.USER_OPERATIONS,
                 message="Paginated people list retrieved successfully",
                 additional_data={
-                    "page": page,
+                    "page": people_page.pageNumber,
                     "page_size": page_size,
                     "returned_items": len(people_responses),
-                    "total_items": total_count,
+                    "total_items": people_page.totalItems,
+                    "total_is_estimate": people_page.totalIsEstimate,
                 },
             )
 
-            return people_responses, total_count
+            return CursorPage[PersonResponse](
+                items=people_responses,
+                pageNumber=people_page.pageNumber,
+                totalItems=people_page.totalItems,
+                totalIsEstimate=people_page.totalIsEstimate,
+                nextCursor=people_page.nextCursor,
+            )
 
         except Exception as e:
             # Log pagination error
@@ -292,6 +340,140 @@ class PeopleService:
             )
             raise
 
+    def import_people(
+        self,
+        records: Iterable[ImportRecord],
+        dry_run: bool = False,
+        batch_size: int = IMPORT_BATCH_SIZE,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Create many people and report the outcome of every row.
+
+        Rows run through the same checks as create_person, a batch at a time.
+        Existing emails are read once into a set, passwords are hashed in a
+        process pool and people are written with batched writes. A failing
+        row never stops the import. With ``dry_run`` rows are only validated.
+
+        Raises PayloadTooLargeException, before anything is written, when the
+        file has more than IMPORT_MAX_ROWS rows, or (unless ``dry_run``) more
+        than IMPORT_MAX_PASSWORD_ROWS rows with a password.
+        """
+        from ..exceptions.base_exceptions import PayloadTooLargeException
+        from ..services.logging_service import logging_service
+
+        records = list(records)
+        if len(records) > IMPORT_MAX_ROWS:
+            raise PayloadTooLargeException(
+                f"Imports are limited to {IMPORT_MAX_ROWS} rows; "
+                f"split the file ({len(records)} rows)",
+                limit=IMPORT_MAX_ROWS,
+                received=len(records),
+            )
+        passwords = sum(1 for _, record, _ in records if (record or {}).get("password"))
+        if not dry_run and passwords > IMPORT_MAX_PASSWORD_ROWS:
+            raise PayloadTooLargeException(
+                f"Imports are limited to {IMPORT_MAX_PASSWORD_ROWS} rows with a "
+                f"password; split the file ({passwords} rows have one)",
+                limit=IMPORT_MAX_PASSWORD_ROWS,
+                received=passwords,
+            )
+
+        emails = self.people_repository.existing_emails()
+        results: List[Dict[str, Any]] = []
+        batch: List[ImportRecord] = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                results.extend(self._import_batch(batch, emails, dry_run, max_workers))
+                batch = []
+        if batch:
+            results.extend(self._import_batch(batch, emails, dry_run, max_workers))
+
+        succeeded = sum(1 for result in results if result["status"] != "failed")
+        report = {
+            "dryRun": dry_run,
+            "total": len(results),
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "rows": results,
+        }
+        logging_service.log_data_operation(
+            operation="import",
+            resource_type="person",
+            success=report["failed"] == 0,
+            details={key: report[key] for key in ("dryRun", "total", "failed")},
+        )
+        return report
+
+    def _import_batch(
+        self,
+        batch: List[ImportRecord],
+        emails: set,
+        dry_run: bool,
+        max_workers: Optional[int],
+    ) -> List[Dict[str, Any]]:
+        """Validate, hash and write one batch; ``emails`` gains the new ones."""
+        from ..utils.password_utils import PasswordValidator, hash_passwords
+
+        results = []
+        # (result, item, password) of every valid row
+        valid = []
+        for line, record, error in batch:
+            result: Dict[str, Any] = {"line": line, "status": "failed"}
+            results.append(result)
+            if error:
+                result["errors"] = [error]
+                continue
+            try:
+                person_data = PersonCreate.model_validate(record)
+            except ValidationError as e:
+                result["errors"] = [
+                    f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}"
+                    for err in e.errors()
+                ]
+                continue
+            result["email"] = person_data.email
+            email = self.people_repository.normalize_email(person_data.email)
+            if email in emails:
+                result["errors"] = [f"Email {person_data.email} is already in use"]
+                continue
+            password = person_data.password
+            person_data.password = person_data.passwordHash = None
+            if password:
+                _, password_errors = PasswordValidator.validate_password(password)
+                if password_errors:
+                    result["errors"] = password_errors
+                    continue
+            try:
+                item = self.people_repository.new_item(person_data)
+            except ValueError as e:
+                result["errors"] = [str(e)]
+                continue
+            emails.add(email)
+            valid.append((result, item, password))
+
+        if dry_run:
+            for result, _, _ in valid:
+                result["status"] = "valid"
+            return results
+        if not valid:
+            return results
+
+        hashing = [(item, password) for _, item, password in valid if password]
+        hashes = hash_passwords([password for _, password in hashing], max_workers)
+        for (item, _), password_hash in zip(hashing, hashes):
+            item["passwordHash"] = password_hash
+
+        written = self.people_repository.create_many([item for _, item, _ in valid])
+        errors = {failed["key"]["id"]: failed["error"] for failed in written.failed}
+        for result, item, _ in valid:
+            if item["id"] in errors:
+                result["errors"] = [errors[item["id"]]]
+                emails.discard(item["emailLower"])
+            else:
+                result.update(status="created", id=item["id"])
+        return results
+
     def check_email_exists(self, email: str) -> bool:
         """Check if an email address is already in use."""
         return self.people_repository.email_exists(email)
@@ -300,7 +482,9 @@ class PeopleService:
         self, person_id: str, is_admin: bool
     ) -> Optional[PersonResponse]:
         """Update a person's admin status."""
-        person = self.people_repository.update_admin_status(person_id, is_admin)
+        person = await self.async_people_repository.update_admin_status(
+            person_id, is_admin
+        )
         if not person:
             return None
 
@@ -308,7 +492,7 @@ class PeopleService:
 
     async def activate_person(self, person_id: str) -> Optional[PersonResponse]:
         """Activate a person's account."""
-        person = self.people_repository.activate_person(person_id)
+        person = await self.async_people_repository.activate_person(person_id)
         if not person:
             return None
 
@@ -316,7 +500,7 @@ class PeopleService:
 
     async def deactivate_person(self, person_id: str) -> Optional[PersonResponse]:
         """Deactivate a person's account."""
-        person = self.people_repository.deactivate_person(person_id)
+        person = await self.async_people_repository.deactivate_person(person_id)
         if not person:
             return None
 
@@ -324,7 +508,7 @@ class PeopleService:
 
     async def unlock_account(self, person_id: str) -> dict:
         """Unlock a person's account."""
-        person = self.people_repository.activate_person(person_id)
+        person = await self.async_people_repository.activate_person(person_id)
         if not person:
             raise ValueError("Person not found")
 
@@ -3,9 +3,10 @@ Projects service - Business logic for projects operations.
 Orchestrates repository operations and implements business rules.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from ..repositories.projects_repository import ProjectsRepository
+from ..repositories.async_repository import AsyncRepository
 from ..models.project import (
     Project,
     ProjectCreate,
@@ -22,6 +23,11 @@ class ProjectsService:
     def __init__(self, projects_repository: ProjectsRepository):
         self.projects_repository = projects_repository
 
+    @property
+    def async_projects_repository(self) -> AsyncRepository[ProjectsRepository]:
+        """Awaitable view of the projects repository."""
+        return AsyncRepository(self.projects_repository)
+
     async def create_project(
         self, project_data: ProjectCreate, created_by: str
     ) -> ProjectResponse:
@@ -31,25 +37,35 @@ class ProjectsService:
             raise ValueError("Maximum participants must be greater than 0")
 
         # Create project
-        project = self.projects_repository.create(project_data, created_by)
+        project = await self.async_projects_repository.create(project_data, created_by)
 
         # Convert to response model
         return ProjectResponse(**project.model_dump())
 
     async def get_project(self, project_id: str) -> Optional[ProjectResponse]:
         """Get a project by ID."""
-        project = self.projects_repository.get_by_id(project_id)
+        project = await self.async_projects_repository.get_by_id(project_id)
         if not project:
             return None
 
         return ProjectResponse(**project.model_dump())
 
+    async def get_projects_by_ids(
+        self, project_ids: List[str]
+    ) -> Dict[str, ProjectResponse]:
+        """Get many projects by ID in batched reads, keyed by ID."""
+        projects = await self.async_projects_repository.get_many_by_ids(project_ids)
+        return {
+            project_id: ProjectResponse(**project.model_dump())
+            for project_id, project in projects.items()
+        }
+
     async def update_project(
         self, project_id: str, updates: ProjectUpdate
     ) -> Optional[ProjectResponse]:
         """Update a project with business validation."""
         # Get existing project to validate date changes
-        existing_project = self.projects_repository.get_by_id(project_id)
+        existing_project = await self.async_projects_repository.get_by_id(project_id)
         if not existing_project:
             return None
 
@@ -75,7 +91,7 @@ class ProjectsService:
             raise ValueError("Maximum participants must be greater than 0")
 
         # Update project
-        project = self.projects_repository.update(project_id, updates)
+        project = await self.async_projects_repository.update(project_id, updates)
         if not project:
             return None
 
@@ -91,7 +107,7 @@ class ProjectsService:
     async def delete_project(self, project_id: str) -> bool:
         """Delete a project."""
         # TODO: Add business rules (e.g., check for active subscriptions)
-        return self.projects_repository.delete(project_id)
+        return await self.async_projects_repository.delete(project_id)
 
     async def list_projects(
         self,
@@ -100,12 +116,13 @@ class ProjectsService:
         category: Optional[str] = None,
     ) -> List[ProjectResponse]:
         """List projects with optional filtering."""
+        repository = self.async_projects_repository
         if status:
-            projects = self.projects_repository.list_by_status(status, limit)
+            projects = await repository.list_by_status(status, limit)
         elif category:
-            projects = self.projects_repository.list_by_category(category, limit)
+            projects = await repository.list_by_category(category, limit)
         else:
-            projects = self.projects_repository.list_all(limit)
+            projects = await repository.list_all(limit)
 
         return [ProjectResponse(**project.model_dump()) for project in projects]
 
@@ -113,22 +130,12 @@ class ProjectsService:
         self, limit: Optional[int] = None
     ) -> List[ProjectResponse]:
         """List public/active projects."""
-        projects = self.projects_repository.list_public_projects(limit)
+        projects = await self.async_projects_repository.list_public_projects(limit)
         return [ProjectResponse(**project.model_dump()) for project in projects]
 
-    async def update_participant_count(
-        self, project_id: str, count: int
-    ) -> Optional[ProjectResponse]:
-        """Update the current participant count for a project."""
-        project = self.projects_repository.update_participant_count(project_id, count)
-        if not project:
-            return None
-
-        return ProjectResponse(**project.model_dump())
-
     async def can_accept_participants(self, project_id: str) -> bool:
         """Check if a project can accept more participants."""
-        project = self.projects_repository.get_by_id(project_id)
+        project = await self.async_projects_repository.get_by_id(project_id)
         if not project:
             return False
 
@@ -136,7 +143,7 @@ class ProjectsService:
 
     async def is_project_active(self, project_id: str) -> bool:
         """Check if a project is active."""
-        project = self.projects_repository.get_by_id(project_id)
+        project = await self.async_projects_repository.get_by_id(project_id)
         if not project:
             return False
 
@@ -211,8 +218,13 @@ class ProjectsService:
 
     def get_with_dynamic_fields(self, project_id: str) -> Optional[Project]:
         """Get project with dynamic fields"""
+        from ..exceptions.base_exceptions import DatabaseUnavailableException
+
         try:
             return self.projects_repository.get_by_id(project_id)
+        except DatabaseUnavailableException:
+            # A throttled or failing table is not a missing project
+            raise
         except Exception:
             return None
 
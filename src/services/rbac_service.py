@@ -30,6 +30,7 @@ from ..exceptions.base_exceptions import (
     ErrorCode,
 )
 from ..repositories.people_repository import PeopleRepository
+from ..repositories.async_repository import run_in_db_executor
 from .logging_service import logging_service, LogCategory, LogLevel, RequestContext
 
 
@@ -53,30 +54,20 @@ class RBACService:
         """Get all active roles for a user."""
         try:
             # Get user roles from database
-            user_roles = self.roles_repository.get_user_roles(user_id)
+            user_roles = await run_in_db_executor(
+                self.roles_repository.get_user_roles, user_id
+            )
 
             # Filter active and non-expired roles
-            active_roles = []
-            now = datetime.now(timezone.utc)
-
-            for user_role in user_roles:
-                if user_role.is_active and (
-                    user_role.expires_at is None or user_role.expires_at > now
-                ):
-                    active_roles.append(user_role.role_type)
+            active_roles = self._active_role_types(user_roles)
 
             # If no roles found, assign default USER role
             if not active_roles:
                 # Check if user exists
-                user = self.people_repository.get_by_id(user_id)
-                if user:
-                    # Check legacy admin field
-                    if getattr(user, "isAdmin", False):
-                        active_roles = [RoleType.ADMIN]
-                    else:
-                        active_roles = [RoleType.USER]
-                else:
-                    active_roles = [RoleType.GUEST]
+                user = await run_in_db_executor(
+                    self.people_repository.get_by_id, user_id
+                )
+                active_roles = self._default_role_types(user)
 
             return active_roles
 
@@ -93,6 +84,66 @@ class RBACService:
             # Return guest role on error
             return [RoleType.GUEST]
 
+    async def get_users_roles(self, user_ids: List[str]) -> Dict[str, List[RoleType]]:
+        """Get active roles for many users with batched reads.
+
+        Same rules as get_user_roles, but role items and the fallback person
+        lookups are each fetched in one batch instead of once per user.
+        """
+        try:
+            user_roles = await run_in_db_executor(
+                self.roles_repository.get_many_by_ids, user_ids
+            )
+            roles = {
+                user_id: self._active_role_types(user_roles.get(user_id, []))
+                for user_id in user_ids
+            }
+
+            # Users without active roles fall back to their person record
+            missing = [user_id for user_id, active in roles.items() if not active]
+            if missing:
+                people = await run_in_db_executor(
+                    self.people_repository.get_many_by_ids, missing
+                )
+                for user_id in missing:
+                    roles[user_id] = self._default_role_types(people.get(user_id))
+
+            return roles
+
+        except Exception as e:
+            logging_service.log_structured(
+                level=LogLevel.ERROR,
+                category=LogCategory.AUTHORIZATION,
+                message="Failed to get roles for users",
+                additional_data={
+                    "user_count": len(user_ids),
+                    "error": str(e),
+                },
+            )
+            # Return guest role on error
+            return {user_id: [RoleType.GUEST] for user_id in user_ids}
+
+    @staticmethod
+    def _active_role_types(user_roles: List[UserRole]) -> List[RoleType]:
+        """Role types of the active, non-expired role assignments."""
+        now = datetime.now(timezone.utc)
+        return [
+            user_role.role_type
+            for user_role in user_roles
+            if user_role.is_active
+            and (user_role.expires_at is None or user_role.expires_at > now)
+        ]
+
+    @staticmethod
+    def _default_role_types(user: Optional[Any]) -> List[RoleType]:
+        """Fallback roles for a user without explicit role assignments."""
+        if not user:
+            return [RoleType.GUEST]
+        # Check legacy admin field
+        if getattr(user, "isAdmin", False):
+            return [RoleType.ADMIN]
+        return [RoleType.USER]
+
     async def user_has_permission(
         self,
         user_id: str,
@@ -229,7 +280,9 @@ class RBACService:
                 )
 
             # Get target user
-            target_user = self.people_repository.get_by_email(request.user_email)
+            target_user = await run_in_db_executor(
+                self.people_repository.get_by_email, request.user_email
+            )
             if not target_user:
                 raise ResourceNotFoundException(
                     resource_type="User", details={"email": request.user_email}
@@ -254,7 +307,9 @@ class RBACService:
             )
 
             # Store role assignment in database
-            self.roles_repository.create_role_assignment(user_role)
+            await run_in_db_executor(
+                self.roles_repository.create_role_assignment, user_role
+            )
 
             # Log role assignment
             logging_service.log_structured(
@@ -408,7 +463,7 @@ class RBACService:
 
     async def get_user_role_assignments(self, user_id: str) -> List[UserRole]:
         """Get all role assignments for a user."""
-        return self.roles_repository.get_user_roles(user_id)
+        return await run_in_db_executor(self.roles_repository.get_user_roles, user_id)
 
 
 # Global RBAC service instance
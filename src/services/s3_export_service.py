@@ -0,0 +1,95 @@
+"""
+S3 Export Service - Stores table exports in S3 behind presigned download URLs.
+Lambda buffers a whole response and caps it at 6 MB, so exports served from
+Lambda are uploaded with a multipart upload and the client downloads them
+from S3 instead.
+"""
+
+import uuid
+from typing import Any, Dict, Iterable, List
+
+import boto3
+
+from ..core.config import config
+
+# S3 multipart parts must be at least 5 MB, except the last one
+PART_SIZE = 8 * 1024 * 1024
+
+
+class S3ExportService:
+    """Service for uploading exports to S3"""
+
+    def __init__(self):
+        self.bucket_name = config.export.bucket
+        self.url_expires_seconds = config.export.url_expires_seconds
+        self.s3_client = None  # Lazy initialization
+
+    def _get_s3_client(self):
+        """Get S3 client with lazy initialization"""
+        if not self.s3_client:
+            self.s3_client = boto3.client("s3")
+        return self.s3_client
+
+    def upload(
+        self, chunks: Iterable[str], filename: str, content_type: str
+    ) -> Dict[str, Any]:
+        """Upload an export part by part and return a presigned download URL.
+
+        Memory stays within about one part, whatever the export size. A failed
+        upload is aborted so no partial object is left behind.
+        """
+        s3_client = self._get_s3_client()
+        key = f"exports/{uuid.uuid4()}/{filename}"
+        upload_id = s3_client.create_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=key,
+            ContentType=content_type,
+            ContentDisposition=f'attachment; filename="{filename}"',
+        )["UploadId"]
+        parts: List[Dict[str, Any]] = []
+        size = 0
+
+        def send(body: bytes) -> None:
+            response = s3_client.upload_part(
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=len(parts) + 1,
+                Body=body,
+            )
+            parts.append({"PartNumber": len(parts) + 1, "ETag": response["ETag"]})
+
+        try:
+            buffer = bytearray()
+            for chunk in chunks:
+                buffer += chunk.encode("utf-8")
+                if len(buffer) >= PART_SIZE:
+                    size += len(buffer)
+                    send(bytes(buffer))
+                    buffer.clear()
+            if buffer or not parts:
+                size += len(buffer)
+                send(bytes(buffer))
+            s3_client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except Exception:
+            s3_client.abort_multipart_upload(
+                Bucket=self.bucket_name, Key=key, UploadId=upload_id
+            )
+            raise
+
+        download_url = s3_client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket_name, "Key": key},
+            ExpiresIn=self.url_expires_seconds,
+        )
+        return {
+            "downloadUrl": download_url,
+            "expiresIn": self.url_expires_seconds,
+            "key": key,
+            "bytes": size,
+        }
@@ -27,6 +27,7 @@ from .subscriptions_service import SubscriptionsService
 from .form_submission_service import FormSubmissionService
 from .auth_service import AuthService
 from .admin_service import AdminService
+from .bulk_jobs_service import BulkJobsService
 
 
 class ServiceRegistryManager:
@@ -59,6 +60,10 @@ class ServiceRegistryManager:
         )
         self._services["auth"] = AuthService()
         self._services["admin"] = AdminService()
+        self._services["bulk_jobs"] = BulkJobsService(
+            self._repositories["people"],
+            on_change=self._services["admin"].snapshots.invalidate,
+        )
 
         # Initialize email service
         from .email_service import EmailService
@@ -121,6 +126,11 @@ class ServiceRegistryManager:
         self.initialize()
         return self._services["admin"]
 
+    def get_bulk_jobs_service(self) -> BulkJobsService:
+        """Get the bulk jobs service instance."""
+        self.initialize()
+        return self._services["bulk_jobs"]
+
     def get_email_service(self):
         """Get the email service instance."""
         self.initialize()
@@ -220,6 +230,11 @@ def get_admin_service() -> AdminService:
     return service_registry.get_admin_service()
 
 
+def get_bulk_jobs_service() -> BulkJobsService:
+    """FastAPI dependency for bulk jobs service."""
+    return service_registry.get_bulk_jobs_service()
+
+
 def get_email_service():
     """FastAPI dependency for email service."""
     return service_registry.get_email_service()
@@ -4,8 +4,13 @@ Handles business logic for subscription operations.
 Follows Clean Architecture principles with proper dependency injection.
 """
 
-from typing import List, Optional
+import asyncio
+from typing import Any, Dict, List, Optional
+from ..core.database import BatchWriteResult, TransactionCancelledError
+from ..core.outbox import DeliveryIncomplete, Outbox, outbox as default_outbox
+from ..services.email_service import EmailTemplate
 from ..repositories.subscriptions_repository import SubscriptionsRepository
+from ..repositories.async_repository import AsyncRepository, run_in_db_executor
 from ..models.subscription import (
     Subscription,
     SubscriptionCreate,
@@ -26,6 +31,88 @@ from ..services.logging_service import (
     LogCategory,
 )
 
+# Outbox message type of the project admins' new-subscription email
+SUBSCRIPTION_NOTIFICATION = "subscription-notification"
+# SES template of that email; placeholders are filled per notification
+SUBSCRIPTION_NOTIFICATION_TEMPLATE = EmailTemplate(
+    name="subscription-notification",
+    subject="Nueva suscripción al proyecto: {{{projectName}}}",
+    html="""\
+<html>
+<head>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+        .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+        .header { background-color: #3b82f6; color: white; padding: 20px; border-radius: 8px 8px 0 0; }
+        .content { background-color: #f9fafb; padding: 30px; border-radius: 0 0 8px 8px; }
+        .info-box { background-color: white; padding: 20px; border-radius: 6px; margin: 20px 0; border-left: 4px solid #3b82f6; }
+        .label { font-weight: bold; color: #1f2937; }
+        .value { color: #4b5563; margin-left: 10px; }
+        .footer { text-align: center; margin-top: 30px; color: #6b7280; font-size: 14px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h2 style="margin: 0;">🎉 Nueva Suscripción</h2>
+        </div>
+        <div class="content">
+            <p>Hola,</p>
+            <p>Un nuevo usuario se ha suscrito a tu proyecto.</p>
+
+            <div class="info-box">
+                <h3 style="margin-top: 0; color: #1f2937;">Información del Proyecto</h3>
+                <p><span class="label">Proyecto:</span><span class="value">{{projectName}}</span></p>
+                <p><span class="label">Participantes actuales:</span><span class="value">{{currentParticipants}}/{{maxParticipants}}</span></p>
+            </div>
+
+            <div class="info-box">
+                <h3 style="margin-top: 0; color: #1f2937;">Información del Suscriptor</h3>
+                <p><span class="label">Nombre:</span><span class="value">{{subscriberName}}</span></p>
+                <p><span class="label">Email:</span><span class="value">{{subscriberEmail}}</span></p>
+            </div>
+
+            <p style="margin-top: 30px;">
+                Puedes ver todos los suscriptores y gestionar tu proyecto desde el panel de administración.
+            </p>
+
+            <div style="text-align: center; margin-top: 30px;">
+                <a href="https://registry.cbba.cloud.org.bo/dashboard"
+                   style="background-color: #3b82f6; color: white; padding: 12px 30px; text-decoration: none; border-radius: 6px; display: inline-block;">
+                    Ver Panel de Administración
+                </a>
+            </div>
+        </div>
+        <div class="footer">
+            <p>AWS User Group Cochabamba - Sistema de Registro</p>
+            <p>Este es un correo automático, por favor no responder.</p>
+        </div>
+    </div>
+</body>
+</html>
+""",
+    text="""\
+Nueva Suscripción al Proyecto
+
+Un nuevo usuario se ha suscrito a tu proyecto.
+
+Información del Proyecto:
+- Proyecto: {{{projectName}}}
+- Participantes actuales: {{currentParticipants}}/{{maxParticipants}}
+
+Información del Suscriptor:
+- Nombre: {{{subscriberName}}}
+- Email: {{{subscriberEmail}}}
+
+Puedes ver todos los suscriptores y gestionar tu proyecto desde el panel de administración:
+https://registry.cbba.cloud.org.bo/dashboard
+
+---
+AWS User Group Cochabamba - Sistema de Registro
+Este es un correo automático, por favor no responder.
+""",
+)
+
 
 class SubscriptionsService:
     """Service for subscription business logic with enterprise patterns."""
@@ -36,6 +123,7 @@ class SubscriptionsService:
         projects_service=None,
         people_service=None,
         email_service=None,
+        outbox: Optional[Outbox] = None,
     ):
         """Initialize service with dependency injection.
 
@@ -44,6 +132,7 @@ class SubscriptionsService:
             projects_service: Service for project operations (injected to avoid circular imports)
             people_service: Service for people operations (injected to avoid circular imports)
             email_service: Service for email operations (injected to avoid circular imports)
+            outbox: Outbox that delivers notification emails after the write
         """
         self.subscriptions_repository = (
             subscriptions_repository or SubscriptionsRepository()
@@ -51,6 +140,17 @@ class SubscriptionsService:
         self._projects_service = projects_service
         self._people_service = people_service
         self._email_service = email_service
+        self.outbox = outbox or default_outbox
+        self.outbox.register(
+            SUBSCRIPTION_NOTIFICATION, self._deliver_subscription_notification
+        )
+
+    @property
+    def async_subscriptions_repository(
+        self,
+    ) -> AsyncRepository[SubscriptionsRepository]:
+        """Awaitable view of the subscriptions repository."""
+        return AsyncRepository(self.subscriptions_repository)
 
     def _get_projects_service(self):
         """Lazy load projects service to avoid circular imports."""
@@ -120,12 +220,25 @@ class SubscriptionsService:
                 message=f"Subscription already exists for person {subscription_data.personId} and project {subscription_data.projectId}",
                 error_code=ErrorCode.RESOURCE_ALREADY_EXISTS,
                 user_message="You are already subscribed to this project",
-                severity=ErrorSeverity.LOW,
             )
 
         try:
-            # Create subscription
-            subscription = self.subscriptions_repository.create(subscription_data)
+            # Create subscription, take a project spot and queue the admins'
+            # notification atomically; the email is sent after the request
+            notification = self.outbox.repository.new_message(
+                SUBSCRIPTION_NOTIFICATION,
+                {
+                    "personId": subscription_data.personId,
+                    "projectId": subscription_data.projectId,
+                },
+            )
+            try:
+                subscription = self.subscriptions_repository.create_reserving_seat(
+                    subscription_data,
+                    [self.outbox.repository.put_action(notification)],
+                )
+            except TransactionCancelledError as e:
+                raise self._seat_reservation_error(subscription_data, e.reasons)
 
             logging_service.log_structured(
                 level=LogLevel.INFO,
@@ -138,42 +251,13 @@ class SubscriptionsService:
                 },
             )
 
-            # Send notification emails to project admins (async, non-blocking)
-            # Skip in test environments to avoid async/mock issues
-            import os
-            import asyncio
-
-            if os.getenv("TESTING") != "true":
-                try:
-                    # Fire and forget - don't wait for email to complete
-                    asyncio.create_task(
-                        self._send_subscription_notification(
-                            subscription.personId, subscription.projectId
-                        )
-                    )
-                except Exception as email_error:
-                    # Log email error but don't fail subscription creation
-                    logging_service.log_structured(
-                        level=LogLevel.WARNING,
-                        category=LogCategory.EMAIL_OPERATIONS,
-                        message=f"Failed to send subscription notification: {str(email_error)}",
-                        additional_data={
-                            "subscription_id": subscription.id,
-                            "error": str(email_error),
-                        },
-                    )
-            else:
-                # In test environment, log that we would send notification
-                logging_service.log_structured(
-                    level=LogLevel.DEBUG,
-                    category=LogCategory.EMAIL_OPERATIONS,
-                    message="Skipping notification in test environment",
-                    additional_data={"subscription_id": subscription.id},
-                )
+            self.outbox.publish(notification["id"])
 
             # Convert to response format
             return SubscriptionResponse(**subscription.model_dump())
 
+        except BusinessLogicException:
+            raise
         except Exception as e:
             logging_service.log_structured(
                 level=LogLevel.ERROR,
@@ -192,6 +276,59 @@ class SubscriptionsService:
                 cause=e,
             )
 
+    def _seat_reservation_error(
+        self, subscription_data: SubscriptionCreate, reasons: List[str]
+    ) -> BusinessLogicException:
+        """Map a cancelled subscription transaction to a business error."""
+        details = {
+            "person_id": subscription_data.personId,
+            "project_id": subscription_data.projectId,
+            "reasons": reasons,
+        }
+        if reasons and reasons[0] == "ConditionalCheckFailed":
+            return BusinessLogicException(
+                message=f"Subscription already exists for person {subscription_data.personId} and project {subscription_data.projectId}",
+                error_code=ErrorCode.RESOURCE_ALREADY_EXISTS,
+                details=details,
+                user_message="You are already subscribed to this project",
+            )
+
+        logging_service.log_structured(
+            level=LogLevel.WARNING,
+            category=LogCategory.SUBSCRIPTION_OPERATIONS,
+            message="Subscription rejected: project is full or does not exist",
+            additional_data=details,
+        )
+        return BusinessLogicException(
+            message=f"Project {subscription_data.projectId} is full or does not exist",
+            error_code=ErrorCode.BUSINESS_RULE_VIOLATION,
+            details=details,
+            user_message="This project has no available spots",
+        )
+
+    def _seat_update_error(
+        self, subscription: Subscription, reasons: List[str]
+    ) -> BusinessLogicException:
+        """Map a rejected seat-moving update to a business error."""
+        details = {
+            "subscription_id": subscription.id,
+            "project_id": subscription.projectId,
+            "reasons": reasons,
+        }
+        if len(reasons) > 1 and reasons[1] == "ConditionalCheckFailed":
+            return BusinessLogicException(
+                message=f"Project {subscription.projectId} is full or does not exist",
+                error_code=ErrorCode.BUSINESS_RULE_VIOLATION,
+                details=details,
+                user_message="This project has no available spots",
+            )
+        return BusinessLogicException(
+            message=f"Subscription {subscription.id} was changed concurrently",
+            error_code=ErrorCode.DEPENDENCY_CONFLICT,
+            details=details,
+            user_message="The subscription was changed by someone else, please retry",
+        )
+
     def get_subscription(self, subscription_id: str) -> Optional[SubscriptionResponse]:
         """Get a subscription by ID."""
         subscription = self.subscriptions_repository.get_by_id(subscription_id)
@@ -225,13 +362,16 @@ class SubscriptionsService:
             additional_data={"person_id": person_id},
         )
 
-        subscriptions = self.subscriptions_repository.get_by_person(person_id)
+        subscriptions = await self.async_subscriptions_repository.get_by_person(
+            person_id
+        )
 
-        # Enrich subscriptions with project details
-        enriched_subscriptions = []
-        for sub in subscriptions:
-            enriched_sub = await self._enrich_subscription_with_project(sub)
-            enriched_subscriptions.append(enriched_sub)
+        # Enrich subscriptions with project details loaded in one batched read
+        projects = await self._load_projects(subscriptions)
+        enriched_subscriptions = [
+            self._enrich_subscription_with_project(sub, projects)
+            for sub in subscriptions
+        ]
 
         logging_service.log_structured(
             level=LogLevel.INFO,
@@ -245,73 +385,50 @@ class SubscriptionsService:
 
         return enriched_subscriptions
 
-    async def _enrich_subscription_with_project(
-        self, subscription: Subscription
-    ) -> EnrichedSubscriptionResponse:
-        """Enrich a subscription with project details.
-
-        Args:
-            subscription: Base subscription object
+    async def _load_projects(
+        self, subscriptions: List[Subscription]
+    ) -> Optional[Dict[str, Any]]:
+        """Batch-load the projects referenced by subscriptions.
 
         Returns:
-            Enriched subscription with project details
+            Projects keyed by ID, or None if they could not be loaded
         """
-        # Start with base subscription data
-        enriched_data = subscription.model_dump()
-
-        # Get project details
+        if not subscriptions:
+            return {}
         try:
             projects_service = self._get_projects_service()
-            project = await projects_service.get_project(subscription.projectId)
-
-            if project:
-                enriched_data.update(
-                    {
-                        "projectName": project.name,
-                        "projectDescription": project.description,
-                        "projectStatus": project.status,
-                    }
-                )
-                logging_service.log_structured(
-                    level=LogLevel.DEBUG,
-                    category=LogCategory.SUBSCRIPTION_OPERATIONS,
-                    message="Enriched subscription with project details",
-                    additional_data={
-                        "subscription_id": subscription.id,
-                        "project_id": subscription.projectId,
-                    },
-                )
-            else:
-                # Project not found - likely deleted
-                enriched_data.update(
-                    {
-                        "projectName": "[DELETED] Project Not Found",
-                        "projectDescription": "This project no longer exists",
-                        "projectStatus": "deleted",
-                    }
-                )
-                logging_service.log_structured(
-                    level=LogLevel.WARNING,
-                    category=LogCategory.SUBSCRIPTION_OPERATIONS,
-                    message="Project not found for subscription",
-                    additional_data={
-                        "subscription_id": subscription.id,
-                        "project_id": subscription.projectId,
-                    },
-                )
-
+            return await projects_service.get_projects_by_ids(
+                [sub.projectId for sub in subscriptions]
+            )
         except Exception as e:
-            # Error loading project details
             logging_service.log_structured(
                 level=LogLevel.ERROR,
                 category=LogCategory.ERROR_HANDLING,
-                message=f"Failed to enrich subscription with project details: {str(e)}",
+                message=f"Failed to enrich subscriptions with project details: {str(e)}",
                 additional_data={
-                    "subscription_id": subscription.id,
-                    "project_id": subscription.projectId,
+                    "subscription_ids": [sub.id for sub in subscriptions],
                     "error": str(e),
                 },
             )
+            return None
+
+    def _enrich_subscription_with_project(
+        self, subscription: Subscription, projects: Optional[Dict[str, Any]]
+    ) -> EnrichedSubscriptionResponse:
+        """Enrich a subscription with prefetched project details.
+
+        Args:
+            subscription: Base subscription object
+            projects: Projects keyed by ID, or None if loading them failed
+
+        Returns:
+            Enriched subscription with project details
+        """
+        # Start with base subscription data
+        enriched_data = subscription.model_dump()
+
+        if projects is None:
+            # Error loading project details
             enriched_data.update(
                 {
                     "projectName": "[ERROR] Unable to load project",
@@ -319,6 +436,35 @@ class SubscriptionsService:
                     "projectStatus": "unknown",
                 }
             )
+            return EnrichedSubscriptionResponse(**enriched_data)
+
+        project = projects.get(subscription.projectId)
+        if project:
+            enriched_data.update(
+                {
+                    "projectName": project.name,
+                    "projectDescription": project.description,
+                    "projectStatus": project.status,
+                }
+            )
+        else:
+            # Project not found - likely deleted
+            enriched_data.update(
+                {
+                    "projectName": "[DELETED] Project Not Found",
+                    "projectDescription": "This project no longer exists",
+                    "projectStatus": "deleted",
+                }
+            )
+            logging_service.log_structured(
+                level=LogLevel.WARNING,
+                category=LogCategory.SUBSCRIPTION_OPERATIONS,
+                message="Project not found for subscription",
+                additional_data={
+                    "subscription_id": subscription.id,
+                    "project_id": subscription.projectId,
+                },
+            )
 
         return EnrichedSubscriptionResponse(**enriched_data)
 
@@ -340,13 +486,15 @@ class SubscriptionsService:
             additional_data={"project_id": project_id},
         )
 
-        subscriptions = self.subscriptions_repository.get_by_project(project_id)
+        subscriptions = await self.async_subscriptions_repository.get_by_project(
+            project_id
+        )
 
-        # Enrich subscriptions with person details
-        enriched_subscriptions = []
-        for sub in subscriptions:
-            enriched_sub = self._enrich_subscription_with_person(sub)
-            enriched_subscriptions.append(enriched_sub)
+        # Enrich subscriptions with person details loaded in one batched read
+        people = await self._load_people(subscriptions)
+        enriched_subscriptions = [
+            self._enrich_subscription_with_person(sub, people) for sub in subscriptions
+        ]
 
         logging_service.log_structured(
             level=LogLevel.INFO,
@@ -360,75 +508,61 @@ class SubscriptionsService:
 
         return enriched_subscriptions
 
-    def _enrich_subscription_with_person(
-        self, subscription: Subscription
-    ) -> EnrichedSubscriptionResponse:
-        """Enrich a subscription with person details.
-
-        Args:
-            subscription: Base subscription object
+    async def _load_people(
+        self, subscriptions: List[Subscription]
+    ) -> Optional[Dict[str, Any]]:
+        """Batch-load the people referenced by subscriptions.
 
         Returns:
-            Enriched subscription with person details
+            People keyed by ID, or None if they could not be loaded
         """
-        # Start with base subscription data
-        enriched_data = subscription.model_dump()
-
-        # Get person details
+        if not subscriptions:
+            return {}
         try:
             people_service = self._get_people_service()
-            person = people_service.get_person(subscription.personId)
-
-            if person:
-                enriched_data.update(
-                    {
-                        "personName": f"{person.firstName} {person.lastName}".strip(),
-                        "personEmail": person.email,
-                        "personFirstName": person.firstName,
-                        "personLastName": person.lastName,
-                    }
-                )
-                logging_service.log_structured(
-                    level=LogLevel.DEBUG,
-                    category=LogCategory.SUBSCRIPTION_OPERATIONS,
-                    message="Enriched subscription with person details",
-                    additional_data={
-                        "subscription_id": subscription.id,
-                        "person_id": subscription.personId,
-                    },
-                )
-            else:
-                # Person not found - likely deleted
-                enriched_data.update(
-                    {
-                        "personName": "Unknown User",
-                        "personEmail": "unknown@example.com",
-                        "personFirstName": "Unknown",
-                        "personLastName": "User",
-                    }
-                )
-                logging_service.log_structured(
-                    level=LogLevel.WARNING,
-                    category=LogCategory.SUBSCRIPTION_OPERATIONS,
-                    message="Person not found for subscription",
-                    additional_data={
-                        "subscription_id": subscription.id,
-                        "person_id": subscription.personId,
-                    },
-                )
-
+            return await run_in_db_executor(
+                people_service.get_people_by_ids,
+                [sub.personId for sub in subscriptions],
+            )
         except Exception as e:
-            # Error loading person details
             logging_service.log_structured(
                 level=LogLevel.ERROR,
                 category=LogCategory.ERROR_HANDLING,
-                message=f"Failed to enrich subscription with person details: {str(e)}",
+                message=f"Failed to enrich subscriptions with person details: {str(e)}",
                 additional_data={
-                    "subscription_id": subscription.id,
-                    "person_id": subscription.personId,
+                    "subscription_ids": [sub.id for sub in subscriptions],
                     "error": str(e),
                 },
             )
+            return None
+
+    def _enrich_subscription_with_person(
+        self, subscription: Subscription, people: Optional[Dict[str, Any]]
+    ) -> EnrichedSubscriptionResponse:
+        """Enrich a subscription with prefetched person details.
+
+        Args:
+            subscription: Base subscription object
+            people: People keyed by ID, or None if loading them failed
+
+        Returns:
+            Enriched subscription with person details
+        """
+        # Start with base subscription data
+        enriched_data = subscription.model_dump()
+
+        person = people.get(subscription.personId) if people else None
+        if person:
+            enriched_data.update(
+                {
+                    "personName": f"{person.firstName} {person.lastName}".strip(),
+                    "personEmail": person.email,
+                    "personFirstName": person.firstName,
+                    "personLastName": person.lastName,
+                }
+            )
+        else:
+            # Person not found (likely deleted) or people could not be loaded
             enriched_data.update(
                 {
                     "personName": "Unknown User",
@@ -437,6 +571,16 @@ class SubscriptionsService:
                     "personLastName": "User",
                 }
             )
+            if people is not None:
+                logging_service.log_structured(
+                    level=LogLevel.WARNING,
+                    category=LogCategory.SUBSCRIPTION_OPERATIONS,
+                    message="Person not found for subscription",
+                    additional_data={
+                        "subscription_id": subscription.id,
+                        "person_id": subscription.personId,
+                    },
+                )
 
         return EnrichedSubscriptionResponse(**enriched_data)
 
@@ -482,10 +626,14 @@ class SubscriptionsService:
             )
 
         try:
-            # Update the subscription
-            subscription = self.subscriptions_repository.update(
-                subscription_id, updates
-            )
+            # Update the subscription; approvals take a project spot and
+            # cancellations free one
+            try:
+                subscription = self.subscriptions_repository.update(
+                    subscription_id, updates
+                )
+            except TransactionCancelledError as e:
+                raise self._seat_update_error(current_subscription, e.reasons)
             if not subscription:
                 raise ValidationException(
                     message=f"Failed to update subscription {subscription_id}",
@@ -601,30 +749,52 @@ class SubscriptionsService:
             )
 
     def delete_subscription(self, subscription_id: str) -> bool:
-        """Delete a subscription."""
-        return self.subscriptions_repository.delete(subscription_id)
+        """Delete a subscription and free its project spot."""
+        try:
+            return self.subscriptions_repository.delete_releasing_seat(subscription_id)
+        except TransactionCancelledError:
+            return False
+
+    def delete_subscriptions(self, subscription_ids: List[str]) -> BatchWriteResult:
+        """Delete many subscriptions, freeing each one's spot in its transaction."""
+        return self.subscriptions_repository.delete_many(subscription_ids)
 
     def check_subscription_exists(self, person_id: str, project_id: str) -> bool:
         """Check if a subscription exists for a person and project."""
         return self.subscriptions_repository.subscription_exists(person_id, project_id)
 
+    def _deliver_subscription_notification(self, payload: Dict[str, Any]) -> None:
+        """Outbox handler for subscription notifications."""
+        asyncio.run(
+            self._send_subscription_notification(
+                payload["personId"], payload["projectId"], payload.get("sentTo", [])
+            )
+        )
+
     async def _send_subscription_notification(
-        self, person_id: str, project_id: str
+        self, person_id: str, project_id: str, sent_to: Optional[List[str]] = None
     ) -> None:
         """Send email notification to project admins about new subscription.
 
         Args:
             person_id: ID of the person who subscribed
             project_id: ID of the project they subscribed to
+            sent_to: Recipients an earlier attempt already emailed
 
-        Note:
-            This method is called after subscription creation and should not
-            fail the subscription if email sending fails.
+        Raises:
+            DeliveryIncomplete: If any recipient could not be emailed, so the
+            outbox retries the notification for those recipients only. A
+            missing project or person, or disabled notifications, are not
+            errors.
         """
+        sent = set(sent_to or [])
         try:
-            # Get project details
-            projects_service = self._get_projects_service()
-            project = await projects_service.get_project(project_id)
+            # Read the project past the cache, so the email's participant
+            # count includes this subscription
+            project = await run_in_db_executor(
+                self.subscriptions_repository.projects_repository.get_current,
+                project_id,
+            )
             if not project:
                 logging_service.log_structured(
                     level=LogLevel.WARNING,
@@ -644,9 +814,15 @@ class SubscriptionsService:
                 )
                 return
 
-            # Get subscriber details
+            # Get subscriber and project creator details in one batched read
             people_service = self._get_people_service()
-            person = people_service.get_person(person_id)
+            creator_id = project.createdBy
+            has_creator = bool(creator_id) and creator_id != "system"
+            people = await run_in_db_executor(
+                people_service.get_people_by_ids,
+                [person_id, creator_id] if has_creator else [person_id],
+            )
+            person = people.get(person_id)
             if not person:
                 logging_service.log_structured(
                     level=LogLevel.WARNING,
@@ -660,8 +836,8 @@ class SubscriptionsService:
             recipients = []
 
             # Get project creator details (if not system)
-            if project.createdBy and project.createdBy != "system":
-                creator = people_service.get_person(project.createdBy)
+            if has_creator:
+                creator = people.get(creator_id)
                 if creator:
                     recipients.append(creator.email)
                 else:
@@ -689,120 +865,60 @@ class SubscriptionsService:
                 )
                 return
 
-            # Prepare email content
-            subscriber_name = f"{person.firstName} {person.lastName}"
-            subscriber_email = person.email
-            project_name = project.name
-
-            subject = f"Nueva suscripción al proyecto: {project_name}"
-
-            html_body = f"""
-            <html>
-            <head>
-                <style>
-                    body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                    .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                    .header {{ background-color: #3b82f6; color: white; padding: 20px; border-radius: 8px 8px 0 0; }}
-                    .content {{ background-color: #f9fafb; padding: 30px; border-radius: 0 0 8px 8px; }}
-                    .info-box {{ background-color: white; padding: 20px; border-radius: 6px; margin: 20px 0; border-left: 4px solid #3b82f6; }}
-                    .label {{ font-weight: bold; color: #1f2937; }}
-                    .value {{ color: #4b5563; margin-left: 10px; }}
-                    .footer {{ text-align: center; margin-top: 30px; color: #6b7280; font-size: 14px; }}
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <div class="header">
-                        <h2 style="margin: 0;">🎉 Nueva Suscripción</h2>
-                    </div>
-                    <div class="content">
-                        <p>Hola,</p>
-                        <p>Un nuevo usuario se ha suscrito a tu proyecto.</p>
-
-                        <div class="info-box">
-                            <h3 style="margin-top: 0; color: #1f2937;">Información del Proyecto</h3>
-                            <p><span class="label">Proyecto:</span><span class="value">{project_name}</span></p>
-                            <p><span class="label">Participantes actuales:</span><span class="value">{project.currentParticipants}/{project.maxParticipants}</span></p>
-                        </div>
-
-                        <div class="info-box">
-                            <h3 style="margin-top: 0; color: #1f2937;">Información del Suscriptor</h3>
-                            <p><span class="label">Nombre:</span><span class="value">{subscriber_name}</span></p>
-                            <p><span class="label">Email:</span><span class="value">{subscriber_email}</span></p>
-                        </div>
-
-                        <p style="margin-top: 30px;">
-                            Puedes ver todos los suscriptores y gestionar tu proyecto desde el panel de administración.
-                        </p>
-
-                        <div style="text-align: center; margin-top: 30px;">
-                            <a href="https://registry.cbba.cloud.org.bo/dashboard"
-                               style="background-color: #3b82f6; color: white; padding: 12px 30px; text-decoration: none; border-radius: 6px; display: inline-block;">
-                                Ver Panel de Administración
-                            </a>
-                        </div>
-                    </div>
-                    <div class="footer">
-                        <p>AWS User Group Cochabamba - Sistema de Registro</p>
-                        <p>Este es un correo automático, por favor no responder.</p>
-                    </div>
-                </div>
-            </body>
-            </html>
-            """
-
-            text_body = f"""
-            Nueva Suscripción al Proyecto
-
-            Un nuevo usuario se ha suscrito a tu proyecto.
-
-            Información del Proyecto:
-            - Proyecto: {project_name}
-            - Participantes actuales: {project.currentParticipants}/{project.maxParticipants}
-
-            Información del Suscriptor:
-            - Nombre: {subscriber_name}
-            - Email: {subscriber_email}
-
-            Puedes ver todos los suscriptores y gestionar tu proyecto desde el panel de administración:
-            https://registry.cbba.cloud.org.bo/dashboard
-
-            ---
-            AWS User Group Cochabamba - Sistema de Registro
-            Este es un correo automático, por favor no responder.
-            """
-
-            # Send email to all recipients
-            email_service = self._get_email_service()
-            for recipient in recipients:
-                try:
-                    email_service.send_email(
-                        to_email=recipient,
-                        subject=subject,
-                        html_body=html_body,
-                        text_body=text_body,
-                    )
+            # A retry only emails the recipients the last attempt missed
+            pending = [recipient for recipient in recipients if recipient not in sent]
+            if not pending:
+                return
 
+            # One bulk templated send reaches every pending recipient
+            email_service = self._get_email_service()
+            result = email_service.send_bulk_templated_email(
+                SUBSCRIPTION_NOTIFICATION_TEMPLATE,
+                [{"email": recipient} for recipient in pending],
+                {
+                    "projectName": project.name,
+                    "currentParticipants": project.currentParticipants,
+                    "maxParticipants": project.maxParticipants,
+                    "subscriberName": f"{person.firstName} {person.lastName}",
+                    "subscriberEmail": person.email,
+                },
+            )
+            for recipient_result in result["results"]:
+                if recipient_result["success"]:
+                    sent.add(recipient_result["email"])
                     logging_service.log_structured(
                         level=LogLevel.INFO,
                         category=LogCategory.EMAIL_OPERATIONS,
                         message="Subscription notification sent",
                         additional_data={
-                            "recipient": recipient,
+                            "recipient": recipient_result["email"],
                             "project_id": project_id,
                             "subscriber_id": person_id,
                         },
                     )
-                except Exception as send_error:
+                else:
                     logging_service.log_structured(
                         level=LogLevel.ERROR,
                         category=LogCategory.EMAIL_OPERATIONS,
-                        message=f"Failed to send notification to {recipient}",
+                        message=(
+                            "Failed to send notification to "
+                            f"{recipient_result['email']}"
+                        ),
                         additional_data={
-                            "recipient": recipient,
-                            "error": str(send_error),
+                            "recipient": recipient_result["email"],
+                            "error": recipient_result.get("error"),
                         },
                     )
+            if result["failed"]:
+                raise DeliveryIncomplete(
+                    f"Notification not sent to {result['failed']} "
+                    f"of {len(recipients)} recipients",
+                    {
+                        "personId": person_id,
+                        "projectId": project_id,
+                        "sentTo": sorted(sent),
+                    },
+                )
 
         except Exception as e:
             logging_service.log_structured(
@@ -815,4 +931,5 @@ class SubscriptionsService:
                     "error": str(e),
                 },
             )
-            # Don't re-raise - we don't want to fail subscription creation
+            # The outbox retries, then dead-letters, the notification
+            raise
@@ -0,0 +1,83 @@
+"""
+Streaming encoders for table exports.
+Rows are encoded one at a time and emitted in chunks of about CHUNK_SIZE
+characters, so memory stays flat however many rows are exported.
+"""
+
+import csv
+import io
+import json
+from decimal import Decimal
+from typing import Any, Iterable, Iterator, List
+
+CHUNK_SIZE = 64 * 1024
+
+# Leading characters that make spreadsheet apps evaluate a cell as a formula
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _plain(value: Any) -> Any:
+    """JSON-compatible form of values read from DynamoDB."""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, set):
+        return sorted(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dict, list, set)):
+        return json.dumps(value, default=_plain, separators=(",", ":"))
+    if isinstance(value, Decimal):
+        return str(_plain(value))
+    text = str(value)
+    if text.startswith(_FORMULA_PREFIXES):
+        return "'" + text
+    return text
+
+
+def _chunked(parts: Iterable[str]) -> Iterator[str]:
+    buffer: List[str] = []
+    size = 0
+    for part in parts:
+        buffer.append(part)
+        size += len(part)
+        if size >= CHUNK_SIZE:
+            yield "".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def ndjson_lines(rows: Iterable[dict]) -> Iterator[str]:
+    """Encode rows as newline-delimited JSON."""
+    return _chunked(
+        json.dumps(row, default=_plain, separators=(",", ":")) + "\n" for row in rows
+    )
+
+
+def csv_lines(rows: Iterable[dict], fields: List[str]) -> Iterator[str]:
+    """Encode rows as CSV with a header of ``fields``.
+
+    Nested values are written as JSON and text that a spreadsheet would
+    evaluate as a formula is prefixed with a quote.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def lines() -> Iterator[str]:
+        writer.writerow(fields)
+        for row in rows:
+            writer.writerow([_cell(row.get(field)) for field in fields])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+        yield buffer.getvalue()
+
+    return _chunked(lines())
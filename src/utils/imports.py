@@ -0,0 +1,68 @@
+"""
+Streaming decoders for bulk imports.
+Each record is yielded with its line number and either its data or the reason
+it could not be read, so one bad line is reported without failing the file.
+"""
+
+import csv
+import json
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+FORMATS = ("ndjson", "csv")
+
+# (line number, record, error): exactly one of record and error is set
+ImportRecord = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+def ndjson_records(lines: Iterable[str]) -> Iterator[ImportRecord]:
+    """Decode newline-delimited JSON objects; blank lines are skipped."""
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield number, None, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(record, dict):
+            yield number, None, "Each line must be a JSON object"
+            continue
+        yield number, record, None
+
+
+def csv_records(lines: Iterable[str]) -> Iterator[ImportRecord]:
+    """Decode CSV with a header row.
+
+    Empty cells are left out. Columns named ``parent.child`` are nested, and
+    cells holding a JSON object or array (as written by the CSV export) are
+    decoded.
+    """
+    reader = csv.DictReader(lines)
+    for row in reader:
+        record: Dict[str, Any] = {}
+        try:
+            for column, cell in row.items():
+                if column is None:
+                    raise ValueError("Row has more cells than the header")
+                if cell is None or cell == "":
+                    continue
+                if cell[0] in "{[":
+                    cell = json.loads(cell)
+                parent, _, child = column.partition(".")
+                if child:
+                    record.setdefault(parent, {})[child] = cell
+                else:
+                    record[column] = cell
+        except (ValueError, TypeError) as e:
+            yield reader.line_num, None, f"Invalid row: {e}"
+            continue
+        yield reader.line_num, record, None
+
+
+def import_records(lines: Iterable[str], format: str) -> Iterator[ImportRecord]:
+    """Decode ``lines`` in one of FORMATS."""
+    if format == "csv":
+        return csv_records(lines)
+    if format == "ndjson":
+        return ndjson_records(lines)
+    raise ValueError(f"Unknown import format {format!r}; expected one of {FORMATS}")
@@ -3,10 +3,17 @@ Password utilities for secure password hashing, validation, and generation.
 """
 
 import bcrypt
+import logging
 import secrets
 import string
 import re
-from typing import List, Tuple
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
 
 
 class PasswordPolicy:
@@ -185,3 +192,69 @@ def generate_and_hash_password(length: int = 12) -> Tuple[str, str]:
     plain_password = PasswordGenerator.generate_secure_password(length)
     hashed_password = PasswordHasher.hash_password(plain_password)
     return plain_password, hashed_password
+
+
+# Hashing pools of this process, by size. Workers are started by a fork
+# server, never forked from the (multithreaded) server process itself, so no
+# child inherits a lock another thread was holding
+_hash_pools: Dict[Optional[int], ProcessPoolExecutor] = {}
+_hash_pools_lock = threading.Lock()
+# Set once process pools turn out to be unavailable here
+_process_pools_unavailable = False
+
+
+def _hash_pool(max_workers: Optional[int]) -> ProcessPoolExecutor:
+    """The process's long-lived hashing pool of ``max_workers`` workers."""
+    with _hash_pools_lock:
+        pool = _hash_pools.get(max_workers)
+        if pool is None:
+            start_method = (
+                "forkserver"
+                if "forkserver" in multiprocessing.get_all_start_methods()
+                else "spawn"
+            )
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context(start_method),
+            )
+            _hash_pools[max_workers] = pool
+        return pool
+
+
+def hash_passwords(
+    passwords: Sequence[str], max_workers: Optional[int] = None
+) -> List[str]:
+    """
+    Hash many passwords in parallel, in a process pool.
+
+    bcrypt is CPU bound, so separate processes use every core. The pool is
+    kept for the life of the process and its workers come from a fork
+    server. Where process pools are unavailable (e.g. AWS Lambda has no
+    /dev/shm), threads are used instead; bcrypt releases the GIL while
+    hashing.
+
+    Args:
+        passwords: The plain text passwords to hash
+        max_workers: Pool size (default: number of CPUs)
+
+    Returns:
+        The hashed passwords, in the order given
+    """
+    global _process_pools_unavailable
+
+    if len(passwords) <= 1:
+        return [PasswordHasher.hash_password(password) for password in passwords]
+    if not _process_pools_unavailable:
+        try:
+            pool = _hash_pool(max_workers)
+            return list(pool.map(PasswordHasher.hash_password, passwords))
+        except BrokenProcessPool as e:
+            # A worker died; the next call starts a fresh pool
+            with _hash_pools_lock:
+                _hash_pools.pop(max_workers, None)
+            logger.warning(f"Hashing pool broke, hashing in threads: {e}")
+        except (OSError, NotImplementedError) as e:
+            _process_pools_unavailable = True
+            logger.warning(f"Process pool unavailable, hashing in threads: {e}")
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(PasswordHasher.hash_password, passwords))
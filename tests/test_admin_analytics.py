@@ -0,0 +1,155 @@
+"""
+Tests for the columnar analytics behind the admin dashboards.
+"""
+
+from datetime import date, datetime
+from unittest.mock import patch
+
+from src.core.analytics import CodedColumn, SignupColumns, SubscriptionColumns
+from src.core.database import db
+from src.services.admin_service import AdminService
+
+PEOPLE = "test-people-table-v2"
+PROJECTS = "test-projects-table-v2"
+SUBSCRIPTIONS = "test-subscriptions-table-v2"
+
+
+class TestColumns:
+    """Test the dictionary-encoded columns and their group-bys."""
+
+    def test_coded_column_counts(self):
+        column = CodedColumn()
+        for value in ["a", "b", "a", "c", "a"]:
+            column.append(value)
+
+        assert column.values == ["a", "b", "c"]
+        assert column.counts() == {"a": 3, "b": 1, "c": 1}
+        assert column.counts(bytes([1, 0, 0, 1, 1])) == {"a": 2, "c": 1}
+
+    def test_subscription_group_bys(self):
+        columns = SubscriptionColumns(
+            [
+                {"projectId": "p1", "status": "active", "isActive": True},
+                {"projectId": "p1", "status": "cancelled", "isActive": False},
+                {"projectId": "p2"},
+            ]
+        )
+
+        assert columns.by_project() == {"p1": 2, "p2": 1}
+        assert columns.active_by_project() == {"p1": 1, "p2": 1}
+        assert columns.by_status() == {"active": 2, "cancelled": 1}
+
+    def test_large_subscription_tables_aggregate_in_one_pass(self):
+        rows = (
+            {
+                "projectId": f"project-{index % 250}",
+                "status": "cancelled" if index % 10 == 0 else "active",
+                "isActive": index % 10 != 0,
+            }
+            for index in range(120_000)
+        )
+
+        columns = SubscriptionColumns(rows)
+
+        assert len(columns) == 120_000
+        assert len(columns.project.values) == 250
+        assert columns.by_project()["project-7"] == 480
+        assert columns.by_status() == {"cancelled": 12_000, "active": 108_000}
+        assert sum(columns.active_by_project().values()) == 108_000
+
+
+class TestSignupColumns:
+    """Test recent signup counts and bucketed series."""
+
+    def setup_method(self):
+        self.columns = SignupColumns(
+            [
+                {"createdAt": "2025-03-03T09:00:00"},
+                {"createdAt": "2025-03-03T18:30:00Z"},
+                {"createdAt": "2025-03-05T00:00:00+00:00"},
+                {"createdAt": "2025-03-10T12:00:00"},
+                {"createdAt": "2025-02-01T00:00:00"},
+                {"createdAt": "not-a-date"},
+                {},
+            ],
+            recent_since=datetime(2025, 3, 4),
+        )
+
+    def test_recent_signups_compare_timestamps_as_text(self):
+        assert self.columns.recent == 2
+
+    def test_daily_series_fills_gaps(self):
+        series = self.columns.series("day", since=date(2025, 3, 1))
+
+        assert series[0] == {"period": "2025-03-03", "count": 2}
+        assert series[2] == {"period": "2025-03-05", "count": 1}
+        assert series[1]["count"] == 0
+        assert series[-1] == {"period": "2025-03-10", "count": 1}
+        assert len(series) == 8
+
+    def test_weekly_series_starts_on_mondays(self):
+        series = self.columns.series("week", since=date(2025, 3, 1))
+
+        assert series == [
+            {"period": "2025-03-03", "count": 3},
+            {"period": "2025-03-10", "count": 1},
+        ]
+
+
+class TestEnhancedDashboard:
+    """Test the enhanced dashboard on the columnar path."""
+
+    def setup_method(self):
+        self.scan = patch.object(db, "parallel_scan", db.iter_scan)
+        self.scan.start()
+
+    def teardown_method(self):
+        self.scan.stop()
+
+    def test_project_stats_and_recent_signups(self):
+        now = datetime.utcnow().isoformat()
+        for person_id, created_at in [("a", now), ("b", "2020-01-01T00:00:00")]:
+            db.put_item(PEOPLE, {"id": person_id, "createdAt": created_at})
+        for project_id in ("p1", "p2"):
+            db.put_item(
+                PROJECTS,
+                {
+                    "id": project_id,
+                    "name": f"Project {project_id}",
+                    "description": "A project",
+                    "startDate": "2025-01-01",
+                    "endDate": "2025-12-31",
+                    "maxParticipants": 10,
+                    "currentParticipants": 0,
+                    "status": "active",
+                    "createdBy": "system",
+                    "createdAt": now,
+                    "updatedAt": now,
+                },
+            )
+        for index, (project_id, active) in enumerate(
+            [("p1", True), ("p1", False), ("p1", True)]
+        ):
+            db.put_item(
+                SUBSCRIPTIONS,
+                {
+                    "id": f"s{index}",
+                    "projectId": project_id,
+                    "personId": "a",
+                    "status": "active" if active else "cancelled",
+                    "isActive": active,
+                },
+            )
+
+        with patch.object(db, "scan_attributes", wraps=db.scan_attributes) as scans:
+            data = AdminService().get_enhanced_dashboard_data()
+
+        assert data["recentSignups"] == 1
+        assert data["projectStats"]["p1"]["subscriptions"] == 3
+        assert data["projectStats"]["p1"]["activeSubscriptions"] == 2
+        assert data["projectStats"]["p2"]["subscriptions"] == 0
+        assert data["subscriptionsByStatus"] == {"active": 2, "cancelled": 1}
+        assert {call.args[1] for call in scans.call_args_list} >= {
+            ("createdAt",),
+            ("projectId", "status", "isActive"),
+        }
@@ -0,0 +1,189 @@
+"""
+Tests for the streaming admin exports.
+"""
+
+import json
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.database import db
+from src.exceptions.base_exceptions import ValidationException
+from src.models.person import PersonCreate, PersonUpdate
+from src.repositories.people_repository import PeopleRepository
+from src.services.admin_service import AdminService
+from src.utils import exports
+from src.utils.exports import csv_lines, ndjson_lines
+
+
+def _person(name, is_admin=False):
+    return PersonCreate(
+        firstName=name,
+        lastName="Export",
+        email=f"{name.lower()}.export@example.com",
+        phone="+1234567890",
+        dateOfBirth="1990-01-01",
+        address={
+            "street": "123 Main St",
+            "city": "Anytown",
+            "state": "CA",
+            "country": "USA",
+            "postalCode": "12345",
+        },
+        isAdmin=is_admin,
+    )
+
+
+class TestEncoders:
+    """Test the NDJSON and CSV encoders."""
+
+    def test_ndjson_converts_dynamodb_numbers(self):
+        rows = [{"id": "a", "count": Decimal("3"), "ratio": Decimal("0.5")}]
+
+        lines = "".join(ndjson_lines(rows)).splitlines()
+
+        assert [json.loads(line) for line in lines] == [
+            {"id": "a", "count": 3, "ratio": 0.5}
+        ]
+
+    def test_csv_quotes_nested_values_and_formulas(self):
+        rows = [
+            {"name": "=SUM(A1)", "address": {"city": "Anytown"}, "isAdmin": True},
+            {"name": "Plain, with comma"},
+        ]
+
+        text = "".join(csv_lines(rows, ["name", "address", "isAdmin"]))
+
+        assert text.splitlines() == [
+            "name,address,isAdmin",
+            '\'=SUM(A1),"{""city"":""Anytown""}",true',
+            '"Plain, with comma",,',
+        ]
+
+    def test_output_is_emitted_in_chunks(self):
+        rows = ({"id": str(n)} for n in range(50))
+
+        with patch.object(exports, "CHUNK_SIZE", 100):
+            chunks = list(ndjson_lines(rows))
+
+        assert len(chunks) > 1
+        assert len("".join(chunks).splitlines()) == 50
+
+
+class TestExportRows:
+    """Test field selection and filters of the admin exports."""
+
+    def setup_method(self):
+        self.scan = patch.object(db, "parallel_scan", db.iter_scan)
+        self.scan.start()
+        self.service = AdminService()
+        people = PeopleRepository()
+        self.admin = people.create(_person("Ada", is_admin=True))
+        self.inactive = people.create(_person("Ben"))
+        people.update(self.inactive.id, PersonUpdate(isActive=False))
+
+    def teardown_method(self):
+        self.scan.stop()
+
+    def _exported(self, **kwargs):
+        fields, rows = self.service.export_rows("people", **kwargs)
+        return fields, {row["id"]: row for row in rows}
+
+    def test_only_selected_fields_are_exported(self):
+        fields, rows = self._exported(fields=["id", "email"])
+
+        assert fields == ["id", "email"]
+        assert set(rows[self.admin.id]) == {"id", "email"}
+
+    def test_default_fields_never_include_secrets(self):
+        fields, rows = self._exported()
+
+        assert "passwordHash" not in fields
+        assert all("passwordHash" not in row for row in rows.values())
+
+    def test_filters_match_typed_values(self):
+        _, admins = self._exported(fields=["id"], filters={"isAdmin": "true"})
+        _, active = self._exported(fields=["id"], filters={"isActive": "true"})
+
+        assert self.admin.id in admins
+        assert self.inactive.id not in admins
+        assert self.admin.id in active
+        assert self.inactive.id not in active
+
+    def test_unknown_resources_fields_and_bad_values_are_rejected(self):
+        with pytest.raises(ValidationException):
+            self.service.export_rows("passwords")
+        with pytest.raises(ValidationException) as error:
+            self.service.export_rows("people", fields=["id", "passwordHash"])
+        assert "passwordHash" in error.value.details["field_errors"]
+        with pytest.raises(ValidationException):
+            self.service.export_rows("people", filters={"isAdmin": "maybe"})
+
+    @pytest.mark.asyncio
+    async def test_endpoint_streams_csv(self):
+        from src.routers.admin_router import export_resource
+
+        response = await export_resource(
+            resource="people",
+            export_format="csv",
+            fields="id,isAdmin",
+            filter=["isAdmin:true"],
+            current_user=MagicMock(),
+            admin_service=self.service,
+        )
+        body = "".join([chunk async for chunk in response.body_iterator])
+
+        assert response.media_type == "text/csv"
+        assert 'filename="people.csv"' in response.headers["content-disposition"]
+        lines = body.splitlines()
+        assert lines[0] == "id,isAdmin"
+        assert f"{self.admin.id},true" in lines
+        assert all(self.inactive.id not in line for line in lines)
+
+    @pytest.mark.asyncio
+    async def test_endpoint_rejects_bad_requests_before_streaming(self):
+        from src.routers.admin_router import export_resource
+
+        for export_format, filters in (("xml", []), ("ndjson", ["isAdmin"])):
+            with pytest.raises(ValidationException):
+                await export_resource(
+                    resource="people",
+                    export_format=export_format,
+                    fields=None,
+                    filter=filters,
+                    current_user=MagicMock(),
+                    admin_service=self.service,
+                )
+
+    @pytest.mark.asyncio
+    async def test_endpoint_uploads_to_s3_when_responses_are_capped(self):
+        import boto3
+
+        from src.core.config import config
+        from src.routers.admin_router import export_resource
+        from src.services.s3_export_service import S3ExportService
+
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket=config.export.bucket)
+
+        with patch.object(config.export, "to_s3", True):
+            response = await export_resource(
+                resource="people",
+                export_format="csv",
+                fields="id,isAdmin",
+                filter=["isAdmin:true"],
+                current_user=MagicMock(),
+                admin_service=self.service,
+                export_service=S3ExportService(),
+            )
+
+        download = response["data"]
+        assert download["downloadUrl"].startswith("https://")
+        stored = s3.get_object(Bucket=config.export.bucket, Key=download["key"])
+        body = stored["Body"].read()
+        lines = body.decode().splitlines()
+        assert stored["ContentType"] == "text/csv"
+        assert lines[0] == "id,isAdmin"
+        assert f"{self.admin.id},true" in lines
+        assert download["bytes"] == len(body)
@@ -0,0 +1,218 @@
+"""
+Tests for the stale-while-revalidate snapshots behind the admin dashboards.
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.database import db
+from src.core.snapshots import SnapshotCache
+from src.services.admin_service import AdminService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ManualExecutor:
+    """Holds submitted refreshes until the test runs them."""
+
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, job):
+        self.jobs.append(job)
+
+    def run_all(self):
+        jobs, self.jobs = self.jobs, []
+        for job in jobs:
+            job()
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {"calls": self.calls}
+
+
+class TestSnapshotCache:
+    """Test freshness, stale serving and background refresh."""
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.executor = ManualExecutor()
+        self.cache = SnapshotCache(
+            fresh_seconds=30,
+            max_stale_seconds=300,
+            clock=self.clock,
+            executor=self.executor,
+        )
+        self.compute = Counter()
+
+    def test_fresh_snapshots_are_reused(self):
+        first = self.cache.get("k", self.compute)
+        self.clock.now = 10
+        second = self.cache.get("k", self.compute)
+
+        assert self.compute.calls == 1
+        assert second.value == first.value
+        assert second.metadata()["ageSeconds"] == 10
+        assert not second.stale
+
+    def test_stale_snapshots_are_served_while_one_refresh_runs(self):
+        self.cache.get("k", self.compute)
+        self.clock.now = 45
+
+        stale = self.cache.get("k", self.compute)
+        self.cache.get("k", self.compute)
+
+        assert stale.value == {"calls": 1}
+        assert stale.stale
+        assert len(self.executor.jobs) == 1
+
+        self.executor.run_all()
+        refreshed = self.cache.get("k", self.compute)
+        assert refreshed.value == {"calls": 2}
+        assert refreshed.age_seconds == 0
+
+    def test_too_old_snapshots_and_fresh_requests_recompute(self):
+        self.cache.get("k", self.compute)
+        self.clock.now = 300
+
+        assert self.cache.get("k", self.compute).value == {"calls": 2}
+        assert self.cache.get("k", self.compute, fresh=True).value == {"calls": 3}
+        assert self.executor.jobs == []
+
+    def test_failed_refresh_keeps_the_stale_snapshot(self):
+        self.cache.get("k", self.compute)
+        self.clock.now = 60
+
+        def broken():
+            raise RuntimeError("scan failed")
+
+        self.cache.get("k", broken)
+        self.executor.run_all()
+
+        assert self.cache.get("k", self.compute).value == {"calls": 1}
+        assert len(self.executor.jobs) == 1
+
+    def test_concurrent_misses_compute_once(self):
+        cache = SnapshotCache(fresh_seconds=30, max_stale_seconds=300)
+        started = threading.Barrier(4)
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            release.wait(5)
+            return {"ok": True}
+
+        def read():
+            started.wait()
+            cache.get("k", slow)
+
+        threads = [threading.Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert calls == [1]
+
+
+class TestAdminSnapshots:
+    """Test that admin reads go through the snapshots."""
+
+    def setup_method(self):
+        self.scan = patch.object(db, "parallel_scan", db.iter_scan)
+        self.scan.start()
+        self.service = AdminService()
+        self.counters = {
+            "people": {"total": 2, "active": 1, "admins": 1},
+            "projects": {"total": 1, "status:active": 1},
+            "subscriptions": {"total": 3, "active": 3, "project:p1": 3},
+        }
+
+    def teardown_method(self):
+        self.scan.stop()
+
+    def test_dashboard_and_analytics_are_cached_until_fresh_is_asked(self):
+        with patch.object(
+            self.service.stats_repository, "get_counters", return_value=self.counters
+        ) as get_counters:
+            dashboard = self.service.get_dashboard_data()
+            self.service.get_dashboard_data()
+            self.service.get_analytics_data()
+            self.service.get_analytics_data()
+            assert get_counters.call_count == 2
+
+            self.service.get_dashboard_data(fresh=True)
+            assert get_counters.call_count == 3
+
+        assert dashboard["totalUsers"] == 2
+        assert set(dashboard["snapshot"]) == {"generatedAt", "ageSeconds", "stale"}
+
+    def test_failed_reads_are_not_cached(self):
+        with patch.object(
+            self.service.stats_repository,
+            "get_counters",
+            side_effect=[Exception("unavailable"), self.counters],
+        ):
+            assert self.service.get_dashboard_data()["totalUsers"] == 0
+            assert self.service.get_dashboard_data()["totalUsers"] == 2
+
+    def test_bulk_actions_drop_the_snapshots(self):
+        with patch.object(
+            self.service.stats_repository, "get_counters", return_value=self.counters
+        ) as get_counters:
+            self.service.get_dashboard_data()
+            self.service.execute_bulk_action({"action": "activate", "userIds": ["x"]})
+            self.service.get_dashboard_data()
+
+        assert get_counters.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_endpoints_pass_fresh_through(self):
+        from src.routers.admin_router import get_admin_analytics
+
+        with patch.object(
+            self.service, "get_analytics_data", return_value={"users": {}}
+        ) as get_analytics_data:
+            response = await get_admin_analytics(
+                fresh=True,
+                bucket="week",
+                current_user=MagicMock(),
+                admin_service=self.service,
+            )
+
+        get_analytics_data.assert_called_once_with(fresh=True, bucket="week")
+        assert response["data"] == {"users": {}}
+
+    @pytest.mark.asyncio
+    async def test_recomputes_run_off_the_event_loop(self):
+        from src.routers.admin_router import get_dashboard_data
+
+        loop_thread = threading.current_thread()
+        threads = []
+
+        def dashboard(fresh):
+            threads.append(threading.current_thread())
+            return {}
+
+        with patch.object(self.service, "get_dashboard_data", side_effect=dashboard):
+            await get_dashboard_data(
+                fresh=True, current_user=MagicMock(), admin_service=self.service
+            )
+
+        assert threads and threads[0] is not loop_thread
+        assert threads[0].name.startswith("db")
@@ -0,0 +1,220 @@
+"""
+Tests for the aggregate counters kept on the write path for the admin dashboard.
+"""
+
+from unittest.mock import patch
+
+from src.core.database import db
+from src.models.person import PersonCreate, PersonUpdate
+from src.models.project import ProjectCreate, ProjectStatus, ProjectUpdate
+from src.models.subscription import SubscriptionCreate, SubscriptionUpdate
+from src.repositories import stats_repository
+from src.repositories.people_repository import PeopleRepository
+from src.repositories.projects_repository import ProjectsRepository
+from src.repositories.stats_repository import StatsRepository
+from src.repositories.subscriptions_repository import SubscriptionsRepository
+from src.services.admin_service import AdminService
+
+STATS_TABLE = "test-stats-table"
+
+
+def _person(name, is_admin=False):
+    return PersonCreate(
+        firstName=name,
+        lastName="Test",
+        email=f"{name.lower()}@example.com",
+        phone="+1234567890",
+        dateOfBirth="1990-01-01",
+        address={
+            "street": "123 Main St",
+            "city": "Anytown",
+            "state": "CA",
+            "country": "USA",
+            "postalCode": "12345",
+        },
+        isAdmin=is_admin,
+    )
+
+
+def _project(name, status=ProjectStatus.ACTIVE):
+    return ProjectCreate(
+        name=name,
+        description="A project",
+        startDate="2025-01-01",
+        endDate="2025-12-31",
+        maxParticipants=10,
+        status=status,
+    )
+
+
+class TestWritePathCounters:
+    """Test that repository writes keep the counters equal to a recount."""
+
+    def setup_method(self):
+        self.stats = StatsRepository()
+        self.people = PeopleRepository()
+        self.projects = ProjectsRepository()
+        self.subscriptions = SubscriptionsRepository()
+        self.scan = patch.object(db, "parallel_scan", db.iter_scan)
+        self.scan.start()
+        # Start from reconciled (empty) counters
+        self.stats.reconcile()
+
+    def teardown_method(self):
+        self.scan.stop()
+
+    def _assert_matches_recount(self):
+        counters = self.stats.get_counters()
+        projects = self.stats.get_project_counters()
+        recount = self.stats.reconcile()
+        assert projects == self.stats.get_project_counters()
+        assert {
+            scope: {name: n for name, n in values.items() if n}
+            for scope, values in counters.items()
+        } == {
+            scope: {name: n for name, n in values.items() if n}
+            for scope, values in recount.items()
+        }
+        return counters
+
+    def test_people_writes(self):
+        ana = self.people.create(_person("Ana", is_admin=True))
+        bea = self.people.create(_person("Bea"))
+        cy = self.people.create(_person("Cy"))
+        dan = self.people.create(_person("Dan"))
+
+        self.people.update(bea.id, PersonUpdate(isAdmin=True, isActive=False))
+        self.people.update(cy.id, PersonUpdate(firstName="Cyd"))
+        self.people.delete(ana.id)
+        self.people.delete("missing")
+        self.people.set_active_many([bea.id, cy.id, "missing"], False)
+        self.people.delete_many([dan.id, "missing"])
+
+        counters = self._assert_matches_recount()
+        assert counters["people"] == {"total": 2, "active": 0, "admins": 1}
+
+    def test_project_and_subscription_writes(self):
+        first = self.projects.create(_project("First"))
+        second = self.projects.create(_project("Second", ProjectStatus.PENDING))
+        self.projects.update(second.id, ProjectUpdate(status=ProjectStatus.ACTIVE))
+        self.projects.update(first.id, ProjectUpdate(name="Renamed"))
+
+        seat = self.subscriptions.create_reserving_seat(
+            SubscriptionCreate(personId="p1", projectId=first.id)
+        )
+        plain = self.subscriptions.create(
+            SubscriptionCreate(personId="p2", projectId=second.id)
+        )
+        other = self.subscriptions.create(
+            SubscriptionCreate(personId="p3", projectId=second.id)
+        )
+        self.subscriptions.update(
+            plain.id, SubscriptionUpdate(status="cancelled", isActive=False)
+        )
+        self.subscriptions.delete_releasing_seat(seat.id)
+        self.subscriptions.delete_many([other.id])
+        self.projects.delete(first.id)
+
+        counters = self._assert_matches_recount()
+        assert counters["projects"]["total"] == 1
+        assert counters["projects"]["status:active"] == 1
+        assert counters["subscriptions"]["total"] == 1
+        assert counters["subscriptions"]["active"] == 0
+        assert self.stats.get_project_counters() == {second.id: 1}
+
+    def test_updates_that_do_not_touch_counters_skip_them(self):
+        person = self.people.create(_person("Eva"))
+
+        with patch.object(db, "increment") as increment:
+            self.people.update(person.id, PersonUpdate(lastName="Other"))
+            self.people.update(person.id, PersonUpdate(isActive=True))
+
+        increment.assert_not_called()
+
+    def test_failed_counter_update_does_not_fail_the_write(self):
+        with patch.object(db, "increment", side_effect=Exception("throttled")):
+            person = self.people.create(_person("Fay"))
+
+        assert self.people.get_by_id(person.id) is not None
+        assert self.stats.get_counters()["people"].get("total", 0) == 0
+        assert self.stats.reconcile()["people"]["total"] == 1
+
+    def test_counters_are_spread_over_shards_and_summed(self):
+        shards = iter(range(3))
+        with patch.object(
+            stats_repository.random, "randrange", side_effect=lambda n: next(shards)
+        ):
+            for project_id in ("p1", "p1", "p2"):
+                self.stats.record("subscriptions", new={"projectId": project_id})
+
+        items = {item["id"]: item for item in db.iter_scan(STATS_TABLE)}
+        assert {"subscriptions#1", "subscriptions#2"} <= set(items)
+        # Per-project counts stay out of the scope's shards
+        assert not any(
+            name.startswith("project:")
+            for item_id, item in items.items()
+            if item_id.startswith("subscriptions#")
+            for name in item
+        )
+        assert self.stats.get_counters()["subscriptions"]["total"] == 3
+        assert self.stats.get_project_counters() == {"p1": 2, "p2": 1}
+
+        recount = self.stats.reconcile()
+        assert recount["subscriptions"].get("total", 0) == 0
+        assert self.stats.get_project_counters() == {}
+        assert "subscriptions#1" not in {
+            item["id"] for item in db.iter_scan(STATS_TABLE)
+        }
+
+
+class TestDashboardFromCounters:
+    """Test that the dashboard and analytics read counters instead of tables."""
+
+    def test_counters_are_seeded_once_then_read_without_scans(self):
+        people = PeopleRepository()
+        for name in ("Ana", "Bea"):
+            people.create(_person(name))
+        db.delete_item(STATS_TABLE, {"id": "people#0"})
+        service = AdminService()
+
+        with patch.object(db, "parallel_scan", db.iter_scan):
+            assert service.get_dashboard_data()["totalUsers"] == 2
+
+        with (
+            patch.object(db, "parallel_scan") as parallel_scan,
+            patch.object(db, "scan_table") as scan_table,
+            patch.object(db, "get_many", wraps=db.get_many) as get_many,
+        ):
+            dashboard = service.get_dashboard_data(fresh=True)
+
+        parallel_scan.assert_not_called()
+        scan_table.assert_not_called()
+        get_many.assert_called_once()
+        assert dashboard["activeUsers"] == 2
+
+    def test_analytics_groups_by_status_and_project(self):
+        stats = StatsRepository()
+        with patch.object(db, "parallel_scan", db.iter_scan):
+            stats.reconcile()
+        stats.record_many(
+            "projects",
+            [
+                (None, {"status": "active"}),
+                (None, {"status": "pending"}),
+                ({"status": "pending"}, {"status": "active"}),
+            ],
+        )
+        for project_id in ("p1", "p1", "p2"):
+            stats.record("subscriptions", new={"projectId": project_id})
+        stats.record("people", new={})
+
+        with patch.object(db, "parallel_scan", db.iter_scan):
+            analytics = AdminService().get_analytics_data()
+
+        assert analytics["projects"]["projectsByStatus"] == {"active": 2}
+        assert analytics["projects"]["activeProjects"] == 2
+        assert analytics["subscriptions"]["subscriptionsByProject"] == {
+            "p1": 2,
+            "p2": 1,
+        }
+        assert analytics["subscriptions"]["subscriptionsByStatus"] == {"active": 3}
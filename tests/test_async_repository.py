@@ -0,0 +1,81 @@
+"""
+Tests for the async repository facade.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from src.repositories.async_repository import AsyncRepository, run_in_db_executor
+
+request_marker = contextvars.ContextVar("request_marker", default=None)
+
+
+class SlowRepository:
+    """Synchronous repository stand-in with a blocking call."""
+
+    table_name = "slow-table"
+
+    def __init__(self):
+        self.threads = []
+
+    def get_by_id(self, item_id: str):
+        self.threads.append(threading.current_thread().name)
+        time.sleep(0.05)
+        return {"id": item_id, "marker": request_marker.get()}
+
+
+class TestAsyncRepository:
+    """Test that repository calls run off the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_calls_run_on_database_executor(self):
+        """Repository methods execute on the dedicated db thread pool."""
+        repository = SlowRepository()
+        facade = AsyncRepository(repository)
+
+        result = await facade.get_by_id("abc")
+
+        assert result["id"] == "abc"
+        assert repository.threads[0].startswith("db")
+        assert facade.table_name == "slow-table"
+        assert facade.repository is repository
+
+    @pytest.mark.asyncio
+    async def test_independent_lookups_run_concurrently(self):
+        """Several awaited lookups overlap instead of running back to back."""
+        facade = AsyncRepository(SlowRepository())
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(facade.get_by_id(str(i)) for i in range(5)))
+        elapsed = time.perf_counter() - started
+
+        assert [item["id"] for item in results] == ["0", "1", "2", "3", "4"]
+        assert elapsed < 0.2
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self):
+        """The loop keeps running other tasks while a lookup blocks."""
+        facade = AsyncRepository(SlowRepository())
+        ticks = []
+
+        async def ticker():
+            for _ in range(3):
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(facade.get_by_id("x"), ticker())
+
+        assert len(ticks) == 3
+
+    @pytest.mark.asyncio
+    async def test_context_variables_are_propagated(self):
+        """Request-scoped context variables are visible in the worker thread."""
+        request_marker.set("request-1")
+
+        result = await run_in_db_executor(SlowRepository().get_by_id, "abc")
+
+        assert result["marker"] == "request-1"
@@ -18,9 +18,8 @@ class TestAsyncSyncConsistency:
     def test_subscription_service_methods_are_sync(self):
         """Ensure all SubscriptionsService methods are synchronous.
 
-        Note: create_subscription is synchronous but uses asyncio.create_task()
-        internally for non-blocking email notifications. This design maintains
-        test compatibility while allowing async operations in production.
+        Note: create_subscription is synchronous; its email notification is
+        written to the outbox with the subscription and sent by outbox workers.
         """
         service = SubscriptionsService(Mock())
 
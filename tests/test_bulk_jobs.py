@@ -0,0 +1,246 @@
+"""
+Tests for background bulk admin jobs and their checkpoints.
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from src.exceptions.base_exceptions import ValidationException
+from src.models.person import PersonCreate
+from src.repositories.people_repository import PeopleRepository
+from src.services import bulk_jobs_service
+from src.services.bulk_jobs_service import LEASE_SECONDS, BulkJobsService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ManualExecutor:
+    """Holds submitted work until the test runs it."""
+
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, job):
+        self.jobs.append(job)
+
+    def run_all(self):
+        jobs, self.jobs = self.jobs, []
+        for job in jobs:
+            job()
+
+
+class WorkerStopped(BaseException):
+    """Stands in for the process being frozen or killed mid-job."""
+
+
+def _person(name):
+    return PersonCreate(
+        firstName=name,
+        lastName="Job",
+        email=f"{name.lower()}.job@example.com",
+        phone="+1234567890",
+        dateOfBirth="1990-01-01",
+        address={
+            "street": "123 Main St",
+            "city": "Anytown",
+            "state": "CA",
+            "country": "USA",
+            "postalCode": "12345",
+        },
+    )
+
+
+class TestBulkJobs:
+    """Test submitting, checkpointing and resuming bulk jobs."""
+
+    def setup_method(self):
+        self.people = PeopleRepository()
+        self.ids = [self.people.create(_person(f"P{n}")).id for n in range(5)]
+        self.clock = FakeClock()
+        self.executor = ManualExecutor()
+        self.on_change = MagicMock()
+        self.service = BulkJobsService(
+            self.people,
+            on_change=self.on_change,
+            executor=self.executor,
+            clock=self.clock,
+            workers=4,
+        )
+        self.chunk_size = patch.object(bulk_jobs_service, "CHUNK_SIZE", 2)
+        self.chunk_size.start()
+
+    def teardown_method(self):
+        self.chunk_size.stop()
+
+    def test_submit_returns_at_once_and_workers_report_outcomes(self):
+        job = self.service.submit("deactivate", self.ids + ["missing"], "admin-1")
+
+        assert job["status"] == "queued"
+        assert (job["total"], job["chunkCount"], job["progress"]) == (6, 3, 0.0)
+        assert self.people.get_by_id(self.ids[0]).isActive
+
+        self.executor.run_all()
+        done = self.service.get_job(job["id"], include_results=True)
+
+        assert done["status"] == "completed"
+        assert (done["processed"], done["succeeded"], done["failed"]) == (6, 5, 1)
+        assert done["progress"] == 100.0
+        assert done["results"][-1] == {
+            "userId": "missing",
+            "status": "failed",
+            "error": "Person not found",
+        }
+        assert not self.people.get_by_id(self.ids[0]).isActive
+        assert self.on_change.call_count == 3
+
+    def test_stopped_workers_are_resumed_from_the_checkpoint(self):
+        job = self.service.submit("deactivate", self.ids)
+        applied = []
+        apply = self.service._apply
+
+        def stop_on_second_chunk(action, user_ids):
+            applied.append(user_ids)
+            if len(applied) == 2:
+                raise WorkerStopped()
+            return apply(action, user_ids)
+
+        with patch.object(self.service, "_apply", side_effect=stop_on_second_chunk):
+            with pytest.raises(WorkerStopped):
+                self.executor.run_all()
+
+            # The lease is still live: nobody else takes the job over
+            stalled = self.service.get_job(job["id"])
+            assert stalled["status"] == "running"
+            assert stalled["processed"] == 2
+            assert self.executor.jobs == []
+            assert self.service.run(job["id"]) is None
+
+            # Reading a stopped job does not restart it
+            self.clock.now += LEASE_SECONDS + 1
+            assert self.service.get_job(job["id"])["status"] == "running"
+            assert self.executor.jobs == []
+
+            self.service.resume(job["id"])
+            self.executor.run_all()
+
+        done = self.service.get_job(job["id"], include_results=True)
+        assert done["status"] == "completed"
+        assert [len(user_ids) for user_ids in applied] == [2, 2, 2, 1]
+        assert [result["userId"] for result in done["results"]] == self.ids
+
+    def test_failed_jobs_can_be_resumed(self):
+        job = self.service.submit("activate", self.ids[:2])
+
+        with patch.object(
+            self.people, "set_active_many", side_effect=Exception("throttled")
+        ):
+            self.executor.run_all()
+        failed = self.service.get_job(job["id"])
+        assert (failed["status"], failed["error"]) == ("failed", "throttled")
+        assert self.executor.jobs == []
+
+        self.service.resume(job["id"])
+        self.executor.run_all()
+
+        done = self.service.get_job(job["id"])
+        assert (done["status"], done["error"], done["succeeded"]) == (
+            "completed",
+            None,
+            2,
+        )
+
+    def test_resume_unfinished_runs_stalled_jobs(self):
+        job = self.service.submit("delete", self.ids[:3])
+        self.executor.jobs.clear()
+        self.service._active.clear()
+
+        assert self.service.resume_unfinished() == [job["id"]]
+        assert self.people.get_by_id(self.ids[0]) is None
+        assert self.service.resume_unfinished() == []
+
+    def test_without_workers_jobs_wait_for_the_scheduled_resume(self):
+        service = BulkJobsService(
+            self.people, executor=self.executor, clock=self.clock, workers=0
+        )
+        job = service.submit("deactivate", self.ids)
+        assert self.executor.jobs == []
+        assert service.get_job(job["id"])["status"] == "queued"
+
+        apply = service._apply
+
+        def slow_apply(action, user_ids):
+            self.clock.now += 10
+            return apply(action, user_ids)
+
+        with patch.object(service, "_apply", side_effect=slow_apply):
+            # Out of time after the first chunk: checkpoint and let go
+            assert service.resume_unfinished(until=self.clock.now + 5) == []
+            stopped = service.get_job(job["id"])
+            assert (stopped["status"], stopped["processed"]) == ("running", 2)
+
+            assert service.resume_unfinished() == [job["id"]]
+
+        assert service.get_job(job["id"])["processed"] == 5
+        assert self.executor.jobs == []
+
+    def test_lambda_entry_point_resumes_jobs(self):
+        import main
+
+        job = self.service.submit("deactivate", self.ids[:2])
+        self.executor.jobs.clear()
+        self.service._active.clear()
+        self.service._clock = time.time  # the handler's deadline is in real time
+        context = MagicMock()
+        context.get_remaining_time_in_millis.return_value = 60_000
+
+        with patch(
+            "src.services.service_registry_manager.service_registry."
+            "get_bulk_jobs_service",
+            return_value=self.service,
+        ):
+            assert main.jobs_handler({}, context) == {"completed": 1}
+
+        assert self.service.get_job(job["id"])["status"] == "completed"
+
+    def test_invalid_submissions_are_rejected(self):
+        with pytest.raises(ValidationException):
+            self.service.submit("promote", self.ids)
+        with pytest.raises(ValidationException):
+            self.service.submit("activate", [])
+
+    @pytest.mark.asyncio
+    async def test_endpoints(self):
+        from src.routers.admin_router import get_job, submit_bulk_user_job
+
+        user = MagicMock()
+        user.id = "admin-1"
+        response = await submit_bulk_user_job(
+            bulk_data={"action": "activate", "userIds": self.ids},
+            current_user=user,
+            jobs_service=self.service,
+        )
+        job_id = response["data"]["id"]
+        self.executor.run_all()
+
+        status = await get_job(
+            job_id, includeResults=False, current_user=user, jobs_service=self.service
+        )
+        assert status["data"]["status"] == "completed"
+        assert status["data"]["requestedBy"] == "admin-1"
+        with pytest.raises(HTTPException) as error:
+            await get_job(
+                "missing",
+                includeResults=False,
+                current_user=user,
+                jobs_service=self.service,
+            )
+        assert error.value.status_code == 404
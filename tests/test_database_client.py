@@ -0,0 +1,763 @@
+"""
+Tests for DatabaseClient data access primitives against moto DynamoDB.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.core.database import DatabaseClient
+
+TABLE_NAME = "test-people-table-v2"
+
+
+def _seed_people(client: DatabaseClient, count: int):
+    """Insert `count` simple people rows."""
+    for index in range(count):
+        client.put_item(
+            TABLE_NAME,
+            {
+                "id": f"person-{index:03d}",
+                "email": f"person{index}@example.com",
+                "firstName": f"Person{index}",
+            },
+        )
+
+
+class TestPaginatedScan:
+    """Test the streaming scan API."""
+
+    def setup_method(self):
+        """Set up a fresh client bound to the moto mock."""
+        self.client = DatabaseClient()
+
+    def test_scan_table_follows_last_evaluated_key(self):
+        """scan_table should return every item, not just the first page."""
+        _seed_people(self.client, 25)
+
+        items = list(self.client.iter_scan(TABLE_NAME, page_size=7))
+
+        assert len(items) == 25
+        assert len(self.client.scan_table(TABLE_NAME)) == 25
+
+    def test_scan_table_limit_caps_returned_items(self):
+        """A limit caps the number of items returned across pages."""
+        _seed_people(self.client, 12)
+
+        assert len(self.client.scan_table(TABLE_NAME, limit=5)) == 5
+
+    def test_scan_pages_yields_resume_tokens(self):
+        """Each page yields a resume token until the table is exhausted."""
+        _seed_people(self.client, 10)
+
+        pages = list(self.client.scan_pages(TABLE_NAME, page_size=4))
+
+        assert [len(items) for items, _ in pages][:2] == [4, 4]
+        assert pages[-1][1] is None
+        assert all(token is not None for _, token in pages[:-1])
+
+    def test_scan_page_resumes_from_exclusive_start_key(self):
+        """scan_page returns a token that resumes where the last page ended."""
+        _seed_people(self.client, 9)
+
+        first_items, token = self.client.scan_page(TABLE_NAME, limit=5)
+        rest_items, last_token = self.client.scan_page(
+            TABLE_NAME, limit=5, exclusive_start_key=token
+        )
+
+        ids = {item["id"] for item in first_items + rest_items}
+        assert len(ids) == 9
+        assert last_token is None
+
+    def test_iter_scan_stops_reading_pages_early(self):
+        """Breaking out of iter_scan must not fetch the remaining pages."""
+        _seed_people(self.client, 20)
+        dynamodb = self.client._get_client()
+
+        with patch.object(dynamodb, "scan", wraps=dynamodb.scan) as scan:
+            first = next(self.client.iter_scan(TABLE_NAME, page_size=5))
+
+        assert first["id"].startswith("person-")
+        assert scan.call_count == 1
+
+    def test_scan_errors_propagate_instead_of_ending_the_scan(self):
+        """A failed page raises rather than looking like the end of the table."""
+        from botocore.exceptions import ClientError
+
+        _seed_people(self.client, 10)
+        dynamodb = self.client._get_client()
+        denied = ClientError(
+            {"Error": {"Code": "AccessDeniedException", "Message": "denied"}},
+            "Scan",
+        )
+        first_page = dynamodb.scan(TableName=TABLE_NAME, Limit=4)
+
+        with patch.object(dynamodb, "scan", side_effect=[first_page, denied]):
+            pages = self.client.scan_pages(TABLE_NAME, page_size=4)
+            assert len(next(pages)[0]) == 4
+            with pytest.raises(ClientError):
+                next(pages)
+
+
+class TestRepositoryEmailLookup:
+    """Test email lookups through the emailLower index and the scan fallback."""
+
+    def test_get_by_email_uses_email_index(self):
+        """Lookups query the index instead of scanning the table."""
+        from src.core.database import db
+        from src.repositories.people_repository import PeopleRepository
+
+        db.put_item(
+            TABLE_NAME,
+            {"id": "p-1", "email": "Ana@Example.com", "emailLower": "ana@example.com"},
+        )
+        repository = PeopleRepository()
+
+        with (
+            patch.object(db, "iter_scan") as iter_scan,
+            patch.object(db, "query_by_index", wraps=db.query_by_index) as query,
+        ):
+            raw = repository.get_by_email_for_auth(" ANA@example.com")
+
+        iter_scan.assert_not_called()
+        query.assert_called_once_with(
+            repository.table_name, "EmailLowerIndex", {"emailLower": "ana@example.com"}
+        )
+        assert raw["id"] == "p-1"
+        assert repository.get_by_email_for_auth("nobody@example.com") is None
+
+    def test_get_by_email_falls_back_to_scan_without_index(self):
+        """Without the index, the scan still sees rows past the first page."""
+        from src.core.database import db
+        from src.repositories.people_repository import PeopleRepository
+
+        _seed_people(db, 5)
+        repository = PeopleRepository()
+
+        with (
+            patch.object(db, "has_index", return_value=False),
+            patch.object(db, "iter_scan", wraps=db.iter_scan) as iter_scan,
+        ):
+            raw = repository.get_by_email_for_auth("PERSON4@example.com ")
+
+        iter_scan.assert_called_once_with(repository.table_name)
+        assert raw is not None
+        assert raw["id"] == "person-004"
+
+    def test_has_index_raises_describe_errors_other_than_not_found(self):
+        """A denied DescribeTable is not mistaken for a missing index."""
+        from botocore.exceptions import ClientError
+
+        client = DatabaseClient()
+        describe = patch.object(
+            client._get_resource().meta.client,
+            "describe_table",
+            side_effect=ClientError(
+                {"Error": {"Code": "AccessDeniedException", "Message": "denied"}},
+                "DescribeTable",
+            ),
+        )
+
+        with describe, pytest.raises(ClientError):
+            client.has_index(TABLE_NAME, "EmailLowerIndex")
+        assert client._index_cache == {}
+        assert not client.has_index("no-such-table", "EmailLowerIndex")
+
+    def test_backfill_sets_email_lower_on_existing_rows(self):
+        """The backfill makes pre-index rows reachable through the index."""
+        from src.core.database import db
+        from src.repositories.people_repository import PeopleRepository
+
+        _seed_people(db, 3)
+        repository = PeopleRepository()
+        assert repository.get_by_email_for_auth("person1@example.com") is None
+
+        with patch.object(db, "parallel_scan", db.iter_scan):
+            assert repository.backfill_index_keys() == 3
+            assert repository.backfill_index_keys() == 0
+
+        raw = repository.get_by_email_for_auth("Person1@Example.com")
+        assert raw["id"] == "person-001"
+
+
+class TestParallelScan:
+    """Test the segmented parallel scan engine."""
+
+    def setup_method(self):
+        """Set up a client whose scan pages are split by segment."""
+        self.client = DatabaseClient()
+        self.rows = [{"id": f"row-{index}"} for index in range(40)]
+
+    def _fake_scan_pages(self, table_name, page_size=None, start_key=None, **kw):
+        """Emulate DynamoDB segments: each segment owns every Nth row."""
+        segment, total = kw["Segment"], kw["TotalSegments"]
+        owned = self.rows[segment::total]
+        for start in range(0, len(owned), 3):
+            yield owned[start : start + 3], None
+
+    def test_parallel_scan_merges_all_segments(self):
+        """Every row from every segment is yielded exactly once."""
+        with patch.object(self.client, "scan_pages", self._fake_scan_pages):
+            items = self.client.parallel_scan_table(TABLE_NAME, total_segments=4)
+
+        assert sorted(item["id"] for item in items) == sorted(
+            row["id"] for row in self.rows
+        )
+
+    def test_parallel_scan_caps_worker_threads(self):
+        """No more than max_workers segments are scanned at the same time."""
+        import threading
+        import time
+
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow_pages(table_name, page_size=None, start_key=None, **kw):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            yield from self._fake_scan_pages(table_name, page_size, start_key, **kw)
+            with lock:
+                active.pop()
+
+        with patch.object(self.client, "scan_pages", slow_pages):
+            items = self.client.parallel_scan_table(
+                TABLE_NAME, total_segments=6, max_workers=2
+            )
+
+        assert len(items) == len(self.rows)
+        assert max(peak) <= 2
+
+    def test_parallel_scan_can_stop_early(self):
+        """Closing the generator early does not hang or read everything."""
+        with patch.object(self.client, "scan_pages", self._fake_scan_pages):
+            scan = self.client.parallel_scan(TABLE_NAME, total_segments=4)
+            first = next(scan)
+            scan.close()
+
+        assert first["id"].startswith("row-")
+
+    def test_parallel_scans_reuse_the_client_worker_pool(self):
+        """Segments of every call run on the same long-lived threads."""
+        import threading
+
+        threads = set()
+
+        def recording_pages(table_name, page_size=None, start_key=None, **kw):
+            threads.add(threading.current_thread().name)
+            yield from self._fake_scan_pages(table_name, page_size, start_key, **kw)
+
+        with (
+            patch("src.core.database.config.database.worker_threads", 2),
+            patch.object(self.client, "scan_pages", recording_pages),
+        ):
+            for _ in range(5):
+                self.client.parallel_scan_table(TABLE_NAME, total_segments=4)
+
+        assert len(threads) <= 3
+        assert self.client._get_executor()._max_workers == 2
+
+    def test_parallel_scan_runs_segments_inline_when_the_pool_is_busy(self):
+        """A scan consumed from inside another still finishes."""
+        with (
+            patch("src.core.database.config.database.worker_threads", 1),
+            patch.object(self.client, "SCAN_INLINE_AFTER_SECONDS", 0.01),
+            patch.object(self.client, "scan_pages", self._fake_scan_pages),
+        ):
+            outer = self.client.parallel_scan(TABLE_NAME, total_segments=2)
+            next(outer)
+            inner = self.client.parallel_scan_table(TABLE_NAME, total_segments=4)
+            rest = list(outer)
+
+        assert len(inner) == len(self.rows)
+        assert len(rest) == len(self.rows) - 1
+
+    def test_single_segment_falls_back_to_sequential_scan(self):
+        """A single segment uses the regular paginated scan."""
+        _seed_people(self.client, 6)
+
+        items = self.client.parallel_scan_table(TABLE_NAME, total_segments=1)
+
+        assert len(items) == 6
+
+
+class TestBatchGet:
+    """Test BatchGetItem based multi-key reads."""
+
+    def setup_method(self):
+        """Set up a fresh client bound to the moto mock."""
+        self.client = DatabaseClient()
+
+    def test_get_many_preserves_order_and_marks_missing(self):
+        """Results line up with the requested keys, None for missing items."""
+        _seed_people(self.client, 5)
+
+        items = self.client.get_many(
+            TABLE_NAME,
+            [{"id": "person-003"}, {"id": "missing"}, {"id": "person-001"}],
+        )
+
+        assert items[0]["id"] == "person-003"
+        assert items[1] is None
+        assert items[2]["id"] == "person-001"
+
+    def test_get_many_deduplicates_keys(self):
+        """Repeated keys are fetched once and returned at every position."""
+        _seed_people(self.client, 3)
+        dynamodb = self.client._get_client()
+
+        with patch.object(
+            dynamodb, "batch_get_item", wraps=dynamodb.batch_get_item
+        ) as batch_get:
+            items = self.client.get_many(
+                TABLE_NAME, [{"id": "person-000"}, {"id": "person-000"}]
+            )
+
+        requested = batch_get.call_args.kwargs["RequestItems"][TABLE_NAME]["Keys"]
+        assert len(requested) == 1
+        assert [item["id"] for item in items] == ["person-000", "person-000"]
+
+    def test_get_many_chunks_requests_of_one_hundred_keys(self):
+        """More than 100 keys are split across several BatchGetItem calls."""
+        _seed_people(self.client, 5)
+        dynamodb = self.client._get_client()
+        keys = [{"id": f"person-{index:03d}"} for index in range(205)]
+
+        with patch.object(
+            dynamodb, "batch_get_item", wraps=dynamodb.batch_get_item
+        ) as batch_get:
+            items = self.client.get_many(TABLE_NAME, keys)
+
+        assert batch_get.call_count == 3
+        assert sum(item is not None for item in items) == 5
+
+    def test_get_many_retries_unprocessed_keys(self):
+        """UnprocessedKeys are re-requested until every key is served."""
+        responses = [
+            {
+                "Responses": {TABLE_NAME: [{"id": {"S": "a"}}]},
+                "UnprocessedKeys": {TABLE_NAME: {"Keys": [{"id": {"S": "b"}}]}},
+            },
+            {"Responses": {TABLE_NAME: [{"id": {"S": "b"}}]}, "UnprocessedKeys": {}},
+        ]
+        dynamodb = self.client._get_client()
+
+        with (
+            patch.object(
+                dynamodb, "batch_get_item", side_effect=responses
+            ) as batch_get,
+            patch.object(self.client, "_backoff_delay", return_value=0),
+        ):
+            items = self.client.get_many(TABLE_NAME, [{"id": "a"}, {"id": "b"}])
+
+        assert batch_get.call_count == 2
+        retried = batch_get.call_args.kwargs["RequestItems"][TABLE_NAME]["Keys"]
+        assert retried == [{"id": {"S": "b"}}]
+        assert [item["id"] for item in items] == ["a", "b"]
+
+    def test_get_many_raises_when_keys_stay_unprocessed(self):
+        """Keys left unprocessed after every retry are not reported missing."""
+        from src.exceptions.base_exceptions import DatabaseUnavailableException
+
+        response = {
+            "Responses": {TABLE_NAME: []},
+            "UnprocessedKeys": {TABLE_NAME: {"Keys": [{"id": {"S": "a"}}]}},
+        }
+        dynamodb = self.client._get_client()
+
+        with (
+            patch.object(dynamodb, "batch_get_item", return_value=response),
+            patch.object(self.client, "_backoff_delay", return_value=0),
+            pytest.raises(DatabaseUnavailableException),
+        ):
+            self.client.get_many(TABLE_NAME, [{"id": "a"}])
+
+    def test_get_many_propagates_client_errors(self):
+        """Non-transient errors are raised instead of returning None items."""
+        from botocore.exceptions import ClientError
+
+        dynamodb = self.client._get_client()
+        denied = ClientError(
+            {"Error": {"Code": "AccessDeniedException", "Message": "denied"}},
+            "BatchGetItem",
+        )
+
+        with (
+            patch.object(dynamodb, "batch_get_item", side_effect=denied),
+            pytest.raises(ClientError),
+        ):
+            self.client.get_many(TABLE_NAME, [{"id": "a"}])
+
+    def test_repository_get_many_by_ids_returns_models(self):
+        """Repositories map batch results to models keyed by ID."""
+        from src.core.database import db
+        from src.repositories.people_repository import PeopleRepository
+
+        for index in range(3):
+            db.put_item(
+                TABLE_NAME,
+                {
+                    "id": f"person-{index:03d}",
+                    "firstName": f"Person{index}",
+                    "lastName": "Test",
+                    "email": f"person{index}@example.com",
+                    "phone": "+1234567890",
+                    "dateOfBirth": "1990-01-01",
+                    "address": {
+                        "street": "123 Main St",
+                        "city": "Anytown",
+                        "state": "CA",
+                        "country": "USA",
+                        "postalCode": "12345",
+                    },
+                    "isAdmin": False,
+                    "isActive": True,
+                    "requirePasswordChange": False,
+                    "emailVerified": True,
+                    "createdAt": "2025-01-01T00:00:00",
+                    "updatedAt": "2025-01-01T00:00:00",
+                },
+            )
+        repository = PeopleRepository()
+
+        with patch.object(db, "get_many", wraps=db.get_many) as get_many:
+            people = repository.get_many_by_ids(["person-002", "nope", "person-000"])
+
+        get_many.assert_called_once()
+        assert set(people) == {"person-002", "person-000"}
+        assert people["person-002"].email == "person2@example.com"
+
+
+class TestBatchWrite:
+    """Test BatchWriteItem based bulk puts and deletes."""
+
+    def setup_method(self):
+        """Set up a fresh client bound to the moto mock."""
+        self.client = DatabaseClient()
+
+    def test_put_many_writes_every_item_in_chunks(self):
+        """Items are written in chunks of 25 and each one is reported."""
+        items = [{"id": f"bulk-{index:03d}"} for index in range(60)]
+        dynamodb = self.client._get_client()
+
+        with patch.object(
+            dynamodb, "batch_write_item", wraps=dynamodb.batch_write_item
+        ) as batch_write:
+            result = self.client.put_many(TABLE_NAME, items, max_workers=1)
+
+        assert batch_write.call_count == 3
+        assert result.success_count == 60
+        assert result.failure_count == 0
+        assert len(self.client.scan_table(TABLE_NAME)) == 60
+
+    def test_batch_requests_share_the_low_level_client(self):
+        """Worker threads send batches through the one shared client."""
+        items = [{"id": f"bulk-{index:03d}"} for index in range(100)]
+        dynamodb = self.client._get_client()
+
+        with (
+            patch.object(self.client.backend, "resource") as resource,
+            patch.object(
+                dynamodb, "batch_write_item", wraps=dynamodb.batch_write_item
+            ) as batch_write,
+        ):
+            self.client.put_many(TABLE_NAME, items, max_workers=4)
+            self.client.get_many(TABLE_NAME, [{"id": "bulk-000"}])
+
+        resource.assert_not_called()
+        assert batch_write.call_count == 4
+
+    def test_put_many_submits_chunks_in_parallel(self):
+        """Several chunks are written from worker threads."""
+        items = [{"id": f"bulk-{index:03d}"} for index in range(100)]
+
+        result = self.client.put_many(TABLE_NAME, items, max_workers=4)
+
+        assert result.success_count == 100
+        assert len(self.client.scan_table(TABLE_NAME)) == 100
+
+    def test_delete_many_removes_items(self):
+        """delete_many deletes every key, including ones seen twice."""
+        _seed_people(self.client, 30)
+        keys = [{"id": f"person-{index:03d}"} for index in range(30)]
+
+        result = self.client.delete_many(TABLE_NAME, keys + keys[:2])
+
+        assert result.success_count == 30
+        assert self.client.scan_table(TABLE_NAME) == []
+
+    def test_unprocessed_items_are_retried(self):
+        """UnprocessedItems are resubmitted until they are written."""
+        responses = [
+            {
+                "UnprocessedItems": {
+                    TABLE_NAME: [{"DeleteRequest": {"Key": {"id": {"S": "b"}}}}]
+                }
+            },
+            {"UnprocessedItems": {}},
+        ]
+        dynamodb = self.client._get_client()
+
+        with (
+            patch.object(
+                dynamodb, "batch_write_item", side_effect=responses
+            ) as batch_write,
+            patch.object(self.client, "_backoff_delay", return_value=0),
+        ):
+            result = self.client.delete_many(TABLE_NAME, [{"id": "a"}, {"id": "b"}])
+
+        assert batch_write.call_count == 2
+        retried = batch_write.call_args.kwargs["RequestItems"][TABLE_NAME]
+        assert retried == [{"DeleteRequest": {"Key": {"id": {"S": "b"}}}}]
+        assert sorted(key["id"] for key in result.succeeded) == ["a", "b"]
+
+    def test_items_left_unprocessed_are_reported_as_failed(self):
+        """Items still unprocessed after every attempt are reported per key."""
+        stuck = {
+            "UnprocessedItems": {
+                TABLE_NAME: [
+                    {"PutRequest": {"Item": {"id": {"S": "b"}, "x": {"N": "1"}}}}
+                ]
+            }
+        }
+        dynamodb = self.client._get_client()
+
+        with (
+            patch.object(dynamodb, "batch_write_item", return_value=stuck),
+            patch.object(self.client, "_backoff_delay", return_value=0),
+        ):
+            result = self.client.put_many(
+                TABLE_NAME, [{"id": "a", "x": 1}, {"id": "b", "x": 1}]
+            )
+
+        assert result.succeeded == [{"id": "a"}]
+        assert result.failed[0]["key"] == {"id": "b"}
+
+
+class TestBulkAdminAction:
+    """Test that admin bulk actions use batched writes."""
+
+    def test_bulk_deactivate_reports_missing_users(self):
+        """Existing users are updated in bulk, unknown IDs fail individually."""
+        from src.core.database import db
+        from src.services.admin_service import AdminService
+
+        _seed_people(db, 3)
+        service = AdminService()
+
+        with patch.object(db, "put_many") as put_many:
+            results = service.execute_bulk_action(
+                {"action": "deactivate", "userIds": ["person-000", "x", "person-002"]}
+            )
+
+        put_many.assert_not_called()
+        assert results["successCount"] == 2
+        assert results["failureCount"] == 1
+        assert results["results"][1] == {
+            "userId": "x",
+            "status": "failed",
+            "error": "Person not found",
+        }
+        assert db.get_item(TABLE_NAME, {"id": "person-002"})["isActive"] is False
+
+    def test_bulk_deactivate_only_writes_the_active_flag(self):
+        """Fields written elsewhere are kept and update errors stay per user."""
+        from botocore.exceptions import ClientError
+        from src.core.database import db
+        from src.repositories.people_repository import PeopleRepository
+
+        _seed_people(db, 2)
+        repository = PeopleRepository()
+        update_item_if_exists = db.update_item_if_exists
+
+        def update(table_name, key, update_data, return_old=False):
+            if key["id"] == "person-001":
+                raise ClientError(
+                    {"Error": {"Code": "AccessDeniedException", "Message": "no"}},
+                    "UpdateItem",
+                )
+            # A profile edit lands between the bulk request and its write
+            db.update_item(table_name, key, {"firstName": "Edited"})
+            return update_item_if_exists(table_name, key, update_data, return_old)
+
+        with patch.object(db, "update_item_if_exists", side_effect=update):
+            result = repository.set_active_many(["person-000", "person-001"], False)
+
+        assert result.succeeded == [{"id": "person-000"}]
+        assert result.failed[0]["key"] == {"id": "person-001"}
+        assert "AccessDenied" in result.failed[0]["error"]
+        stored = db.get_item(TABLE_NAME, {"id": "person-000"})
+        assert stored["firstName"] == "Edited"
+        assert stored["isActive"] is False
+
+    def test_bulk_delete_uses_batch_delete(self):
+        """Bulk delete removes every user through delete_many."""
+        from src.core.database import db
+        from src.services.admin_service import AdminService
+
+        _seed_people(db, 4)
+
+        results = AdminService().execute_bulk_action(
+            {"action": "delete", "userIds": [f"person-{i:03d}" for i in range(4)]}
+        )
+
+        assert results["successCount"] == 4
+        assert db.scan_table(TABLE_NAME) == []
+
+
+class TestConditionalUpdate:
+    """Test single round-trip conditional updates."""
+
+    def setup_method(self):
+        """Set up a fresh client bound to the moto mock."""
+        self.client = DatabaseClient()
+
+    def test_update_item_if_exists_returns_new_item(self):
+        """The updated item comes back from the same request."""
+        _seed_people(self.client, 1)
+
+        item = self.client.update_item_if_exists(
+            TABLE_NAME, {"id": "person-000"}, {"firstName": "Renamed"}
+        )
+
+        assert item["firstName"] == "Renamed"
+        assert item["email"] == "person0@example.com"
+
+    def test_update_item_if_exists_does_not_create_missing_items(self):
+        """A missing key is reported as None and nothing is written."""
+        item = self.client.update_item_if_exists(
+            TABLE_NAME, {"id": "ghost"}, {"firstName": "Nobody"}
+        )
+
+        assert item is None
+        assert self.client.get_item(TABLE_NAME, {"id": "ghost"}) is None
+
+    def test_unconditional_writes_raise_client_errors(self):
+        """Only failed conditions are reported as False; other errors raise."""
+        from botocore.exceptions import ClientError
+
+        def error(code):
+            return ClientError({"Error": {"Code": code, "Message": code}}, "Write")
+
+        writes = [
+            lambda: self.client.update_item(TABLE_NAME, {"id": "a"}, {"x": 1}),
+            lambda: self.client.increment(TABLE_NAME, {"id": "a"}, {"x": 1}),
+            lambda: self.client.delete_item(TABLE_NAME, {"id": "a"}),
+            lambda: self.client.delete_item_returning(TABLE_NAME, {"id": "a"})[0],
+        ]
+        for write in writes:
+            with patch.object(
+                self.client, "_call", side_effect=error("AccessDeniedException")
+            ):
+                with pytest.raises(ClientError):
+                    write()
+            with patch.object(
+                self.client,
+                "_call",
+                side_effect=error("ConditionalCheckFailedException"),
+            ):
+                assert write() is False
+
+    def test_repository_update_is_one_round_trip(self):
+        """Repository updates no longer read the item before and after."""
+        from src.core.database import db
+        from src.models.subscription import SubscriptionCreate, SubscriptionUpdate
+        from src.repositories.subscriptions_repository import SubscriptionsRepository
+
+        repository = SubscriptionsRepository()
+        created = repository.create(
+            SubscriptionCreate(personId="person-1", projectId="project-1")
+        )
+
+        with patch.object(db, "get_item") as get_item:
+            updated = repository.update(created.id, SubscriptionUpdate(notes="Hi"))
+            missing = repository.update("ghost", SubscriptionUpdate(notes="Hi"))
+
+        get_item.assert_not_called()
+        assert updated.notes == "Hi"
+        assert missing is None
+
+
+class TestLowLevelClientMode:
+    """Test the low-level client read path and its attribute decoder."""
+
+    def test_decoder_maps_known_number_fields_directly(self):
+        """Declared int/float fields skip Decimal; other numbers keep it."""
+        from decimal import Decimal
+        from src.core.database import FastAttributeDecoder
+
+        decoder = FastAttributeDecoder(int_fields={"count"}, float_fields={"ratio"})
+
+        item = decoder.decode_item(
+            {
+                "id": {"S": "a"},
+                "count": {"N": "3"},
+                "ratio": {"N": "0.5"},
+                "other": {"N": "7"},
+                "flag": {"BOOL": True},
+                "missing": {"NULL": True},
+                "address": {"M": {"city": {"S": "Cochabamba"}, "zip": {"N": "1"}}},
+                "tags": {"L": [{"S": "x"}, {"N": "2"}]},
+                "names": {"SS": ["b", "c"]},
+            }
+        )
+
+        assert item["count"] == 3 and type(item["count"]) is int
+        assert item["ratio"] == 0.5 and type(item["ratio"]) is float
+        assert item["other"] == Decimal("7")
+        assert item["flag"] is True and item["missing"] is None
+        assert item["address"] == {"city": "Cochabamba", "zip": Decimal("1")}
+        assert item["tags"] == ["x", Decimal("2")]
+        assert item["names"] == {"b", "c"}
+
+    def test_decoder_reads_number_fields_from_models(self):
+        """Model annotations, including Optional ones, drive the schema."""
+        from src.core.database import FastAttributeDecoder
+        from src.models.person import Person
+        from src.models.project import Project
+
+        project_decoder = FastAttributeDecoder.for_model(Project)
+        person_decoder = FastAttributeDecoder.for_model(Person)
+
+        assert {"maxParticipants", "currentParticipants"} <= project_decoder.int_fields
+        assert "failedLoginAttempts" in person_decoder.int_fields
+        assert "email" not in person_decoder.int_fields
+
+    def test_client_mode_reads_match_resource_mode(self):
+        """Scans, gets and queries return the same items in both modes."""
+        from pydantic import BaseModel
+
+        class Row(BaseModel):
+            id: str
+            age: int
+
+        resource_client = DatabaseClient(client_mode="resource")
+        low_level_client = DatabaseClient(client_mode="client")
+        low_level_client.register_model(TABLE_NAME, Row)
+        for index in range(7):
+            resource_client.put_item(
+                TABLE_NAME,
+                {
+                    "id": f"p-{index}",
+                    "age": 20 + index,
+                    "emailLower": f"p{index}@example.com",
+                    "address": {"city": "La Paz"},
+                },
+            )
+
+        resource_items = sorted(
+            resource_client.scan_table(TABLE_NAME), key=lambda item: item["id"]
+        )
+        low_level_items = sorted(
+            low_level_client.iter_scan(TABLE_NAME, page_size=3),
+            key=lambda item: item["id"],
+        )
+
+        assert low_level_items == resource_items
+        assert all(type(item["age"]) is int for item in low_level_items)
+        assert low_level_client.get_item(TABLE_NAME, {"id": "p-2"})["age"] == 22
+        assert low_level_client.get_item(TABLE_NAME, {"id": "nope"}) is None
+        assert low_level_client.query_by_index(
+            TABLE_NAME, "EmailLowerIndex", {"emailLower": "p3@example.com"}
+        ) == [resource_client.get_item(TABLE_NAME, {"id": "p-3"})]
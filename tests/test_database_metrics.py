@@ -0,0 +1,180 @@
+"""
+Tests for DynamoDB request metrics.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+from fastapi import HTTPException
+
+from src.core.database import DatabaseClient
+from src.core.metrics import DatabaseMetrics, database_metrics, percentile
+from src.core.storage import InMemoryBackend
+
+PEOPLE = "test-people-table-v2"
+PROJECTS = "test-projects-table-v2"
+
+
+class TestDatabaseMetrics:
+    """Test aggregation of recorded requests."""
+
+    def test_percentiles_use_nearest_rank(self):
+        values = [float(value) for value in range(1, 101)]
+
+        assert percentile(values, 0.50) == 50.0
+        assert percentile(values, 0.95) == 95.0
+        assert percentile(values, 0.99) == 99.0
+        assert percentile([], 0.95) == 0.0
+
+    def test_snapshot_groups_by_table_and_operation(self):
+        metrics = DatabaseMetrics(window_seconds=60)
+        for latency in (10.0, 20.0, 30.0):
+            metrics.record_response(
+                PEOPLE,
+                "Query",
+                latency,
+                {
+                    "Count": 2,
+                    "ScannedCount": 5,
+                    "ConsumedCapacity": {"TableName": PEOPLE, "CapacityUnits": 0.5},
+                },
+            )
+        metrics.record_response(
+            PEOPLE,
+            "PutItem",
+            5.0,
+            {"ConsumedCapacity": {"TableName": PEOPLE, "CapacityUnits": 1.0}},
+            items=1,
+        )
+
+        snapshot = metrics.snapshot()
+        query = snapshot["tables"][PEOPLE]["Query"]
+        assert (query["calls"], query["items"], query["scannedItems"]) == (3, 6, 15)
+        assert query["readCapacityUnits"] == 1.5
+        assert query["latencyMs"]["p50"] == 20.0
+        assert snapshot["tables"][PEOPLE]["PutItem"]["writeCapacityUnits"] == 1.0
+        assert snapshot["throughput"]["reads"] == 3
+        assert snapshot["throughput"]["writes"] == 1
+        assert snapshot["topConsumers"][0]["operation"] == "Query"
+
+    def test_transaction_capacity_is_split_per_table(self):
+        metrics = DatabaseMetrics()
+        metrics.record_response(
+            PEOPLE,
+            "TransactWriteItems",
+            8.0,
+            {
+                "ConsumedCapacity": [
+                    {"TableName": PEOPLE, "CapacityUnits": 2.0},
+                    {"TableName": PROJECTS, "CapacityUnits": 4.0},
+                ]
+            },
+            items=2,
+        )
+
+        tables = metrics.snapshot()["tables"]
+        assert tables[PEOPLE]["TransactWriteItems"]["writeCapacityUnits"] == 2.0
+        assert tables[PROJECTS]["TransactWriteItems"]["writeCapacityUnits"] == 4.0
+
+    def test_latencies_leave_the_window(self):
+        metrics = DatabaseMetrics(window_seconds=60)
+        with patch("src.core.metrics.time.time", return_value=1000.0):
+            metrics.record(PEOPLE, "GetItem", 50.0)
+        with patch("src.core.metrics.time.time", return_value=2000.0):
+            metrics.record(PEOPLE, "GetItem", 5.0)
+            snapshot = metrics.snapshot()
+
+        get_item = snapshot["tables"][PEOPLE]["GetItem"]
+        assert get_item["calls"] == 2
+        assert get_item["windowCalls"] == 1
+        assert get_item["latencyMs"]["max"] == 5.0
+
+    def test_history_is_bucketed_per_interval(self):
+        metrics = DatabaseMetrics(bucket_seconds=60)
+        with patch("src.core.metrics.time.time", return_value=6000.0):
+            metrics.record(PEOPLE, "Scan", 10.0, read_units=3.0)
+            metrics.record(PEOPLE, "Scan", 30.0, read_units=1.0)
+        with patch("src.core.metrics.time.time", return_value=6075.0):
+            metrics.record(PEOPLE, "Scan", 20.0)
+            history = metrics.history(3600)
+
+        assert [bucket["calls"] for bucket in history] == [2, 1]
+        assert history[0]["avgLatencyMs"] == 20.0
+        assert history[0]["readCapacityUnits"] == 4.0
+
+
+class TestDatabaseClientInstrumentation:
+    """Test that DatabaseClient records every request."""
+
+    def setup_method(self):
+        backend = InMemoryBackend()
+        backend.create_registry_tables()
+        self.metrics = DatabaseMetrics()
+        self.client = DatabaseClient(backend=backend, metrics=self.metrics)
+
+    def test_operations_are_recorded(self):
+        self.client.put_item(PEOPLE, {"id": "p1"})
+        self.client.get_item(PEOPLE, {"id": "p1"})
+        self.client.put_many(PEOPLE, [{"id": f"b{i}"} for i in range(30)])
+        list(self.client.iter_scan(PEOPLE, page_size=10))
+        with pytest.raises(ClientError):
+            self.client.get_item("missing-table", {"id": "p1"})
+
+        tables = self.metrics.snapshot()["tables"]
+        assert tables[PEOPLE]["PutItem"]["calls"] == 1
+        assert tables[PEOPLE]["GetItem"]["items"] == 1
+        assert tables[PEOPLE]["BatchWriteItem"]["items"] == 30
+        assert tables[PEOPLE]["Scan"]["items"] == 31
+        assert tables["missing-table"]["GetItem"]["errors"] == 1
+
+    def test_requests_ask_for_consumed_capacity(self):
+        table = self.client._get_table(PEOPLE)
+
+        with patch.object(table, "get_item", return_value={}) as get_item:
+            self.client.get_item(PEOPLE, {"id": "p1"})
+
+        get_item.assert_called_once_with(
+            Key={"id": "p1"}, ReturnConsumedCapacity="TOTAL"
+        )
+
+    def test_disabled_metrics_send_plain_requests(self):
+        self.metrics.enabled = False
+        table = self.client._get_table(PEOPLE)
+
+        with patch.object(table, "get_item", return_value={}) as get_item:
+            self.client.get_item(PEOPLE, {"id": "p1"})
+
+        get_item.assert_called_once_with(Key={"id": "p1"})
+        assert self.metrics.snapshot()["tables"] == {}
+
+
+class TestDatabaseMetricsEndpoints:
+    """Test the admin endpoints serving the metrics."""
+
+    def setup_method(self):
+        database_metrics.reset()
+
+    @pytest.mark.asyncio
+    async def test_metrics_endpoint_reports_recorded_requests(self):
+        from src.routers.admin_router import get_database_metrics
+
+        database_metrics.record(PEOPLE, "GetItem", 12.0, items=1, read_units=0.5)
+
+        response = await get_database_metrics(current_user=MagicMock())
+
+        data = response["data"]
+        assert data["tables"][PEOPLE]["GetItem"]["readCapacityUnits"] == 0.5
+        assert data["queryTime"]["p95"] == 12.0
+
+    @pytest.mark.asyncio
+    async def test_history_endpoint_validates_the_range(self):
+        from src.routers.admin_router import get_optimization_history
+
+        database_metrics.record(PEOPLE, "Query", 7.0)
+
+        response = await get_optimization_history(current_user=MagicMock(), range="1h")
+        assert response["data"]["history"][0]["table"] == PEOPLE
+
+        with pytest.raises(HTTPException):
+            await get_optimization_history(current_user=MagicMock(), range="soon")
@@ -0,0 +1,190 @@
+"""
+Tests for DynamoDB retries, circuit breaking and error propagation.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.core.database import DatabaseClient
+from src.core.metrics import DatabaseMetrics
+from src.core.resilience import CircuitBreaker
+from src.core.storage import InMemoryBackend
+from src.exceptions.base_exceptions import DatabaseUnavailableException
+
+PEOPLE = "test-people-table-v2"
+
+
+def _error(code: str, operation: str = "GetItem") -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": code}}, operation)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Test the breaker state machine."""
+
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=3, reset_seconds=10)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+
+    def test_half_open_allows_a_single_probe(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 10
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request()
+
+    def test_failed_probe_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=5, reset_seconds=10, clock=clock)
+        for _ in range(5):
+            breaker.record_failure()
+
+        clock.now = 10
+        assert breaker.allow_request()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.retry_after() == 10
+
+
+class TestDatabaseClientResilience:
+    """Test retries and error propagation in DatabaseClient."""
+
+    def setup_method(self):
+        backend = InMemoryBackend()
+        backend.create_registry_tables()
+        self.client = DatabaseClient(backend=backend, metrics=DatabaseMetrics())
+        self.client.put_item(PEOPLE, {"id": "p1", "firstName": "Ana"})
+        self.table = self.client._get_table(PEOPLE)
+        self.no_sleep = patch.object(self.client, "_backoff_delay", return_value=0)
+        self.no_sleep.start()
+
+    def teardown_method(self):
+        self.no_sleep.stop()
+
+    def test_throttled_reads_are_retried(self):
+        real_get = self.table.get_item
+        responses = [
+            _error("ProvisionedThroughputExceededException"),
+            _error("ThrottlingException"),
+        ]
+
+        def flaky_get(**params):
+            if responses:
+                raise responses.pop(0)
+            return real_get(**params)
+
+        with patch.object(self.table, "get_item", side_effect=flaky_get) as get_item:
+            item = self.client.get_item(PEOPLE, {"id": "p1"})
+
+        assert item["firstName"] == "Ana"
+        assert get_item.call_count == 3
+
+    def test_exhausted_throttling_is_not_reported_as_missing(self):
+        throttled = _error("ProvisionedThroughputExceededException")
+
+        with patch.object(self.table, "get_item", side_effect=throttled) as get_item:
+            with pytest.raises(DatabaseUnavailableException) as error:
+                self.client.get_item(PEOPLE, {"id": "p1"})
+
+        assert get_item.call_count == 4
+        assert error.value.details["reason"] == "ProvisionedThroughputExceededException"
+
+    def test_server_errors_on_writes_are_not_retried(self):
+        with patch.object(
+            self.table, "put_item", side_effect=_error("InternalServerError")
+        ) as put_item:
+            with pytest.raises(DatabaseUnavailableException):
+                self.client.put_item(PEOPLE, {"id": "p2"})
+
+        assert put_item.call_count == 1
+
+    def test_failed_conditions_do_not_trip_the_breaker(self):
+        for _ in range(10):
+            assert (
+                self.client.update_item_if_exists(PEOPLE, {"id": "nope"}, {"a": 1})
+                is None
+            )
+
+        assert self.client.circuit_states()[PEOPLE]["state"] == "closed"
+
+    def test_open_breaker_fails_fast_then_probes(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_seconds=30, clock=clock)
+        self.client._breakers[PEOPLE] = breaker
+        unavailable = _error("ServiceUnavailable")
+
+        with patch.object(self.table, "get_item", side_effect=unavailable):
+            for _ in range(2):
+                with pytest.raises(DatabaseUnavailableException):
+                    self.client.get_item(PEOPLE, {"id": "p1"})
+
+        with patch.object(self.table, "get_item") as get_item:
+            with pytest.raises(DatabaseUnavailableException) as error:
+                self.client.get_item(PEOPLE, {"id": "p1"})
+        get_item.assert_not_called()
+        assert error.value.retry_after_seconds == 30
+
+        clock.now = 30
+        assert self.client.get_item(PEOPLE, {"id": "p1"})["firstName"] == "Ana"
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_parallel_scan_raises_segment_errors(self):
+        def failing_scan(**params):
+            raise _error("InternalServerError", "Scan")
+
+        # Segment workers resolve their own thread-local table handles
+        with patch.object(
+            type(self.table), "scan", side_effect=failing_scan, create=True
+        ):
+            with pytest.raises(DatabaseUnavailableException):
+                self.client.parallel_scan_table(PEOPLE, total_segments=2)
+
+    def test_unavailable_tables_map_to_503(self):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from src.exceptions.base_exceptions import BaseApplicationException
+        from src.exceptions.error_handler import error_handler
+
+        app = FastAPI()
+        app.add_exception_handler(
+            BaseApplicationException, error_handler.handle_application_exception
+        )
+
+        @app.get("/busy")
+        async def busy():
+            raise DatabaseUnavailableException(
+                "GetItem", PEOPLE, "circuit open", retry_after_seconds=12.4
+            )
+
+        response = TestClient(app).get("/busy")
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "12"
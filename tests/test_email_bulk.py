@@ -0,0 +1,158 @@
+"""
+Tests for bulk templated email sends through SES.
+"""
+
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError
+
+from src.services.email_service import EmailService, EmailTemplate, SendRateLimiter
+
+TEMPLATE = EmailTemplate(name="welcome", subject="Hi {{name}}", html="<p>{{name}}</p>")
+
+
+def _client_error(code):
+    return ClientError(
+        {"Error": {"Code": code, "Message": f"{code} error"}},
+        "SendBulkTemplatedEmail",
+    )
+
+
+def _accept_all(**request):
+    return {
+        "Status": [
+            {"Status": "Success", "MessageId": f"id-{index}"}
+            for index, _ in enumerate(request["Destinations"])
+        ]
+    }
+
+
+class TestBulkTemplatedEmail:
+    """Test chunking, pacing and per-recipient results of bulk sends."""
+
+    def setup_method(self):
+        self.service = EmailService()
+        self.service.test_mode = False
+        self.service.ses_client = MagicMock()
+        self.service.rate_limiter = MagicMock()
+        self.service._sleep = MagicMock()
+
+    def test_destinations_are_sent_fifty_to_a_call(self):
+        self.service.ses_client.send_bulk_templated_email.side_effect = _accept_all
+        destinations = [
+            {"email": f"user{n}@example.com", "data": {"name": f"User {n}"}}
+            for n in range(120)
+        ]
+
+        result = self.service.send_bulk_templated_email(
+            TEMPLATE, destinations, {"name": "friend"}
+        )
+
+        assert (result["success"], result["sent"], result["failed"]) == (
+            True,
+            120,
+            0,
+        )
+        assert [r["email"] for r in result["results"]] == [
+            d["email"] for d in destinations
+        ]
+        calls = self.service.ses_client.send_bulk_templated_email.call_args_list
+        assert sorted(len(call.kwargs["Destinations"]) for call in calls) == [
+            20,
+            50,
+            50,
+        ]
+        request = calls[0].kwargs
+        assert request["Template"] == "welcome"
+        assert request["DefaultTemplateData"] == '{"name": "friend"}'
+        acquired = self.service.rate_limiter.acquire.call_args_list
+        assert sum(call.args[0] for call in acquired) == 120
+        self.service.ses_client.create_template.assert_called_once()
+
+    def test_rejected_destinations_are_reported_per_recipient(self):
+        self.service.ses_client.send_bulk_templated_email.return_value = {
+            "Status": [
+                {"Status": "Success", "MessageId": "id-a"},
+                {"Status": "MessageRejected", "Error": "Email address is not verified"},
+            ]
+        }
+
+        result = self.service.send_bulk_templated_email(
+            TEMPLATE, [{"email": "a@example.com"}, {"email": "b@example.com"}]
+        )
+
+        assert (result["success"], result["sent"], result["failed"]) == (
+            False,
+            1,
+            1,
+        )
+        assert result["results"] == [
+            {"email": "a@example.com", "success": True, "message_id": "id-a"},
+            {
+                "email": "b@example.com",
+                "success": False,
+                "error": "Email address is not verified",
+            },
+        ]
+
+    def test_throttled_calls_are_retried_and_other_errors_fail_the_chunk(self):
+        send = self.service.ses_client.send_bulk_templated_email
+        send.side_effect = [_client_error("Throttling"), _accept_all(Destinations=[0])]
+
+        result = self.service.send_bulk_templated_email(
+            TEMPLATE, [{"email": "a@example.com"}]
+        )
+        assert result["sent"] == 1
+        self.service._sleep.assert_called_once_with(1)
+
+        send.side_effect = _client_error("MessageRejected")
+        result = self.service.send_bulk_templated_email(
+            TEMPLATE, [{"email": "a@example.com"}]
+        )
+        assert result["results"] == [
+            {
+                "email": "a@example.com",
+                "success": False,
+                "error": "Failed to send email: MessageRejected error",
+            }
+        ]
+
+    def test_existing_templates_are_updated_once(self):
+        self.service.ses_client.create_template.side_effect = _client_error(
+            "AlreadyExists"
+        )
+
+        self.service.ensure_template(TEMPLATE)
+        self.service.ensure_template(TEMPLATE)
+
+        self.service.ses_client.update_template.assert_called_once_with(
+            Template={
+                "TemplateName": "welcome",
+                "SubjectPart": "Hi {{name}}",
+                "HtmlPart": "<p>{{name}}</p>",
+            }
+        )
+
+    def test_test_mode_sends_nothing(self):
+        self.service.test_mode = True
+
+        result = self.service.send_bulk_templated_email(
+            TEMPLATE, [{"email": "a@example.com"}]
+        )
+
+        assert result["sent"] == 1
+        self.service.ses_client.send_bulk_templated_email.assert_not_called()
+
+
+def test_rate_limiter_paces_sends_to_the_quota():
+    now = [100.0]
+    waits = []
+    limiter = SendRateLimiter(10, clock=lambda: now[0], sleep=waits.append)
+
+    limiter.acquire(50)
+    limiter.acquire(20)
+    now[0] += 6
+    limiter.acquire(10)
+
+    # 50 emails at 10/s take 5s, so the next 20 wait 5s and run until 7s
+    assert waits == [5.0, 1.0]
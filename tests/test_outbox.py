@@ -0,0 +1,314 @@
+"""
+Tests for the notification outbox and its delivery workers.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.database import db
+from src.core.outbox import LocalQueue, Outbox
+from src.exceptions.base_exceptions import BusinessLogicException
+from src.models.project import ProjectCreate, ProjectStatus
+from src.models.subscription import SubscriptionCreate
+from src.repositories.outbox_repository import DEAD, OutboxRepository
+from src.repositories.projects_repository import ProjectsRepository
+from src.repositories.subscriptions_repository import SubscriptionsRepository
+from src.services.subscriptions_service import (
+    SUBSCRIPTION_NOTIFICATION,
+    SubscriptionsService,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 2_000_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _project(max_participants=10):
+    return ProjectsRepository().create(
+        ProjectCreate(
+            name="Outbox",
+            description="A project",
+            startDate="2025-01-01",
+            endDate="2025-12-31",
+            maxParticipants=max_participants,
+            status=ProjectStatus.ACTIVE,
+        )
+    )
+
+
+class TestOutboxDelivery:
+    """Test leasing, retries and dead-lettering of outbox messages."""
+
+    def setup_method(self):
+        self.repository = OutboxRepository()
+        self.clock = FakeClock()
+        self.handler = MagicMock()
+        self.outbox = Outbox(
+            self.repository,
+            workers=0,
+            max_attempts=3,
+            retry_base_seconds=10,
+            clock=self.clock,
+        )
+        self.outbox.register("test", self.handler)
+
+    def _message(self, real_clock=False):
+        message = self.repository.new_message("test", {"n": 1})
+        if not real_clock:
+            message["availableAt"] = int(self.clock.now)
+        db.put_item(self.repository.table_name, message)
+        return message["id"]
+
+    def test_delivered_messages_are_removed(self):
+        message_id = self._message()
+
+        assert self.outbox.deliver(message_id)
+        self.handler.assert_called_once_with({"n": 1})
+        assert self.repository.get(message_id) is None
+        assert not self.outbox.deliver(message_id)
+
+    def test_failures_back_off_then_dead_letter(self):
+        message_id = self._message()
+        self.handler.side_effect = Exception("ses throttled")
+
+        assert not self.outbox.deliver(message_id)
+        # Not due again until the backoff has passed
+        assert self.outbox.drain() == {"due": 0, "delivered": 0}
+        self.clock.now += 10
+        self.outbox.drain()
+        assert self.repository.get(message_id)["attempts"] == 2
+        self.clock.now += 20
+        self.outbox.drain()
+
+        dead = self.repository.get(message_id)
+        assert (dead["status"], dead["attempts"]) == (DEAD, 3)
+        assert dead["lastError"] == "ses throttled"
+        self.clock.now += 3600
+        assert self.outbox.drain()["due"] == 0
+
+        self.handler.side_effect = None
+        assert self.repository.requeue(message_id, int(self.clock.now))
+        assert self.outbox.drain() == {"due": 1, "delivered": 1}
+
+    def test_leased_messages_are_not_delivered_twice(self):
+        message_id = self._message()
+        now = int(self.clock.now)
+        assert self.repository.claim(message_id, now, now + 60) is not None
+
+        assert not self.outbox.deliver(message_id)
+        self.handler.assert_not_called()
+
+    def test_due_messages_are_read_from_the_status_index(self):
+        due = [self._message() for _ in range(3)]
+        self.clock.now += 60
+        self._message()  # due a minute after the others
+
+        with patch.object(db, "scan_pages") as scan_pages:
+            listed = self.repository.list_due(int(self.clock.now) - 1)
+
+        scan_pages.assert_not_called()
+        assert sorted(message["id"] for message in listed) == sorted(due)
+
+    def test_drain_stops_at_its_deadline(self):
+        for _ in range(3):
+            self._message()
+
+        def slow_handler(payload):
+            self.clock.now += 10
+
+        self.outbox.register("test", slow_handler)
+
+        assert self.outbox.drain(until=self.clock.now + 15) == {
+            "due": 3,
+            "delivered": 2,
+        }
+        assert self.outbox.drain() == {"due": 1, "delivered": 1}
+
+    def test_lambda_entry_point_drains_due_messages(self):
+        import main
+
+        self._message(real_clock=True)
+        context = MagicMock()
+        context.get_remaining_time_in_millis.return_value = 60_000
+
+        self.outbox._clock = time.time
+
+        with patch("src.core.outbox.outbox", self.outbox):
+            result = main.outbox_handler({}, context)
+
+        assert result == {"due": 1, "delivered": 1}
+        self.handler.assert_called_once_with({"n": 1})
+
+    def test_workers_deliver_published_messages(self):
+        delivered = threading.Event()
+        outbox = Outbox(self.repository, workers=1, sweep_interval_seconds=3600)
+        outbox.register("test", lambda payload: delivered.set())
+
+        outbox.publish(self._message(real_clock=True))
+
+        assert delivered.wait(5)
+
+    def test_publishing_never_blocks_on_a_full_queue(self):
+        outbox = Outbox(self.repository, LocalQueue(maxsize=1), workers=1)
+        outbox._threads = [MagicMock()]  # no workers consume the queue
+
+        outbox.publish("a")
+        outbox.publish("b")
+
+        assert len(outbox.queue) == 1
+
+
+class TestSubscriptionNotifications:
+    """Test that subscriptions queue their notification with the write."""
+
+    def setup_method(self):
+        self.repository = OutboxRepository()
+        self.outbox = Outbox(self.repository, workers=0)
+        self.email_service = MagicMock()
+        self.service = SubscriptionsService(
+            SubscriptionsRepository(),
+            email_service=self.email_service,
+            outbox=self.outbox,
+        )
+
+    def _queued(self, person_id):
+        return [
+            message
+            for message in self.repository.list_due(2**40)
+            if message["payload"]["personId"] == person_id
+        ]
+
+    def test_notification_is_written_with_the_subscription(self):
+        project = _project()
+
+        self.service.create_subscription(
+            SubscriptionCreate(personId="outbox-person", projectId=project.id)
+        )
+
+        [message] = self._queued("outbox-person")
+        assert message["type"] == SUBSCRIPTION_NOTIFICATION
+        assert message["payload"] == {
+            "personId": "outbox-person",
+            "projectId": project.id,
+        }
+
+    def test_rejected_subscriptions_queue_nothing(self):
+        project = _project(max_participants=1)
+        self.service.create_subscription(
+            SubscriptionCreate(personId="first-person", projectId=project.id)
+        )
+
+        with pytest.raises(BusinessLogicException):
+            self.service.create_subscription(
+                SubscriptionCreate(personId="late-person", projectId=project.id)
+            )
+
+        assert self._queued("late-person") == []
+
+    def _notify_through_mocks(self, notification_emails):
+        people = {"p": MagicMock(email="p@example.com", firstName="P", lastName="Q")}
+        people["admin"] = MagicMock(email="admin@example.com")
+        project = MagicMock(
+            createdBy="admin", notificationEmails=notification_emails, name="X"
+        )
+        people_service = MagicMock()
+        people_service.get_people_by_ids.return_value = people
+        self.service._people_service = people_service
+        projects = self.service.subscriptions_repository.projects_repository
+        return patch.object(projects, "get_current", return_value=project)
+
+    def test_failed_sends_are_retried(self):
+        send = self.email_service.send_bulk_templated_email
+        send.return_value = {
+            "failed": 1,
+            "results": [
+                {"email": "admin@example.com", "success": False, "error": "Throttling"}
+            ],
+        }
+
+        with self._notify_through_mocks([]):
+            with pytest.raises(Exception, match="1 of 1 recipients"):
+                self.service._deliver_subscription_notification(
+                    {"personId": "p", "projectId": "x"}
+                )
+
+            send.return_value = {
+                "failed": 0,
+                "results": [{"email": "admin@example.com", "success": True}],
+            }
+            self.service._deliver_subscription_notification(
+                {"personId": "p", "projectId": "x"}
+            )
+
+        template, destinations, data = send.call_args.args
+        assert template.name == "subscription-notification"
+        assert destinations == [{"email": "admin@example.com"}]
+        assert data["subscriberEmail"] == "p@example.com"
+
+    def test_retries_only_email_the_recipients_that_failed(self):
+        send = self.email_service.send_bulk_templated_email
+        send.return_value = {
+            "failed": 1,
+            "results": [
+                {"email": "admin@example.com", "success": True},
+                {"email": "team@example.com", "success": False, "error": "Throttling"},
+            ],
+        }
+        message = self.repository.new_message(
+            SUBSCRIPTION_NOTIFICATION, {"personId": "p", "projectId": "x"}
+        )
+        db.put_item(self.repository.table_name, message)
+        self.outbox.register(
+            SUBSCRIPTION_NOTIFICATION, self.service._deliver_subscription_notification
+        )
+
+        with self._notify_through_mocks(["team@example.com"]):
+            assert not self.outbox.deliver(message["id"])
+            retry = self.repository.get(message["id"])
+            assert retry["payload"]["sentTo"] == ["admin@example.com"]
+
+            send.return_value = {
+                "failed": 0,
+                "results": [{"email": "team@example.com", "success": True}],
+            }
+            # Make the retry due now instead of after the backoff
+            self.repository.failed(message["id"], 1, "retry now", 0)
+            assert self.outbox.deliver(message["id"])
+
+        assert send.call_args.args[1] == [{"email": "team@example.com"}]
+
+    def test_email_counts_the_new_subscriber(self):
+        project = _project()
+        projects = self.service.subscriptions_repository.projects_repository
+        db.update_item(
+            projects.table_name,
+            {"id": project.id},
+            {"notificationEmails": ["team@example.com"]},
+        )
+        self.service.create_subscription(
+            SubscriptionCreate(personId="counted-person", projectId=project.id)
+        )
+        people = {
+            "counted-person": MagicMock(
+                email="c@example.com", firstName="C", lastName="D"
+            )
+        }
+        self.service._people_service = MagicMock()
+        self.service._people_service.get_people_by_ids.return_value = people
+        send = self.email_service.send_bulk_templated_email
+        send.return_value = {"failed": 0, "results": []}
+
+        # The drain runs in another process, whose cached project is stale
+        with patch.object(projects, "get_by_id", side_effect=AssertionError):
+            self.service._deliver_subscription_notification(
+                self._queued("counted-person")[0]["payload"]
+            )
+
+        assert send.call_args.args[2]["currentParticipants"] == 1
@@ -0,0 +1,226 @@
+"""
+Tests for the bulk people import.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.database import db
+from src.exceptions.base_exceptions import ValidationException
+from src.repositories.people_repository import PeopleRepository
+from src.services.people_service import PeopleService
+from src.utils.imports import csv_records, ndjson_records
+from src.utils.password_utils import PasswordHasher, hash_passwords
+
+ADDRESS = {
+    "street": "123 Main St",
+    "city": "Anytown",
+    "state": "CA",
+    "country": "USA",
+    "postalCode": "12345",
+}
+
+
+def _row(name, **extra):
+    return {
+        "firstName": name,
+        "lastName": "Import",
+        "email": f"{name.lower()}.import@example.com",
+        "phone": "+1234567890",
+        "dateOfBirth": "1990-01-01",
+        "address": ADDRESS,
+        **extra,
+    }
+
+
+def _ndjson(*rows):
+    return [json.dumps(row) + "\n" for row in rows]
+
+
+class TestImportDecoders:
+    """Test decoding of import files."""
+
+    def test_ndjson_reports_bad_lines(self):
+        lines = ['{"a": 1}\n', "\n", "not json\n", "[1]\n"]
+
+        records = list(ndjson_records(lines))
+
+        assert records[0] == (1, {"a": 1}, None)
+        assert [(line, record) for line, record, _ in records[1:]] == [
+            (3, None),
+            (4, None),
+        ]
+
+    def test_csv_nests_dotted_columns_and_decodes_json_cells(self):
+        lines = [
+            "firstName,address.city,address.state,tags,phone\n",
+            'Ana,Anytown,CA,"[""a""]",\n',
+        ]
+
+        [(line, record, error)] = list(csv_records(lines))
+
+        assert (line, error) == (2, None)
+        assert record == {
+            "firstName": "Ana",
+            "address": {"city": "Anytown", "state": "CA"},
+            "tags": ["a"],
+        }
+
+
+class TestImportPeople:
+    """Test validation, uniqueness and batched writes of the import."""
+
+    def setup_method(self):
+        self.scan = patch.object(db, "parallel_scan", db.iter_scan)
+        self.scan.start()
+        self.repository = PeopleRepository()
+        self.service = PeopleService(self.repository)
+        self.repository.create_many(
+            [self.repository.new_item(self._create(_row("Existing")))]
+        )
+
+    def teardown_method(self):
+        self.scan.stop()
+
+    @staticmethod
+    def _create(row):
+        from src.models.person import PersonCreate
+
+        return PersonCreate(**row)
+
+    def test_rows_are_validated_and_written_in_batches(self):
+        rows = _ndjson(
+            _row("Ana", password="Str0ng!Pass"),
+            _row("Bea"),
+            _row("Existing"),
+            _row("ana"),
+            _row("Cy", email="not-an-email"),
+            _row("Dee", password="weakpassword"),
+            _row("<script>alert(1)</script>", email="xss.import@example.com"),
+        ) + ["{broken\n"]
+
+        with patch.object(db, "put_many", wraps=db.put_many) as put_many:
+            report = self.service.import_people(ndjson_records(rows), batch_size=3)
+
+        statuses = {row["line"]: row["status"] for row in report["rows"]}
+        assert statuses == {
+            1: "created",
+            2: "created",
+            3: "failed",
+            4: "failed",
+            5: "failed",
+            6: "failed",
+            7: "failed",
+            8: "failed",
+        }
+        assert (report["succeeded"], report["failed"]) == (2, 6)
+        assert "already in use" in report["rows"][3]["errors"][0]
+        assert put_many.call_count == 1
+
+        ana = self.repository.get_by_email_for_auth("ana.import@example.com")
+        assert PasswordHasher.verify_password("Str0ng!Pass", ana["passwordHash"])
+        assert ana["id"] == report["rows"][0]["id"]
+
+    def test_dry_run_writes_nothing(self):
+        report = self.service.import_people(
+            ndjson_records(_ndjson(_row("Eve"))), dry_run=True
+        )
+
+        assert report["rows"][0]["status"] == "valid"
+        assert self.repository.get_by_email("eve.import@example.com") is None
+
+    def test_failed_writes_are_reported_and_free_the_email(self):
+        def reject(table_name, items):
+            from src.core.database import BatchWriteResult
+
+            return BatchWriteResult(
+                failed=[
+                    {"key": {"id": item["id"]}, "error": "throttled"} for item in items
+                ]
+            )
+
+        with patch.object(db, "put_many", side_effect=reject):
+            report = self.service.import_people(ndjson_records(_ndjson(_row("Fay"))))
+
+        assert report["rows"][0]["errors"] == ["throttled"]
+        retry = self.service.import_people(ndjson_records(_ndjson(_row("Fay"))))
+        assert retry["rows"][0]["status"] == "created"
+
+    def test_files_over_the_row_caps_are_rejected_before_writing(self):
+        from src.exceptions.base_exceptions import PayloadTooLargeException
+        from src.exceptions.error_handler import EnterpriseErrorHandler
+
+        rows = _ndjson(*[_row(f"Cap{n}", password="Str0ng!Pass") for n in range(3)])
+
+        with (
+            patch("src.services.people_service.IMPORT_MAX_PASSWORD_ROWS", 2),
+            patch.object(db, "put_many") as put_many,
+            pytest.raises(PayloadTooLargeException) as error,
+        ):
+            self.service.import_people(ndjson_records(rows))
+
+        put_many.assert_not_called()
+        assert EnterpriseErrorHandler()._get_http_status_code(error.value) == 413
+        with patch("src.services.people_service.IMPORT_MAX_PASSWORD_ROWS", 2):
+            report = self.service.import_people(ndjson_records(rows), dry_run=True)
+        assert report["succeeded"] == 3
+        with (
+            patch("src.services.people_service.IMPORT_MAX_ROWS", 2),
+            pytest.raises(PayloadTooLargeException),
+        ):
+            self.service.import_people(ndjson_records(rows), dry_run=True)
+
+    @pytest.mark.asyncio
+    async def test_endpoint_imports_csv_bodies(self):
+        from src.routers.admin_router import import_users
+
+        body = (
+            "firstName,lastName,email,dateOfBirth,address.street,address.city,"
+            "address.state,address.country,address.postalCode\n"
+            "Gus,Import,gus.import@example.com,1990-01-01,1 St,Town,CA,USA,12345\n"
+        )
+        request = MagicMock()
+        request.headers = {"content-type": "text/csv"}
+
+        async def read_body():
+            return body.encode()
+
+        request.body = read_body
+
+        response = await import_users(
+            request=request,
+            import_format=None,
+            dryRun=False,
+            current_user=MagicMock(),
+            people_service=self.service,
+        )
+
+        assert response["data"]["succeeded"] == 1
+        with pytest.raises(ValidationException):
+            await import_users(
+                request=request,
+                import_format="xml",
+                dryRun=False,
+                current_user=MagicMock(),
+                people_service=self.service,
+            )
+
+
+def test_hash_passwords_keeps_order():
+    hashes = hash_passwords(["First!Pass1", "Second!Pass2"], max_workers=2)
+
+    assert PasswordHasher.verify_password("First!Pass1", hashes[0])
+    assert PasswordHasher.verify_password("Second!Pass2", hashes[1])
+
+
+def test_hash_passwords_reuses_one_fork_server_pool():
+    from src.utils import password_utils
+
+    hash_passwords(["First!Pass1", "Second!Pass2"], max_workers=2)
+    pool = password_utils._hash_pools[2]
+    hash_passwords(["Third!Pass3", "Fourth!Pass4"], max_workers=2)
+
+    assert password_utils._hash_pools[2] is pool
+    assert pool._mp_context.get_start_method() in ("forkserver", "spawn")
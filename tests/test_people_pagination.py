@@ -0,0 +1,228 @@
+"""
+Tests for keyset (cursor) pagination of the people listing.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.database import db
+from src.exceptions.base_exceptions import ValidationException
+from src.models.pagination import decode_cursor, encode_cursor
+from src.repositories.people_repository import PeopleRepository
+
+TABLE_NAME = "test-people-table-v2"
+NAMES = ["Hugo", "Ana", "Eva", "Carl", "Gus", "Bea", "Dan", "Fay", "Ivy", "Joe"]
+
+
+def _seed_people(names=NAMES, **overrides):
+    repo = PeopleRepository()
+    for index, name in enumerate(names):
+        db.put_item(
+            TABLE_NAME,
+            {
+                "id": f"person-{index:03d}",
+                "listPartition": repo.list_partition(f"person-{index:03d}"),
+                "firstName": name,
+                "lastName": "Test",
+                "email": f"{name.lower()}@example.com",
+                "emailLower": f"{name.lower()}@example.com",
+                "phone": "+1234567890",
+                "dateOfBirth": "1990-01-01",
+                "address": {
+                    "street": "123 Main St",
+                    "city": "Anytown",
+                    "state": "CA",
+                    "country": "USA",
+                    "postalCode": "12345",
+                },
+                "isAdmin": index % 3 == 0,
+                "isActive": True,
+                "requirePasswordChange": False,
+                "emailVerified": False,
+                "createdAt": f"2025-01-{index + 1:02d}T00:00:00",
+                "updatedAt": "2025-01-01T00:00:00",
+                **overrides,
+            },
+        )
+
+
+class TestCursors:
+    """Test cursor encoding and signing."""
+
+    def test_cursor_round_trips(self):
+        payload = {"sort": "firstName", "key": {"id": "p1", "firstName": "Ana"}}
+
+        assert decode_cursor(encode_cursor(payload)) == payload
+
+    def test_tampered_cursor_is_rejected(self):
+        signature = encode_cursor({"page": 2}).split(".")[1]
+        forged = encode_cursor({"page": 9}).split(".")[0]
+
+        with pytest.raises(ValidationException):
+            decode_cursor(f"{forged}.{signature}")
+        with pytest.raises(ValidationException):
+            decode_cursor("not-a-cursor")
+
+
+class TestKeysetPagination:
+    """Test listing people through the sort indexes."""
+
+    def setup_method(self):
+        self.repo = PeopleRepository()
+        self.no_count_cache = patch.object(db, "ITEM_COUNT_TTL_SECONDS", 0)
+        self.no_count_cache.start()
+
+    def teardown_method(self):
+        self.no_count_cache.stop()
+
+    def _walk(self, **kwargs):
+        names, cursor = [], None
+        while True:
+            page = self.repo.list_paginated(page_size=3, cursor=cursor, **kwargs)
+            names.extend(person.firstName for person in page.items)
+            cursor = page.nextCursor
+            if cursor is None:
+                return names, page
+
+    def test_cursors_walk_the_index_in_order(self):
+        _seed_people()
+
+        names, last_page = self._walk()
+
+        assert names == sorted(NAMES)
+        assert last_page.pageNumber == 4
+        assert (last_page.totalItems, last_page.totalIsEstimate) == (10, False)
+
+    def test_descending_sort(self):
+        _seed_people()
+
+        names, _ = self._walk(sort_by="createdAt", sort_direction="desc")
+
+        assert names == list(reversed(NAMES))
+
+    def test_cursor_pages_read_about_a_page(self):
+        _seed_people()
+        first = self.repo.list_paginated(page_size=3)
+
+        with (
+            patch.object(db, "scan_pages") as scan_pages,
+            patch.object(db, "query_page", wraps=db.query_page) as query_page,
+        ):
+            second = self.repo.list_paginated(page_size=3, cursor=first.nextCursor)
+
+        scan_pages.assert_not_called()
+        # One page per shard, each about a share of the page
+        shards = len(decode_cursor(first.nextCursor)["shards"])
+        assert query_page.call_count <= 2 * shards
+        assert query_page.call_args.kwargs["limit"] == -(-4 // shards) + 1
+        assert [person.firstName for person in second.items] == ["Dan", "Eva", "Fay"]
+        assert second.totalIsEstimate
+
+    def test_filters_are_applied_while_walking(self):
+        _seed_people()
+
+        names, last_page = self._walk(filters={"isAdmin": True})
+
+        assert names == ["Carl", "Dan", "Hugo", "Joe"]
+        assert last_page.totalItems == 4
+
+    def test_page_numbers_without_a_cursor_skip_on_the_index(self):
+        _seed_people()
+
+        page = self.repo.list_paginated(page=2, page_size=4, sort_by="firstName")
+
+        assert [person.firstName for person in page.items] == [
+            "Eva",
+            "Fay",
+            "Gus",
+            "Hugo",
+        ]
+        assert page.pageNumber == 2
+        assert decode_cursor(page.nextCursor)["page"] == 3
+
+    def test_cursor_must_match_the_listing(self):
+        _seed_people()
+        cursor = self.repo.list_paginated(page_size=3).nextCursor
+
+        with pytest.raises(ValidationException):
+            self.repo.list_paginated(page_size=3, sort_by="email", cursor=cursor)
+        with pytest.raises(ValidationException):
+            self.repo.list_paginated(page_size=3, search="a", cursor=cursor)
+
+    def test_search_is_ranked_without_a_cursor(self):
+        _seed_people()
+
+        page = self.repo.list_paginated(page_size=3, search="an")
+
+        assert [person.firstName for person in page.items] == ["Ana"]
+        assert page.nextCursor is None
+
+    def test_people_are_spread_over_the_list_shards(self):
+        _seed_people(names=[f"Name{index:02d}" for index in range(28)])
+
+        partitions = {item["listPartition"] for item in db.scan_table(TABLE_NAME)}
+        cursor = decode_cursor(self.repo.list_paginated(page_size=3).nextCursor)
+
+        assert partitions == {f"person#{shard}" for shard in range(4)}
+        assert set(cursor["shards"]) <= partitions
+
+    def test_shards_merge_in_sort_order_with_filters(self):
+        names = [f"Name{index:02d}" for index in range(28)]
+        _seed_people(names=names)
+
+        walked, last_page = self._walk(sort_direction="desc")
+        admins, _ = self._walk(filters={"isAdmin": True})
+
+        assert walked == sorted(names, reverse=True)
+        assert (last_page.totalItems, last_page.totalIsEstimate) == (28, False)
+        assert admins == [name for name in names if int(name[4:]) % 3 == 0]
+
+    def test_backfill_adds_rows_to_the_sort_indexes(self):
+        _seed_people(listPartition="legacy")
+        assert self.repo.list_paginated(page_size=3).items == []
+
+        with patch.object(db, "parallel_scan", db.iter_scan):
+            assert self.repo.backfill_index_keys() == len(NAMES)
+
+        assert len(self.repo.list_paginated(page_size=3).items) == 3
+
+
+class TestPaginatedUsersEndpoint:
+    """Test the admin listing endpoint with cursors."""
+
+    @pytest.mark.asyncio
+    async def test_endpoint_returns_and_accepts_cursors(self):
+        from src.routers.admin_router import list_users_paginated
+        from src.services.people_service import PeopleService
+
+        _seed_people()
+        arguments = dict(
+            pageSize=4,
+            sortBy=None,
+            sortDirection="asc",
+            search=None,
+            isAdmin=None,
+            isActive=None,
+            emailVerified=None,
+            current_user=MagicMock(),
+            people_service=PeopleService(PeopleRepository()),
+        )
+
+        first = await list_users_paginated(page=1, cursor=None, **arguments)
+        pagination = first["data"]["pagination"]
+        second = await list_users_paginated(
+            page=1, cursor=pagination["nextCursor"], **arguments
+        )
+
+        assert pagination["hasNextPage"]
+        assert second["data"]["pagination"]["currentPage"] == 2
+        assert [user["firstName"] for user in second["data"]["items"]] == [
+            "Eva",
+            "Fay",
+            "Gus",
+            "Hugo",
+        ]
+
+        with pytest.raises(ValidationException):
+            await list_users_paginated(page=1, cursor="forged", **arguments)
@@ -0,0 +1,174 @@
+"""
+Tests for the in-memory people search index.
+"""
+
+import threading
+from unittest.mock import patch
+
+from src.core.database import db
+from src.core.search import SearchIndex
+from src.repositories.people_repository import PeopleRepository
+
+TABLE_NAME = "test-people-table-v2"
+FIELDS = ("firstName", "lastName", "email")
+
+
+def _person(person_id, first, last, email=None):
+    return {
+        "id": person_id,
+        "firstName": first,
+        "lastName": last,
+        "email": email or f"{first.lower()}.{last.lower()}@example.com",
+    }
+
+
+PEOPLE = [
+    _person("1", "Ana", "Silva"),
+    _person("2", "Anabel", "Costa"),
+    _person("3", "Joana", "Anders"),
+    _person("4", "Bruno", "Lima", "bruno@banana.org"),
+    _person("5", "Carla", "Mendes"),
+]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSearchIndex:
+    """Test matching, ranking and incremental updates."""
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.index = SearchIndex(FIELDS, ttl_seconds=60, clock=self.clock)
+        self.index.build(PEOPLE)
+
+    def test_matches_rank_exact_then_prefix_then_substring(self):
+        assert self.index.search("ana") == ["1", "2", "4", "3"]
+
+    def test_short_queries_match_token_prefixes(self):
+        assert self.index.search("an") == ["1", "2", "3"]
+        assert self.index.search("B") == ["4"]
+
+    def test_emails_and_limits(self):
+        assert self.index.search("banana.org") == ["4"]
+        assert self.index.search("example.com", limit=2) == ["1", "2"]
+        assert self.index.search("zzz") == []
+        assert self.index.search("  ") == []
+
+    def test_writes_update_the_index(self):
+        self.index.add(_person("1", "Beatriz", "Silva"))
+        self.index.add(_person("6", "Anita", "Rocha"))
+        self.index.remove("2")
+
+        assert self.index.search("ana") == ["4", "3"]
+        assert self.index.search("ani") == ["6"]
+        assert self.index.search("beatriz") == ["1"]
+        assert self.index.size == 5
+
+    def test_writes_during_a_build_are_replayed(self):
+        def snapshot():
+            yield from PEOPLE[:2]
+            # Written while the snapshot is still streaming
+            self.index.add(_person("1", "Beatriz", "Silva"))
+            self.index.add(_person("7", "Anders", "Berg"))
+            yield PEOPLE[0]
+
+        self.index.build(snapshot())
+
+        assert self.index.search("beatriz") == ["1"]
+        assert self.index.search("anders") == ["7"]
+
+    def test_index_expires_after_its_ttl(self):
+        loads = []
+
+        def load():
+            loads.append(1)
+            return PEOPLE
+
+        self.index.refresh(load)
+        assert loads == []
+
+        self.clock.now = 60
+        assert not self.index.is_fresh()
+        self.index.refresh(load)
+        self.index.refresh(load)
+        assert loads == [1]
+
+    def test_concurrent_refreshes_build_once(self):
+        index = SearchIndex(FIELDS, ttl_seconds=60)
+        loads = []
+        started = threading.Barrier(4)
+
+        def load():
+            loads.append(1)
+            return PEOPLE
+
+        def search():
+            started.wait()
+            index.refresh(load)
+
+        threads = [threading.Thread(target=search) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert loads == [1]
+        assert index.search("carla") == ["5"]
+
+
+class TestPeopleRepositorySearch:
+    """Test that the repository keeps the index in step with its writes."""
+
+    def setup_method(self):
+        self.repo = PeopleRepository()
+        for person in PEOPLE:
+            db.put_item(TABLE_NAME, person)
+
+    def test_index_is_built_once_from_a_scan(self):
+        with patch.object(db, "iter_scan", wraps=db.iter_scan) as iter_scan:
+            assert self.repo.search_ids("silva") == ["1"]
+            assert self.repo.search_ids("costa") == ["2"]
+
+        iter_scan.assert_called_once()
+        assert "ProjectionExpression" in iter_scan.call_args.kwargs
+
+    def test_repository_writes_keep_the_index_current(self):
+        from src.models.person import PersonUpdate
+
+        db.put_item(
+            TABLE_NAME,
+            {
+                **_person("9", "Old", "Name", "p9@example.com"),
+                "phone": "+1234567890",
+                "dateOfBirth": "1990-01-01",
+                "address": {
+                    "street": "123 Main St",
+                    "city": "Anytown",
+                    "state": "CA",
+                    "country": "USA",
+                    "postalCode": "12345",
+                },
+                "isAdmin": False,
+                "isActive": True,
+                "requirePasswordChange": False,
+                "emailVerified": False,
+                "createdAt": "2025-01-01T00:00:00",
+                "updatedAt": "2025-01-01T00:00:00",
+            },
+        )
+        self.repo.search_ids("warm")
+
+        with patch.object(db, "iter_scan") as iter_scan:
+            self.repo.update("9", PersonUpdate(firstName="Renata"))
+            assert self.repo.search_ids("renata") == ["9"]
+            assert self.repo.search_ids("old") == []
+
+            self.repo.delete("9")
+            assert self.repo.search_ids("renata") == []
+        iter_scan.assert_not_called()
@@ -0,0 +1,226 @@
+"""
+Tests for the read-through repository cache.
+"""
+
+import time
+from unittest.mock import patch
+
+from src.core.cache import (
+    InProcessCacheBackend,
+    LocalSharedStore,
+    ReadThroughCache,
+    SharedCacheBackend,
+    cache_stats,
+    request_scope,
+    use_cache_backend,
+)
+from src.core.database import db
+from src.models.project import ProjectUpdate
+from src.models.subscription import SubscriptionCreate
+from src.repositories.projects_repository import ProjectsRepository
+from src.repositories.subscriptions_repository import SubscriptionsRepository
+
+PROJECTS = "test-projects-table-v2"
+
+
+def _project(project_id: str, max_participants: int = 5):
+    db.put_item(
+        PROJECTS,
+        {
+            "id": project_id,
+            "name": "Cached Project",
+            "description": "Read often",
+            "startDate": "2025-01-01",
+            "endDate": "2025-12-31",
+            "maxParticipants": max_participants,
+            "currentParticipants": 0,
+            "status": "active",
+            "createdBy": "system",
+            "createdAt": "2025-01-01T00:00:00",
+            "updatedAt": "2025-01-01T00:00:00",
+        },
+    )
+
+
+class TestCacheBackends:
+    """Test the cache backends and the read-through wrapper."""
+
+    def test_lru_evicts_least_recently_used(self):
+        backend = InProcessCacheBackend(max_entries=2)
+        backend.set("a", 1, 60)
+        backend.set("b", 2, 60)
+        backend.get("a")
+        backend.set("c", 3, 60)
+
+        assert backend.get("a") == 1
+        assert backend.get("b") is None
+        assert backend.get("c") == 3
+        assert backend.evictions == 1
+
+    def test_entries_expire(self):
+        backend = InProcessCacheBackend(max_entries=10)
+        backend.set("a", 1, 0.01)
+        time.sleep(0.02)
+
+        assert backend.get("a") is None
+
+    def test_shared_backend_round_trips_values(self):
+        store = LocalSharedStore()
+        backend = SharedCacheBackend(store)
+        backend.set("people:1", {"id": "1", "tags": ["x"]}, 60)
+
+        assert backend.get("people:1") == {"id": "1", "tags": ["x"]}
+        assert isinstance(store.get("registry:cache:people:1"), bytes)
+        backend.clear()
+        assert backend.size() == 0
+
+    def test_read_through_counts_hits_and_misses(self):
+        cache = ReadThroughCache("items", 60, InProcessCacheBackend(max_entries=10))
+        loads = []
+
+        def load():
+            loads.append(1)
+            return {"id": "1"}
+
+        assert cache.get_or_load("1", load) == {"id": "1"}
+        assert cache.get_or_load("1", load) == {"id": "1"}
+        cache.invalidate("1")
+        cache.get_or_load("1", load)
+
+        assert len(loads) == 2
+        assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+    def test_missing_items_are_not_cached(self):
+        cache = ReadThroughCache("items", 60, InProcessCacheBackend(max_entries=10))
+
+        cache.get_or_load("1", lambda: None)
+
+        assert cache.get_or_load("1", lambda: {"id": "1"}) == {"id": "1"}
+
+    def test_load_racing_an_invalidation_is_not_stored(self):
+        cache = ReadThroughCache("items", 60, InProcessCacheBackend(max_entries=10))
+
+        def stale_load():
+            # A writer invalidates while this read is in flight
+            cache.invalidate("1")
+            return {"id": "1", "version": 1}
+
+        cache.get_or_load("1", stale_load)
+
+        assert cache.get_or_load("1", lambda: {"id": "1", "version": 2}) == {
+            "id": "1",
+            "version": 2,
+        }
+
+
+class TestRepositoryCaching:
+    """Test that repositories read through and invalidate the cache."""
+
+    def setup_method(self):
+        self.repo = ProjectsRepository()
+
+    def test_repeated_reads_hit_the_cache(self):
+        _project("project-1")
+
+        with patch.object(db, "get_item", wraps=db.get_item) as get_item:
+            first = self.repo.get_by_id("project-1")
+            second = ProjectsRepository().get_by_id("project-1")
+
+        assert first == second
+        assert get_item.call_count == 1
+        assert cache_stats()["namespaces"][PROJECTS]["hits"] == 1
+
+    def test_update_and_delete_invalidate(self):
+        _project("project-1")
+        self.repo.get_by_id("project-1")
+
+        self.repo.update("project-1", ProjectUpdate(name="Renamed"))
+        assert self.repo.get_by_id("project-1").name == "Renamed"
+
+        self.repo.delete("project-1")
+        assert self.repo.get_by_id("project-1") is None
+
+    def test_seat_reservation_invalidates_the_project(self):
+        _project("project-1")
+        assert self.repo.get_by_id("project-1").currentParticipants == 0
+
+        SubscriptionsRepository().create_reserving_seat(
+            SubscriptionCreate(personId="person-1", projectId="project-1")
+        )
+
+        assert self.repo.get_by_id("project-1").currentParticipants == 1
+
+    def test_shared_backend_can_be_plugged_in(self):
+        previous = use_cache_backend(SharedCacheBackend(LocalSharedStore()))
+        try:
+            _project("project-1")
+            self.repo.get_by_id("project-1")
+
+            with patch.object(db, "get_item") as get_item:
+                assert self.repo.get_by_id("project-1").name == "Cached Project"
+            get_item.assert_not_called()
+            assert cache_stats()["backend"] == "SharedCacheBackend"
+        finally:
+            use_cache_backend(previous)
+
+
+class TestRequestIdentityMap:
+    """Test per-request deduplication of repository reads."""
+
+    def setup_method(self):
+        self.repo = ProjectsRepository()
+
+    def test_each_item_is_loaded_once_per_scope(self):
+        _project("project-1")
+
+        with (
+            patch.object(self.repo.cache, "ttl_seconds", 0),
+            patch.object(db, "get_item", wraps=db.get_item) as get_item,
+        ):
+            with request_scope():
+                self.repo.get_by_id("project-1")
+                ProjectsRepository().get_by_id("project-1")
+                assert self.repo.get_by_id("missing") is None
+                assert self.repo.get_by_id("missing") is None
+            assert get_item.call_count == 2
+
+            # Outside a scope every read goes to the database again
+            self.repo.get_by_id("project-1")
+            assert get_item.call_count == 3
+
+    def test_writes_inside_the_scope_are_visible(self):
+        _project("project-1")
+
+        with request_scope():
+            self.repo.get_by_id("project-1")
+            self.repo.update("project-1", ProjectUpdate(name="Renamed"))
+
+            assert self.repo.get_by_id("project-1").name == "Renamed"
+
+    def test_middleware_shares_the_map_with_worker_threads(self):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from src.middleware.request_scope_middleware import RequestScopeMiddleware
+        from src.repositories.async_repository import AsyncRepository
+
+        _project("project-1")
+        app = FastAPI()
+        app.add_middleware(RequestScopeMiddleware)
+
+        @app.get("/project")
+        async def read_project():
+            async_repo = AsyncRepository(self.repo)
+            first = await async_repo.get_by_id("project-1")
+            second = await async_repo.get_by_id("project-1")
+            return {"same": first == second}
+
+        with (
+            patch.object(self.repo.cache, "ttl_seconds", 0),
+            patch.object(db, "get_item", wraps=db.get_item) as get_item,
+        ):
+            client = TestClient(app)
+            assert client.get("/project").json() == {"same": True}
+            assert client.get("/project").json() == {"same": True}
+
+        assert get_item.call_count == 2
@@ -101,3 +101,45 @@ class TestRolesRepository:
 
         assert len(roles) == 0
         assert roles == []
+
+    @patch("src.repositories.roles_repository.config")
+    @patch("src.repositories.roles_repository.boto3")
+    def test_get_many_by_ids_uses_repository_client(self, mock_boto3, mock_config):
+        """Batched and single role reads share one client and region."""
+        mock_config.database.region = "eu-west-1"
+        mock_client = Mock()
+        mock_boto3.client.return_value = mock_client
+        mock_client.batch_get_item.side_effect = [
+            {
+                "Responses": {"people-registry-roles": []},
+                "UnprocessedKeys": {
+                    "people-registry-roles": {
+                        "Keys": [
+                            {"user_id": {"S": "user-1"}, "role_type": {"S": "admin"}}
+                        ]
+                    }
+                },
+            },
+            {
+                "Responses": {
+                    "people-registry-roles": [
+                        {
+                            "user_id": {"S": "user-1"},
+                            "role_type": {"S": "admin"},
+                            "assigned_at": {"S": "2025-10-04T23:46:00.000Z"},
+                            "assigned_by": {"S": "system"},
+                            "is_active": {"BOOL": True},
+                        }
+                    ]
+                },
+                "UnprocessedKeys": {},
+            },
+        ]
+
+        repository = RolesRepository()
+        roles = repository.get_many_by_ids(["user-1", "user-2"])
+
+        mock_boto3.client.assert_called_once_with("dynamodb", region_name="eu-west-1")
+        assert mock_client.batch_get_item.call_count == 2
+        assert [role.role_type for role in roles["user-1"]] == [RoleType.ADMIN]
+        assert roles["user-2"] == []
@@ -0,0 +1,228 @@
+"""
+Tests for DatabaseClient running on the in-memory storage backend.
+"""
+
+import pytest
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
+
+from src.core.database import DatabaseClient, TransactionCancelledError, db
+from src.core.storage import InMemoryBackend
+from src.models.subscription import SubscriptionCreate
+from src.repositories.subscriptions_repository import SubscriptionsRepository
+
+PEOPLE = "test-people-table-v2"
+PROJECTS = "test-projects-table-v2"
+SUBSCRIPTIONS = "test-subscriptions-table-v2"
+
+
+def _memory_client() -> DatabaseClient:
+    backend = InMemoryBackend()
+    backend.create_registry_tables()
+    return DatabaseClient(backend=backend)
+
+
+class TestInMemoryBackend:
+    """Test the DatabaseClient primitives on the in-memory stand-in."""
+
+    def setup_method(self):
+        self.client = _memory_client()
+
+    def test_put_get_update_delete(self):
+        """Single-item operations behave like DynamoDB."""
+        self.client.put_item(PEOPLE, {"id": "p1", "firstName": "Ana", "age": 30})
+
+        assert self.client.get_item(PEOPLE, {"id": "p1"})["firstName"] == "Ana"
+
+        updated = self.client.update_item_if_exists(
+            PEOPLE, {"id": "p1"}, {"firstName": "Eva"}
+        )
+        assert updated == {"id": "p1", "firstName": "Eva", "age": 30}
+        assert (
+            self.client.update_item_if_exists(PEOPLE, {"id": "nope"}, {"a": 1}) is None
+        )
+
+        assert self.client.delete_item(PEOPLE, {"id": "p1"})
+        assert self.client.get_item(PEOPLE, {"id": "p1"}) is None
+
+    def test_returned_items_are_copies(self):
+        """Mutating a returned item does not change the stored one."""
+        self.client.put_item(PEOPLE, {"id": "p1", "tags": ["a"]})
+
+        self.client.get_item(PEOPLE, {"id": "p1"})["tags"].append("b")
+
+        assert self.client.get_item(PEOPLE, {"id": "p1"})["tags"] == ["a"]
+
+    def test_scan_pages_and_segments(self):
+        """Paged, filtered and segmented scans see every item exactly once."""
+        self.client.put_many(
+            PEOPLE, [{"id": f"p{i:03d}", "even": i % 2 == 0} for i in range(250)]
+        )
+
+        assert len(list(self.client.iter_scan(PEOPLE, page_size=40))) == 250
+        evens = self.client.iter_scan(
+            PEOPLE, page_size=40, FilterExpression=Attr("even").eq(True)
+        )
+        assert len(list(evens)) == 125
+        items = self.client.parallel_scan(PEOPLE, total_segments=4, page_size=30)
+        assert sorted(item["id"] for item in items) == [f"p{i:03d}" for i in range(250)]
+
+    def test_scan_pages_resume_without_walking_the_table(self):
+        """Resumed pages bisect to their start key and see writes in between."""
+        from unittest.mock import patch
+
+        from src.core import storage
+
+        self.client.put_many(PEOPLE, [{"id": f"p{i:03d}"} for i in range(100)])
+        table = self.client._get_table(PEOPLE)
+        first = table.scan(Limit=10, Segment=1, TotalSegments=2)
+
+        self.client.put_item(PEOPLE, {"id": "p500"})
+        self.client.delete_item(PEOPLE, {"id": "p000"})
+        with patch.object(storage.zlib, "crc32", wraps=storage.zlib.crc32) as crc32:
+            rest = table.scan(
+                Segment=1,
+                TotalSegments=2,
+                ExclusiveStartKey=first["LastEvaluatedKey"],
+            )
+        crc32.assert_not_called()
+
+        seen = [item["id"] for item in first["Items"] + rest["Items"]]
+        assert seen == sorted(seen)
+        segment_ids = [
+            item["id"]
+            for item in self.client.parallel_scan(PEOPLE, total_segments=2)
+            if storage.InMemoryTable._segment_of((item["id"],), 2) == 1
+        ]
+        assert sorted(segment_ids) == [i for i in seen if i != "p000"]
+
+    def test_query_by_index(self):
+        """GSIs exist and are kept in step with writes."""
+        self.client.put_item(PEOPLE, {"id": "p1", "emailLower": "a@example.com"})
+        self.client.put_item(PEOPLE, {"id": "p2", "emailLower": "b@example.com"})
+        self.client.update_item(PEOPLE, {"id": "p2"}, {"emailLower": "a@example.com"})
+
+        assert self.client.has_index(PEOPLE, "EmailLowerIndex")
+        assert not self.client.has_index(PEOPLE, "MissingIndex")
+        items = self.client.query_by_index(
+            PEOPLE, "EmailLowerIndex", {"emailLower": "a@example.com"}
+        )
+        assert sorted(item["id"] for item in items) == ["p1", "p2"]
+        assert (
+            self.client.query_by_index(
+                PEOPLE, "EmailLowerIndex", {"emailLower": "b@example.com"}
+            )
+            == []
+        )
+
+    def test_sorted_index_pages_in_range_order(self):
+        """Range-key GSIs return items sorted and resume from the index key."""
+        for person_id, name in [("p1", "Cy"), ("p2", "Al"), ("p3", "Bo")]:
+            self.client.put_item(
+                PEOPLE, {"id": person_id, "listPartition": "person", "firstName": name}
+            )
+        self.client.update_item(PEOPLE, {"id": "p1"}, {"firstName": "Ab"})
+        condition = {"listPartition": "person"}
+
+        first, last_key = self.client.query_page(PEOPLE, "FirstNameIndex", condition, 2)
+        rest, _ = self.client.query_page(
+            PEOPLE, "FirstNameIndex", condition, 2, exclusive_start_key=last_key
+        )
+        descending, _ = self.client.query_page(
+            PEOPLE, "FirstNameIndex", condition, 3, scan_index_forward=False
+        )
+
+        assert [item["firstName"] for item in first + rest] == ["Ab", "Al", "Bo"]
+        assert last_key == {"id": "p2", "listPartition": "person", "firstName": "Al"}
+        assert [item["firstName"] for item in descending] == ["Bo", "Al", "Ab"]
+
+    def test_batch_get_and_write(self):
+        """Batched reads and writes go through the chunked paths."""
+        result = self.client.put_many(
+            PEOPLE, [{"id": f"p{i}", "n": i} for i in range(60)]
+        )
+        assert result.success_count == 60
+
+        items = self.client.get_many(PEOPLE, [{"id": f"p{i}"} for i in range(120)])
+        assert len([item for item in items if item]) == 60
+
+        self.client.delete_many(PEOPLE, [{"id": f"p{i}"} for i in range(30)])
+        assert len(self.client.scan_table(PEOPLE)) == 30
+
+    def test_transaction_is_all_or_nothing(self):
+        """A failed condition cancels every action of the transaction."""
+        self.client.put_item(PROJECTS, {"id": "x", "current": 1, "max": 1})
+
+        with pytest.raises(TransactionCancelledError) as error:
+            self.client.transact_write(
+                [
+                    {"Put": {"TableName": SUBSCRIPTIONS, "Item": {"id": "s1"}}},
+                    {
+                        "Update": {
+                            "TableName": PROJECTS,
+                            "Key": {"id": "x"},
+                            "UpdateExpression": "ADD #c :one",
+                            "ConditionExpression": "#c < #m",
+                            "ExpressionAttributeNames": {"#c": "current", "#m": "max"},
+                            "ExpressionAttributeValues": {":one": 1},
+                        }
+                    },
+                ]
+            )
+
+        assert error.value.reasons == ["None", "ConditionalCheckFailed"]
+        assert self.client.get_item(SUBSCRIPTIONS, {"id": "s1"}) is None
+        assert self.client.get_item(PROJECTS, {"id": "x"})["current"] == 1
+
+    def test_unknown_table_is_reported(self):
+        """Missing tables fail the way DynamoDB does."""
+        with pytest.raises(ClientError) as error:
+            self.client.get_item("missing-table", {"id": "a"})
+        assert error.value.response["Error"]["Code"] == "ResourceNotFoundException"
+        with pytest.raises(ClientError) as error:
+            self.client.put_item("missing-table", {"id": "a"})
+        assert error.value.response["Error"]["Code"] == "ResourceNotFoundException"
+
+
+class TestRepositoriesOnInMemoryBackend:
+    """Test repositories against the global client switched to memory."""
+
+    def setup_method(self):
+        backend = InMemoryBackend()
+        backend.create_registry_tables()
+        self.previous = db.use_backend(backend)
+
+    def teardown_method(self):
+        db.use_backend(self.previous)
+
+    def test_subscription_round_trip(self):
+        """Seat reservation and index lookups work without DynamoDB."""
+        db.put_item(
+            PROJECTS,
+            {
+                "id": "project-1",
+                "name": "Capacity Project",
+                "description": "Limited spots",
+                "startDate": "2025-01-01",
+                "endDate": "2025-12-31",
+                "maxParticipants": 1,
+                "currentParticipants": 0,
+                "status": "active",
+                "createdBy": "system",
+                "createdAt": "2025-01-01T00:00:00",
+                "updatedAt": "2025-01-01T00:00:00",
+            },
+        )
+        repo = SubscriptionsRepository()
+
+        repo.create_reserving_seat(
+            SubscriptionCreate(personId="person-1", projectId="project-1")
+        )
+        with pytest.raises(TransactionCancelledError):
+            repo.create_reserving_seat(
+                SubscriptionCreate(personId="person-2", projectId="project-1")
+            )
+
+        assert [s.personId for s in repo.get_by_project("project-1")] == ["person-1"]
+        project = db.get_item(PROJECTS, {"id": "project-1"})
+        assert project["currentParticipants"] == 1
@@ -0,0 +1,400 @@
+"""
+Tests for SubscriptionsRepository index-backed lookups.
+"""
+
+from unittest.mock import patch
+
+from src.core.database import db
+from src.models.subscription import SubscriptionCreate
+from src.repositories.subscriptions_repository import SubscriptionsRepository
+
+
+def _legacy_subscription(subscription_id: str, person_id: str, project_id: str):
+    """Insert a subscription row with a random-style ID, as before pair IDs."""
+    db.put_item(
+        "test-subscriptions-table-v2",
+        {
+            "id": subscription_id,
+            "personId": person_id,
+            "projectId": project_id,
+            "status": "active",
+            "subscriptionDate": "2025-01-01T00:00:00",
+            "createdAt": "2025-01-01T00:00:00",
+            "updatedAt": "2025-01-01T00:00:00",
+        },
+    )
+
+
+class TestSubscriptionsRepository:
+    """Test subscription access by person, project and pair."""
+
+    def setup_method(self):
+        """Create a repository bound to the moto tables."""
+        self.repo = SubscriptionsRepository()
+
+    def test_create_uses_deterministic_pair_id(self):
+        """New subscriptions are keyed by their person/project pair."""
+        subscription = self.repo.create(
+            SubscriptionCreate(personId="person-1", projectId="project-1")
+        )
+
+        assert subscription.id == self.repo.pair_id("person-1", "project-1")
+        assert subscription.id != self.repo.pair_id("project-1", "person-1")
+
+    def test_pair_lookup_is_a_single_get_item(self):
+        """The pair check reads one item instead of scanning the table."""
+        self.repo.create(SubscriptionCreate(personId="person-1", projectId="project-1"))
+
+        with (
+            patch.object(db, "get_item", wraps=db.get_item) as get_item,
+            patch.object(db, "iter_scan") as iter_scan,
+            patch.object(db, "query_by_index") as query,
+        ):
+            assert self.repo.subscription_exists("person-1", "project-1")
+
+        get_item.assert_called_once()
+        iter_scan.assert_not_called()
+        query.assert_not_called()
+
+    def test_legacy_pair_lookup_is_off_by_default(self):
+        """Without the flag, rows keyed by random IDs are not looked up."""
+        _legacy_subscription("legacy-1", "person-2", "project-9")
+
+        with patch.object(db, "query_by_index") as query:
+            assert self.repo.get_by_person_and_project("person-2", "project-9") is None
+
+        query.assert_not_called()
+
+    def test_pair_lookup_finds_legacy_subscriptions(self):
+        """With the flag on, legacy rows are found through the person index."""
+        _legacy_subscription("legacy-1", "person-2", "project-9")
+        self.repo.legacy_pair_lookup = True
+
+        subscription = self.repo.get_by_person_and_project("person-2", "project-9")
+
+        assert subscription.id == "legacy-1"
+        assert not self.repo.subscription_exists("person-2", "project-1")
+
+    def test_rekey_moves_legacy_rows_to_pair_ids(self):
+        """Legacy rows move to their pair ID; taken pair IDs are reported."""
+        _legacy_subscription("legacy-1", "person-1", "project-1")
+        _legacy_subscription("legacy-2", "person-2", "project-1")
+        _legacy_subscription("legacy-3", "person-2", "project-1")
+        self.repo.create(SubscriptionCreate(personId="person-3", projectId="project-1"))
+
+        with patch.object(db, "parallel_scan", db.iter_scan):
+            outcome = self.repo.rekey_legacy_ids()
+
+        assert sorted(outcome["rekeyed"]) in (
+            ["legacy-1", "legacy-2"],
+            ["legacy-1", "legacy-3"],
+        )
+        assert len(outcome["duplicates"]) == 1
+        assert outcome["changed"] == []
+        moved = self.repo.get_by_person_and_project("person-1", "project-1")
+        assert moved.id == self.repo.pair_id("person-1", "project-1")
+        assert self.repo.get_by_id("legacy-1") is None
+        assert self.repo.get_by_id(outcome["duplicates"][0]) is not None
+
+    def test_person_and_project_lookups_query_indexes(self):
+        """get_by_person and get_by_project use their GSIs."""
+        _legacy_subscription("s-1", "person-1", "project-1")
+        _legacy_subscription("s-2", "person-1", "project-2")
+        _legacy_subscription("s-3", "person-2", "project-1")
+
+        with patch.object(db, "iter_scan") as iter_scan:
+            by_person = self.repo.get_by_person("person-1")
+            by_project = self.repo.get_by_project("project-1")
+
+        iter_scan.assert_not_called()
+        assert sorted(sub.id for sub in by_person) == ["s-1", "s-2"]
+        assert sorted(sub.id for sub in by_project) == ["s-1", "s-3"]
+
+    def test_project_subscriptions_can_be_paged(self):
+        """Pages follow the resume token until the project is exhausted."""
+        for index in range(5):
+            _legacy_subscription(f"s-{index}", f"person-{index}", "project-1")
+        _legacy_subscription("other", "person-9", "project-2")
+
+        seen = []
+        token = None
+        while True:
+            page, token = self.repo.get_page_by_project("project-1", 2, token)
+            assert len(page) <= 2
+            seen.extend(sub.id for sub in page)
+            if not token:
+                break
+
+        assert sorted(seen) == [f"s-{index}" for index in range(5)]
+
+    def test_lookups_fall_back_to_scan_without_indexes(self):
+        """Before the indexes exist, lookups stream the table."""
+        _legacy_subscription("s-1", "person-1", "project-1")
+        _legacy_subscription("s-2", "person-2", "project-1")
+
+        with patch.object(db, "has_index", return_value=False):
+            by_project = self.repo.get_by_project("project-1")
+            page, _ = self.repo.get_page_by_person("person-2", 10)
+
+        assert sorted(sub.id for sub in by_project) == ["s-1", "s-2"]
+        assert [sub.id for sub in page] == ["s-2"]
+
+
+def _project(project_id: str, max_participants: int, current: int = 0):
+    """Insert a project row with a participant limit."""
+    db.put_item(
+        "test-projects-table-v2",
+        {
+            "id": project_id,
+            "name": "Capacity Project",
+            "description": "Limited spots",
+            "startDate": "2025-01-01",
+            "endDate": "2025-12-31",
+            "maxParticipants": max_participants,
+            "currentParticipants": current,
+            "status": "active",
+            "createdBy": "system",
+            "createdAt": "2025-01-01T00:00:00",
+            "updatedAt": "2025-01-01T00:00:00",
+        },
+    )
+
+
+def _participants(project_id: str) -> int:
+    return int(
+        db.get_item("test-projects-table-v2", {"id": project_id})["currentParticipants"]
+    )
+
+
+class TestParticipantCounting:
+    """Test transactional participant counting."""
+
+    def setup_method(self):
+        """Create repositories bound to the moto tables."""
+        self.repo = SubscriptionsRepository()
+
+    def test_reserving_a_seat_counts_the_participant(self):
+        """The insert and the counter increment commit together."""
+        _project("project-1", 2)
+
+        self.repo.create_reserving_seat(
+            SubscriptionCreate(personId="person-1", projectId="project-1")
+        )
+
+        assert _participants("project-1") == 1
+        assert self.repo.subscription_exists("person-1", "project-1")
+
+    def test_full_project_rejects_the_whole_transaction(self):
+        """No subscription is written when the project has no free spots."""
+        from src.core.database import TransactionCancelledError
+
+        _project("project-1", 1, current=1)
+
+        try:
+            self.repo.create_reserving_seat(
+                SubscriptionCreate(personId="person-1", projectId="project-1")
+            )
+            raise AssertionError("expected the transaction to be cancelled")
+        except TransactionCancelledError as e:
+            assert e.reasons[1] == "ConditionalCheckFailed"
+
+        assert _participants("project-1") == 1
+        assert not self.repo.subscription_exists("person-1", "project-1")
+
+    def test_counter_stops_at_max_participants(self):
+        """More subscribers than spots: exactly maxParticipants get in."""
+        from src.core.database import TransactionCancelledError
+
+        _project("project-1", 3)
+
+        accepted = 0
+        for index in range(6):
+            try:
+                self.repo.create_reserving_seat(
+                    SubscriptionCreate(personId=f"p-{index}", projectId="project-1")
+                )
+                accepted += 1
+            except TransactionCancelledError:
+                pass
+
+        assert accepted == 3
+        assert _participants("project-1") == 3
+
+    def test_service_maps_rejections_to_business_errors(self):
+        """Duplicate and full-project rejections surface as business errors."""
+        import pytest
+        from src.exceptions.base_exceptions import BusinessLogicException, ErrorCode
+        from src.services.subscriptions_service import SubscriptionsService
+
+        _project("project-1", 1)
+        service = SubscriptionsService(self.repo)
+        service.create_subscription(
+            SubscriptionCreate(personId="person-1", projectId="project-1")
+        )
+
+        with pytest.raises(BusinessLogicException) as full:
+            service.create_subscription(
+                SubscriptionCreate(personId="person-2", projectId="project-1")
+            )
+
+        assert full.value.error_code == ErrorCode.BUSINESS_RULE_VIOLATION
+
+    def test_deleting_a_subscription_frees_its_seat(self):
+        """Deletes release the spot taken by the subscription."""
+        from src.services.subscriptions_service import SubscriptionsService
+
+        _project("project-1", 1)
+        service = SubscriptionsService(self.repo)
+        created = service.create_subscription(
+            SubscriptionCreate(personId="person-1", projectId="project-1")
+        )
+
+        assert service.delete_subscription(created.id)
+        assert _participants("project-1") == 0
+
+    def test_batch_delete_frees_seats_per_project(self):
+        """Batch deletes release one spot per deleted subscription."""
+        from src.services.subscriptions_service import SubscriptionsService
+
+        _project("project-1", 5)
+        ids = [
+            self.repo.create_reserving_seat(
+                SubscriptionCreate(personId=f"p-{index}", projectId="project-1")
+            ).id
+            for index in range(3)
+        ]
+
+        SubscriptionsService(self.repo).delete_subscriptions(ids[:2])
+
+        assert _participants("project-1") == 1
+
+    def test_repository_batch_delete_frees_seats(self):
+        """delete_many releases every deleted subscription's spot."""
+        _project("project-1", 5)
+        ids = [
+            self.repo.create_reserving_seat(
+                SubscriptionCreate(personId=f"p-{index}", projectId="project-1")
+            ).id
+            for index in range(3)
+        ]
+
+        result = self.repo.delete_many(ids[:2] + ["missing"])
+
+        assert result.success_count == 2
+        assert result.failed == [{"key": {"id": "missing"}, "error": "Item not found"}]
+        assert _participants("project-1") == 1
+
+    def test_only_active_subscriptions_hold_a_seat(self):
+        """Pending subscriptions take a spot on approval and free it on cancel."""
+        from src.models.subscription import SubscriptionUpdate
+
+        _project("project-1", 2)
+        pending = self.repo.create_reserving_seat(
+            SubscriptionCreate(
+                personId="person-1", projectId="project-1", status="pending"
+            )
+        )
+        assert _participants("project-1") == 0
+
+        self.repo.update(pending.id, SubscriptionUpdate(status="active"))
+        assert _participants("project-1") == 1
+
+        self.repo.update(pending.id, SubscriptionUpdate(notes="Approved"))
+        self.repo.update(pending.id, SubscriptionUpdate(isActive=False))
+        assert _participants("project-1") == 0
+
+        self.repo.update(pending.id, SubscriptionUpdate(isActive=True))
+        self.repo.update(pending.id, SubscriptionUpdate(status="cancelled"))
+        assert _participants("project-1") == 0
+
+    def test_approval_into_a_full_project_is_rejected(self):
+        """An approval that needs a spot fails as a business error when full."""
+        import pytest
+        from src.exceptions.base_exceptions import BusinessLogicException, ErrorCode
+        from src.models.subscription import SubscriptionUpdate
+        from src.services.subscriptions_service import SubscriptionsService
+
+        _project("project-1", 1, current=1)
+        pending = self.repo.create_reserving_seat(
+            SubscriptionCreate(
+                personId="person-1", projectId="project-1", status="pending"
+            )
+        )
+        service = SubscriptionsService(self.repo)
+
+        with pytest.raises(BusinessLogicException) as full:
+            service.update_subscription(pending.id, SubscriptionUpdate(status="active"))
+
+        assert full.value.error_code == ErrorCode.BUSINESS_RULE_VIOLATION
+        assert self.repo.get_by_id(pending.id).status == "pending"
+        assert _participants("project-1") == 1
+
+    def test_seat_update_retries_after_a_concurrent_write(self):
+        """A write planned from a stale read is retried from a fresh read."""
+        from src.models.subscription import SubscriptionUpdate
+
+        _project("project-1", 2)
+        created = self.repo.create_reserving_seat(
+            SubscriptionCreate(personId="person-1", projectId="project-1")
+        )
+        get_item = db.get_item
+        reads = []
+
+        def racing_get_item(table_name, key):
+            item = get_item(table_name, key)
+            if not reads:
+                # Another request cancels the subscription after this read
+                db.update_item(
+                    table_name,
+                    key,
+                    {"status": "cancelled", "updatedAt": "2099-01-01T00:00:00"},
+                )
+                db.transact_write(
+                    [
+                        self.repo.projects_repository.participant_count_action(
+                            "project-1", -1
+                        )
+                    ]
+                )
+            reads.append(item)
+            return item
+
+        with patch.object(db, "get_item", side_effect=racing_get_item):
+            self.repo.update(created.id, SubscriptionUpdate(isActive=False))
+
+        assert len(reads) == 2
+        assert _participants("project-1") == 0
+
+    def test_deleting_a_pending_subscription_keeps_the_count(self):
+        """Subscriptions without a seat free nothing when deleted."""
+        _project("project-1", 2, current=1)
+        pending = self.repo.create_reserving_seat(
+            SubscriptionCreate(
+                personId="person-1", projectId="project-1", status="pending"
+            )
+        )
+
+        assert self.repo.delete_releasing_seat(pending.id)
+        assert not self.repo.delete_releasing_seat(pending.id)
+        assert _participants("project-1") == 1
+
+    def test_reconcile_recounts_participants_from_subscriptions(self):
+        """Stale counts are replaced with the number of seat holders."""
+        _project("project-1", 5, current=4)
+        _project("project-2", 5, current=0)
+        _legacy_subscription("s-1", "person-1", "project-1")
+        _legacy_subscription("s-2", "person-2", "project-2")
+        _legacy_subscription("s-3", "person-3", "project-2")
+        self.repo.create_reserving_seat(
+            SubscriptionCreate(
+                personId="person-4", projectId="project-2", status="pending"
+            )
+        )
+
+        with patch.object(db, "parallel_scan", db.iter_scan):
+            changed = self.repo.reconcile_participants()
+            assert self.repo.reconcile_participants() == {}
+
+        assert changed == {"project-1": (4, 1), "project-2": (0, 2)}
+        assert _participants("project-1") == 1
+        assert _participants("project-2") == 2